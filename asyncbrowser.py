@@ -0,0 +1,562 @@
+"""
+비동기 브라우저 백엔드 (Playwright async API, 브라우저 프로세스 몇 개 + 가벼운 컨텍스트 여러 개)
+
+Selenium 경로는 동시 작업 하나마다 chromedriver + Chrome 한 벌(수백 MB)과 OS 스레드가 필요하다.
+이 백엔드는 이벤트 루프 하나가 Chromium 프로세스 몇 개(browsers) 안에 서로 격리된 브라우저
+컨텍스트(쿠키/캐시/스토리지 분리, 시크릿 창과 같은 단위)를 최대 contexts개까지 동시에 연다.
+대기 시간이 대부분인 크롤링은 컨텍스트 수만큼 겹쳐서 진행된다.
+
+crawl_multiple_products / crawl_price_only / crawl_reviews에 backend='async'를 주면 이 모듈을
+사용하며, 페이지 분류(PageGuard), 스키마 추출, 리뷰 파싱/정규화, 저장은 Selenium 경로와 같은
+함수를 그대로 쓴다. 목록 수집(urlcrawler)은 페이지를 순서대로 넘기는 작업이라 Selenium만 지원한다.
+
+    pip install playwright && playwright install chromium
+    python bench_storefront.py --stages products prices reviews --backend both --contexts 16
+
+- 상품마다 컨텍스트를 새로 열고 닫으므로 렌더러 메모리가 쌓이지 않는다 (DriverGovernor 불필요).
+- 브라우저 프로세스가 죽으면 다음 컨텍스트를 열 때 다시 띄운다.
+- 리뷰는 상품을 하나씩 처리하므로 BrowserSession으로 이벤트 루프와 풀을 상품 간에 유지한다
+  (세션 없이 부르면 상품마다 Chromium을 새로 띄운다).
+- CrawlProfiler는 상품 세션이 동시에 열리므로 이 백엔드에서는 쓰지 않는다.
+"""
+import asyncio
+import contextlib
+
+from lazyimport import lazy_module, lazy_import
+from driverfactory import DEFAULT_ASYNC_CONTEXTS
+from productcrawler_beauty import extract_product_data, merge_expanded, extract_price_data, page_usable, resolve_schema
+from reviewcrawler import (
+    NEXT_BUTTON_XPATHS, PAGINATION_SELECTORS, check_review_page, extract_review_raw, find_review_blocks,
+    merge_range_batches, plan_page_ranges, read_product_title, read_total_reviews
+)
+from reviewnormalize import RAW_REVIEW_COLUMNS, RAW_CATEGORICAL_COLUMNS
+from reviewrecord import ReviewBatch
+from retrypolicy import BlockedPageError, ParseMissError
+
+async_playwright = lazy_import("playwright.async_api", "async_playwright")
+playwright_api = lazy_module("playwright.async_api")
+BeautifulSoup = lazy_import("bs4", "BeautifulSoup")
+
+DEFAULT_BROWSERS = 2
+
+# 가벼운 모드에서 요청 자체를 막는 리소스 (Selenium 경로의 이미지 끄기에 해당)
+BLOCKED_RESOURCE_TYPES = ('image', 'media', 'font')
+
+# 상품 사이 서버 부하 완화 대기 (Selenium 경로의 time.sleep(2)와 같은 값, 컨텍스트 슬롯마다 적용)
+PRODUCT_DELAY = 2
+
+LAUNCH_ARGS = ['--disable-gpu', '--disable-extensions', '--no-sandbox', '--disable-dev-shm-usage']
+CONTEXT_OPTIONS = {'viewport': {'width': 1920, 'height': 1080}, 'locale': 'ko-KR'}
+
+# 선택자 목록의 요소 outerHTML만 꺼내는 스크립트 (PRICE_ONLY_SCRIPT와 같은 동작)
+PRICE_ONLY_FUNCTION = """
+selectors => selectors.map(selector => {
+    const el = document.querySelector(selector);
+    return el ? el.outerHTML : '';
+}).join('')
+"""
+
+# 리뷰 탭 / 최신순 버튼 후보 (reviewcrawler.open_review_page와 같은 순서)
+REVIEW_TAB_QUERIES = [
+    '#content > div > div.z7cS6-TO7X > div._27jmWaPaKy > ul > li:nth-child(2) > a',
+    '#content > div > div._2-I30XS1lA > div._25tOXGEYJK > ul > li:nth-child(2) > a',
+    'a[href="#REVIEW"]',
+    "xpath=//a[contains(text(), '리뷰')]",
+]
+LATEST_SORT_QUERIES = [
+    '#REVIEW > div > div._2LvIMaBiIO > div._2LAwVxx1Sd > div._1txuie7UTH > ul > li:nth-child(2) > a',
+    'xpath=//a[contains(text(), "최신순")]',
+]
+
+
+class ContextPool:
+    """
+    Chromium 프로세스 browsers개에 격리된 컨텍스트를 최대 contexts개까지 동시에 여는 풀
+
+        async with ContextPool(browsers=2, contexts=16) as pool:
+            async with pool.page() as page:
+                await page.goto(url)
+    """
+
+    def __init__(self, browsers=DEFAULT_BROWSERS, contexts=DEFAULT_ASYNC_CONTEXTS, headless=True, lightweight=False):
+        """
+        Args:
+            browsers (int): 띄울 Chromium 프로세스 수 (컨텍스트는 가장 한가한 프로세스에 배정)
+            contexts (int): 동시에 열 수 있는 컨텍스트(=동시 작업) 수
+            headless (bool): 헤드리스 모드 여부
+            lightweight (bool): 이미지/미디어/폰트 요청을 막고 DOMContentLoaded에서 goto 반환
+        """
+        self.browser_count = max(1, min(browsers, contexts))
+        self.contexts = max(1, contexts)
+        self.headless = headless
+        self.lightweight = lightweight
+        self.wait_until = 'domcontentloaded' if lightweight else 'load'
+        self.pages = 0
+        self.relaunches = 0
+        self.peak_open = 0
+        self._playwright = None
+        self._browsers = []
+        self._open = []
+        self._slots = None
+
+    async def __aenter__(self):
+        try:
+            self._playwright = await async_playwright().start()
+        except ImportError:
+            raise ImportError("비동기 백엔드에는 playwright가 필요합니다: "
+                              "pip install playwright && playwright install chromium") from None
+        self._slots = asyncio.Semaphore(self.contexts)
+        self._browsers = [await self._launch() for _ in range(self.browser_count)]
+        self._open = [0] * self.browser_count
+        print(f"[INFO] 비동기 브라우저 {self.browser_count}개, 동시 컨텍스트 최대 {self.contexts}개")
+        return self
+
+    async def __aexit__(self, *exc_info):
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except Exception as e:
+                print(f"[WARN] 브라우저 종료 중 오류: {e}")
+        await self._playwright.stop()
+        return False
+
+    async def _launch(self):
+        return await self._playwright.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+
+    @contextlib.asynccontextmanager
+    async def page(self):
+        """컨텍스트 슬롯을 얻어 새 컨텍스트의 페이지를 열고, 블록을 나가면 컨텍스트째 닫음"""
+        async with self._slots:
+            index = min(range(len(self._browsers)), key=self._open.__getitem__)
+            self._open[index] += 1
+            self.peak_open = max(self.peak_open, sum(self._open))
+            context = None
+            try:
+                if not self._browsers[index].is_connected():
+                    print(f"[WARN] 브라우저 {index + 1} 연결이 끊겨 다시 띄웁니다.")
+                    self._browsers[index] = await self._launch()
+                    self.relaunches += 1
+                context = await self._browsers[index].new_context(**CONTEXT_OPTIONS)
+                if self.lightweight:
+                    await context.route('**/*', _block_heavy_resources)
+                yield await context.new_page()
+            finally:
+                self._open[index] -= 1
+                self.pages += 1
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        print(f"[WARN] 컨텍스트 종료 중 오류: {e}")
+
+    def report(self):
+        print(f"[INFO] 비동기 브라우저: 컨텍스트 {self.pages}개 사용, 최대 동시 {self.peak_open}개, "
+              f"브라우저 재시작 {self.relaunches}회")
+
+
+class BrowserSession:
+    """
+    이벤트 루프 하나와 ContextPool을 여러 상품에 걸쳐 유지하는 동기 래퍼
+
+    상품마다 asyncio.run()을 부르면 상품마다 Playwright와 Chromium을 새로 띄우므로,
+    상품을 하나씩 처리하는 동기 루프(main.py 리뷰 단계 등)는 세션을 열어 두고 run()으로 넘긴다.
+
+        session = BrowserSession(contexts=4).start()
+        title, batch = session.run(collect_reviews_async(url, page_workers=4, pool=session.pool))
+        session.close()
+    """
+
+    def __init__(self, browsers=1, contexts=DEFAULT_ASYNC_CONTEXTS, headless=True, lightweight=False):
+        self.pool = ContextPool(browsers, contexts, headless=headless, lightweight=lightweight)
+        self._loop = None
+
+    def start(self):
+        self._loop = asyncio.new_event_loop()
+        try:
+            self._loop.run_until_complete(self.pool.__aenter__())
+        except BaseException:
+            self._loop.close()
+            self._loop = None
+            raise
+        return self
+
+    def run(self, coroutine):
+        """세션 이벤트 루프에서 코루틴을 끝까지 실행하고 결과 반환"""
+        return self._loop.run_until_complete(coroutine)
+
+    def close(self):
+        if self._loop is None:
+            return
+        try:
+            self._loop.run_until_complete(self.pool.__aexit__(None, None, None))
+            self.pool.report()
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def js_click(element):
+    """화면 중앙으로 스크롤 후 JS 클릭 (safe_click(use_js=True)와 같은 방식, 실패하면 False)"""
+    try:
+        await element.evaluate("el => el.scrollIntoView({block: 'center'})")
+        await asyncio.sleep(0.5)
+        await element.evaluate("el => el.click()")
+        await asyncio.sleep(1)
+        return True
+    except Exception as e:
+        print(f"[WARN] 클릭 실패: {e}")
+        return False
+
+
+async def _gather_in_order(items, worker):
+    """items마다 worker(item)를 동시에 실행하고 입력 순서대로 결과 반환 (예외는 항목별로 출력 후 None)"""
+    async def guarded(item):
+        try:
+            return await worker(item)
+        except Exception as e:
+            print(f"[ERROR] URL 처리 중 오류 발생: {item} - {e}")
+            return None
+    return await asyncio.gather(*(guarded(item) for item in items))
+
+
+# ---------------------------------------------------------------
+# 상품 상세 / 가격
+# ---------------------------------------------------------------
+async def crawl_product_detail_async(pool, product_url, page_guard=None, raise_errors=False, schema=None):
+    """crawl_product_detail의 비동기 버전 (CSV 저장 없음, 같은 스키마 추출)"""
+    if product_url.startswith('/'):
+        product_url = 'https://brand.naver.com' + product_url
+    if page_guard is not None and not page_guard.allow(product_url, task='products'):
+        if raise_errors:
+            raise BlockedPageError(f"스토어 요청 중단 중: {product_url}")
+        return {}
+    schema = resolve_schema(schema)
+
+    async with pool.page() as page:
+        print(f"[INFO] 상품 URL 열기: {product_url}")
+        await page.goto(product_url, wait_until=pool.wait_until)
+        await asyncio.sleep(3)
+
+        html_source = await page.content()
+        if not page_usable(page_guard, product_url, html_source, 'products'):
+            if raise_errors:
+                raise BlockedPageError(f"차단/없는 상품 페이지: {product_url}")
+            return {}
+        product_data = extract_product_data(BeautifulSoup(html_source, 'html.parser'), product_url, schema)
+
+        # 상세 정보 펼치기 버튼 클릭 후 펼쳐진 필드만 다시 추출
+        if schema.expand:
+            try:
+                more_button = await page.query_selector(schema.expand['selector'])
+                if more_button and await more_button.is_visible() and await js_click(more_button):
+                    await asyncio.sleep(2)
+                    soup = BeautifulSoup(await page.content(), 'html.parser')
+                    merge_expanded(product_data, schema.extract(soup, only=schema.expand['fields'], context=product_data))
+            except Exception as e:
+                print(f"[WARN] 상세 정보 펼치기 버튼 클릭 중 오류: {e}")
+
+        if raise_errors and not (product_data.get('product_title') or product_data.get('price')):
+            raise ParseMissError(f"상품명/가격을 찾지 못했습니다: {product_url}")
+        print(f"[INFO] 상품 '{product_data.get('product_title', '알 수 없음')}' 정보 수집 완료")
+
+        # 서버 부하 완화 (Selenium 경로의 상품 사이 대기와 같은 간격을 슬롯마다 유지)
+        await asyncio.sleep(PRODUCT_DELAY)
+        return product_data
+
+
+async def crawl_products_async(product_urls, headless=True, page_guard=None, retry_policy=None, schema=None,
+                               browsers=DEFAULT_BROWSERS, contexts=DEFAULT_ASYNC_CONTEXTS):
+    """
+    상품 URL 목록을 컨텍스트 contexts개로 동시에 수집
+
+    Returns:
+        list: product_urls 순서의 상품 정보 딕셔너리 (실패/차단은 {})
+    """
+    schema = resolve_schema(schema)
+    async with ContextPool(browsers, contexts, headless=headless) as pool:
+        async def crawl(url):
+            if retry_policy is not None:
+                return await retry_policy.run_async(
+                    'products', url, crawl_product_detail_async,
+                    pool, url, page_guard=page_guard, raise_errors=True, schema=schema
+                )
+            return await crawl_product_detail_async(pool, url, page_guard=page_guard, schema=schema)
+
+        results = await _gather_in_order(product_urls, crawl)
+        pool.report()
+    return [result or {} for result in results]
+
+
+async def crawl_price_snapshot_async(pool, product_url, wait_time=5, page_guard=None, schema=None):
+    """crawl_price_snapshot의 비동기 버전 (가격 요소만 기다렸다가 해당 요소 HTML만 추출)"""
+    if product_url.startswith('/'):
+        product_url = 'https://brand.naver.com' + product_url
+    schema = resolve_schema(schema)
+    price_selectors = schema.selectors(schema.price_fields)
+
+    async with pool.page() as page:
+        await page.goto(product_url, wait_until=pool.wait_until)
+        try:
+            await page.wait_for_selector(price_selectors[0], state='attached', timeout=wait_time * 1000)
+        except playwright_api.TimeoutError:
+            print(f"[WARN] 가격 요소를 찾지 못했습니다: {product_url}")
+            if not page_usable(page_guard, product_url, await page.content(), 'prices'):
+                return None
+        fragment = await page.evaluate(PRICE_ONLY_FUNCTION, price_selectors) or ""
+    return extract_price_data(fragment, product_url, schema)
+
+
+async def crawl_prices_async(product_urls, headless=True, wait_time=5, page_guard=None, schema=None,
+                             browsers=DEFAULT_BROWSERS, contexts=DEFAULT_ASYNC_CONTEXTS):
+    """
+    가격/프로모션만 컨텍스트 contexts개로 동시에 수집 (이미지 등 차단, DOMContentLoaded 기준)
+
+    Returns:
+        list: 수집에 성공한 상품별 가격 정보 딕셔너리 (product_urls 순서)
+    """
+    schema = resolve_schema(schema)
+    async with ContextPool(browsers, contexts, headless=headless, lightweight=True) as pool:
+        async def crawl(url):
+            if page_guard is not None and not page_guard.allow(url, task='prices'):
+                return None
+            return await crawl_price_snapshot_async(pool, url, wait_time=wait_time, page_guard=page_guard,
+                                                    schema=schema)
+
+        results = await _gather_in_order(product_urls, crawl)
+        pool.report()
+    return [row for row in results if row]
+
+
+# ---------------------------------------------------------------
+# 리뷰
+# ---------------------------------------------------------------
+async def open_review_page_async(page, target_url, page_guard=None):
+    """open_review_page의 비동기 버전 (상품 페이지 → 리뷰 탭 → 최신순, 상품 제목 반환)"""
+    await page.goto(target_url)
+    await asyncio.sleep(3)
+    html_source = await page.content()
+    if not check_review_page(page_guard, target_url, html_source):
+        raise BlockedPageError(f"차단/없는 상품 페이지: {target_url}")
+    product_title = read_product_title(BeautifulSoup(html_source, 'html.parser'))
+
+    review_tab_clicked = False
+    for query in REVIEW_TAB_QUERIES:
+        review_tab = await page.query_selector(query)
+        if review_tab and await js_click(review_tab):
+            review_tab_clicked = True
+            print("[INFO] 리뷰 탭 클릭 완료.")
+            break
+    if not review_tab_clicked:
+        print("[WARN] 리뷰 탭을 찾을 수 없거나 클릭할 수 없습니다. 이미 리뷰 페이지일 수 있습니다.")
+        html_source = await page.content()
+        if "REVIEW" not in html_source and "리뷰" not in html_source:
+            print("[ERROR] 리뷰 섹션을 찾을 수 없습니다.")
+            return None
+    await asyncio.sleep(3)
+
+    latest_clicked = False
+    for query in LATEST_SORT_QUERIES:
+        latest_btn = await page.query_selector(query)
+        if latest_btn and await js_click(latest_btn):
+            latest_clicked = True
+            print("[INFO] 최신순 버튼 클릭 완료.")
+            break
+    if not latest_clicked:
+        for button in await page.query_selector_all('a[aria-selected="false"]'):
+            if '최신' in await button.inner_text() and await js_click(button):
+                latest_clicked = True
+                print("[INFO] 최신순 버튼 클릭 완료 (aria 속성).")
+                break
+    if not latest_clicked:
+        print("[WARN] 최신순 버튼 클릭 실패. 기본 정렬 순서로 진행합니다.")
+    await asyncio.sleep(3)
+    return product_title
+
+
+async def click_page_number_async(page, number):
+    """click_page_number의 비동기 버전"""
+    for element in await page.query_selector_all(f"xpath=//a[contains(text(), '{number}')]"):
+        if (await element.inner_text()).strip() == str(number):
+            return await js_click(element)
+    return False
+
+
+async def click_next_block_async(page):
+    """click_next_block의 비동기 버전"""
+    for button in await page.query_selector_all("xpath=//a[contains(text(), '다음')]"):
+        if await button.is_visible() and await button.is_enabled():
+            return await js_click(button)
+    return False
+
+
+async def go_to_next_page_async(page, page_num):
+    """go_to_next_page의 비동기 버전 (숫자 버튼 → 다음 버튼 → 페이지네이션 영역 순으로 시도)"""
+    if await click_page_number_async(page, page_num + 1):
+        return True
+    for xpath in NEXT_BUTTON_XPATHS:
+        for button in await page.query_selector_all(f"xpath={xpath}"):
+            if await button.is_visible() and await button.is_enabled() and await js_click(button):
+                return True
+    for selector in PAGINATION_SELECTORS:
+        area = await page.query_selector(selector)
+        if area is None:
+            continue
+        page_links = await area.query_selector_all('a')
+        for i, link in enumerate(page_links):
+            if (await link.inner_text()).strip() == str(page_num) and i + 1 < len(page_links):
+                return await js_click(page_links[i + 1])
+        break
+    return False
+
+
+async def jump_to_page_async(page, page_num):
+    """jump_to_page의 비동기 버전 ('다음'으로 10페이지 블록 단위 이동 후 번호 클릭)"""
+    current = 1
+    while current < page_num:
+        if (current - 1) // 10 < (page_num - 1) // 10:
+            if await click_next_block_async(page):
+                current = ((current - 1) // 10 + 1) * 10 + 1
+            elif await go_to_next_page_async(page, current):
+                current += 1
+            else:
+                return False
+        elif await click_page_number_async(page, page_num):
+            current = page_num
+        elif await go_to_next_page_async(page, current):
+            current += 1
+        else:
+            return False
+        await asyncio.sleep(1)
+    return True
+
+
+async def collect_review_pages_async(page, target_url, product_title, review_batch, first_page=1, last_page=None,
+                                     page_guard=None, stop_at_total=True):
+    """collect_review_pages의 비동기 버전 (종료 조건/차단 시 BlockedPageError 동일, 브라우저 재시작 없음)"""
+    page_num = first_page
+    consecutive_empty_pages = 0
+    max_consecutive_empty = 2
+    previous_page_html = ""
+
+    while True:
+        print(f"[INFO] {page_num} 페이지 수집 중...")
+        html_source = await page.content()
+        if html_source == previous_page_html:
+            print("[INFO] 이전 페이지와 동일한 내용입니다. 더 이상 새로운 페이지가 없는 것으로 판단됩니다.")
+            break
+        previous_page_html = html_source
+
+        if page_num > 1 and not check_review_page(page_guard, target_url, html_source):
+            raise BlockedPageError(f"{page_num} 페이지에서 차단/캡차 페이지 감지: {target_url}")
+        soup = BeautifulSoup(html_source, 'html.parser')
+        await asyncio.sleep(0.5)
+
+        reviews = find_review_blocks(soup)
+        if not reviews:
+            print("[INFO] 이 페이지에서 리뷰를 찾을 수 없습니다.")
+            consecutive_empty_pages += 1
+            if consecutive_empty_pages >= max_consecutive_empty:
+                print(f"[INFO] {max_consecutive_empty}페이지 연속으로 리뷰를 찾을 수 없어 크롤링을 종료합니다.")
+                break
+        else:
+            consecutive_empty_pages = 0
+
+        for r in reviews:
+            raw_review = extract_review_raw(r)
+            if raw_review:
+                review_batch.append(PRODUCT_TITLE=product_title, **raw_review)
+
+        if last_page and page_num >= last_page:
+            print(f"[INFO] {last_page} 페이지에 도달했습니다. 크롤링을 종료합니다.")
+            break
+
+        total_reviews = read_total_reviews(soup) if stop_at_total else None
+        if total_reviews:
+            current_reviews = len(review_batch)
+            print(f"[INFO] 총 리뷰 {total_reviews}개 중 {current_reviews}개 수집 완료 (진행률: {current_reviews/total_reviews*100:.1f}%)")
+            if current_reviews >= total_reviews:
+                print("[INFO] 모든 리뷰 수집 완료! 크롤링을 종료합니다.")
+                break
+
+        if not await go_to_next_page_async(page, page_num):
+            print("[INFO] 더 이상 다음 페이지를 찾을 수 없습니다. 크롤링을 종료합니다.")
+            break
+        await asyncio.sleep(3)
+        page_num += 1
+
+
+async def collect_reviews_async(target_url, max_pages=None, page_workers=1, page_guard=None, headless=True,
+                                browsers=1, pool=None):
+    """
+    상품 하나의 리뷰 수집 (페이지 구간마다 컨텍스트 하나, 모두 같은 이벤트 루프에서 진행)
+
+    Args:
+        pool (ContextPool, optional): 여러 상품에 걸쳐 열어 둔 풀 (BrowserSession.pool).
+            없으면 이 상품만을 위한 풀을 띄웠다가 닫음
+
+    Returns:
+        tuple: (상품 제목, ReviewBatch) - 리뷰 섹션을 찾지 못하면 (None, None)
+
+    Raises:
+        Exception: 페이지 구간 하나라도 실패하면 그 예외 (reviewcrawler.merge_range_batches)
+    """
+    if pool is None:
+        async with ContextPool(browsers, max(1, page_workers), headless=headless) as pool:
+            result = await collect_reviews_async(target_url, max_pages, page_workers, page_guard, pool=pool)
+            pool.report()
+        return result
+
+    # 첫 페이지가 슬롯 하나를 잡은 채 구간을 기다리므로 구간 수는 풀의 동시 컨텍스트 수를 넘지 않음
+    page_workers = min(page_workers, pool.contexts)
+    async with pool.page() as page:
+        product_title = await open_review_page_async(page, target_url, page_guard)
+        if product_title is None:
+            return None, None
+
+        review_batch = ReviewBatch(RAW_REVIEW_COLUMNS, RAW_CATEGORICAL_COLUMNS)
+        page_ranges = plan_page_ranges(await page.content(), page_workers, max_pages) if page_workers > 1 else None
+        if not page_ranges:
+            await collect_review_pages_async(page, target_url, product_title, review_batch,
+                                             last_page=max_pages, page_guard=page_guard)
+            return product_title, review_batch
+
+        async def collect_range(first_page, last_page):
+            batch = ReviewBatch(RAW_REVIEW_COLUMNS, RAW_CATEGORICAL_COLUMNS)
+            try:
+                async with pool.page() as range_page:
+                    if await open_review_page_async(range_page, target_url, page_guard) is None:
+                        raise ParseMissError(f"리뷰 섹션을 찾을 수 없습니다: {target_url}")
+                    if not await jump_to_page_async(range_page, first_page):
+                        raise ParseMissError(f"{first_page} 페이지로 이동하지 못했습니다: {target_url}")
+                    await collect_review_pages_async(range_page, target_url, product_title, batch, first_page,
+                                                     last_page, page_guard, stop_at_total=False)
+            except Exception as e:
+                return batch, e
+            return batch, None
+
+        first_page, last_page = page_ranges[0]
+        # 첫 구간이 실패해도 나머지 구간이 끝난 뒤 올림 (공유 루프에 구간 작업이 남지 않도록)
+        first_error, *results = await asyncio.gather(
+            collect_review_pages_async(page, target_url, product_title, review_batch, first_page, last_page,
+                                       page_guard, stop_at_total=False),
+            *(collect_range(first, last) for first, last in page_ranges[1:]),
+            return_exceptions=True
+        )
+        if first_error is not None:
+            raise first_error
+    merge_range_batches(review_batch, page_ranges[1:], results)
+    return product_title, review_batch
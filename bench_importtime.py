@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+"""
+CLI 모듈 임포트 시간 벤치마크 (python -X importtime 기반)
+
+각 모듈을 새 인터프리터에서 `python -X importtime -c "import <module>"`로 여러 번
+임포트하여 최소 누적 시간을 측정하고, 가장 느린 하위 임포트와 임포트 직후 이미
+로드되어 버린 무거운 의존성을 보고한다. 목표 예산을 넘으면 종료 코드 1을 반환한다.
+
+    python bench_importtime.py                 # 기본 예산 50ms
+    python bench_importtime.py --budget-ms 80 --repeat 10
+"""
+import argparse
+import subprocess
+import sys
+
+DEFAULT_MODULES = ["main", "urlcrawler", "reviewcrawler", "productcrawler_beauty", "productcrawler_loader"]
+
+# 임포트 시점에 로드되면 안 되는 무거운 의존성
+HEAVY_MODULES = ["pandas", "numpy", "selenium", "bs4", "webdriver_manager", "tqdm", "requests"]
+
+
+def parse_importtime(stderr_text):
+    """
+    -X importtime 출력 파싱
+
+    Returns:
+        list: (self_us, cumulative_us, depth, module_name) 튜플 목록
+    """
+    entries = []
+    for line in stderr_text.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            head, cumulative_us, raw_name = line.split("|", 2)
+            self_us = int(head.split(":", 1)[1])
+            cumulative_us = int(cumulative_us)
+        except (ValueError, IndexError):
+            continue
+        depth = (len(raw_name) - len(raw_name.lstrip(" "))) // 2
+        entries.append((self_us, cumulative_us, depth, raw_name.strip()))
+    return entries
+
+
+def module_subtree(entries, module):
+    """
+    대상 모듈의 임포트 트리만 추출 (인터프리터 기동 시의 site 등은 제외)
+
+    importtime은 하위 모듈을 부모보다 먼저 출력하므로, 대상 모듈 줄 직전의
+    최상위(depth 0) 줄 이후부터 대상 모듈 줄까지가 해당 모듈의 하위 트리다.
+    """
+    start = 0
+    for idx, (_, _, depth, name) in enumerate(entries):
+        if depth != 0:
+            continue
+        if name == module:
+            return entries[start:idx + 1]
+        start = idx + 1
+    return []
+
+
+def measure_module(module, repeat=5):
+    """
+    모듈 임포트 시간 측정 (repeat회 중 최소값)
+
+    Returns:
+        dict: total_us, entries(가장 빠른 회차의 상세), leaked(로드된 무거운 모듈)
+    """
+    best = None
+    check = (
+        "import sys; import {0}; "
+        "print(','.join(m for m in {1!r} if m in sys.modules))"
+    ).format(module, HEAVY_MODULES)
+
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", check],
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{module} 임포트 실패:\n{proc.stderr[-2000:]}")
+
+        entries = module_subtree(parse_importtime(proc.stderr), module)
+        total_us = entries[-1][1] if entries else 0
+        if best is None or total_us < best['total_us']:
+            leaked = [m for m in proc.stdout.strip().split(",") if m]
+            best = {'total_us': total_us, 'entries': entries, 'leaked': leaked}
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 CLI 임포트 시간 벤치마크')
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help='측정할 모듈 (기본값: 전체 CLI 모듈)')
+    parser.add_argument('--budget-ms', type=float, default=50.0, help='모듈당 임포트 시간 예산 (ms)')
+    parser.add_argument('--repeat', type=int, default=5, help='모듈당 반복 측정 횟수 (최소값 사용)')
+    parser.add_argument('--top', type=int, default=5, help='표시할 느린 하위 임포트 개수')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"임포트 시간 벤치마크 (예산: {args.budget_ms:.0f}ms, 반복: {args.repeat}회)")
+    print("=" * 60)
+
+    failed = []
+    for module in args.modules:
+        result = measure_module(module, repeat=args.repeat)
+        total_ms = result['total_us'] / 1000
+        over_budget = total_ms > args.budget_ms
+        status = "OVER" if over_budget else "OK"
+        print(f"\n[{status}] {module}: {total_ms:.1f}ms")
+
+        slowest = sorted(
+            result['entries'][:-1],
+            key=lambda e: e[1], reverse=True
+        )[:args.top]
+        for self_us, cumulative_us, _, name in slowest:
+            print(f"    {cumulative_us / 1000:8.1f}ms (self {self_us / 1000:6.1f}ms)  {name}")
+
+        if result['leaked']:
+            print(f"    [WARN] 임포트 시점에 로드된 무거운 모듈: {', '.join(result['leaked'])}")
+
+        if over_budget or result['leaked']:
+            failed.append(module)
+
+    print("\n" + "=" * 60)
+    if failed:
+        print(f"예산 초과 또는 무거운 의존성 로드: {', '.join(failed)}")
+        print("=" * 60)
+        sys.exit(1)
+    print("모든 모듈이 예산 내에서 임포트되었습니다.")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+리뷰 레코드 메모리 벤치마크 (10만 건당 최대 RSS)
+
+합성 리뷰 데이터로 두 방식의 최대 RSS 증가량을 각각 별도 프로세스에서 측정한다.
+  - lists: 기존 crawl_reviews 방식 (컬럼별 str 리스트 8개 + 상품명 반복 리스트 → DataFrame)
+  - batch: ReviewBatch (반복 문자열 인턴 + 코드 배열 → Categorical DataFrame)
+
+스크래핑 결과처럼 매 리뷰마다 새 str 객체가 만들어지도록 값을 복사해서 넣는다.
+
+    python bench_review_memory.py --reviews 100000
+"""
+import argparse
+import random
+import resource
+import subprocess
+import sys
+
+OPTION_SIZES = ["잘 맞아요", "잘 맞아요 (가슴)", "한 치수 크게 나왔어요", "한 치수 작게 나왔어요", ""]
+OPTION_COLORS = ["LIGHT BEIGE(네이버 단독)", "IVORY", "BLUE", "BLACK", ""]
+ITEM_NAMES = [f"COLOR: {c} / SIZE: {s}" for c in ["LIGHT BEIGE", "IVORY", "BLUE", "BLACK"] for s in ["44", "55", "66", "77"]]
+REVIEWER_INFOS = [f"키 {h}cm · 몸무게 {w}kg · 평소사이즈 {s}" for h in (155, 160, 165) for w in (45, 50, 55) for s in ("44", "55", "66")]
+PRODUCT_TITLE = "[네이버 단독][온앤온] 퍼프 슬리브 타이 블라우스 NEW4XB285"
+
+
+def copy_str(value):
+    """스크래핑처럼 매번 새 str 객체를 만든다 (인턴된 리터럴 공유 방지)"""
+    return (value + " ")[:-1]
+
+
+def generate_reviews(count, seed=0):
+    """합성 리뷰 생성기 (컬럼명 → 값 dict)"""
+    rng = random.Random(seed)
+    for idx in range(count):
+        yield {
+            'RD_WRITE_DT': copy_str(f"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"),
+            'RD_RATING': copy_str(str(rng.choice((5, 5, 5, 4, 4, 3, 2, 1)))),
+            'RD_ITEM_NM': copy_str(rng.choice(ITEM_NAMES)),
+            'RD_CONTENT': f"리뷰 {idx}번 " + "색상 너무 은은하니 예쁘고 얼굴도 환해보이구 좋아요~ " * rng.randint(1, 3),
+            'RD_OPTION_SIZE': copy_str(rng.choice(OPTION_SIZES)),
+            'RD_OPTION_COLOR': copy_str(rng.choice(OPTION_COLORS)),
+            'RD_REVIEWER_INFO': copy_str(rng.choice(REVIEWER_INFOS)),
+            'RD_REVIEW_IMAGES': "" if rng.random() < 0.7 else f"https://phinf.pstatic.net/review/{idx}.jpg",
+            'PRODUCT_TITLE': copy_str(PRODUCT_TITLE),
+        }
+
+
+def peak_rss_mb():
+    # Linux는 KB, macOS는 byte 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_lists(count):
+    import pandas as pd
+    columns = ['RD_WRITE_DT', 'RD_RATING', 'RD_ITEM_NM', 'RD_CONTENT', 'RD_OPTION_SIZE',
+               'RD_OPTION_COLOR', 'RD_REVIEWER_INFO', 'RD_REVIEW_IMAGES']
+    lists = {column: [] for column in columns}
+    product_title = None
+    for review in generate_reviews(count):
+        for column in columns:
+            lists[column].append(review[column])
+        product_title = review['PRODUCT_TITLE']
+    lists['PRODUCT_TITLE'] = [product_title] * count
+    return pd.DataFrame(lists)
+
+
+def run_batch(count):
+    from reviewrecord import ReviewBatch
+    batch = ReviewBatch()
+    for review in generate_reviews(count):
+        batch.append(**review)
+    return batch.to_dataframe()
+
+
+def measure(mode, count):
+    """현재 프로세스에서 한 방식을 실행하고 RSS 증가량 출력 (자식 프로세스용)"""
+    import pandas  # noqa: F401  (임포트 비용은 기준선에 포함)
+    baseline = peak_rss_mb()
+    df = run_lists(count) if mode == 'lists' else run_batch(count)
+    peak = peak_rss_mb()
+    frame_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
+    print(f"{peak - baseline:.1f} {frame_mb:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='리뷰 레코드 메모리 벤치마크')
+    parser.add_argument('--reviews', type=int, default=100000, help='합성 리뷰 수 (기본값: 100000)')
+    parser.add_argument('--mode', choices=['lists', 'batch'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        measure(args.mode, args.reviews)
+        return
+
+    print("=" * 60)
+    print(f"리뷰 레코드 메모리 벤치마크 ({args.reviews:,}건)")
+    print("=" * 60)
+
+    results = {}
+    for mode in ('lists', 'batch'):
+        proc = subprocess.run(
+            [sys.executable, __file__, '--mode', mode, '--reviews', str(args.reviews)],
+            capture_output=True, text=True, check=True
+        )
+        rss_mb, frame_mb = (float(v) for v in proc.stdout.split())
+        results[mode] = rss_mb
+        per_100k = rss_mb * 100000 / args.reviews
+        print(f"- {mode:5s}: 최대 RSS 증가 {rss_mb:7.1f}MB (10만 건당 {per_100k:7.1f}MB), DataFrame {frame_mb:7.1f}MB")
+
+    if results['lists'] > 0:
+        print(f"- 절감률: {(1 - results['batch'] / results['lists']) * 100:.1f}%")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+"""
+종단 간 크롤링 처리량 벤치마크 (로컬 모의 스토어프런트 대상)
+
+mockstorefront.py 서버를 같은 프로세스의 스레드로 띄우고, 실제 크롤러 함수를 그대로 돌린다.
+  - listing:  urlcrawler.scrape_multiple_pages (목록 페이지네이션)
+  - products: productcrawler_beauty.crawl_multiple_products (상세 + 펼쳐보기)
+  - reviews:  reviewcrawler.crawl_reviews (리뷰 탭 → 최신순 → 리뷰 페이지네이션)
+  - prices:   productcrawler_beauty.crawl_price_only (워커 드라이버 재사용)
+
+단계별 소요 시간, 분당 상품 수, 초당 리뷰 수, 서버가 측정한 페이지 응답 시간 p50/p95,
+주입된 오류/차단 응답 수를 출력한다. 크롤러 내부의 고정 대기(time.sleep)도 그대로
+포함되므로, 결과는 실제 실행과 같은 조건의 처리량이다 (Chrome/chromedriver 필요).
+
+--backend로 상품/리뷰/가격 단계를 Selenium 경로, 비동기(Playwright 컨텍스트) 경로 또는 둘 다로
+돌린다. 단계 동안 이 프로세스 트리(파이썬 + 모의 서버 + 드라이버/브라우저 전부)의 RSS를
+샘플링해 초당 페이지 수(서버가 응답한 상품/목록/리뷰 요청)를 최대 RSS GB로 나눈
+'페이지/초/GB'를 함께 출력한다 (psutil 필요).
+
+    python bench_storefront.py --products 20 --latency-ms 200 --jitter-ms 80
+    python bench_storefront.py --stages reviews --error-rate 0.02 --reviews-csv old/onnonreviews.csv
+    python bench_storefront.py --stages products prices --backend both --workers 4 --contexts 16
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from mockstorefront import PAGE_KINDS, add_server_arguments, build_server, percentile
+from drivergovernor import process_tree, psutil_available, tree_usage
+from driverfactory import BACKEND_ASYNC, BACKEND_SELENIUM, BACKENDS, DEFAULT_ASYNC_CONTEXTS
+
+STAGES = ['listing', 'products', 'reviews', 'prices']
+
+
+class TreeMemorySampler:
+    """이 프로세스와 모든 하위 프로세스(chromedriver, Chrome, Playwright 드라이버 등)의 RSS 합계 샘플링"""
+
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.peak_bytes = 0
+        self.baseline_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='bench-memory', daemon=True)
+
+    def _sample(self):
+        return tree_usage(process_tree(os.getpid()))[0]
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_bytes = max(self.peak_bytes, self._sample())
+
+    def __enter__(self):
+        self.baseline_bytes = self.peak_bytes = self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+
+def run_stage(server, name, func, backend=BACKEND_SELENIUM):
+    """
+    한 단계 실행 (서버 통계를 단계마다 초기화)
+
+    Returns:
+        dict: stage, backend, elapsed, items(func 반환값), stats(서버 통계 스냅샷),
+              peak_gb/baseline_gb(프로세스 트리 최대/시작 RSS, psutil이 없으면 None)
+    """
+    print(f"\n[INFO] ===== {name} 단계 시작 ({backend}) =====")
+    server.stats.reset()
+    sampler = TreeMemorySampler() if psutil_available() else None
+    start = time.perf_counter()
+    if sampler is not None:
+        with sampler:
+            items = func()
+    else:
+        items = func()
+    elapsed = time.perf_counter() - start
+    gb = 1024 ** 3
+    return {'stage': name, 'backend': backend, 'elapsed': elapsed, 'items': items, 'stats': server.stats.snapshot(),
+            'peak_gb': sampler.peak_bytes / gb if sampler else None,
+            'baseline_gb': sampler.baseline_bytes / gb if sampler else None}
+
+
+def served_pages(stats):
+    """서버가 응답한 페이지 수 (목록/상품/리뷰 조각)"""
+    return sum(len(stats['latencies'].get(kind, [])) for kind in PAGE_KINDS)
+
+
+def print_report(results):
+    print("\n" + "=" * 72)
+    print("종단 간 크롤링 벤치마크 결과")
+    print("=" * 72)
+    for result in results:
+        stage, elapsed, items, stats = result['stage'], result['elapsed'], result['items'], result['stats']
+        if stage == 'reviews':
+            rate = f"{items / elapsed:.2f} 리뷰/초" if elapsed > 0 else "-"
+            label = f"리뷰 {items}건"
+        else:
+            rate = f"{items / elapsed * 60:.1f} 상품/분" if elapsed > 0 else "-"
+            label = f"상품 {items}개"
+        print(f"\n[{stage}/{result['backend']}] {elapsed:.1f}초, {label} ({rate}), "
+              f"오류 주입 {stats['errors']}회, 차단 주입 {stats['blocked']}회")
+        pages = served_pages(stats)
+        pages_per_sec = pages / elapsed if elapsed > 0 else 0
+        if result['peak_gb']:
+            print(f"    페이지 {pages}개 ({pages_per_sec:.2f}/초), 최대 RSS {result['peak_gb']:.2f}GB "
+                  f"(시작 {result['baseline_gb']:.2f}GB) → {pages_per_sec / result['peak_gb']:.2f} 페이지/초/GB")
+        else:
+            print(f"    페이지 {pages}개 ({pages_per_sec:.2f}/초), psutil이 없어 메모리는 측정하지 않았습니다.")
+        for kind in PAGE_KINDS:
+            latencies = stats['latencies'].get(kind)
+            if not latencies:
+                continue
+            print(f"    {kind:<9} 요청 {len(latencies):>5}회  p50 {percentile(latencies, 50) * 1000:7.1f}ms"
+                  f"  p95 {percentile(latencies, 95) * 1000:7.1f}ms")
+    print_backend_comparison(results)
+    print("\n" + "=" * 72)
+
+
+def print_backend_comparison(results):
+    """같은 단계를 두 백엔드로 돌렸으면 페이지/초/GB 비교"""
+    by_stage = {}
+    for result in results:
+        if result['peak_gb']:
+            by_stage.setdefault(result['stage'], {})[result['backend']] = result
+    compared = {stage: runs for stage, runs in by_stage.items() if len(runs) > 1}
+    if not compared:
+        return
+    print("\n[백엔드 비교] 페이지/초/GB (최대 RSS 기준)")
+    for stage, runs in compared.items():
+        values = {backend: served_pages(run['stats']) / run['elapsed'] / run['peak_gb'] for backend, run in runs.items()}
+        ratio = values[BACKEND_ASYNC] / values[BACKEND_SELENIUM] if values.get(BACKEND_SELENIUM) else 0
+        summary = ", ".join(f"{backend} {value:.2f}" for backend, value in values.items())
+        print(f"    {stage:<9} {summary} (async/selenium {ratio:.1f}배)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모의 스토어프런트 대상 종단 간 크롤링 벤치마크')
+    add_server_arguments(parser)
+    parser.set_defaults(port=0, products=20, max_reviews=60)
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES, help='실행할 단계 (기본값: 전체)')
+    parser.add_argument('--limit', type=int, help='상품/리뷰/가격 단계에서 처리할 최대 상품 수')
+    parser.add_argument('--review-pages', type=int, help='상품당 최대 리뷰 페이지 수 (기본값: 전체)')
+    parser.add_argument('--workers', type=int, default=4, help='가격 단계 브라우저 수 (async는 Chromium 프로세스 수, 기본값: 4)')
+    parser.add_argument('--backend', choices=list(BACKENDS) + ['both'], default=BACKEND_SELENIUM,
+                        help='상품/리뷰/가격 단계의 브라우저 백엔드 (both면 두 백엔드를 차례로 실행, 기본값: selenium)')
+    parser.add_argument('--contexts', type=int, default=DEFAULT_ASYNC_CONTEXTS,
+                        help=f'비동기 백엔드의 동시 컨텍스트 수 (기본값: {DEFAULT_ASYNC_CONTEXTS})')
+    parser.add_argument('--page-workers', type=int, default=1,
+                        help='리뷰 단계에서 상품당 페이지 구간 수 (Selenium은 브라우저, async는 컨텍스트, 기본값: 1)')
+    parser.add_argument('--show-browser', action='store_true', help='상품/가격 단계 브라우저 표시 (기본: 헤드리스)')
+    args = parser.parse_args()
+
+    # 크롤러 모듈(pandas/selenium)은 서버 설정이 끝난 뒤에 로드
+    from urlcrawler import scrape_multiple_pages
+    from productcrawler_beauty import crawl_multiple_products, crawl_price_only
+    from reviewcrawler import crawl_reviews
+    from asyncbrowser import BrowserSession
+
+    server = build_server(args)
+    server.start_background()
+    total_reviews = sum(product['review_count'] for product in server.catalog.products.values())
+    print(f"[INFO] 모의 스토어프런트: {server.base_url} (상품 {len(server.catalog.products)}개, 리뷰 {total_reviews}개)")
+
+    headless = not args.show_browser
+    results = []
+    product_urls = [
+        f"{server.base_url}/{product['store']}/products/{product_id}"
+        for product_id, product in server.catalog.products.items()
+    ]
+
+    with tempfile.TemporaryDirectory(prefix='bench_storefront_') as work_dir:
+        try:
+            if 'listing' in args.stages:
+                def listing_stage():
+                    urls = []
+                    for idx, seed_url in enumerate(server.seed_urls()):
+                        result = scrape_multiple_pages(seed_url, max_page=999,
+                                                       output_csv=os.path.join(work_dir, f'urls_{idx}.csv'))
+                        urls.extend(result['urls'])
+                    return urls
+
+                result = run_stage(server, 'listing', listing_stage)
+                if result['items']:
+                    # 이후 단계는 목록에서 실제로 수집한 URL 사용
+                    product_urls = result['items']
+                result['items'] = len(result['items'])
+                results.append(result)
+
+            if args.limit:
+                product_urls = product_urls[:args.limit]
+
+            backends = list(BACKENDS) if args.backend == 'both' else [args.backend]
+            for backend in backends:
+                if 'products' in args.stages:
+                    result = run_stage(server, 'products', lambda: crawl_multiple_products(
+                        product_urls, output_prefix=os.path.join(work_dir, 'product_detail'), headless=headless,
+                        backend=backend, contexts=args.contexts
+                    ), backend)
+                    result['items'] = len(result['items'])
+                    results.append(result)
+
+                if 'reviews' in args.stages:
+                    def review_stage():
+                        count = 0
+                        session = BrowserSession(contexts=max(1, args.page_workers)).start() \
+                            if backend == BACKEND_ASYNC else None
+                        try:
+                            for idx, url in enumerate(product_urls):
+                                print(f"\n[{idx + 1}/{len(product_urls)}] 리뷰 수집: {url}")
+                                try:
+                                    df = crawl_reviews(url, max_pages=args.review_pages, return_df=True,
+                                                       page_workers=args.page_workers, backend=backend,
+                                                       async_session=session)
+                                except Exception as e:
+                                    print(f"[ERROR] 리뷰 수집 실패: {url} - {e}")
+                                    continue
+                                count += len(df) if df is not None else 0
+                        finally:
+                            if session is not None:
+                                session.close()
+                        return count
+
+                    results.append(run_stage(server, 'reviews', review_stage, backend))
+
+                if 'prices' in args.stages:
+                    result = run_stage(server, 'prices', lambda: crawl_price_only(
+                        product_urls, output_csv=os.path.join(work_dir, 'prices.csv'), headless=headless,
+                        workers=args.workers, backend=backend, contexts=args.contexts
+                    ), backend)
+                    result['items'] = len(result['items'])
+                    results.append(result)
+        except KeyboardInterrupt:
+            print("\n[WARN] 사용자에 의해 중단되었습니다. 완료된 단계만 보고합니다.")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    if not results:
+        print("[ERROR] 완료된 단계가 없습니다.")
+        sys.exit(1)
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+상품 단위 프로파일링 (가장 느린 / 메모리를 많이 쓴 상품 N개만 보관)
+
+실행이 느려졌을 때 어떤 상품/코드 경로 때문인지 보기 위해 crawl_reviews와
+crawl_product_detail이 상품마다 세션을 열고 닫는다(profiler 인자를 줄 때만).
+  - sample 모드: 별도 스레드가 interval마다 크롤링 스레드와 세션 중에 시작된 스레드
+    (page_workers>1일 때의 리뷰 구간 작업자 등)의 호출 스택을 샘플링해
+    collapsed stack(.folded, flamegraph.pl / speedscope에 바로 입력)으로 남긴다.
+  - cprofile 모드: cProfile 결과를 .pstats로 남긴다 (snakeviz, flameprof 등).
+    cProfile은 세션을 연 스레드만 기록하므로 작업자 스레드를 쓰는 실행은 sample 모드를 쓴다.
+  - trace_memory: tracemalloc으로 세션 중 최대 Python 힙과 세션 종료 시점에 남아 있는
+    할당 상위 줄(.memory.txt)을 기록한다.
+
+경과 시간 상위 keep개, 최대 힙 상위 keep개에 드는 세션만 결과를 보관하고 나머지는
+바로 버린다. report()가 output_dir에 파일과 summary.tsv를 쓴다.
+profiler를 넘기지 않으면 크롤러는 None 확인 한 번 외에 아무 비용도 들지 않는다.
+
+tracemalloc 최대값은 프로세스 전역이므로 세션이 동시에 열리지 않는(상품을 순서대로
+처리하는) 실행에서만 상품별 값이 정확하다.
+"""
+import heapq
+import itertools
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from reviewdedup import product_key
+
+MODE_SAMPLE = 'sample'
+MODE_CPROFILE = 'cprofile'
+PROFILE_MODES = (MODE_SAMPLE, MODE_CPROFILE)
+
+MEMORY_TOP_LINES = 25
+
+
+class StackSampler:
+    """
+    호출 스택을 주기적으로 샘플링 (collapsed stack 집계)
+
+    thread_id 스레드와 샘플러 생성 이후에 시작된 스레드를 모두 샘플링한다.
+    작업자 스레드의 스택은 같은 함수 경로끼리 합쳐진다.
+    """
+
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        # 세션 전부터 있던 다른 스레드(다른 세션, 서버 스레드 등)는 제외
+        self._ignored = set(sys._current_frames()) - {thread_id}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='crawlprofiler-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        self._ignored.add(threading.get_ident())
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id in self._ignored:
+                    continue
+                frames = []
+                while frame is not None:
+                    code = frame.f_code
+                    frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                if frames:
+                    self.stacks[';'.join(reversed(frames))] += 1
+
+    def folded(self):
+        """flamegraph 입력 형식 ('root;...;leaf 샘플 수' 줄 목록)"""
+        return [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+
+
+class ProfileSession:
+    """상품 하나의 프로파일링 세션"""
+
+    def __init__(self, task, item):
+        self.task = task
+        self.item = item
+        self.started = None
+        self.elapsed = None
+        self.peak_bytes = None
+        self.sampler = None
+        self.profile = None
+        self.memory_lines = None
+
+
+class CrawlProfiler:
+    """상품 단위 프로파일러 (느린/메모리 많이 쓴 상품 keep개씩만 보관)"""
+
+    def __init__(self, output_dir, keep=5, mode=MODE_SAMPLE, interval=0.005, trace_memory=True, memory_frames=1):
+        """
+        Args:
+            output_dir (str): 결과 디렉터리 (report 시 생성)
+            keep (int): 경과 시간/최대 힙 기준으로 각각 보관할 상품 수
+            mode (str): 'sample'(스택 샘플링) 또는 'cprofile'
+            interval (float): 샘플링 간격 (초, sample 모드)
+            trace_memory (bool): tracemalloc으로 메모리 기록
+            memory_frames (int): tracemalloc이 할당마다 저장할 스택 깊이
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"알 수 없는 프로파일링 모드: {mode} (가능: {', '.join(PROFILE_MODES)})")
+        self.output_dir = output_dir
+        self.keep = keep
+        self.mode = mode
+        self.interval = interval
+        self.trace_memory = trace_memory
+        self.memory_frames = memory_frames
+        self._slowest = []   # (elapsed, seq, session) 최소 힙
+        self._hungriest = []  # (peak_bytes, seq, session) 최소 힙
+        self._seq = itertools.count()
+        self._started_tracemalloc = False
+        self.sessions = 0
+
+    def start(self, task, item, workers=1):
+        """
+        세션 시작 (같은 스레드에서 stop 호출)
+
+        Args:
+            task (str): 작업 종류 ('reviews', 'products')
+            item (str): 상품 URL
+            workers (int): 세션 중 작업을 나눠 맡을 스레드 수 (cprofile 모드 경고용)
+        """
+        session = ProfileSession(task, item)
+        if self.mode == MODE_CPROFILE and workers > 1:
+            print(f"[WARN] cprofile 모드는 작업자 스레드 {workers}개의 실행을 기록하지 않습니다. "
+                  f"page_workers=1 또는 sample 모드를 사용하세요: {item}")
+        if self.trace_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.memory_frames)
+                self._started_tracemalloc = True
+            # 세션 시작 전 할당은 제외하고 이번 상품의 최대값만 측정
+            tracemalloc.clear_traces()
+            tracemalloc.reset_peak()
+        if self.mode == MODE_CPROFILE:
+            import cProfile
+            session.profile = cProfile.Profile()
+            session.profile.enable()
+        else:
+            session.sampler = StackSampler(threading.get_ident(), self.interval)
+            session.sampler.start()
+        session.started = time.perf_counter()
+        return session
+
+    def stop(self, session):
+        """세션 종료 후 상위 keep개에 들면 보관"""
+        session.elapsed = time.perf_counter() - session.started
+        if session.profile is not None:
+            session.profile.disable()
+        if session.sampler is not None:
+            session.sampler.stop()
+        self.sessions += 1
+
+        if self.trace_memory:
+            import tracemalloc
+            session.peak_bytes = tracemalloc.get_traced_memory()[1]
+
+        seq = next(self._seq)
+        kept_slow = self._push(self._slowest, session.elapsed, seq, session)
+        kept_memory = session.peak_bytes is not None and self._push(self._hungriest, session.peak_bytes, seq, session)
+        if kept_slow or kept_memory:
+            if self.trace_memory:
+                import tracemalloc
+                # 보관하는 세션만 스냅샷 통계 계산 (스냅샷 자체는 바로 버림)
+                statistics = tracemalloc.take_snapshot().statistics('lineno')[:MEMORY_TOP_LINES]
+                session.memory_lines = [str(stat) for stat in statistics]
+
+    def _push(self, heap, metric, seq, session):
+        """최소 힙에 넣고 keep개를 넘으면 가장 작은 항목 제거 (이번 세션이 남으면 True)"""
+        if len(heap) < self.keep:
+            heapq.heappush(heap, (metric, seq, session))
+            return True
+        if metric <= heap[0][0]:
+            return False
+        heapq.heapreplace(heap, (metric, seq, session))
+        return True
+
+    def _kept(self):
+        """보관 중인 세션 (경과 시간 내림차순, 중복 제거)"""
+        sessions = {}
+        for _, seq, session in self._slowest + self._hungriest:
+            sessions[seq] = session
+        return sorted(sessions.items(), key=lambda entry: entry[1].elapsed, reverse=True)
+
+    def report(self):
+        """
+        보관한 세션 결과를 output_dir에 저장
+
+        Returns:
+            list: 저장한 파일 경로 목록
+        """
+        if self._started_tracemalloc:
+            import tracemalloc
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+        kept = self._kept()
+        if not kept:
+            print("[INFO] 프로파일링된 상품이 없습니다.")
+            return []
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        slow_seqs = {seq for _, seq, _ in self._slowest}
+        memory_seqs = {seq for _, seq, _ in self._hungriest}
+        paths = []
+        summary_rows = []
+        for rank, (seq, session) in enumerate(kept, 1):
+            key = re.sub(r'\W+', '_', product_key(session.item)).strip('_')[-40:]
+            base = os.path.join(self.output_dir, f"{rank:02d}_{session.task}_{key}")
+            files = []
+            if session.sampler is not None:
+                with open(f"{base}.folded", 'w', encoding='utf-8') as f:
+                    f.write('\n'.join(session.sampler.folded()) + '\n')
+                files.append(f"{base}.folded")
+            if session.profile is not None:
+                session.profile.dump_stats(f"{base}.pstats")
+                files.append(f"{base}.pstats")
+            if session.memory_lines is not None:
+                with open(f"{base}.memory.txt", 'w', encoding='utf-8') as f:
+                    f.write(f"# {session.task} {session.item}\n")
+                    f.write(f"# 최대 Python 힙: {session.peak_bytes / 1024 / 1024:.1f}MB\n")
+                    f.write(f"# 세션 종료 시점에 남은 할당 상위 {MEMORY_TOP_LINES}줄\n")
+                    f.write('\n'.join(session.memory_lines) + '\n')
+                files.append(f"{base}.memory.txt")
+            paths.extend(files)
+            reasons = [name for name, seqs in (('slow', slow_seqs), ('memory', memory_seqs)) if seq in seqs]
+            peak_mb = f"{session.peak_bytes / 1024 / 1024:.1f}" if session.peak_bytes is not None else ''
+            summary_rows.append([str(rank), ','.join(reasons), session.task, session.item,
+                                 f"{session.elapsed:.2f}", peak_mb, ' '.join(os.path.basename(p) for p in files)])
+
+        summary_path = os.path.join(self.output_dir, 'summary.tsv')
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            f.write('\t'.join(['rank', 'reason', 'task', 'item', 'seconds', 'peak_mb', 'files']) + '\n')
+            for row in summary_rows:
+                f.write('\t'.join(row) + '\n')
+        paths.append(summary_path)
+
+        print(f"[INFO] 프로파일링: 상품 {self.sessions}개 중 {len(kept)}개 보관 → {self.output_dir}")
+        for row in summary_rows:
+            peak = f", 최대 힙 {row[5]}MB" if row[5] else ''
+            print(f"  {row[0]}. [{row[2]}] {row[4]}초{peak} ({row[1]}) {row[3]}")
+        return paths
@@ -0,0 +1,471 @@
+"""
+웹드라이버 생성 백엔드 (로컬 Chrome / 원격 WebDriver·Selenium Grid 세션 풀)
+
+세 크롤러(urlcrawler, reviewcrawler, productcrawler_beauty)는 ChromeOptions만 만들고
+create_driver()로 드라이버를 받으며, 다 쓴 드라이버는 release_driver()로 돌려준다.
+
+- 로컬(기본값): 지금처럼 chromedriver + Chrome을 이 머신에 띄우고 release 시 종료한다.
+- 원격: CRAWLER_REMOTE_URL(또는 --remote-url)이 있으면 webdriver.Remote로 Grid/standalone
+  서버에 세션을 만든다. RemoteSessionPool이
+    * 용량: 동시 세션을 max_sessions(지정하지 않으면 Grid /status의 chrome 슬롯 수)로
+      제한하고, 빈 슬롯이 없으면 Grid 신규 세션 큐에 쌓지 않고 여기서 기다린다.
+      노드를 추가하면 슬롯 수가 늘어나므로 파이썬 쪽 설정을 바꿀 필요가 없다.
+    * 재사용/친화성: release된 세션을 닫지 않고 보관했다가 같은 옵션의 요청에 다시 준다.
+      같은 affinity 키(스토어)로 쓰던 세션을 우선 배정해 쿠키/캐시를 이어 쓰고,
+      다른 키에 넘길 때는 쿠키를 지운다.
+    * Grid의 세션 유휴 타임아웃 전에 오래 쉰 세션을 닫고, 재사용 전 응답 확인에
+      실패한 세션은 버린다.
+
+로컬 standalone 서버로 확인하는 방법:
+
+    java -jar selenium-server-4.x.jar standalone --max-sessions 4
+    # 또는 docker run -d -p 4444:4444 --shm-size 2g selenium/standalone-chrome
+    python driverfactory.py status --remote-url http://localhost:4444
+    python driverfactory.py check --remote-url http://localhost:4444 --sessions 4
+    CRAWLER_REMOTE_URL=http://localhost:4444 python bench_storefront.py --host 0.0.0.0
+
+(docker 안의 브라우저가 모의 서버에 접근하려면 --host 0.0.0.0으로 띄우고
+ base URL 호스트를 host.docker.internal 등 컨테이너에서 보이는 주소로 바꿔야 한다.)
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from lazyimport import lazy_module, lazy_import
+from drivergovernor import mark_options
+
+webdriver = lazy_module("selenium.webdriver")
+Service = lazy_import("selenium.webdriver.chrome.service", "Service")
+ChromeDriverManager = lazy_import("webdriver_manager.chrome", "ChromeDriverManager")
+# http.client/email까지 끌고 오므로 Grid 상태 조회 시점에 로드
+urlopen = lazy_import("urllib.request", "urlopen")
+
+# 크롤링 함수의 브라우저 백엔드 ('async'는 asyncbrowser.py의 Playwright 컨텍스트 풀)
+BACKEND_SELENIUM = 'selenium'
+BACKEND_ASYNC = 'async'
+BACKENDS = (BACKEND_SELENIUM, BACKEND_ASYNC)
+DEFAULT_ASYNC_CONTEXTS = 16
+
+ENV_REMOTE_URL = 'CRAWLER_REMOTE_URL'
+ENV_REMOTE_SESSIONS = 'CRAWLER_REMOTE_SESSIONS'
+
+# Grid 기본 세션 유휴 타임아웃(300초)보다 짧게 잡아 만료된 세션을 재사용하지 않도록 함
+DEFAULT_IDLE_TIMEOUT = 240
+DEFAULT_ACQUIRE_TIMEOUT = 600
+STATUS_POLL_INTERVAL = 2.0
+
+
+class SessionCapacityError(TimeoutError):
+    """acquire_timeout 안에 원격 세션을 얻지 못함 (RetryPolicy는 timeout으로 분류)"""
+
+
+def grid_status(remote_url, browser_name='chrome', timeout=5):
+    """
+    Grid/standalone 서버의 /status 조회
+
+    Returns:
+        dict: ready, total(browser_name 슬롯 수), free(빈 슬롯 수), nodes
+              (조회 실패 시 None)
+    """
+    try:
+        with urlopen(remote_url.rstrip('/') + '/status', timeout=timeout) as response:
+            value = json.load(response).get('value', {})
+    except Exception as e:
+        print(f"[WARN] Grid 상태 조회 실패: {remote_url} - {e}")
+        return None
+
+    total = free = nodes = 0
+    for node in value.get('nodes', []):
+        if node.get('availability', 'UP') != 'UP':
+            continue
+        nodes += 1
+        for slot in node.get('slots', []):
+            stereotype = slot.get('stereotype') or {}
+            if stereotype.get('browserName', browser_name) != browser_name:
+                continue
+            total += 1
+            if not slot.get('session'):
+                free += 1
+    return {'ready': bool(value.get('ready')), 'total': total, 'free': free, 'nodes': nodes}
+
+
+def _options_key(options):
+    """옵션 지문 (같은 지문의 세션끼리만 재사용)"""
+    return json.dumps(options.to_capabilities(), sort_keys=True, default=str)
+
+
+class LocalDriverFactory:
+    """이 머신에 Chrome을 띄우는 기본 백엔드"""
+
+    remote = False
+
+    def describe(self):
+        return "로컬 Chrome"
+
+    def create(self, options, affinity=None):
+        mark_options(options)  # 고아 프로세스 정리용 소유 표시
+        service = Service(ChromeDriverManager().install())
+        return webdriver.Chrome(service=service, options=options)
+
+    def owns(self, driver):
+        return False
+
+    def release(self, driver):
+        driver.quit()
+
+    def discard(self, driver):
+        driver.quit()
+
+    def close(self):
+        pass
+
+    def report(self):
+        pass
+
+
+class _PooledSession:
+    __slots__ = ('driver', 'options_key', 'affinity', 'created', 'last_used', 'uses')
+
+    def __init__(self, driver, options_key, affinity):
+        self.driver = driver
+        self.options_key = options_key
+        self.affinity = affinity
+        self.created = time.time()
+        self.last_used = self.created
+        self.uses = 0
+
+
+class RemoteSessionPool:
+    """원격 WebDriver 세션 풀 (용량 제한, 세션 재사용, affinity 우선 배정)"""
+
+    remote = True
+
+    def __init__(self, remote_url, max_sessions=None, idle_timeout=DEFAULT_IDLE_TIMEOUT,
+                 acquire_timeout=DEFAULT_ACQUIRE_TIMEOUT, browser_name='chrome'):
+        """
+        Args:
+            remote_url (str): Grid/standalone 서버 주소 (예: http://localhost:4444)
+            max_sessions (int, optional): 이 프로세스의 최대 동시 세션 수
+                (None이면 Grid /status의 전체 슬롯 수를 매번 다시 읽어 사용)
+            idle_timeout (float): 이보다 오래 쉰 보관 세션은 닫음 (초)
+            acquire_timeout (float): 세션을 기다리는 최대 시간 (초)
+            browser_name (str): 용량 계산에 쓰는 Grid 슬롯 브라우저 이름
+        """
+        self.remote_url = remote_url.rstrip('/')
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.browser_name = browser_name
+        self._cond = threading.Condition()
+        self._idle = []
+        self._active = {}
+        self._creating = 0
+        self.created = 0
+        self.reused = 0
+        self.affinity_hits = 0
+        self.discarded = 0
+        self.waits = 0
+
+    def describe(self):
+        limit = self.max_sessions if self.max_sessions else 'Grid 슬롯 수'
+        return f"원격 WebDriver {self.remote_url} (최대 세션: {limit})"
+
+    def _in_use(self):
+        return len(self._idle) + len(self._active) + self._creating
+
+    def _has_capacity(self):
+        """새 세션을 만들어도 되는지 (락 안에서 호출)"""
+        if self.max_sessions and self._in_use() >= self.max_sessions:
+            return False
+        status = grid_status(self.remote_url, self.browser_name)
+        if status is None:
+            # 상태를 모르면 max_sessions 한도만 믿고 생성 시도 (실패는 생성 재시도에서 처리)
+            return True
+        if not self.max_sessions and self._in_use() >= status['total']:
+            return False
+        # 생성 중인 세션은 아직 Grid 슬롯에 잡히지 않음
+        return status['free'] - self._creating > 0
+
+    def _pick_idle(self, options_key, affinity):
+        """같은 옵션의 보관 세션 중 affinity가 같은 것을 우선, 없으면 가장 최근 것"""
+        candidates = [session for session in self._idle if session.options_key == options_key]
+        if not candidates:
+            return None
+        matched = [session for session in candidates if affinity is not None and session.affinity == affinity]
+        session = max(matched or candidates, key=lambda s: s.last_used)
+        self._idle.remove(session)
+        return session
+
+    def _expire_idle(self):
+        """오래 쉰 보관 세션을 목록에서 빼서 반환 (종료는 락 밖에서)"""
+        now = time.time()
+        expired = [session for session in self._idle if now - session.last_used > self.idle_timeout]
+        for session in expired:
+            self._idle.remove(session)
+        return expired
+
+    def _quit_sessions(self, sessions):
+        for session in sessions:
+            try:
+                session.driver.quit()
+            except Exception as e:
+                print(f"[WARN] 원격 세션 종료 중 오류: {e}")
+            self.discarded += 1
+
+    def create(self, options, affinity=None):
+        """
+        세션 하나 얻기 (보관 세션 재사용 → 용량이 있으면 새로 생성 → 없으면 대기)
+
+        Raises:
+            SessionCapacityError: acquire_timeout 안에 세션을 얻지 못함
+        """
+        options_key = _options_key(options)
+        deadline = time.time() + self.acquire_timeout
+        waited = False
+        while True:
+            start_new = False
+            with self._cond:
+                stale = self._expire_idle()
+                session = self._pick_idle(options_key, affinity)
+                if session is None and not stale:
+                    if self._has_capacity():
+                        self._creating += 1
+                        start_new = True
+                    elif self._idle:
+                        # 한도가 찼지만 다른 옵션의 보관 세션이 있으면 가장 오래된 것을 닫고 자리를 만듦
+                        stale = [min(self._idle, key=lambda s: s.last_used)]
+                        self._idle.remove(stale[0])
+                    else:
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            raise SessionCapacityError(
+                                f"{self.acquire_timeout}초 동안 원격 세션을 얻지 못했습니다: {self.remote_url}")
+                        if not waited:
+                            self.waits += 1
+                            waited = True
+                            print(f"[INFO] 원격 세션이 모두 사용 중입니다. 빈 슬롯을 기다립니다 ({self.remote_url})")
+                        # release 알림 또는 다른 클라이언트가 쓰던 Grid 슬롯이 비는 것을 주기적으로 확인
+                        self._cond.wait(timeout=min(remaining, STATUS_POLL_INTERVAL))
+                        continue
+            self._quit_sessions(stale)
+            if start_new:
+                return self._start_session(options, options_key, affinity, deadline)
+            if session is not None:
+                driver = self._reuse(session, affinity)
+                if driver is not None:
+                    return driver
+
+    def _reuse(self, session, affinity):
+        """보관 세션 응답 확인 후 배정 (죽은 세션이면 버리고 None)"""
+        try:
+            session.driver.current_url
+            if session.affinity != affinity:
+                # 다른 스토어에 넘기는 세션은 이전 쿠키를 지움
+                session.driver.delete_all_cookies()
+        except Exception:
+            self._quit_sessions([session])
+            with self._cond:
+                self._cond.notify()
+            return None
+        with self._cond:
+            if affinity is not None and session.affinity == affinity:
+                self.affinity_hits += 1
+            session.affinity = affinity
+            session.uses += 1
+            self._active[id(session.driver)] = session
+            self.reused += 1
+        return session.driver
+
+    def _start_session(self, options, options_key, affinity, deadline):
+        """새 원격 세션 생성 (Grid가 세션을 못 만들면 기한까지 재시도)"""
+        attempt = 0
+        try:
+            while True:
+                try:
+                    driver = webdriver.Remote(command_executor=self.remote_url, options=options)
+                    break
+                except Exception as e:
+                    attempt += 1
+                    delay = min(30, 2 ** attempt)
+                    if time.time() + delay > deadline:
+                        raise SessionCapacityError(f"원격 세션 생성 실패: {self.remote_url} - {e}") from e
+                    print(f"[WARN] 원격 세션 생성 실패 ({attempt}회), {delay}초 후 재시도: {e}")
+                    time.sleep(delay)
+        finally:
+            with self._cond:
+                self._creating -= 1
+                self._cond.notify()
+        session = _PooledSession(driver, options_key, affinity)
+        session.uses = 1
+        with self._cond:
+            self._active[id(driver)] = session
+            self.created += 1
+        return driver
+
+    def owns(self, driver):
+        with self._cond:
+            return id(driver) in self._active
+
+    def release(self, driver):
+        """세션을 닫지 않고 보관 (다음 create에서 재사용)"""
+        with self._cond:
+            session = self._active.pop(id(driver), None)
+            if session is None:
+                return
+            session.last_used = time.time()
+            self._idle.append(session)
+            self._cond.notify()
+
+    def discard(self, driver):
+        """세션 종료 후 슬롯 반환 (브라우저 재시작/오류 시)"""
+        with self._cond:
+            session = self._active.pop(id(driver), None)
+        if session is not None:
+            self._quit_sessions([session])
+        else:
+            driver.quit()
+        with self._cond:
+            self._cond.notify()
+
+    def close(self):
+        """보관 중인 세션 모두 종료 (사용 중인 세션은 각 크롤러가 반환)"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+        self._quit_sessions(idle)
+
+    def report(self):
+        print(f"[INFO] 원격 세션: 생성 {self.created}회, 재사용 {self.reused}회 (같은 스토어 {self.affinity_hits}회), "
+              f"종료 {self.discarded}회, 용량 대기 {self.waits}회")
+
+
+_factory = None
+_factory_lock = threading.Lock()
+
+
+def configure(remote_url=None, max_sessions=None, **pool_options):
+    """
+    드라이버 백엔드 설정 (remote_url이 없으면 로컬 Chrome)
+
+    Returns:
+        LocalDriverFactory 또는 RemoteSessionPool
+    """
+    global _factory
+    with _factory_lock:
+        if _factory is not None:
+            _factory.close()
+        if remote_url:
+            _factory = RemoteSessionPool(remote_url, max_sessions=max_sessions, **pool_options)
+            atexit.register(_factory.close)
+        else:
+            _factory = LocalDriverFactory()
+        return _factory
+
+
+def get_factory():
+    """설정된 백엔드 (configure 전이면 환경 변수 CRAWLER_REMOTE_URL/CRAWLER_REMOTE_SESSIONS로 설정)"""
+    if _factory is None:
+        max_sessions = os.environ.get(ENV_REMOTE_SESSIONS)
+        configure(os.environ.get(ENV_REMOTE_URL), int(max_sessions) if max_sessions else None)
+    return _factory
+
+
+def create_driver(options, affinity=None):
+    """
+    설정된 백엔드로 드라이버 생성
+
+    Args:
+        options: ChromeOptions (로컬이면 소유 표시 인자가 추가됨)
+        affinity (str, optional): 세션 친화성 키 (예: 스토어, 원격 풀에서만 사용)
+    """
+    return get_factory().create(options, affinity=affinity)
+
+
+def release_driver(driver):
+    """다 쓴 드라이버 반환 (원격 풀 세션은 보관, 그 외에는 종료)"""
+    factory = get_factory()
+    if factory.owns(driver):
+        factory.release(driver)
+    else:
+        driver.quit()
+
+
+def discard_driver(driver):
+    """드라이버를 재사용하지 않고 종료 (원격 풀 세션이면 슬롯 반환)"""
+    factory = get_factory()
+    if factory.owns(driver):
+        factory.discard(driver)
+    else:
+        driver.quit()
+
+
+def add_driver_arguments(parser):
+    """원격 WebDriver 설정 인자 (크롤러 CLI 공용)"""
+    parser.add_argument('--remote-url', type=str, default=os.environ.get(ENV_REMOTE_URL),
+                        help=f'원격 WebDriver/Selenium Grid 주소 (기본값: ${ENV_REMOTE_URL}, 없으면 로컬 Chrome)')
+    parser.add_argument('--remote-sessions', type=int, default=None,
+                        help='원격 최대 동시 세션 수 (기본값: Grid 슬롯 수)')
+
+
+def configure_from_args(args):
+    """add_driver_arguments로 받은 인자로 백엔드 설정"""
+    max_sessions = args.remote_sessions
+    if max_sessions is None and os.environ.get(ENV_REMOTE_SESSIONS):
+        max_sessions = int(os.environ[ENV_REMOTE_SESSIONS])
+    factory = configure(args.remote_url, max_sessions)
+    print(f"[INFO] 드라이버 백엔드: {factory.describe()}")
+    return factory
+
+
+def _check(factory, sessions, url, rounds):
+    """세션 sessions개를 동시에 열어 url을 열고 반환하기를 rounds번 반복"""
+    def worker(idx):
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless')
+        affinity = f"check-{idx}"
+        for round_idx in range(rounds):
+            start = time.perf_counter()
+            driver = create_driver(options, affinity=affinity)
+            acquired = time.perf_counter() - start
+            try:
+                driver.get(url)
+                title = driver.title
+            finally:
+                release_driver(driver)
+            print(f"  [세션 {idx}] {round_idx + 1}회차: 획득 {acquired:.2f}초, 제목 '{title}'")
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    factory.report()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='원격 WebDriver/Selenium Grid 상태 확인 및 세션 풀 점검')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    status_parser = subparsers.add_parser('status', help='Grid 슬롯 현황')
+    check_parser = subparsers.add_parser('check', help='세션 동시 생성/재사용 점검')
+    for sub in (status_parser, check_parser):
+        add_driver_arguments(sub)
+    check_parser.add_argument('--sessions', type=int, default=2, help='동시에 열 세션 수 (기본값: 2)')
+    check_parser.add_argument('--rounds', type=int, default=2, help='세션마다 반복할 횟수 (기본값: 2)')
+    check_parser.add_argument('--url', type=str, default='about:blank', help='열어 볼 URL (기본값: about:blank)')
+    args = parser.parse_args()
+
+    if not args.remote_url:
+        parser.error(f"--remote-url 또는 {ENV_REMOTE_URL}가 필요합니다.")
+
+    if args.command == 'status':
+        status = grid_status(args.remote_url)
+        if status is None:
+            raise SystemExit(1)
+        print(f"준비: {'예' if status['ready'] else '아니오'}, 노드 {status['nodes']}개, "
+              f"chrome 슬롯 {status['total']}개 중 {status['free']}개 사용 가능")
+    else:
+        factory = configure_from_args(args)
+        _check(factory, args.sessions, args.url, args.rounds)
+        factory.close()
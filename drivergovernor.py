@@ -0,0 +1,279 @@
+"""
+Chrome 드라이버 자원 관리 (RSS/CPU 감시, 브라우저 재시작, 고아 프로세스 정리)
+
+오래 도는 Selenium 세션은 Chrome 렌더러 메모리가 계속 불어난다. 또 crawl_reviews가
+try 블록 전에 예외로 빠지거나 워커가 강제 종료되면 chromedriver/Chrome 프로세스가
+남아 메모리를 잡아먹는다.
+
+- DriverGovernor: 드라이버(chromedriver) 프로세스 트리 전체의 RSS/CPU를 페이지 사이에
+  측정해 임계값을 넘으면 브라우저를 재시작하고, 워커별 최대 메모리를 기록한다.
+- reap_orphans: 소유 프로세스가 사라진 Chrome(OWNER_FLAG로 표시)과 그 Chrome을 띄운
+  chromedriver를 정리한다. 표시가 없는 프로세스(다른 사용자/도구의 드라이버)는 건드리지
+  않는다. 시작 시와 종료 시(atexit) 호출한다.
+
+psutil이 없으면 감시/정리는 조용히 꺼지고 크롤링은 그대로 진행된다.
+"""
+import atexit
+import os
+import time
+
+from lazyimport import lazy_module
+
+psutil = lazy_module("psutil")
+
+# 크롤러가 띄운 Chrome임을 표시하는 명령행 인자 (값은 소유 프로세스 pid)
+OWNER_FLAG = '--crawler-owner-pid'
+
+DRIVER_PROCESS_NAMES = ('chromedriver', 'chromedriver.exe')
+
+_exit_reaper_installed = False
+
+
+def psutil_available():
+    """psutil 설치 여부"""
+    try:
+        psutil.Process
+        return True
+    except ImportError:
+        return False
+
+
+def mark_options(options):
+    """ChromeOptions에 소유 표시 인자 추가 (고아 판별용) 및 종료 시 정리 등록"""
+    options.add_argument(f'{OWNER_FLAG}={os.getpid()}')
+    install_exit_reaper()
+
+
+def driver_pid(driver):
+    """드라이버의 chromedriver 프로세스 pid (알 수 없으면 None)"""
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    return getattr(process, 'pid', None)
+
+
+def process_tree(pid):
+    """pid와 모든 하위 프로세스 목록 (프로세스가 없으면 빈 리스트)"""
+    try:
+        root = psutil.Process(pid)
+        return [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+
+
+def tree_usage(processes):
+    """프로세스 목록의 (RSS 합계 bytes, CPU 시간 합계 초)"""
+    rss = 0
+    cpu = 0.0
+    for process in processes:
+        try:
+            rss += process.memory_info().rss
+            times = process.cpu_times()
+            cpu += times.user + times.system
+        except psutil.Error:
+            continue
+    return rss, cpu
+
+
+def kill_processes(processes, timeout=3):
+    """프로세스 종료 (terminate 후 남으면 kill)"""
+    alive = []
+    for process in processes:
+        try:
+            process.terminate()
+            alive.append(process)
+        except psutil.Error:
+            continue
+    _, alive = psutil.wait_procs(alive, timeout=timeout)
+    for process in alive:
+        try:
+            process.kill()
+        except psutil.Error:
+            continue
+    return len(processes)
+
+
+def _owner_pid(cmdline):
+    """Chrome 명령행에서 소유 프로세스 pid 추출"""
+    for arg in cmdline:
+        if arg.startswith(OWNER_FLAG + '='):
+            try:
+                return int(arg.split('=', 1)[1])
+            except ValueError:
+                return None
+    return None
+
+
+def _driver_parent(process):
+    """Chrome을 띄운 chromedriver 프로세스 (부모가 chromedriver가 아니면 None)"""
+    try:
+        parent = process.parent()
+        if parent is not None and parent.name().lower() in DRIVER_PROCESS_NAMES:
+            return parent
+    except psutil.Error:
+        pass
+    return None
+
+
+def reap_orphans(include_own=False):
+    """
+    고아 chromedriver/Chrome 프로세스 정리
+
+    OWNER_FLAG가 붙은 Chrome만 대상으로 하고, chromedriver는 그 Chrome의 부모일 때만 함께
+    종료한다 (공유 호스트/컨테이너에서 ppid가 1인 다른 드라이버를 죽이지 않도록).
+
+    Args:
+        include_own (bool): 현재 프로세스가 띄운 Chrome/chromedriver도 정리 (종료 시)
+
+    Returns:
+        int: 종료한 프로세스 수
+    """
+    if not psutil_available():
+        return 0
+
+    my_pid = os.getpid()
+    targets = {}
+    for process in psutil.process_iter(['pid', 'ppid', 'name', 'cmdline']):
+        info = process.info
+        name = (info.get('name') or '').lower()
+
+        # 현재 프로세스가 직접 띄운 chromedriver는 종료 시 표시와 관계없이 정리
+        if name in DRIVER_PROCESS_NAMES:
+            if include_own and info.get('ppid') == my_pid:
+                for member in process_tree(info['pid']):
+                    targets[member.pid] = member
+            continue
+
+        owner = _owner_pid(info.get('cmdline') or [])
+        if owner is None:
+            continue
+        if (owner == my_pid and include_own) or (owner != my_pid and not psutil.pid_exists(owner)):
+            driver = _driver_parent(process)
+            for member in process_tree(driver.pid if driver is not None else info['pid']):
+                targets[member.pid] = member
+
+    targets.pop(my_pid, None)
+    if targets:
+        kill_processes(list(targets.values()))
+        print(f"[INFO] 남아 있던 chromedriver/Chrome 프로세스 {len(targets)}개를 정리했습니다.")
+    return len(targets)
+
+
+def _reap_own_at_exit():
+    try:
+        reap_orphans(include_own=True)
+    except Exception:
+        pass
+
+
+def install_exit_reaper():
+    """프로세스 종료 시 이 프로세스가 띄운 드라이버를 정리하도록 한 번만 등록"""
+    global _exit_reaper_installed
+    if not _exit_reaper_installed:
+        atexit.register(_reap_own_at_exit)
+        _exit_reaper_installed = True
+
+
+class DriverGovernor:
+    """워커 하나의 드라이버 프로세스 트리 자원 감시 및 재시작"""
+
+    def __init__(self, name="worker", max_rss_mb=1536, max_cpu_percent=None):
+        """
+        Args:
+            name (str): 보고서에 쓰는 워커 이름
+            max_rss_mb (float, optional): 프로세스 트리 RSS 상한 (MB, None이면 검사 안 함)
+            max_cpu_percent (float, optional): 직전 측정 이후 평균 CPU 사용률 상한 (%, 코어 합)
+        """
+        self.name = name
+        self.max_rss_mb = max_rss_mb
+        self.max_cpu_percent = max_cpu_percent
+        self.enabled = psutil_available()
+        self.peak_rss_mb = 0.0
+        self.recycles = 0
+        self._pid = None
+        self._last_cpu = None
+
+    def attach(self, driver):
+        """감시할 드라이버 등록"""
+        self._pid = driver_pid(driver) if self.enabled else None
+        self._last_cpu = None
+        if self._pid:
+            self.sample()
+        return driver
+
+    def sample(self):
+        """
+        현재 프로세스 트리 자원 측정
+
+        Returns:
+            dict: rss_mb, cpu_percent (측정 불가면 None)
+        """
+        if not self._pid:
+            return None
+        rss, cpu_seconds = tree_usage(process_tree(self._pid))
+        now = time.time()
+        cpu_percent = None
+        if self._last_cpu is not None:
+            last_seconds, last_time = self._last_cpu
+            if now > last_time:
+                cpu_percent = (cpu_seconds - last_seconds) / (now - last_time) * 100
+        self._last_cpu = (cpu_seconds, now)
+
+        rss_mb = rss / (1024 * 1024)
+        self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+        return {'rss_mb': rss_mb, 'cpu_percent': cpu_percent}
+
+    def should_recycle(self):
+        """임계값을 넘었으면 True (페이지 사이에 호출)"""
+        usage = self.sample()
+        if not usage:
+            return False
+        if self.max_rss_mb and usage['rss_mb'] > self.max_rss_mb:
+            print(f"[INFO] [{self.name}] 브라우저 메모리 {usage['rss_mb']:.0f}MB > {self.max_rss_mb}MB, 재시작합니다.")
+            return True
+        if self.max_cpu_percent and usage['cpu_percent'] and usage['cpu_percent'] > self.max_cpu_percent:
+            print(f"[INFO] [{self.name}] 브라우저 CPU {usage['cpu_percent']:.0f}% > {self.max_cpu_percent}%, 재시작합니다.")
+            return True
+        return False
+
+    def quit(self, driver, reuse=True):
+        """
+        드라이버 종료 후 남은 하위 프로세스(렌더러 등)까지 정리
+
+        원격 세션 풀(driverfactory)의 세션은 reuse=True면 닫지 않고 풀에 반환한다.
+        """
+        # driverfactory가 이 모듈을 임포트하므로 순환을 피해 여기서 임포트
+        from driverfactory import release_driver, discard_driver
+
+        if driver is None:
+            return
+        leftovers = process_tree(self._pid) if self._pid else []
+        if self._pid:
+            self.sample()
+        try:
+            if reuse:
+                release_driver(driver)
+            else:
+                discard_driver(driver)
+        except Exception as e:
+            print(f"[WARN] [{self.name}] 드라이버 종료 중 오류: {e}")
+        if leftovers:
+            survivors = [process for process in leftovers if process.is_running()]
+            if survivors:
+                kill_processes(survivors)
+        self._pid = None
+
+    def recycle(self, driver, driver_factory):
+        """드라이버를 종료하고 driver_factory()로 새로 띄워 반환 (원격 세션도 재사용하지 않음)"""
+        self.quit(driver, reuse=False)
+        self.recycles += 1
+        return self.attach(driver_factory())
+
+    def report(self):
+        """워커별 최대 메모리/재시작 횟수 출력"""
+        if not self.enabled:
+            print(f"[INFO] [{self.name}] psutil이 없어 브라우저 자원 측정을 건너뛰었습니다.")
+            return
+        if not self.peak_rss_mb:
+            # 원격 세션(driverfactory)은 로컬 프로세스가 없어 측정하지 않음
+            print(f"[INFO] [{self.name}] 측정된 로컬 브라우저 프로세스가 없습니다. 재시작 {self.recycles}회")
+            return
+        print(f"[INFO] [{self.name}] 브라우저 최대 메모리 {self.peak_rss_mb:.0f}MB, 재시작 {self.recycles}회")
@@ -0,0 +1,72 @@
+"""
+무거운 의존성(pandas, selenium, bs4 등)을 첫 사용 시점까지 지연 로드하는 헬퍼
+
+크롤러 모듈을 임포트하는 것만으로 pandas/selenium 전체가 로드되지 않도록,
+모듈 최상단에서는 아래 프록시만 만들어 두고 실제 임포트는 처음 속성에 접근하거나
+호출할 때 수행한다.
+
+    pd = lazy_module("pandas")                          # pd.DataFrame(...) 시점에 임포트
+    BeautifulSoup = lazy_import("bs4", "BeautifulSoup")   # BeautifulSoup(...) 시점에 임포트
+"""
+import importlib
+import types
+
+
+class LazyModule(types.ModuleType):
+    """속성에 처음 접근할 때 실제 모듈을 임포트하는 모듈 프록시"""
+
+    def __getattr__(self, attr):
+        # 일반 속성 조회가 실패했을 때만 호출됨 → 실제 모듈 로드 후 결과를 캐시
+        module = importlib.import_module(self.__name__)
+        value = getattr(module, attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __repr__(self):
+        return f"<lazy module '{self.__name__}'>"
+
+
+class LazyAttribute:
+    """모듈 속성(클래스/함수)에 대한 지연 프록시 (호출 및 속성 접근 시 로드)"""
+
+    __slots__ = ('_module_name', '_attr', '_target')
+
+    def __init__(self, module_name, attr):
+        self._module_name = module_name
+        self._attr = attr
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            module = importlib.import_module(self._module_name)
+            self._target = getattr(module, self._attr)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __repr__(self):
+        return f"<lazy attribute '{self._module_name}.{self._attr}'>"
+
+
+def lazy_module(name):
+    """
+    첫 속성 접근 시 임포트되는 모듈 프록시 반환
+
+    Args:
+        name (str): 모듈 이름 (예: pandas, selenium.common.exceptions)
+    """
+    return LazyModule(name)
+
+
+def lazy_import(module_name, attr):
+    """
+    `from module_name import attr`의 지연 버전
+
+    except 절에는 실제 클래스가 필요하므로 예외 클래스는 lazy_module로 모듈을
+    감싼 뒤 `exceptions.TimeoutException`처럼 사용해야 한다.
+    """
+    return LazyAttribute(module_name, attr)
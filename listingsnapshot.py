@@ -0,0 +1,291 @@
+"""
+카테고리 목록 스냅샷 저장소 (페이지별 상품 순서 비교로 조기 종료 + 신규/삭제 델타)
+
+scrape_multiple_pages는 매 실행마다 카테고리의 모든 목록 페이지(main.py에서 max_page=999)를
+넘기며 대부분 같은 URL 집합을 다시 찾는다. ListingSnapshotStore는 시드 URL별로
+페이지마다 상품번호 순서를 저장해 두고, 이번에 읽은 페이지가 이전 스냅샷과 연속으로
+stop_after_matching 페이지 같으면 페이지 넘김을 멈춘다. 나머지 페이지는 이전 스냅샷을
+그대로 이어 붙이므로 전체 URL 목록은 유지되고, 새로 생긴/사라진 상품만 델타로 남는다.
+
+페이지 비교는 정렬이 고정되어 있어야 의미가 있으므로 시드 URL에 정렬 조건(쿼리 문자열)을
+포함해 쓴다. 스냅샷은 시드 URL 전체(쿼리 포함)를 키로 저장한다.
+
+목록 카드의 가격/리뷰 수/평점(listing_cards)도 함께 저장한다. 리뷰/상세 단계가 상품을
+처리하면 그때의 카드 값을 작업별로 기록(mark_processed)해 두고, 다음 실행에서 카드의
+가격과 리뷰 수가 그대로인 상품은 상품 페이지를 열지 않고 건너뛴다(unchanged).
+조기 종료로 이전 스냅샷에서 채운 페이지의 상품은 이번 카드 값이 없으므로 건너뛰지 않는다.
+
+    python listingsnapshot.py list
+    python listingsnapshot.py show "https://brand.naver.com/lucky567/category/50000803"
+"""
+import sqlite3
+import time
+
+from reviewdedup import product_key
+
+
+class ListingSnapshotStore:
+    """시드 URL별 목록 페이지 스냅샷"""
+
+    def __init__(self, db_path="listing_snapshots.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS listing_pages (
+                seed_url TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                product_ids TEXT NOT NULL,
+                captured_at TEXT NOT NULL,
+                PRIMARY KEY (seed_url, page)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS listing_cards (
+                product_id TEXT PRIMARY KEY,
+                url TEXT,
+                title TEXT,
+                price INTEGER,
+                review_count INTEGER,
+                rating REAL,
+                seen_at TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS processed_cards (
+                task TEXT NOT NULL,
+                product_id TEXT NOT NULL,
+                price INTEGER,
+                review_count INTEGER,
+                processed_at TEXT NOT NULL,
+                PRIMARY KEY (task, product_id)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS listing_products (
+                seed_url TEXT NOT NULL,
+                product_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                PRIMARY KEY (seed_url, product_id)
+            ) WITHOUT ROWID;
+        """)
+        self.conn.commit()
+
+    def pages(self, seed_url):
+        """이전 스냅샷 {페이지 번호: [상품번호, ...]}"""
+        return {
+            page: ids.split(' ') if ids else []
+            for page, ids in self.conn.execute(
+                "SELECT page, product_ids FROM listing_pages WHERE seed_url = ? ORDER BY page", (seed_url,)
+            )
+        }
+
+    def urls(self, seed_url):
+        """이전 스냅샷의 {상품번호: URL}"""
+        return dict(self.conn.execute(
+            "SELECT product_id, url FROM listing_products WHERE seed_url = ?", (seed_url,)
+        ).fetchall())
+
+    def save(self, seed_url, pages, urls, captured_at=None):
+        """
+        새 스냅샷 저장 (이전 스냅샷을 대체)
+
+        Args:
+            seed_url (str): 시드 URL
+            pages (dict): {페이지 번호: [상품번호, ...]}
+            urls (dict): {상품번호: URL} (pages에 나온 상품 전체)
+        """
+        captured_at = captured_at or time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            self.conn.execute("DELETE FROM listing_pages WHERE seed_url = ?", (seed_url,))
+            self.conn.executemany(
+                "INSERT INTO listing_pages (seed_url, page, product_ids, captured_at) VALUES (?, ?, ?, ?)",
+                ((seed_url, page, ' '.join(ids), captured_at) for page, ids in pages.items())
+            )
+            self.conn.executemany(
+                """INSERT INTO listing_products (seed_url, product_id, url, first_seen, last_seen)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(seed_url, product_id) DO UPDATE SET url = excluded.url, last_seen = excluded.last_seen""",
+                ((seed_url, product_id, url, captured_at, captured_at) for product_id, url in urls.items())
+            )
+            self.conn.execute(
+                "DELETE FROM listing_products WHERE seed_url = ? AND last_seen != ?", (seed_url, captured_at)
+            )
+
+    def record_cards(self, cards, seen_at=None):
+        """목록 카드 메타데이터 저장 ({상품번호: 카드 dict})"""
+        seen_at = seen_at or time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO listing_cards (product_id, url, title, price, review_count, rating, seen_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                ((product_id, card.get('url'), card.get('title'), card.get('price'), card.get('review_count'),
+                  card.get('rating'), seen_at) for product_id, card in cards.items())
+            )
+
+    def unchanged(self, task, cards):
+        """
+        마지막으로 task를 처리했을 때와 카드의 가격/리뷰 수가 같은 상품번호 집합
+
+        가격이나 리뷰 수를 카드에서 읽지 못한 상품은 변경 여부를 알 수 없으므로 포함하지 않는다.
+        """
+        known = {pid: card for pid, card in cards.items()
+                 if card.get('price') is not None and card.get('review_count') is not None}
+        unchanged = set()
+        ids = list(known)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            for product_id, price, review_count in self.conn.execute(
+                f"SELECT product_id, price, review_count FROM processed_cards WHERE task = ? AND product_id IN ({placeholders})",
+                [task] + chunk
+            ):
+                card = known[product_id]
+                if card['price'] == price and card['review_count'] == review_count:
+                    unchanged.add(product_id)
+        return unchanged
+
+    def mark_processed(self, task, cards, processed_at=None):
+        """task 처리를 마친 상품의 카드 값 기록 ({상품번호: 카드 dict})"""
+        processed_at = processed_at or time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            self.conn.executemany(
+                """INSERT OR REPLACE INTO processed_cards (task, product_id, price, review_count, processed_at)
+                   VALUES (?, ?, ?, ?, ?)""",
+                ((task, product_id, card.get('price'), card.get('review_count'), processed_at)
+                 for product_id, card in cards.items())
+            )
+
+    def seeds(self):
+        """저장된 시드 URL 목록 (시드 URL, 페이지 수, 상품 수, 저장 시각)"""
+        return self.conn.execute(
+            """SELECT p.seed_url, COUNT(*), (SELECT COUNT(*) FROM listing_products l WHERE l.seed_url = p.seed_url),
+                      MAX(p.captured_at)
+               FROM listing_pages p GROUP BY p.seed_url ORDER BY p.seed_url"""
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+class ListingDiff:
+    """
+    한 번의 목록 수집을 이전 스냅샷과 비교
+
+    scrape_multiple_pages가 페이지를 읽을 때마다 add_page를 호출하고, 반환값이 True이면
+    (연속 일치 페이지 수가 stop_after_matching에 도달) 페이지 넘김을 멈춘다.
+    finish()는 남은 페이지를 이전 스냅샷으로 채워 저장하고 델타를 반환한다.
+    """
+
+    def __init__(self, store, seed_url, stop_after_matching=2):
+        """
+        Args:
+            store (ListingSnapshotStore): 스냅샷 저장소
+            seed_url (str): 시드 URL (정렬 조건 포함)
+            stop_after_matching (int): 이전 스냅샷과 연속으로 이만큼 같으면 조기 종료 (0이면 끝까지)
+        """
+        self.store = store
+        self.seed_url = seed_url
+        self.stop_after_matching = stop_after_matching
+        self.previous_pages = store.pages(seed_url)
+        self.previous_urls = store.urls(seed_url)
+        self.pages = {}
+        self.urls = {}
+        self.cards = {}
+        self.matching_run = 0
+        self.stopped_early = False
+
+    def add_page(self, page, urls, cards=None):
+        """
+        이번에 읽은 페이지 등록
+
+        Args:
+            page (int): 페이지 번호
+            urls (list): 페이지에 나온 순서대로의 상품 URL
+            cards (list, optional): urls와 같은 순서의 카드 메타데이터 dict
+
+        Returns:
+            bool: 이전 스냅샷과 충분히 일치해 페이지 넘김을 멈춰도 되면 True
+        """
+        ids = []
+        for idx, url in enumerate(urls):
+            product_id = product_key(url)
+            if product_id not in self.urls:
+                self.urls[product_id] = url
+                if cards:
+                    self.cards[product_id] = cards[idx]
+            ids.append(product_id)
+        self.pages[page] = ids
+
+        if page in self.previous_pages and self.previous_pages[page] == ids:
+            self.matching_run += 1
+        else:
+            self.matching_run = 0
+
+        has_more = any(previous_page > page for previous_page in self.previous_pages)
+        if self.stop_after_matching and self.matching_run >= self.stop_after_matching and has_more:
+            self.stopped_early = True
+            return True
+        return False
+
+    def finish(self):
+        """
+        남은 페이지를 이전 스냅샷으로 채워 저장
+
+        Returns:
+            dict: urls(전체 상품 URL, 목록 순서), added/removed(상품번호 → URL),
+                  cards(이번에 읽은 카드, 상품번호 → dict), pages_read, pages_reused
+        """
+        pages = dict(self.pages)
+        urls = dict(self.urls)
+        pages_reused = 0
+        if self.stopped_early:
+            last_page = max(self.pages)
+            for page, ids in self.previous_pages.items():
+                if page > last_page:
+                    pages[page] = ids
+                    pages_reused += 1
+                    for product_id in ids:
+                        if product_id not in urls and product_id in self.previous_urls:
+                            urls[product_id] = self.previous_urls[product_id]
+
+        added = {pid: url for pid, url in urls.items() if pid not in self.previous_urls}
+        removed = {pid: url for pid, url in self.previous_urls.items() if pid not in urls}
+        self.store.save(self.seed_url, pages, urls)
+        if self.cards:
+            self.store.record_cards(self.cards)
+
+        ordered = []
+        for page in sorted(pages):
+            ordered.extend(urls[pid] for pid in pages[page] if pid in urls)
+        return {
+            'urls': list(dict.fromkeys(ordered)),
+            'added': added,
+            'removed': removed,
+            'cards': dict(self.cards),
+            'pages_read': len(self.pages),
+            'pages_reused': pages_reused,
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='카테고리 목록 스냅샷 조회')
+    parser.add_argument('--db', type=str, default='listing_snapshots.db', help='스냅샷 DB (기본값: listing_snapshots.db)')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('list', help='저장된 시드 URL 목록')
+    show_parser = subparsers.add_parser('show', help='시드 URL의 페이지별 상품번호')
+    show_parser.add_argument('seed_url', help='시드 URL')
+
+    args = parser.parse_args()
+    store = ListingSnapshotStore(args.db)
+
+    if args.command == 'list':
+        for seed_url, page_count, product_count, captured_at in store.seeds():
+            print(f"{captured_at}\t{page_count}페이지\t{product_count}개\t{seed_url}")
+    elif args.command == 'show':
+        for page, ids in store.pages(args.seed_url).items():
+            print(f"[페이지 {page}] {len(ids)}개: {' '.join(ids)}")
+    else:
+        parser.print_help()
+
+    store.close()
@@ -2,11 +2,35 @@
 import os
 import time
 import csv
-from tqdm import tqdm
-from urlcrawler import scrape_multiple_pages
-from reviewcrawler import crawl_reviews
+from lazyimport import lazy_import, lazy_module
+from reviewdedup import ReviewDedupIndex, product_key
 from productcrawler_loader import get_available_crawlers, load_crawler, get_crawler_functions
 
+# 크롤러와 부가 기능 모듈은 선택한 모드에서 처음 쓸 때 로드 (CLI 기동 시간 예산 유지)
+scrape_multiple_pages = lazy_import("urlcrawler", "scrape_multiple_pages")
+crawl_reviews = lazy_import("reviewcrawler", "crawl_reviews")
+collect_media_urls = lazy_import("mediadownloader", "collect_media_urls")
+download_media = lazy_import("mediadownloader", "download_media")
+ListingSnapshotStore = lazy_import("listingsnapshot", "ListingSnapshotStore")
+ProductChangeTracker = lazy_import("productchanges", "ProductChangeTracker")
+ProductGraph = lazy_import("productgraph", "ProductGraph")
+ReviewAggregateStore = lazy_import("reviewaggregates", "ReviewAggregateStore")
+ReviewSearchIndex = lazy_import("reviewsearch", "ReviewSearchIndex")
+DriverGovernor = lazy_import("drivergovernor", "DriverGovernor")
+reap_orphans = lazy_import("drivergovernor", "reap_orphans")
+PageGuard = lazy_import("pageguard", "PageGuard")
+QuarantineStore = lazy_import("pageguard", "QuarantineStore")
+RetryPolicy = lazy_import("retrypolicy", "RetryPolicy")
+DeadLetterLog = lazy_import("retrypolicy", "DeadLetterLog")
+CrawlProfiler = lazy_import("crawlprofiler", "CrawlProfiler")
+# 백엔드 이름 상수는 프록시로 감쌀 수 없으므로 모듈째 지연 로드
+driverfactory = lazy_module("driverfactory")
+
+# tqdm은 리뷰 수집 단계에서만 필요하므로 지연 로드
+tqdm = lazy_import("tqdm", "tqdm")
+# 비동기 백엔드(playwright)는 선택했을 때만 로드
+asyncbrowser = lazy_module("asyncbrowser")
+
 def get_user_input(prompt, options=None, default=None):
     """사용자 입력을 받는 함수"""
     if options:
@@ -49,6 +73,18 @@ def main():
     print("네이버 스마트스토어 크롤러 (대화형)")
     print("=" * 50)
     
+    # 이전 실행에서 남은 chromedriver/Chrome 정리 (종료 시 정리는 atexit로 등록됨)
+    reap_orphans()
+    # 브라우저 백엔드: 환경 변수 CRAWLER_REMOTE_URL이 있으면 원격 WebDriver/Selenium Grid 세션 풀
+    driver_backend = driverfactory.get_factory()
+    print(f"[INFO] 드라이버 백엔드: {driver_backend.describe()} ({driverfactory.ENV_REMOTE_URL}로 변경)")
+    # 차단/캡차 감지 + 스토어별 서킷 브레이커 (리뷰/상품/가격 단계가 공유, 차단된 URL은 격리)
+    page_guard = PageGuard(quarantine=QuarantineStore("quarantine.db"))
+    # 오류 분류별 재시도, 끝내 실패한 항목은 dead_letter.jsonl에 기록
+    dead_letter = DeadLetterLog("dead_letter.jsonl")
+    # 성공한 URL은 dead letter와 격리 DB에서 함께 제거
+    retry_policy = RetryPolicy(dead_letter, quarantine=page_guard.quarantine)
+    
     # 사용 가능한 크롤러 목록 가져오기
     available_crawlers = get_available_crawlers()
     
@@ -63,21 +99,23 @@ def main():
     print("2. 상품 정보만 수집")
     print("3. 리뷰와 상품 정보 모두 수집")
     print("4. 단일 상품 상세 정보만 수집")
+    print("5. 상품 가격/프로모션만 빠르게 갱신 (가격 모니터링)")
     
-    mode_choice = get_user_input("작업 번호를 선택하세요", ["1", "2", "3", "4"], "3")
+    mode_choice = get_user_input("작업 번호를 선택하세요", ["1", "2", "3", "4", "5"], "3")
     
     mode_mapping = {
         "1": "reviews",
         "2": "products",
         "3": "both",
-        "4": "productinfo"
+        "4": "productinfo",
+        "5": "prices"
     }
     
     mode = mode_mapping[mode_choice]
     
     # 상품 크롤러 선택 (상품 정보 수집 시)
     selected_crawler = None
-    if mode in ["products", "both", "productinfo"]:
+    if mode in ["products", "both", "productinfo", "prices"]:
         print("\n어떤 상품 카테고리를 크롤링하시겠습니까?")
         for idx, crawler in enumerate(available_crawlers, 1):
             print(f"{idx}. {crawler['category']}")
@@ -102,6 +140,29 @@ def main():
         
         crawl_product_detail = crawler_functions['crawl_product_detail']
         crawl_multiple_products = crawler_functions['crawl_multiple_products']
+        crawl_price_only = crawler_functions.get('crawl_price_only')
+        if mode == "prices" and not crawl_price_only:
+            print(f"[ERROR] {selected_crawler['category']} 크롤러는 가격 갱신 모드를 지원하지 않습니다.")
+            return
+    
+    # 이전 실행에서 재시도를 소진한 항목만 다시 처리할지 선택
+    retry_tasks = {'reviews': ['reviews'], 'products': ['products'], 'both': ['reviews', 'products']}.get(mode, [])
+    # 격리된 URL은 보류 시간(release_after)이 지난 것만 포함, 보류 중인 URL은 dead letter에 있어도 제외
+    retry_items = {}
+    held_count = 0
+    for task in retry_tasks:
+        held = page_guard.quarantine.held(task)
+        candidates = dead_letter.items(task) + [row[0] for row in page_guard.quarantine.due(task)]
+        retry_items[task] = [item for item in dict.fromkeys(candidates) if item not in held]
+        held_count += len(held)
+    retry_only = False
+    retry_count = sum(len(items) for items in retry_items.values())
+    if retry_count:
+        held_note = f", 격리 보류 중 {held_count}개 제외" if held_count else ""
+        retry_only = get_yes_no_input(
+            f"이전 실행에서 실패했거나 격리가 풀린 항목이 {retry_count}개 있습니다{held_note}. "
+            "이 항목만 다시 처리할까요? (dead_letter.jsonl, quarantine.db)", "n"
+        )
     
     # URL 입력
     url_prompt = "크롤링할 URL을 입력하세요"
@@ -110,7 +171,7 @@ def main():
     else:
         url_prompt += " (카테고리 또는 검색 결과 URL)"
     
-    url = get_user_input(url_prompt)
+    url = get_user_input(url_prompt) if not retry_only else "(실패 항목 재시도)"
     
     # 출력 파일명 입력
     output_prefix = get_user_input("저장할 파일명을 입력하세요 (확장자 제외)", default="navershopping_data")
@@ -120,17 +181,64 @@ def main():
     
     # URL 저장 여부 선택
     save_urls = False
-    if mode != "productinfo":
+    if mode != "productinfo" and not retry_only:
         save_urls = get_yes_no_input("수집한 URL 목록을 별도 파일로 저장할까요?", "n")
+
+    # 실행 간 리뷰 중복 제거 색인 사용 여부
+    use_dedup_index = False
+    if mode in ["reviews", "both"]:
+        use_dedup_index = get_yes_no_input("이전 실행에서 수집한 리뷰를 제외할까요? (review_fingerprints.db)", "y")
+
+    # 리뷰가 아주 많은 상품은 페이지 구간을 나눠 여러 브라우저로 동시에 수집
+    page_workers = 1
+    if mode in ["reviews", "both"]:
+        page_workers = int(get_user_input("리뷰가 많은 상품을 몇 개 브라우저로 나눠 수집할까요? (1이면 나누지 않음)", default="1"))
+
+    # 브라우저 백엔드 (async: 한 이벤트 루프가 Playwright 컨텍스트 여러 개를 동시에 진행)
+    backend = driverfactory.BACKEND_SELENIUM
+    if mode in ["reviews", "products", "both", "prices"]:
+        backend = get_user_input("브라우저 백엔드를 선택하세요 (async는 playwright 필요)", list(driverfactory.BACKENDS), driverfactory.BACKEND_SELENIUM)
+
+    # 상품 변경 감지 사용 여부 (가격 이력은 항상 기록)
+    changed_only = False
+    if mode in ["products", "both"]:
+        changed_only = get_yes_no_input("이전 실행 대비 변경된 상품만 저장할까요? (product_changes.db)", "n")
+
+    # 목록 카드의 가격/리뷰 수가 지난 처리 이후 그대로인 상품은 상품 페이지를 열지 않음
+    skip_unchanged = False
+    if mode in ["reviews", "products", "both"] and not retry_only:
+        skip_unchanged = get_yes_no_input("목록의 가격/리뷰 수가 지난 실행 이후 그대로인 상품은 건너뛸까요? (listing_snapshots.db)", "y")
+
+    # 리뷰/상품 이미지 다운로드 여부
+    download_images = False
+    if mode != "prices":
+        download_images = get_yes_no_input("리뷰/상품 이미지를 함께 다운로드할까요?", "n")
+
+    # 가장 느린/메모리를 많이 쓴 상품만 스택·메모리 프로파일 보관
+    profile_run = False
+    if mode in ["reviews", "products", "both"]:
+        profile_run = get_yes_no_input("가장 느린 상품의 스택/메모리 프로파일을 남길까요? (<파일명>_profiles/)", "n")
     
     print("\n입력 정보 확인:")
     print(f"- 작업 모드: {mode}")
-    if mode in ["products", "both", "productinfo"]:
+    if mode in ["products", "both", "productinfo", "prices"]:
         print(f"- 상품 카테고리: {selected_crawler['category']}")
+    if mode in ["reviews", "both"]:
+        print(f"- 리뷰 중복 색인: {'사용' if use_dedup_index else '사용 안 함'}")
+        print(f"- 상품당 리뷰 수집 브라우저: {page_workers}개")
+    if mode in ["reviews", "products", "both", "prices"]:
+        print(f"- 브라우저 백엔드: {backend}")
+    if mode in ["products", "both"]:
+        print(f"- 변경된 상품만 저장: {'예' if changed_only else '아니오'}")
+    if mode in ["reviews", "products", "both"] and not retry_only:
+        print(f"- 목록 정보가 그대로인 상품 건너뛰기: {'예' if skip_unchanged else '아니오'}")
     print(f"- URL: {url}")
     print(f"- 파일명: {output_prefix}")
     print(f"- 브라우저 표시: 활성화")
     print(f"- URL 저장: {'예' if save_urls else '아니오'}")
+    print(f"- 이미지 다운로드: {'예' if download_images else '아니오'}")
+    if mode in ["reviews", "products", "both"]:
+        print(f"- 느린 상품 프로파일링: {'예' if profile_run else '아니오'}")
     
     if not get_yes_no_input("\n위 정보로 크롤링을 시작할까요?", "y"):
         print("크롤링이 취소되었습니다.")
@@ -154,43 +262,66 @@ def main():
         print(f"- 총 소요 시간: {total_time:.2f}초")
         print(f"- 결과 저장 위치: {output_prefix}.csv, {output_prefix}.json")
         print("=" * 50)
-        return
 
-    # STEP 1. 상품 URL 수집 (productinfo 모드가 아닐 경우)
-    print("\n[STEP 1] 상품 URL 수집 시작")
-    
-    # 모든 상품 페이지를 수집하기 위해 아주 큰 값 설정
-    max_page = 999  
-    url_output = "product_urls.csv" if save_urls else "temp_urls.csv"
-
-    scrape_multiple_pages(
-        page_url=url,
-        max_page=max_page,
-        output_csv=url_output
-    )
-
-    # CSV 파일에서 수집한 상품 URL 읽어오기
-    product_urls = []
-    try:
-        with open(url_output, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            next(reader)  # 헤더 건너뛰기
-            for row in reader:
-                url = row[0]
-                # brand.naver.com을 smartstore.naver.com으로 변경
-                if 'brand.naver.com' in url:
-                    url = url.replace('brand.naver.com', 'smartstore.naver.com')
-                product_urls.append(url)
-    except Exception as e:
-        print(f"[ERROR] URL 파일 읽기 실패: {e}")
-
-    if not save_urls and os.path.exists("temp_urls.csv"):
-        os.remove("temp_urls.csv")
-
-    if not product_urls:
-        print("[ERROR] 상품 URL 수집에 실패했습니다.")
+        if download_images:
+            print("\n[STEP 2] 상품 이미지 다운로드 시작")
+            download_media(collect_media_urls(products_json=f"{output_prefix}.json"), output_dir=f"{output_prefix}_media")
         return
 
+    # 목록 카드 메타데이터 (상품번호 → 가격/리뷰 수/평점)
+    listing_cards = {}
+    snapshot_store = None
+    profiler = CrawlProfiler(f"{output_prefix}_profiles") if profile_run else None
+
+    if retry_only:
+        # 실패 항목 재시도: URL 수집 없이 dead letter/격리 해제 시각이 지난 URL만 처리
+        print("\n[STEP 1] 실패 항목 불러오기 (URL 수집 생략)")
+        product_urls = list(dict.fromkeys(retry_items.get('reviews', []) + retry_items.get('products', [])))
+    else:
+        # STEP 1. 상품 URL 수집 (productinfo 모드가 아닐 경우)
+        print("\n[STEP 1] 상품 URL 수집 시작")
+    
+        # 모든 상품 페이지를 수집하기 위해 아주 큰 값 설정
+        max_page = 999  
+        url_output = "product_urls.csv" if save_urls else "temp_urls.csv"
+
+        # 이전 실행의 목록 스냅샷과 연속 2페이지가 같으면 나머지 페이지는 스냅샷으로 대체
+        snapshot_store = ListingSnapshotStore("listing_snapshots.db")
+        listing = scrape_multiple_pages(
+            page_url=url,
+            max_page=max_page,
+            output_csv=url_output,
+            snapshot_store=snapshot_store,
+            stop_after_matching=2
+        )
+        listing_cards = listing['cards']
+        if listing['added'] or listing['removed']:
+            print(f"[INFO] 목록 변경: 신규 상품 {len(listing['added'])}개, 사라진 상품 {len(listing['removed'])}개")
+
+        # CSV 파일에서 수집한 상품 URL 읽어오기
+        product_urls = []
+        try:
+            with open(url_output, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                next(reader)  # 헤더 건너뛰기
+                for row in reader:
+                    url = row[0]
+                    # brand.naver.com을 smartstore.naver.com으로 변경
+                    if 'brand.naver.com' in url:
+                        url = url.replace('brand.naver.com', 'smartstore.naver.com')
+                    product_urls.append(url)
+        except Exception as e:
+            print(f"[ERROR] URL 파일 읽기 실패: {e}")
+
+        if not save_urls:
+            for temp_file in ("temp_urls.csv", "temp_urls_delta.csv"):
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+
+        if not product_urls:
+            print("[ERROR] 상품 URL 수집에 실패했습니다.")
+            return
+
     url_time = time.time() - start_time
     print(f"URL 수집 완료: {len(product_urls)}개 상품 URL 수집 (소요 시간: {url_time:.2f}초)")
     
@@ -203,11 +334,26 @@ def main():
             product_urls = product_urls[:max_urls]
             print(f"URL을 {max_urls}개로 제한합니다.")
 
+    # 작업별 처리 대상 (실패 항목 재시도 시에는 해당 작업에서 실패한 URL만)
+    review_urls = [u for u in product_urls if u in retry_items.get('reviews', [])] if retry_only else product_urls
+    detail_urls = [u for u in product_urls if u in retry_items.get('products', [])] if retry_only else product_urls
+
+    # 지난 처리 이후 카드의 가격/리뷰 수가 바뀌지 않은 상품 제외
+    if skip_unchanged and listing_cards:
+        unchanged_reviews = snapshot_store.unchanged('reviews', listing_cards)
+        unchanged_details = snapshot_store.unchanged('products', listing_cards)
+        review_urls = [u for u in review_urls if product_key(u) not in unchanged_reviews]
+        detail_urls = [u for u in detail_urls if product_key(u) not in unchanged_details]
+        if mode in ['reviews', 'both']:
+            print(f"[INFO] 목록 정보가 그대로인 상품 {len(product_urls) - len(review_urls)}개의 리뷰 수집을 건너뜁니다.")
+        if mode in ['products', 'both']:
+            print(f"[INFO] 목록 정보가 그대로인 상품 {len(product_urls) - len(detail_urls)}개의 상세 수집을 건너뜁니다.")
+
     # 리뷰 수집
     total_reviews = 0
     if mode in ['reviews', 'both']:
         # STEP 2. 각 상품별 리뷰 수집
-        print(f"\n[STEP 2] 각 상품별 리뷰 수집 시작 (총 {len(product_urls)}개 상품)")
+        print(f"\n[STEP 2] 각 상품별 리뷰 수집 시작 (총 {len(review_urls)}개 상품)")
         review_start_time = time.time()
 
         # 리뷰 출력 파일명 설정
@@ -221,31 +367,61 @@ def main():
             else:
                 reviews_output = f"{output_prefix}_{int(time.time())}_reviews.csv"
                 print(f"[INFO] 새 파일명으로 저장합니다: {reviews_output}")
+
+        dedup_index = ReviewDedupIndex("review_fingerprints.db") if use_dedup_index else None
+        # 상품별 리뷰 집계는 새 리뷰만으로 증분 갱신
+        aggregate_store = ReviewAggregateStore("review_aggregates.db")
+        # 새 리뷰는 전문 검색 색인에도 바로 추가
+        search_index = ReviewSearchIndex("review_search.db")
+        # 상품 간/페이지 간 브라우저 메모리 감시 (임계값 초과 시 재시작)
+        review_governor = DriverGovernor("리뷰 수집")
+        # 비동기 백엔드는 Playwright/Chromium을 상품마다 띄우지 않도록 리뷰 단계 내내 세션 유지
+        review_session = asyncbrowser.BrowserSession(contexts=max(1, page_workers)).start() \
+            if backend == driverfactory.BACKEND_ASYNC else None
                 
-        for idx, url in enumerate(tqdm(product_urls, desc="리뷰 수집 진행", unit="상품")):
-            print(f"\n[{idx + 1}/{len(product_urls)}] 상품 리뷰 수집 중: {url}")
-            try:
-                df = crawl_reviews(
-                    target_url=url,
-                    max_pages=None,
-                    output_csv=reviews_output,
-                    return_df=True,
-                    append_mode=True
-                )
-                count = len(df) if df is not None else 0
-                print(f"[INFO] {url} 리뷰 수집 완료: {count}건")
-                total_reviews += count
-            except Exception as e:
-                print(f"[ERROR] URL 처리 중 오류 발생: {url} - {str(e)}")
+        for idx, url in enumerate(tqdm(review_urls, desc="리뷰 수집 진행", unit="상품")):
+            print(f"\n[{idx + 1}/{len(review_urls)}] 상품 리뷰 수집 중: {url}")
+            # 오류는 분류별로 재시도, 끝내 실패하면 dead letter로 기록되고 None 반환
+            df = retry_policy.run(
+                'reviews', url, crawl_reviews,
+                target_url=url,
+                max_pages=None,
+                output_csv=reviews_output,
+                return_df=True,
+                append_mode=True,
+                dedup_index=dedup_index,
+                review_sinks=[aggregate_store, search_index],
+                governor=review_governor,
+                page_guard=page_guard,
+                raise_errors=True,
+                profiler=profiler,
+                page_workers=page_workers,
+                backend=backend,
+                async_session=review_session
+            )
+            count = len(df) if df is not None else 0
+            print(f"[INFO] {url} 리뷰 수집 완료: {count}건")
+            card = listing_cards.get(product_key(url))
+            if df is not None and card:
+                snapshot_store.mark_processed('reviews', {product_key(url): card})
+            total_reviews += count
+
+        if dedup_index is not None:
+            dedup_index.close()
+        aggregate_store.close()
+        search_index.close()
+        if review_session is not None:
+            review_session.close()
 
         review_time = time.time() - review_start_time
         print(f"\n리뷰 수집 완료: 총 {total_reviews}건 (소요 시간: {review_time:.2f}초)")
+        review_governor.report()
 
     # 상품 상세 정보 수집
     total_products = 0
     if mode in ['products', 'both']:
         # STEP 3. 각 상품별 상세 정보 수집
-        print(f"\n[STEP 3] 각 상품별 상세 정보 수집 시작 (총 {len(product_urls)}개 상품)")
+        print(f"\n[STEP 3] 각 상품별 상세 정보 수집 시작 (총 {len(detail_urls)}개 상품)")
         product_start_time = time.time()
         
         # 상품 정보 출력 파일명 설정
@@ -262,16 +438,73 @@ def main():
                 print(f"[INFO] 새 파일명으로 저장합니다: {products_output}")
         
         # 상품 상세 정보 수집
+        change_tracker = ProductChangeTracker("product_changes.db")
+        # 관련 상품 간선은 중복 없이 그래프에 누적 (python productgraph.py discover로 새 상품 탐색)
+        product_graph = ProductGraph("product_graph.db")
         products = crawl_multiple_products(
-            product_urls=product_urls,
+            product_urls=detail_urls,
             output_prefix=output_prefix,
-            headless=headless
+            headless=headless,
+            change_tracker=change_tracker,
+            changed_only=changed_only,
+            page_guard=page_guard,
+            retry_policy=retry_policy,
+            profiler=profiler,
+            product_graph=product_graph,
+            backend=backend
         )
+        change_tracker.close()
+        product_graph.close()
+
+        # 재시도를 소진하지 않은 상품은 이번 카드 값으로 처리 완료 기록
+        if listing_cards:
+            failed_urls = set(dead_letter.items('products'))
+            snapshot_store.mark_processed('products', {
+                product_key(u): listing_cards[product_key(u)]
+                for u in detail_urls if u not in failed_urls and product_key(u) in listing_cards
+            })
         
         total_products = len(products)
         product_time = time.time() - product_start_time
         print(f"\n상품 정보 수집 완료: 총 {total_products}건 (소요 시간: {product_time:.2f}초)")
 
+    # 이미지 다운로드
+    if download_images:
+        print("\n[STEP 4] 리뷰/상품 이미지 다운로드 시작")
+        media_urls = collect_media_urls(
+            reviews_csv=reviews_output if mode in ['reviews', 'both'] else None,
+            products_json=f"{output_prefix}_all.json" if mode in ['products', 'both'] else None
+        )
+        download_media(media_urls, output_dir=f"{output_prefix}_media")
+
+    # 가격/프로모션만 갱신
+    total_prices = 0
+    if mode == 'prices':
+        print(f"\n[STEP 2] 상품 가격 갱신 시작 (총 {len(product_urls)}개 상품)")
+        price_start_time = time.time()
+        prices_output = f"{output_prefix}_prices.csv"
+
+        change_tracker = ProductChangeTracker("product_changes.db")
+        price_rows = crawl_price_only(
+            product_urls=product_urls,
+            output_csv=prices_output,
+            headless=headless,
+            change_tracker=change_tracker,
+            page_guard=page_guard,
+            backend=backend
+        )
+        change_tracker.close()
+
+        total_prices = len(price_rows)
+        price_time = time.time() - price_start_time
+        print(f"\n가격 갱신 완료: 총 {total_prices}건 (소요 시간: {price_time:.2f}초)")
+
+    page_guard.report()
+    retry_policy.report()
+    driver_backend.report()
+    if profiler is not None:
+        profiler.report()
+
     # 최종 결과 요약
     total_time = time.time() - start_time
     
@@ -284,16 +517,38 @@ def main():
         print(f"- 총 리뷰 수집: {total_reviews}건")
         print(f"- 리뷰 수집 시간: {review_time:.2f}초")
         print(f"- 리뷰 저장 위치: {reviews_output}")
+        print("- 리뷰 집계 저장 위치: review_aggregates.db")
+        print("- 리뷰 검색 색인: review_search.db (python reviewsearch.py \"검색어\")")
     
     if mode in ['products', 'both']:
         print(f"- 총 상품 상세 정보 수집: {total_products}건")
         print(f"- 상품 정보 수집 시간: {product_time:.2f}초")
         print(f"- 상품 정보 저장 위치: {products_output}")
         print(f"- JSON 저장 위치: {output_prefix}_all.json")
+        print("- 관련 상품 그래프: product_graph.db (python productgraph.py discover로 새 상품 탐색)")
+    
+    if mode == 'prices':
+        print(f"- 가격 갱신 상품: {total_prices}건")
+        print(f"- 가격 갱신 시간: {price_time:.2f}초")
+        print(f"- 가격 정보 저장 위치: {prices_output}")
+        print("- 가격 이력 저장 위치: product_changes.db")
+    
+    if download_images:
+        print(f"- 이미지 저장 위치: {output_prefix}_media/")
+    if profiler is not None:
+        print(f"- 프로파일 저장 위치: {profiler.output_dir}/ (summary.tsv, *.folded → flamegraph)")
+    
+    if len(dead_letter):
+        print(f"- 실패 항목: {len(dead_letter)}개 (python retrypolicy.py list, 다음 실행에서 재시도 가능)")
+    if len(page_guard.quarantine):
+        print(f"- 격리된 URL: {len(page_guard.quarantine)}개 (python pageguard.py list)")
     
     print(f"- URL 수집 시간: {url_time:.2f}초")
     print(f"- 총 소요 시간: {total_time:.2f}초")
     print("=" * 50)
+    page_guard.quarantine.close()
+    if snapshot_store is not None:
+        snapshot_store.close()
     
     print("\n크롤링이 완료되었습니다. 감사합니다!")
 
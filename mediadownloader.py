@@ -0,0 +1,347 @@
+"""
+리뷰/상품 이미지 다운로더
+
+crawl_reviews가 저장한 RD_REVIEW_IMAGES(| 구분 URL)와 crawl_multiple_products가
+저장한 image_urls를 모아, 연결 풀을 공유하는 비동기 HTTP 클라이언트(aiohttp)로
+동시 요청 수를 제한해 내려받는다.
+
+- 정규화된 URL 기준 중복 제거 (같은 이미지를 여러 번 요청하지 않음, 요청은 원래 URL로)
+- 내용 해시(sha256) 기준 저장 (objects/ab/cd/<sha256>.<ext>, 동일 내용은 한 번만 저장)
+- 중단된 다운로드는 partial/ 아래의 .part 파일에서 Range 요청으로 이어받음
+- 다운로드 색인은 media_index.db(SQLite)에 기록되어 재실행 시 건너뜀
+
+로컬 정적 파일 서버로 테스트 가능:
+    python -m http.server 8000 --directory ./fixtures
+    python mediadownloader.py --urls http://127.0.0.1:8000/a.jpg --output media_test
+"""
+import csv
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sqlite3
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from lazyimport import lazy_module
+
+# asyncio/aiohttp는 다운로드 단계에서만 필요 (main.py 기동 시간 유지)
+asyncio = lazy_module("asyncio")
+aiohttp = lazy_module("aiohttp")
+yarl = lazy_module("yarl")
+
+# 네이버 이미지 CDN의 리사이즈 파라미터 (?type=w640 등) - 제거하면 원본을 받는다
+RESIZE_PARAM_HOSTS = ('pstatic.net',)
+RESIZE_PARAMS = ('type',)
+
+CHUNK_SIZE = 64 * 1024
+
+# 416 응답의 Content-Range (bytes */전체크기)
+_CONTENT_RANGE_TOTAL = re.compile(r'/\s*(\d+)\s*$')
+
+
+def normalize_media_url(url, keep_resize=False):
+    """
+    다운로드 중복 제거용 URL 정규화
+
+    - 앞뒤 공백 제거, 스킴 없는 //host 형태는 https로 보정
+    - 스킴/호스트 소문자화, fragment 제거, 쿼리 파라미터 정렬
+    - 네이버 이미지 CDN의 리사이즈 파라미터 제거 (keep_resize=False일 때)
+
+    Returns:
+        str: 정규화된 URL (유효하지 않으면 빈 문자열)
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    if url.startswith('//'):
+        url = 'https:' + url
+
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.netloc:
+        return ""
+
+    netloc = parts.netloc.lower()
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if not keep_resize and netloc.endswith(RESIZE_PARAM_HOSTS):
+        query = [(k, v) for k, v in query if k not in RESIZE_PARAMS]
+
+    return urlunsplit((parts.scheme.lower(), netloc, parts.path or '/', urlencode(sorted(query)), ''))
+
+
+def collect_media_urls(reviews_csv=None, products_json=None, extra_urls=None):
+    """
+    크롤링 결과 파일에서 이미지 URL 수집
+
+    Args:
+        reviews_csv (str, optional): crawl_reviews 결과 CSV (RD_REVIEW_IMAGES 컬럼)
+        products_json (str, optional): crawl_product_detail/crawl_multiple_products 결과 JSON
+        extra_urls (list, optional): 직접 지정한 URL 목록
+
+    Returns:
+        list: 원본 URL 목록 (순서 유지)
+    """
+    urls = []
+
+    if reviews_csv and os.path.exists(reviews_csv):
+        with open(reviews_csv, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                images = row.get('RD_REVIEW_IMAGES') or ""
+                urls.extend(u for u in images.split('|') if u.strip())
+
+    if products_json and os.path.exists(products_json):
+        with open(products_json, 'r', encoding='utf-8') as f:
+            products = json.load(f)
+        # 단일 상품 JSON은 dict, 다중 상품 JSON은 list
+        if isinstance(products, dict):
+            products = [products]
+        for product in products:
+            urls.extend(product.get('image_urls') or [])
+            for related in product.get('related_products') or []:
+                if related.get('image_url'):
+                    urls.append(related['image_url'])
+
+    if extra_urls:
+        urls.extend(extra_urls)
+
+    return urls
+
+
+def media_fetch_url(url, keep_resize=False):
+    """
+    실제로 요청할 URL (원래 URL에서 fragment와 네이버 CDN 리사이즈 파라미터만 제거)
+
+    normalize_media_url은 쿼리를 다시 인코딩/정렬하므로 서명되었거나 순서가 중요한 CDN URL이
+    깨질 수 있다. 정규화 URL은 중복 제거/색인 키로만 쓰고 요청은 원래 쿼리 문자열 그대로 보낸다.
+    """
+    url = url.strip()
+    if url.startswith('//'):
+        url = 'https:' + url
+    parts = urlsplit(url)
+    query = parts.query
+    if not keep_resize and parts.netloc.lower().endswith(RESIZE_PARAM_HOSTS):
+        query = '&'.join(pair for pair in query.split('&')
+                         if pair and pair.split('=', 1)[0] not in RESIZE_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+
+
+class MediaStore:
+    """내용 해시 기반 이미지 저장소 (objects/ + partial/ + media_index.db)"""
+
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, 'objects')
+        self.partial_dir = os.path.join(root, 'partial')
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.partial_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(os.path.join(root, 'media_index.db'))
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS media (
+                url_key TEXT PRIMARY KEY,
+                sha256 TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                content_type TEXT,
+                path TEXT NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_media_sha256 ON media (sha256)")
+        self.conn.commit()
+
+    def lookup(self, url_key):
+        """이미 받은 URL이면 저장 경로 반환 (파일이 지워졌으면 None)"""
+        row = self.conn.execute("SELECT path FROM media WHERE url_key = ?", (url_key,)).fetchone()
+        if row and os.path.exists(os.path.join(self.root, row[0])):
+            return row[0]
+        return None
+
+    def partial_path(self, url_key):
+        name = hashlib.sha1(url_key.encode('utf-8')).hexdigest()
+        return os.path.join(self.partial_dir, f"{name}.part")
+
+    def object_path(self, sha256, ext):
+        return os.path.join('objects', sha256[:2], sha256[2:4], f"{sha256}{ext}")
+
+    def commit_partial(self, url_key, part_path, sha256, content_type):
+        """
+        완료된 .part 파일을 내용 해시 경로로 이동하고 색인에 기록
+
+        Returns:
+            bool: 새 객체를 저장했으면 True, 이미 같은 내용이 있어 버렸으면 False
+        """
+        ext = mimetypes.guess_extension((content_type or '').split(';')[0].strip()) or \
+            os.path.splitext(urlsplit(url_key).path)[1][:8]
+        rel_path = self.object_path(sha256, ext)
+        abs_path = os.path.join(self.root, rel_path)
+
+        is_new = not os.path.exists(abs_path)
+        if is_new:
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            os.replace(part_path, abs_path)
+        else:
+            os.remove(part_path)
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO media VALUES (?, ?, ?, ?, ?, ?)",
+            (url_key, sha256, os.path.getsize(abs_path), content_type, rel_path,
+             time.strftime("%Y-%m-%d %H:%M:%S"))
+        )
+        self.conn.commit()
+        return is_new
+
+    def close(self):
+        self.conn.close()
+
+
+async def _fetch_one(session, semaphore, store, url_key, url, stats, retries=2):
+    """단일 이미지 다운로드 (url로 요청, url_key로 저장/색인, Range 이어받기 + sha256 계산)"""
+    part_path = store.partial_path(url_key)
+
+    async with semaphore:
+        for attempt in range(retries + 1):
+            try:
+                offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+                headers = {'Range': f"bytes={offset}-"} if offset else {}
+
+                # encoded=True: aiohttp가 쿼리를 다시 인코딩하지 않고 받은 문자열 그대로 요청
+                async with session.get(yarl.URL(url, encoded=True), headers=headers) as resp:
+                    if resp.status == 416 and offset:
+                        # 전체 크기가 .part 크기와 같을 때만 이미 끝까지 받은 것으로 보고,
+                        # 아니면(서버 파일이 바뀌었거나 크기를 알 수 없음) .part를 버리고 다시 받음
+                        match = _CONTENT_RANGE_TOTAL.search(resp.headers.get('Content-Range', ''))
+                        if not match or int(match.group(1)) != offset:
+                            os.remove(part_path)
+                            raise RuntimeError(f"HTTP 416 (받은 크기 {offset}, "
+                                               f"Content-Range {resp.headers.get('Content-Range')})")
+                        mode = None
+                    elif resp.status == 206 and offset:
+                        mode = 'ab'
+                        stats['resumed'] += 1
+                    elif resp.status == 200:
+                        # Range를 지원하지 않는 서버는 처음부터 다시 받음
+                        mode = 'wb'
+                    elif 400 <= resp.status < 500 and resp.status not in (408, 429):
+                        # 재시도해도 결과가 같은 클라이언트 오류
+                        print(f"[WARN] 이미지 다운로드 실패: {url} - HTTP {resp.status}")
+                        stats['failed'] += 1
+                        return False
+                    else:
+                        raise RuntimeError(f"HTTP {resp.status}")
+
+                    if mode:
+                        with open(part_path, mode) as f:
+                            async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                                f.write(chunk)
+                    # 416 응답의 Content-Type은 오류 본문의 것이므로 확장자 추정에 쓰지 않음
+                    content_type = resp.headers.get('Content-Type', '') if mode else ''
+
+                digest = hashlib.sha256()
+                with open(part_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                        digest.update(chunk)
+                size = os.path.getsize(part_path)
+
+                if store.commit_partial(url_key, part_path, digest.hexdigest(), content_type):
+                    stats['downloaded'] += 1
+                    stats['bytes'] += size
+                else:
+                    stats['deduped'] += 1
+                return True
+
+            except Exception as e:
+                if attempt == retries:
+                    print(f"[WARN] 이미지 다운로드 실패: {url} - {e}")
+                    stats['failed'] += 1
+                    return False
+                await asyncio.sleep(2 ** attempt)
+
+
+async def download_media_async(urls, output_dir="media", concurrency=8, timeout=30, keep_resize=False):
+    """
+    이미지 URL 목록을 비동기로 내려받아 내용 해시 저장소에 저장
+
+    Args:
+        urls (list): 원본 이미지 URL 목록
+        output_dir (str): 저장소 루트 디렉토리
+        concurrency (int): 최대 동시 요청 수 (연결 풀 크기)
+        timeout (int): 요청당 타임아웃 (초)
+        keep_resize (bool): 네이버 CDN 리사이즈 파라미터 유지 여부
+
+    Returns:
+        dict: 다운로드 통계 (downloaded, deduped, skipped, resumed, failed, bytes)
+    """
+    store = MediaStore(output_dir)
+    stats = {'downloaded': 0, 'deduped': 0, 'skipped': 0, 'resumed': 0, 'failed': 0, 'bytes': 0}
+
+    # 정규화 URL 기준 중복 제거 + 이미 받은 URL 건너뛰기
+    # (요청은 원래 URL에서 CDN 리사이즈 파라미터만 뺀 URL로 보내 원본을 받는다)
+    pending = []
+    seen = set()
+    for url in urls:
+        url_key = normalize_media_url(url, keep_resize=keep_resize)
+        if not url_key or url_key in seen:
+            continue
+        seen.add(url_key)
+        if store.lookup(url_key):
+            stats['skipped'] += 1
+            continue
+        pending.append((url_key, media_fetch_url(url, keep_resize=keep_resize)))
+
+    try:
+        if pending:
+            connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
+            client_timeout = aiohttp.ClientTimeout(total=timeout)
+            semaphore = asyncio.Semaphore(concurrency)
+            async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+                await asyncio.gather(*(
+                    _fetch_one(session, semaphore, store, url_key, url, stats)
+                    for url_key, url in pending
+                ))
+    finally:
+        store.close()
+
+    return stats
+
+
+def download_media(urls, output_dir="media", concurrency=8, timeout=30, keep_resize=False):
+    """download_media_async의 동기 래퍼"""
+    start_time = time.time()
+    stats = asyncio.run(download_media_async(
+        urls, output_dir=output_dir, concurrency=concurrency, timeout=timeout, keep_resize=keep_resize
+    ))
+    elapsed = time.time() - start_time
+    print(f"[INFO] 이미지 다운로드 완료: 신규 {stats['downloaded']}건, 내용 중복 {stats['deduped']}건, "
+          f"기존 {stats['skipped']}건, 이어받기 {stats['resumed']}건, 실패 {stats['failed']}건 "
+          f"({stats['bytes'] / 1024 / 1024:.1f}MB, {elapsed:.2f}초)")
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='리뷰/상품 이미지 다운로더')
+    parser.add_argument('--reviews', type=str, help='리뷰 CSV 파일 (RD_REVIEW_IMAGES 컬럼)')
+    parser.add_argument('--products', type=str, help='상품 정보 JSON 파일 (image_urls 필드)')
+    parser.add_argument('--urls', type=str, nargs='*', help='직접 지정할 이미지 URL')
+    parser.add_argument('--output', type=str, default='media', help='저장소 디렉토리 (기본값: media)')
+    parser.add_argument('--concurrency', type=int, default=8, help='최대 동시 다운로드 수 (기본값: 8)')
+    parser.add_argument('--timeout', type=int, default=30, help='요청당 타임아웃 초 (기본값: 30)')
+    parser.add_argument('--keep-resize', action='store_true', help='네이버 CDN 리사이즈 파라미터 유지 (썸네일 받기)')
+
+    args = parser.parse_args()
+
+    media_urls = collect_media_urls(args.reviews, args.products, args.urls)
+    if not media_urls:
+        print("[ERROR] 다운로드할 이미지 URL이 없습니다. --reviews, --products 또는 --urls 인자가 필요합니다.")
+        parser.print_help()
+    else:
+        print(f"[INFO] 이미지 URL {len(media_urls)}개를 처리합니다.")
+        download_media(
+            media_urls,
+            output_dir=args.output,
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+            keep_resize=args.keep_resize
+        )
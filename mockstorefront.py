@@ -0,0 +1,532 @@
+"""
+로컬 모의 스토어프런트 서버 (네이버에 접속하지 않는 종단 간 처리량 벤치마크용)
+
+스마트스토어 목록/상품/리뷰 페이지의 마크업(크롤러들이 쓰는 클래스 이름과 구조)을 재현한
+페이지를 제공한다. 목록 페이지네이션(?page=N), "리뷰" 탭, "최신순" 정렬, 리뷰 페이지네이션
+(숫자 버튼 + '다음')은 실제 페이지처럼 클릭으로 동작하고, 리뷰 목록은 탭/정렬/페이지 클릭 시
+/api/reviews에서 받아 교체된다.
+
+상품/리뷰는 시드로 결정적으로 생성하며, --reviews-csv를 주면 과거 리뷰 CSV(RD_* 컬럼)의
+리뷰 내용/평점/리뷰어 정보/옵션을 가져와 쓴다. 모든 요청에 지연(latency ± jitter)을 넣을 수
+있고, 일정 비율로 HTTP 500(--error-rate)이나 차단 페이지(--block-rate)를 돌려준다.
+
+    python mockstorefront.py --products 40 --latency-ms 150 --jitter-ms 50 --error-rate 0.01
+    # 목록: http://127.0.0.1:8765/mockstore/category/50000803
+"""
+import csv
+import html
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_PORT = 8765
+DEFAULT_CATEGORY_ID = '50000803'
+
+# 요청 종류별 지연 통계 키
+KIND_LISTING = 'listing'
+KIND_PRODUCT = 'product'
+KIND_REVIEWS = 'reviews'
+KIND_OTHER = 'other'
+PAGE_KINDS = (KIND_LISTING, KIND_PRODUCT, KIND_REVIEWS)
+
+_SYNTHETIC_CONTENTS = [
+    "발림성 좋고 촉촉해요. 재구매 의사 있습니다.",
+    "향이 은은하고 자극이 없어서 민감한 피부에도 잘 맞아요.",
+    "배송이 빨랐고 포장도 꼼꼼했어요.",
+    "생각보다 용량이 작지만 만족합니다.",
+    "끈적임 없이 흡수가 빨라서 아침에 쓰기 좋아요.",
+    "백탁 없고 화장 전에 써도 밀리지 않아요.",
+    "가격 대비 괜찮아요. 할인할 때 또 살게요.",
+]
+_SYNTHETIC_PROFILES = [
+    f"피부타입 {skin} · 피부톤 {tone} · 피부고민 {concern}"
+    for skin in ('건성', '지성', '복합성', '중성')
+    for tone in ('쿨톤', '웜톤')
+    for concern in ('보습', '트러블', '모공')
+]
+_SYNTHETIC_OPTIONS = [
+    {'발림성': spread, '보습력': moisture, '자극도': irritation}
+    for spread in ('아주 좋아요', '보통이에요')
+    for moisture in ('촉촉해요', '보통이에요')
+    for irritation in ('자극 없어요', '보통이에요')
+]
+_TITLE_WORDS = ['수분', '진정', '선크림', '앰플', '토너', '세럼', '클렌징폼', '크림', '미스트', '패드']
+
+BLOCKED_PAGE = "<html><body><h1>비정상적인 접근이 감지되었습니다.</h1><p>잠시 후 다시 시도해 주세요.</p></body></html>"
+NOT_FOUND_PAGE = "<html><body><h1>존재하지 않는 상품입니다.</h1></body></html>"
+
+
+def load_review_pool(csv_path, limit=5000):
+    """과거 리뷰 CSV에서 리뷰 내용/평점/리뷰어 정보/옵션 후보 읽기"""
+    pool = []
+    with open(csv_path, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            content = (row.get('RD_CONTENT') or '').strip()
+            if not content:
+                continue
+            options = {}
+            if row.get('RD_OPTION_SIZE'):
+                options['사이즈'] = row['RD_OPTION_SIZE']
+            if row.get('RD_OPTION_COLOR'):
+                options['색상'] = row['RD_OPTION_COLOR']
+            pool.append({
+                'content': content,
+                'rating': (row.get('RD_RATING') or '5').strip() or '5',
+                'profile': (row.get('RD_REVIEWER_INFO') or '').strip(),
+                'options': options,
+            })
+            if len(pool) >= limit:
+                break
+    return pool
+
+
+class MockCatalog:
+    """결정적으로 생성한 모의 상품/리뷰 목록"""
+
+    def __init__(self, products=40, stores=1, max_reviews=120, review_page_size=20, listing_page_size=40,
+                 seed=0, review_pool=None):
+        """
+        Args:
+            products (int): 상품 수 (스토어마다)
+            stores (int): 스토어 수 (mockstore, mockstore2, ...)
+            max_reviews (int): 상품당 최대 리뷰 수 (0 ~ max_reviews 사이에서 결정)
+            review_page_size (int): 리뷰 페이지당 리뷰 수
+            listing_page_size (int): 목록 페이지당 상품 수
+            seed (int): 생성 시드
+            review_pool (list, optional): load_review_pool 결과 (없으면 합성 문장 사용)
+        """
+        self.review_page_size = review_page_size
+        self.listing_page_size = listing_page_size
+        self.seed = seed
+        self.review_pool = review_pool or []
+        rng = random.Random(seed)
+
+        self.stores = ['mockstore' if idx == 0 else f'mockstore{idx + 1}' for idx in range(stores)]
+        self.products = {}
+        self.store_products = {}
+        next_id = 9000000000
+        for store in self.stores:
+            ids = []
+            for idx in range(products):
+                next_id += rng.randint(1, 9999)
+                price = rng.randrange(8000, 60000, 100)
+                self.products[str(next_id)] = {
+                    'id': str(next_id),
+                    'store': store,
+                    'title': f"[{store}] {rng.choice(_TITLE_WORDS)} {rng.choice(_TITLE_WORDS)} {rng.choice((30, 50, 100, 150))}ml",
+                    'price': price,
+                    'discount': rng.choice(('', '10%', '20%', '35%')),
+                    'review_count': rng.randint(0, max_reviews),
+                    'rating': round(rng.uniform(3.5, 5.0), 1),
+                }
+                ids.append(str(next_id))
+            # 고정 정렬(최신 등록순)로 목록 구성
+            self.store_products[store] = sorted(ids, reverse=True)
+
+    def listing(self, store, page):
+        """목록 페이지의 상품 목록과 전체 페이지 수"""
+        ids = self.store_products.get(store, [])
+        total_pages = max(1, -(-len(ids) // self.listing_page_size))
+        start = (page - 1) * self.listing_page_size
+        return [self.products[pid] for pid in ids[start:start + self.listing_page_size]], total_pages
+
+    def reviews(self, product_id, sort='ranking'):
+        """상품 리뷰 전체 (상품 ID로 시드를 정해 요청마다 같은 내용)"""
+        product = self.products[product_id]
+        rng = random.Random(f"{self.seed}:{product_id}")
+        base_day = time.mktime((2025, 5, 1, 12, 0, 0, 0, 0, -1))
+        reviews = []
+        for idx in range(product['review_count']):
+            if self.review_pool:
+                source = rng.choice(self.review_pool)
+                content, rating, profile, options = (source['content'], source['rating'], source['profile'],
+                                                     dict(source['options']))
+            else:
+                content = rng.choice(_SYNTHETIC_CONTENTS)
+                rating = str(rng.choice((5, 5, 5, 4, 4, 3, 2, 1)))
+                profile = rng.choice(_SYNTHETIC_PROFILES)
+                options = dict(rng.choice(_SYNTHETIC_OPTIONS))
+            written = base_day - (idx * 86400 * 2 + rng.randint(0, 86400))
+            reviews.append({
+                'seq': idx,
+                'date': time.strftime("%y.%m.%d.", time.localtime(written)),
+                'rating': rating,
+                'content': f"{content} (#{idx + 1})",
+                'profile': profile,
+                'options': options,
+                'image': f"/static/review/{product_id}/{idx}.jpg" if idx % 7 == 0 else '',
+            })
+        if sort == 'ranking':
+            # 랭킹순: 평점 높은 순, 같으면 내용이 긴 순 (최신순과 순서가 달라야 정렬 클릭이 의미 있음)
+            reviews.sort(key=lambda review: (-float(review['rating'] or 0), -len(review['content']), review['seq']))
+        return reviews
+
+
+class ServerStats:
+    """요청 종류별 응답 시간 기록 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.errors = 0
+        self.blocked = 0
+
+    def record(self, kind, seconds):
+        with self._lock:
+            self.latencies.setdefault(kind, []).append(seconds)
+
+    def count(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'latencies': {kind: list(values) for kind, values in self.latencies.items()},
+                'errors': self.errors,
+                'blocked': self.blocked,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.latencies = {}
+            self.errors = 0
+            self.blocked = 0
+
+
+def percentile(values, q):
+    """q 분위수 (0~100, 선형 보간)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+# ---------------------------------------------------------------------------
+# 페이지 렌더링 (크롤러 선택자와 맞춘 마크업)
+# ---------------------------------------------------------------------------
+
+def _price_text(price):
+    return f"{price:,}원"
+
+
+def render_listing(catalog, base_url, store, category_id, page):
+    products, total_pages = catalog.listing(store, page)
+    cards = []
+    for product in products:
+        href = f"{base_url}/{store}/products/{product['id']}"
+        cards.append(
+            f'<li class="flu7YgFW2k">'
+            f'<a class="_2id8yXpK_k _nlog_click" data-shp-area="list.pd" data-shp-contents-type="chnl_prod_no" href="{href}">'
+            f'<img alt="{html.escape(product["title"])}" src="/static/thumb/{product["id"]}.jpg"></a>'
+            f'<strong>{html.escape(product["title"])}</strong>'
+            f'<span class="price">{_price_text(product["price"])}</span>'
+            f'<em>리뷰 {product["review_count"]:,}</em> <span>별점 {product["rating"]}</span></li>'
+        )
+    pagination = ''.join(
+        f'<a class="UWN4IvaQza _nlog_click" href="/{store}/category/{category_id}?page={number}"'
+        f'{" aria-current=true" if number == page else ""}>{number}</a>'
+        for number in range(1, total_pages + 1)
+    )
+    return (
+        f"<html><head><title>{store} 카테고리</title></head><body>"
+        f"<ul>{''.join(cards)}</ul><div role=\"menubar\">{pagination}</div></body></html>"
+    )
+
+
+def render_reviews_fragment(catalog, product_id, page, sort):
+    reviews = catalog.reviews(product_id, sort)
+    page_size = catalog.review_page_size
+    total_pages = max(1, -(-len(reviews) // page_size))
+    page = min(max(1, page), total_pages)
+    items = []
+    for review in reviews[(page - 1) * page_size:page * page_size]:
+        options = ''.join(f"<dt>{html.escape(name)}:</dt><dd>{html.escape(value)}</dd>"
+                          for name, value in review['options'].items())
+        image = (f'<div class="_2389dRohZq"><img src="{review["image"]}"></div>' if review['image'] else '')
+        items.append(
+            f'<li class="BnwL_cs1av"><div class="_1MMhUGHnc_">'
+            f'<div class="_1_XCKE2RrJ">{html.escape(review["profile"])}</div>'
+            f'<em class="_15NU42F3kT">{review["rating"]}</em>'
+            f'<span class="_2L3vDiadT9">{review["date"]}</span>'
+            f'<div class="_2FXNMst_ak">{html.escape(catalog.products[product_id]["title"])}'
+            f'<dl class="XbGQRlzveO">{options}</dl></div>'
+            f'<div class="_1kMfD5ErZ6"><span class="_2L3vDiadT9">{html.escape(review["content"])}</span></div>'
+            f'{image}</div></li>'
+        )
+
+    # 10페이지 단위 번호 버튼 + 다음 블록으로 가는 '다음' 버튼
+    block_start = (page - 1) // 10 * 10 + 1
+    block_end = min(block_start + 9, total_pages)
+    links = ''.join(
+        f'<a href="#" onclick="loadReviews({number}); return false;"'
+        f'{" aria-current=true" if number == page else ""}>{number}</a>'
+        for number in range(block_start, block_end + 1)
+    )
+    if block_end < total_pages:
+        links += f'<a class="next" href="#" onclick="loadReviews({block_end + 1}); return false;">다음</a>'
+    return f'<ul>{"".join(items)}</ul><div class="_2g7PKvqCKe">{links}</div>'
+
+
+_PRODUCT_SCRIPT = """
+<script>
+var reviewState = {sort: 'ranking', page: 1};
+function loadReviews(page) {
+    reviewState.page = page;
+    fetch('/api/reviews?product=%(product_id)s&page=' + page + '&sort=' + reviewState.sort)
+        .then(function (response) { return response.ok ? response.text() : Promise.reject(response.status); })
+        .then(function (fragment) { document.getElementById('review_list').innerHTML = fragment; });
+}
+function openReviewTab() {
+    document.getElementById('REVIEW').style.display = 'block';
+    loadReviews(1);
+    return false;
+}
+function sortReviews(sort) {
+    reviewState.sort = sort;
+    loadReviews(1);
+    return false;
+}
+function expandDetail(button) {
+    var more = document.createElement('p');
+    more.textContent = button.getAttribute('data-more');
+    document.getElementById('beauty_notice').appendChild(more);
+    return false;
+}
+</script>
+"""
+
+
+def render_product(catalog, product_id):
+    product = catalog.products[product_id]
+    rng = random.Random(f"{catalog.seed}:detail:{product_id}")
+    # 관련 상품은 전체 카탈로그에서 결정적으로 골라 스토어를 넘나드는 그래프가 되게 함
+    related = rng.sample(sorted(pid for pid in catalog.products if pid != product_id), min(4, len(catalog.products) - 1))
+    related_items = ''.join(
+        f'<li class="_1rY1-Sog8x"><a href="/{catalog.products[pid]["store"]}/products/{pid}">'
+        f'<img class="_25CKxIKjAk" src="/static/thumb/{pid}.jpg">'
+        f'<p class="_33pMQzgHDp">{html.escape(catalog.products[pid]["title"])}</p>'
+        f'<span class="_3A6Qt4xeM6">{_price_text(catalog.products[pid]["price"])}</span>'
+        f'<p class="_3XPfyP0knm">{catalog.products[pid]["store"]}</p></a></li>'
+        for pid in related
+    )
+    discount = f'<span class="discount">{product["discount"]}</span>' if product['discount'] else ''
+    coupon = (f'<div class="_3l8UUYnfmI"><div class="_6m0rQkziLj">첫 구매 쿠폰</div>'
+              f'<span class="_2SuxywSpjf">{rng.choice((1000, 2000, 3000)):,}원</span>'
+              f'<div class="_2DIMjdlZpO">{rng.choice((10000, 20000)):,}원 이상 구매 시</div></div>'
+              if rng.random() < 0.5 else '')
+    return f"""<html><head><title>{html.escape(product['title'])}</title></head><body>
+<div id="content"><div>
+<div class="z7cS6-TO7X">
+  <img class="_25CKxIKjAk" src="/static/thumb/{product_id}.jpg">
+  <h3 class="_22kNQuEXmb _copyable">{html.escape(product['title'])}</h3>
+  <span class="_1LY7DqCnwR">{_price_text(product['price'])}</span>{discount}
+  {coupon}
+  <div class="_27jmWaPaKy"><ul>
+    <li><a href="#DETAIL">상세정보</a></li>
+    <li><a href="#REVIEW" onclick="return openReviewTab();">리뷰 {product['review_count']:,}</a></li>
+    <li><a href="#QNA">Q&amp;A</a></li>
+  </ul></div>
+</div>
+<div id="DETAIL">
+  <table class="_1_UiXWHt__">
+    <tr><th>상품번호</th><td>{product_id}</td><th>상품상태</th><td>새상품</td></tr>
+    <tr><th>제조사</th><td>{product['store']} 코스메틱</td><th>브랜드</th><td>{product['store']}</td></tr>
+    <tr><th>원산지</th><td>국산</td></tr>
+  </table>
+  <table class="_1_UiXWHt__">
+    <tr><th>피부타입</th><td>{rng.choice(('모든피부', '건성', '지성'))}</td><th>용량</th><td>{rng.choice((30, 50, 100))}ml</td></tr>
+    <tr><th>주요제품특징</th><td>{rng.choice(('보습', '진정', '자외선차단'))}</td></tr>
+  </table>
+  <a class="_3SMi-TrYq2" href="#">#{rng.choice(_TITLE_WORDS)}</a> <a class="_3SMi-TrYq2" href="#">#{rng.choice(_TITLE_WORDS)}</a>
+  <div class="bd_3GILa"><ul>
+    <li class="bd_WRUDg"><div class="bd_3Kurp">건성</div><div class="bd_LIZeW" style="height: {rng.randint(10, 90)}%"></div></li>
+    <li class="bd_WRUDg"><div class="bd_3Kurp">지성</div><div class="bd_LIZeW" style="height: {rng.randint(10, 90)}%"></div></li>
+  </ul></div>
+  <img class="se-image-resource" src="/static/detail/{product_id}/1.jpg">
+  <div id="beauty_notice"><p>화장품법에 따라 기재해야 하는 모든 성분: 정제수, 글리세린, 나이아신아마이드</p></div>
+  <button class="_1gG8JHE9Zc" data-more="사용할 때의 주의사항: 상처가 있는 부위 등에는 사용을 자제할 것"
+          onclick="return expandDetail(this);">상세정보 펼쳐보기</button>
+  <div class="trade_terms_info"><table>
+    <tr><th>배송방법</th><td>택배</td></tr>
+    <tr><th>주문 이후 예상되는 배송기간</th><td>2~3일</td></tr>
+    <tr><th>소비자가 부담하는 반품비용</th><td>3,000원</td></tr>
+  </table></div>
+  <ul>{related_items}</ul>
+</div>
+<div id="REVIEW" style="display:none"><div>
+  <div class="_2LvIMaBiIO">
+    <span class="review_count">리뷰 {product['review_count']}</span>
+    <div class="_2LAwVxx1Sd"><div class="_1txuie7UTH"><ul>
+      <li><a class="filter_sort" href="#" onclick="return sortReviews('ranking');">랭킹순</a></li>
+      <li><a class="filter_sort" href="#" onclick="return sortReviews('recent');">최신순</a></li>
+    </ul></div></div>
+  </div>
+  <div id="review_list"></div>
+</div></div>
+</div></div>
+{_PRODUCT_SCRIPT % {'product_id': product_id}}
+</body></html>"""
+
+
+# ---------------------------------------------------------------------------
+# HTTP 서버
+# ---------------------------------------------------------------------------
+
+class StorefrontHandler(BaseHTTPRequestHandler):
+    """모의 스토어프런트 요청 처리 (server 속성: catalog, stats, latency/jitter/error/block 설정)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body, content_type='text/html; charset=utf-8'):
+        payload = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _route(self, parsed):
+        """(요청 종류, 상태 코드, 본문, content type)"""
+        catalog = self.server.catalog
+        segments = [segment for segment in parsed.path.split('/') if segment]
+        query = parse_qs(parsed.query)
+
+        if parsed.path == '/api/reviews':
+            product_id = query.get('product', [''])[0]
+            if product_id not in catalog.products:
+                return KIND_REVIEWS, 404, '', 'text/html; charset=utf-8'
+            page = int(query.get('page', ['1'])[0] or 1)
+            sort = query.get('sort', ['ranking'])[0]
+            return KIND_REVIEWS, 200, render_reviews_fragment(catalog, product_id, page, sort), 'text/html; charset=utf-8'
+        if parsed.path == '/api/stats':
+            return KIND_OTHER, 200, json.dumps(self.server.stats.snapshot()), 'application/json'
+        if len(segments) == 3 and segments[1] == 'category':
+            page = int(query.get('page', ['1'])[0] or 1)
+            return KIND_LISTING, 200, render_listing(catalog, self.server.base_url, segments[0], segments[2], page), \
+                'text/html; charset=utf-8'
+        if len(segments) == 3 and segments[1] == 'products':
+            if segments[2] not in catalog.products:
+                return KIND_PRODUCT, 404, NOT_FOUND_PAGE, 'text/html; charset=utf-8'
+            return KIND_PRODUCT, 200, render_product(catalog, segments[2]), 'text/html; charset=utf-8'
+        if segments and segments[0] == 'static':
+            return KIND_OTHER, 200, b'', 'image/jpeg'
+        if len(segments) == 1 and segments[0] in catalog.store_products:
+            link = f'/{segments[0]}/category/{DEFAULT_CATEGORY_ID}'
+            return KIND_OTHER, 200, f'<html><body><a href="{link}">전체상품</a></body></html>', 'text/html; charset=utf-8'
+        return KIND_OTHER, 404, '<html><body>페이지를 찾을 수 없습니다.</body></html>', 'text/html; charset=utf-8'
+
+    def do_GET(self):
+        start = time.perf_counter()
+        server = self.server
+        parsed = urlparse(self.path)
+        kind, status, body, content_type = self._route(parsed)
+
+        if kind in PAGE_KINDS:
+            delay = server.latency + server.rng_uniform(-server.jitter, server.jitter)
+            if delay > 0:
+                time.sleep(delay)
+            roll = server.rng_uniform(0, 1)
+            if roll < server.error_rate:
+                server.stats.count('errors')
+                status, body, content_type = 500, '<html><body>Internal Server Error</body></html>', 'text/html; charset=utf-8'
+            elif roll < server.error_rate + server.block_rate:
+                server.stats.count('blocked')
+                status, body, content_type = 200, BLOCKED_PAGE, 'text/html; charset=utf-8'
+
+        self._send(status, body, content_type)
+        if kind in PAGE_KINDS:
+            server.stats.record(kind, time.perf_counter() - start)
+
+
+class MockStorefrontServer(ThreadingHTTPServer):
+    """모의 스토어프런트 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, catalog, host='127.0.0.1', port=DEFAULT_PORT, latency_ms=0, jitter_ms=0,
+                 error_rate=0.0, block_rate=0.0, seed=0, verbose=False):
+        super().__init__((host, port), StorefrontHandler)
+        self.catalog = catalog
+        self.stats = ServerStats()
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.error_rate = error_rate
+        self.block_rate = block_rate
+        self.verbose = verbose
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.base_url = f"http://{host}:{self.server_address[1]}"
+
+    def rng_uniform(self, low, high):
+        with self._rng_lock:
+            return self._rng.uniform(low, high)
+
+    def seed_urls(self, category_id=DEFAULT_CATEGORY_ID):
+        """스토어별 카테고리 목록 시드 URL"""
+        return [f"{self.base_url}/{store}/category/{category_id}" for store in self.catalog.stores]
+
+    def start_background(self):
+        """별도 스레드에서 서버 실행 (벤치마크용)"""
+        thread = threading.Thread(target=self.serve_forever, name='mockstorefront', daemon=True)
+        thread.start()
+        return thread
+
+
+def add_server_arguments(parser):
+    """서버/카탈로그 설정 인자 (mockstorefront, bench_storefront 공용)"""
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인드 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'포트 (기본값: {DEFAULT_PORT}, 0이면 임의 포트)')
+    parser.add_argument('--products', type=int, default=40, help='스토어당 상품 수 (기본값: 40)')
+    parser.add_argument('--stores', type=int, default=1, help='스토어 수 (기본값: 1)')
+    parser.add_argument('--max-reviews', type=int, default=120, help='상품당 최대 리뷰 수 (기본값: 120)')
+    parser.add_argument('--review-page-size', type=int, default=20, help='리뷰 페이지당 리뷰 수 (기본값: 20)')
+    parser.add_argument('--listing-page-size', type=int, default=40, help='목록 페이지당 상품 수 (기본값: 40)')
+    parser.add_argument('--reviews-csv', type=str, help='리뷰 내용을 가져올 과거 리뷰 CSV (예: old/onnonreviews.csv)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='페이지 응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='지연 변동폭 ± (ms)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='HTTP 500 응답 비율 (0~1)')
+    parser.add_argument('--block-rate', type=float, default=0.0, help='차단 페이지 응답 비율 (0~1)')
+    parser.add_argument('--seed', type=int, default=0, help='생성/오류 주입 시드 (기본값: 0)')
+
+
+def build_server(args, verbose=False):
+    """add_server_arguments로 받은 인자로 서버 생성"""
+    review_pool = load_review_pool(args.reviews_csv) if args.reviews_csv else None
+    catalog = MockCatalog(products=args.products, stores=args.stores, max_reviews=args.max_reviews,
+                          review_page_size=args.review_page_size, listing_page_size=args.listing_page_size,
+                          seed=args.seed, review_pool=review_pool)
+    return MockStorefrontServer(catalog, host=args.host, port=args.port, latency_ms=args.latency_ms,
+                                jitter_ms=args.jitter_ms, error_rate=args.error_rate, block_rate=args.block_rate,
+                                seed=args.seed, verbose=verbose)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='로컬 모의 스토어프런트 서버')
+    add_server_arguments(parser)
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+
+    args = parser.parse_args()
+    server = build_server(args, verbose=args.verbose)
+    total_reviews = sum(product['review_count'] for product in server.catalog.products.values())
+    print(f"[INFO] 모의 스토어프런트: {server.base_url} (상품 {len(server.catalog.products)}개, 리뷰 {total_reviews}개)")
+    for seed_url in server.seed_urls():
+        print(f"  목록: {seed_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[INFO] 서버를 종료합니다.")
+    finally:
+        server.server_close()
@@ -0,0 +1,350 @@
+"""
+차단/캡차 페이지 감지 + 스토어별 서킷 브레이커 + 격리(quarantine) 저장소
+
+네이버가 캡차나 오류 페이지를 보여 주면 crawl_reviews는 리뷰를 찾지 못한 채 빈 페이지
+대기를 반복하고, crawl_product_detail은 {}를 반환한다. 막힌 스토어를 계속 두드리면
+브라우저 시간만 버리므로, 페이지 이동 직후 페이지를 분류해 스토어별 서킷 브레이커에
+넘기고 차단된 URL은 격리 DB에 넣어 나중에 다시 시도한다. 격리된 URL은 release_after가
+지난 뒤(due)에만 실패 항목 재시도 대상이 되고, RetryPolicy가 성공을 기록하면 격리가 풀린다.
+
+페이지 분류: normal, blocked, captcha, not_found, sold_out
+
+    python pageguard.py list
+    python pageguard.py release --all
+"""
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+PAGE_NORMAL = 'normal'
+PAGE_BLOCKED = 'blocked'
+PAGE_CAPTCHA = 'captcha'
+PAGE_NOT_FOUND = 'not_found'
+PAGE_SOLD_OUT = 'sold_out'
+
+# 분류 규칙 (앞에서부터 먼저 일치하는 분류 사용)
+PAGE_SIGNATURES = [
+    (PAGE_CAPTCHA, [
+        r'captcha', r'자동입력\s*방지', r'보안\s*확인', r'실제\s*사용자인지\s*확인', r'로봇이\s*아닙니다',
+    ]),
+    (PAGE_BLOCKED, [
+        r'비정상적인\s*(?:접근|요청)', r'접근이\s*(?:제한|차단)', r'일시적으로\s*(?:제한|차단)',
+        r'Access\s+Denied', r'Too\s+Many\s+Requests', r'\b(?:403|429)\s+Forbidden',
+    ]),
+    (PAGE_NOT_FOUND, [
+        r'존재하지\s*않는\s*상품', r'상품이\s*존재하지\s*않습니다', r'페이지를\s*찾을\s*수\s*없습니다',
+        r'삭제(?:된|되었거나)\s*상품', r'404\s+Not\s+Found',
+    ]),
+    (PAGE_SOLD_OUT, [
+        r'상품이\s*품절되었습니다', r'판매(?:가)?\s*종료된\s*상품', r'판매\s*중지된\s*상품',
+        r'구매하실\s*수\s*없는\s*상품',
+    ]),
+]
+
+# 서킷 브레이커 실패로 세는 분류
+FAILURE_CLASSES = (PAGE_BLOCKED, PAGE_CAPTCHA)
+
+_COMPILED_SIGNATURES = [
+    (page_class, re.compile('|'.join(patterns), re.IGNORECASE))
+    for page_class, patterns in PAGE_SIGNATURES
+]
+
+_TAG_PATTERN = re.compile(r'<script\b.*?</script>|<style\b.*?</style>|<[^>]+>', re.DOTALL | re.IGNORECASE)
+
+# 상세정보/리뷰/Q&A 탭 컨테이너. 이 안에는 판매자 설명과 사용자 리뷰/문의가 들어 있어
+# "접근이 제한된 줄 알았어요" 같은 문장이 차단 문구로 오인되므로, 첫 컨테이너부터는 검사하지 않는다.
+# 차단/캡차/오류 페이지에는 이 컨테이너가 없으므로 페이지 전체가 검사된다.
+_CONTENT_CONTAINER_PATTERN = re.compile(r'<[a-z][^>]*?\bid\s*=\s*["\']?(?:DETAIL|INTRODUCE|REVIEW|QNA)\b', re.IGNORECASE)
+
+# 정상 상품 페이지는 용량이 크므로 앞부분만 검사
+_CLASSIFY_LIMIT = 200000
+
+
+def classify_page(html):
+    """
+    페이지 HTML 분류
+
+    페이지 골격(상세정보/리뷰/Q&A 컨테이너 앞부분)에서 스크립트/스타일/태그를 걷어낸 텍스트로
+    PAGE_SIGNATURES를 찾는다. 리뷰나 문의 본문에 나온 문구로는 분류하지 않는다.
+
+    Returns:
+        str: PAGE_NORMAL / PAGE_BLOCKED / PAGE_CAPTCHA / PAGE_NOT_FOUND / PAGE_SOLD_OUT
+    """
+    shell = (html or '')[:_CLASSIFY_LIMIT]
+    content_start = _CONTENT_CONTAINER_PATTERN.search(shell)
+    if content_start:
+        shell = shell[:content_start.start()]
+    text = _TAG_PATTERN.sub(' ', shell)
+    for page_class, pattern in _COMPILED_SIGNATURES:
+        if pattern.search(text):
+            return page_class
+    return PAGE_NORMAL
+
+
+def store_of(url):
+    """
+    URL의 스토어 키
+
+    smartstore.naver.com/onnon/products/1 → 'onnon', 그 외에는 호스트 이름
+    """
+    parsed = urlparse(url or '')
+    host = parsed.netloc.lower()
+    segments = [segment for segment in parsed.path.split('/') if segment]
+    if host.endswith('naver.com') and segments and segments[0] != 'products':
+        return segments[0]
+    return host or 'unknown'
+
+
+class CircuitBreaker:
+    """
+    스토어별 서킷 브레이커 (연속 차단이 기준을 넘으면 일정 시간 요청 중단)
+
+    닫힘 → (연속 차단 failure_threshold회) → 열림 → (중단 시간 경과) → 반열림: 시험 요청 하나만
+    허용하고, 시험 요청이 정상이면 닫고 차단이면 중단 시간을 늘려 바로 다시 연다.
+    """
+
+    def __init__(self, failure_threshold=2, cooldown=600, max_cooldown=3600):
+        """
+        Args:
+            failure_threshold (int): 회로를 여는 연속 차단/캡차 횟수
+            cooldown (float): 처음 열렸을 때 중단 시간 (초, 다시 열릴 때마다 2배)
+            max_cooldown (float): 중단 시간 상한 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._failures = {}
+        self._trips = {}
+        self._open_until = {}
+        # 반열림 상태에서 시험 요청을 내준 시각 (결과가 기록되지 않으면 cooldown 뒤 다시 시험 허용)
+        self._probe_started = {}
+
+    def allow(self, store):
+        """요청해도 되는지 (열린 회로는 중단 시간이 지나면 시험 요청 하나만 허용)"""
+        now = time.time()
+        open_until = self._open_until.get(store)
+        if open_until is None:
+            return True
+        if now < open_until:
+            return False
+        probe_started = self._probe_started.get(store)
+        if probe_started is not None and now - probe_started < self.cooldown:
+            return False
+        self._probe_started[store] = now
+        return True
+
+    def open_until(self, store):
+        return self._open_until.get(store, 0)
+
+    def record(self, store, page_class):
+        """
+        페이지 분류 결과 기록
+
+        Returns:
+            bool: 이번 기록으로 회로가 열렸으면 True
+        """
+        probing = self._probe_started.pop(store, None) is not None
+        if page_class not in FAILURE_CLASSES:
+            # 정상 페이지 (반열림 시험 성공 포함) → 회로 닫기
+            self._failures[store] = 0
+            self._trips[store] = 0
+            self._open_until.pop(store, None)
+            return False
+
+        self._failures[store] = self._failures.get(store, 0) + 1
+        if self._failures[store] < self.failure_threshold and not probing:
+            return False
+
+        trips = self._trips.get(store, 0)
+        pause = min(self.cooldown * (2 ** trips), self.max_cooldown)
+        self._trips[store] = trips + 1
+        self._failures[store] = 0
+        self._open_until[store] = time.time() + pause
+        print(f"[WARN] 스토어 '{store}' 차단 감지 → {pause:.0f}초 동안 요청 중단")
+        return True
+
+    def open_stores(self):
+        """현재 열린 스토어 목록"""
+        now = time.time()
+        return [store for store, until in self._open_until.items() if until > now]
+
+
+class QuarantineStore:
+    """격리된 URL 저장소 (나중에 다시 시도)"""
+
+    def __init__(self, db_path="quarantine.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS quarantine (
+                url TEXT PRIMARY KEY,
+                store TEXT NOT NULL,
+                reason TEXT NOT NULL,
+                task TEXT,
+                attempts INTEGER NOT NULL DEFAULT 1,
+                quarantined_at TEXT NOT NULL,
+                release_after REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_quarantine_release ON quarantine (release_after);
+        """)
+        self.conn.commit()
+
+    def add(self, url, store, reason, release_after, task=None):
+        """URL 격리 (이미 있으면 사유/해제 시각 갱신, 시도 횟수 증가)"""
+        self.conn.execute(
+            """INSERT INTO quarantine (url, store, reason, task, quarantined_at, release_after)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT (url) DO UPDATE SET
+                   reason = excluded.reason, task = COALESCE(excluded.task, task),
+                   attempts = attempts + 1, quarantined_at = excluded.quarantined_at,
+                   release_after = excluded.release_after""",
+            (url, store, reason, task, time.strftime("%Y-%m-%d %H:%M:%S"), release_after)
+        )
+        self.conn.commit()
+
+    def due(self, task=None, now=None):
+        """다시 시도할 때가 된 격리 URL 목록 (url, store, reason, task, attempts)"""
+        now = time.time() if now is None else now
+        query = "SELECT url, store, reason, task, attempts FROM quarantine WHERE release_after <= ?"
+        params = [now]
+        if task:
+            query += " AND (task = ? OR task IS NULL)"
+            params.append(task)
+        return self.conn.execute(query + " ORDER BY release_after", params).fetchall()
+
+    def held(self, task=None, now=None):
+        """아직 재시도 보류 중인 격리 URL 집합 (release_after 전)"""
+        now = time.time() if now is None else now
+        query = "SELECT url FROM quarantine WHERE release_after > ?"
+        params = [now]
+        if task:
+            query += " AND (task = ? OR task IS NULL)"
+            params.append(task)
+        return {row[0] for row in self.conn.execute(query, params)}
+
+    def entries(self):
+        return self.conn.execute(
+            "SELECT url, store, reason, task, attempts, quarantined_at, release_after FROM quarantine ORDER BY store, url"
+        ).fetchall()
+
+    def release(self, url, task=None):
+        """격리 해제 (재시도에 성공했거나 수동 해제, task를 주면 그 작업으로 격리된 항목만)"""
+        if task:
+            self.conn.execute("DELETE FROM quarantine WHERE url = ? AND (task = ? OR task IS NULL)", (url, task))
+        else:
+            self.conn.execute("DELETE FROM quarantine WHERE url = ?", (url,))
+        self.conn.commit()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM quarantine").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class PageGuard:
+    """페이지 분류 → 서킷 브레이커 → 격리를 묶은 크롤러용 진입점 (스레드 안전)"""
+
+    def __init__(self, breaker=None, quarantine=None, not_found_delay=86400):
+        """
+        Args:
+            breaker (CircuitBreaker, optional): 스토어별 서킷 브레이커
+            quarantine (QuarantineStore, optional): 격리 저장소 (없으면 격리하지 않음)
+            not_found_delay (float): 없는 상품/품절 URL의 재시도 보류 시간 (초)
+        """
+        self.breaker = breaker or CircuitBreaker()
+        self.quarantine = quarantine
+        self.not_found_delay = not_found_delay
+        self.counts = {}
+        self._lock = threading.Lock()
+
+    def allow(self, url, task=None):
+        """
+        URL을 열어도 되는지 확인 (스토어 회로가 열려 있으면 격리하고 False)
+        """
+        store = store_of(url)
+        with self._lock:
+            if self.breaker.allow(store):
+                return True
+            self._quarantine(url, store, 'circuit_open', self.breaker.open_until(store), task)
+        print(f"[INFO] 스토어 '{store}' 요청 중단 중, 격리: {url}")
+        return False
+
+    def check(self, url, html, task=None, tolerate=()):
+        """
+        페이지 이동 직후 분류 결과 기록
+
+        Args:
+            url (str): 이동한 URL
+            html (str): 페이지 HTML (driver.page_source)
+            task (str, optional): 격리 시 함께 저장할 작업 종류 ('reviews', 'products' 등)
+            tolerate (tuple): 격리하지 않고 계속 진행할 분류 (예: 리뷰 수집의 PAGE_SOLD_OUT)
+
+        Returns:
+            str: 페이지 분류 (PAGE_NORMAL과 tolerate 외에는 호출 측이 해당 URL 처리를 중단)
+        """
+        page_class = classify_page(html)
+        store = store_of(url)
+        with self._lock:
+            self.counts[page_class] = self.counts.get(page_class, 0) + 1
+            self.breaker.record(store, page_class)
+            if page_class in FAILURE_CLASSES:
+                release_after = max(self.breaker.open_until(store), time.time() + self.breaker.cooldown)
+                self._quarantine(url, store, page_class, release_after, task)
+            elif page_class != PAGE_NORMAL and page_class not in tolerate:
+                self._quarantine(url, store, page_class, time.time() + self.not_found_delay, task)
+        if page_class != PAGE_NORMAL:
+            print(f"[WARN] 페이지 분류: {page_class} - {url}")
+        return page_class
+
+    def _quarantine(self, url, store, reason, release_after, task):
+        if self.quarantine is not None:
+            self.quarantine.add(url, store, reason, release_after, task)
+
+    def report(self):
+        """분류 통계 및 격리 현황 출력"""
+        if not self.counts:
+            return
+        summary = ", ".join(f"{page_class} {count}" for page_class, count in sorted(self.counts.items()))
+        print(f"[INFO] 페이지 분류: {summary}")
+        open_stores = self.breaker.open_stores()
+        if open_stores:
+            print(f"[INFO] 요청 중단 중인 스토어: {', '.join(open_stores)}")
+        if self.quarantine is not None and len(self.quarantine):
+            print(f"[INFO] 격리된 URL {len(self.quarantine)}개 ({self.quarantine.db_path})")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='격리된 URL 조회/해제')
+    parser.add_argument('--db', type=str, default='quarantine.db', help='격리 DB (기본값: quarantine.db)')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('list', help='격리된 URL 목록')
+    subparsers.add_parser('due', help='다시 시도할 때가 된 URL 목록')
+    release_parser = subparsers.add_parser('release', help='격리 해제')
+    release_parser.add_argument('urls', nargs='*', help='해제할 URL')
+    release_parser.add_argument('--all', action='store_true', help='전체 해제')
+
+    args = parser.parse_args()
+    store = QuarantineStore(args.db)
+
+    if args.command == 'list':
+        for url, store_key, reason, task, attempts, quarantined_at, release_after in store.entries():
+            release_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(release_after))
+            print(f"{store_key}\t{reason}\t{task or '-'}\t{attempts}회\t{quarantined_at} → {release_at}\t{url}")
+        print(f"\n총 {len(store)}개")
+    elif args.command == 'due':
+        for url, store_key, reason, task, attempts in store.due():
+            print(f"{store_key}\t{reason}\t{task or '-'}\t{url}")
+    elif args.command == 'release':
+        urls = [row[0] for row in store.entries()] if args.all else args.urls
+        for url in urls:
+            store.release(url)
+        print(f"[INFO] {len(urls)}개 URL 격리 해제")
+    else:
+        parser.print_help()
+
+    store.close()
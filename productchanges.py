@@ -0,0 +1,268 @@
+"""
+상품 변경 감지 및 가격 이력 저장소
+
+crawl_multiple_products는 매 실행마다 전체 상품 CSV와 _all.json을 다시 쓰지만,
+대부분의 상품은 전날과 price/discount/promotion이 같다. ProductChangeTracker는
+crawl_product_detail 결과(product_data)를 정규화해 해시하고 이전 해시와 비교하여
+바뀐 상품만 골라내며, 가격/프로모션 변경은 상품 ID별 시계열로 SQLite에 쌓는다.
+
+가격 이력은 델타 인코딩으로 저장한다.
+  - price_delta: 직전 관측 대비 가격 변화량 (항상 기록)
+  - price: 키프레임(첫 관측 및 KEYFRAME_INTERVAL번째마다)에만 절대값 기록
+  - discount/promotion: 바뀐 경우에만 기록 (NULL = 직전 값 유지)
+(product_key, seq) 기본 키 덕분에 "상품 X의 가격 이력" 조회는 과거 내보내기 파일을
+훑지 않고 색인 범위 조회 한 번으로 끝난다.
+
+    python productchanges.py history 8045986719
+    python productchanges.py changed --since "2025-04-01"
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import time
+
+from reviewdedup import product_key as url_product_key
+
+# 해시 비교에서 제외하는 필드 (매 실행마다 달라지는 값)
+VOLATILE_FIELDS = ('crawled_at',)
+
+# 절대 가격을 다시 기록하는 주기 (이력 복원 시 누적 합 계산 범위 제한)
+KEYFRAME_INTERVAL = 32
+
+
+def product_id_of(product_data):
+    """상품 데이터의 식별 키 (상품번호 우선, 없으면 URL 기반 키)"""
+    return str(product_data.get('product_id') or url_product_key(product_data.get('url', '')))
+
+
+def content_hash(product_data):
+    """
+    정규화된 상품 데이터 해시
+
+    휘발성 필드를 제거하고 키를 정렬한 JSON으로 직렬화한 뒤 sha1을 계산한다.
+    """
+    normalized = {k: v for k, v in product_data.items() if k not in VOLATILE_FIELDS}
+    payload = json.dumps(normalized, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def parse_price(value):
+    """'12,000원' 같은 가격 문자열을 정수로 변환 (없으면 None)"""
+    digits = re.sub(r'[^\d]', '', str(value or ''))
+    return int(digits) if digits else None
+
+
+class ProductChangeTracker:
+    """상품 변경 감지 + 델타 인코딩 가격 이력 저장소"""
+
+    def __init__(self, db_path="product_changes.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS product_state (
+                product_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                url TEXT,
+                title TEXT,
+                price INTEGER,
+                discount TEXT,
+                promotion TEXT,
+                history_len INTEGER NOT NULL DEFAULT 0,
+                last_seen TEXT NOT NULL,
+                last_changed TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS price_history (
+                product_key TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                observed_at TEXT NOT NULL,
+                price INTEGER,
+                price_delta INTEGER,
+                discount TEXT,
+                promotion TEXT,
+                PRIMARY KEY (product_key, seq)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_product_state_changed ON product_state (last_changed);
+        """)
+        self.conn.commit()
+
+    def observe(self, product_data, observed_at=None):
+        """
+        상품 관측 결과 기록
+
+        Args:
+            product_data (dict): crawl_product_detail 결과
+            observed_at (str, optional): 관측 시각 (기본값: crawled_at 또는 현재 시각)
+
+        Returns:
+            bool: 처음 보거나 내용이 바뀐 상품이면 True
+        """
+        key, observed_at, price_fields = self._price_fields(product_data, observed_at)
+        new_hash = content_hash(product_data)
+
+        row = self.conn.execute(
+            "SELECT content_hash FROM product_state WHERE product_key = ?", (key,)
+        ).fetchone()
+        self._record_price(key, product_data.get('url'), observed_at, price_fields)
+        changed = row is None or row[0] != new_hash
+
+        self.conn.execute(
+            """UPDATE product_state
+               SET content_hash = ?, title = ?, last_changed = CASE WHEN ? THEN ? ELSE last_changed END
+               WHERE product_key = ?""",
+            (new_hash, product_data.get('product_title'), changed, observed_at, key)
+        )
+        self.conn.commit()
+        return changed
+
+    def observe_price(self, price_data, observed_at=None):
+        """
+        가격 갱신 모드(crawl_price_only) 결과 기록
+
+        전체 상품 해시는 건드리지 않고 가격/프로모션 이력만 갱신한다. 처음 보는 상품은
+        빈 해시로 등록되어 다음 전체 크롤링에서 변경된 상품으로 취급된다.
+
+        Returns:
+            bool: 처음 보거나 가격/할인/프로모션이 바뀌었으면 True
+        """
+        key, observed_at, price_fields = self._price_fields(price_data, observed_at)
+        before = self.conn.execute(
+            "SELECT history_len FROM product_state WHERE product_key = ?", (key,)
+        ).fetchone()
+        history_len = self._record_price(key, price_data.get('url'), observed_at, price_fields)
+        self.conn.commit()
+        return before is None or history_len != before[0]
+
+    def _price_fields(self, data, observed_at):
+        """관측 데이터에서 (상품 키, 관측 시각, (가격, 할인, 프로모션 JSON)) 추출"""
+        key = product_id_of(data)
+        observed_at = observed_at or data.get('crawled_at') or time.strftime("%Y-%m-%d %H:%M:%S")
+        price = parse_price(data.get('price'))
+        discount = data.get('discount') or ''
+        promotion = json.dumps(data.get('promotion') or {}, ensure_ascii=False, sort_keys=True)
+        return key, observed_at, (price, discount, promotion)
+
+    def _record_price(self, key, url, observed_at, price_fields):
+        """
+        가격/프로모션 상태 갱신 (바뀐 경우에만 이력 추가, 처음 보는 상품은 빈 해시로 등록)
+
+        Returns:
+            int: 갱신 후 이력 길이
+        """
+        price, discount, promotion = price_fields
+        row = self.conn.execute(
+            "SELECT price, discount, promotion, history_len FROM product_state WHERE product_key = ?",
+            (key,)
+        ).fetchone()
+
+        if row is None:
+            self._append_history(key, 0, observed_at, price, None, discount, promotion)
+            self.conn.execute(
+                "INSERT INTO product_state VALUES (?, '', ?, NULL, ?, ?, ?, 1, ?, ?)",
+                (key, url, price, discount, promotion, observed_at, observed_at)
+            )
+            return 1
+
+        old_price, old_discount, old_promotion, history_len = row
+        if (price, discount, promotion) != (old_price, old_discount, old_promotion):
+            self._append_history(
+                key, history_len, observed_at, price, old_price,
+                discount if discount != old_discount else None,
+                promotion if promotion != old_promotion else None
+            )
+            history_len += 1
+
+        self.conn.execute(
+            """UPDATE product_state
+               SET url = COALESCE(?, url), price = ?, discount = ?, promotion = ?, history_len = ?, last_seen = ?
+               WHERE product_key = ?""",
+            (url, price, discount, promotion, history_len, observed_at, key)
+        )
+        return history_len
+
+    def _append_history(self, key, seq, observed_at, price, previous_price, discount, promotion):
+        """가격 이력 한 줄 추가 (키프레임이면 절대 가격, 아니면 델타만)"""
+        is_keyframe = seq % KEYFRAME_INTERVAL == 0 or previous_price is None or price is None
+        delta = None if is_keyframe else price - previous_price
+        self.conn.execute(
+            "INSERT INTO price_history VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, seq, observed_at, price if is_keyframe else None, delta, discount, promotion)
+        )
+
+    def price_history(self, key):
+        """
+        상품 가격/프로모션 이력 복원
+
+        Returns:
+            list: observed_at, price, discount, promotion 딕셔너리 목록 (시간순)
+        """
+        rows = self.conn.execute(
+            """SELECT observed_at, price, price_delta, discount, promotion
+               FROM price_history WHERE product_key = ? ORDER BY seq""",
+            (str(key),)
+        )
+        history = []
+        price = None
+        discount = ''
+        promotion = {}
+        for observed_at, abs_price, delta, new_discount, new_promotion in rows:
+            price = abs_price if delta is None else price + delta
+            if new_discount is not None:
+                discount = new_discount
+            if new_promotion is not None:
+                promotion = json.loads(new_promotion)
+            history.append({
+                'observed_at': observed_at,
+                'price': price,
+                'discount': discount,
+                'promotion': promotion
+            })
+        return history
+
+    def changed_since(self, since):
+        """since 이후 내용이 바뀐 상품 목록 (product_key, title, last_changed)"""
+        return self.conn.execute(
+            "SELECT product_key, title, last_changed FROM product_state WHERE last_changed >= ? ORDER BY last_changed",
+            (since,)
+        ).fetchall()
+
+    def title_keys(self):
+        """상품명 → 상품 키 매핑 (URL 없는 과거 리뷰를 상품번호 키로 맞출 때 사용)"""
+        return dict(self.conn.execute(
+            "SELECT title, product_key FROM product_state WHERE title IS NOT NULL AND title != ''"
+        ).fetchall())
+
+    def close(self):
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='상품 변경 이력 조회')
+    parser.add_argument('--db', type=str, default='product_changes.db', help='변경 이력 DB (기본값: product_changes.db)')
+    subparsers = parser.add_subparsers(dest='command')
+
+    history_parser = subparsers.add_parser('history', help='상품 가격/프로모션 이력 조회')
+    history_parser.add_argument('product_id', type=str, help='상품번호')
+
+    changed_parser = subparsers.add_parser('changed', help='특정 시각 이후 변경된 상품 조회')
+    changed_parser.add_argument('--since', type=str, default='1970-01-01', help='기준 시각 (YYYY-MM-DD[ HH:MM:SS])')
+
+    args = parser.parse_args()
+    tracker = ProductChangeTracker(args.db)
+
+    if args.command == 'history':
+        history = tracker.price_history(args.product_id)
+        if not history:
+            print(f"[WARN] {args.product_id} 상품의 이력이 없습니다.")
+        for entry in history:
+            promotion = entry['promotion'].get('coupon_title', '') if entry['promotion'] else ''
+            print(f"{entry['observed_at']}  가격 {entry['price']}  할인 {entry['discount'] or '-'}  쿠폰 {promotion or '-'}")
+    elif args.command == 'changed':
+        for key, title, last_changed in tracker.changed_since(args.since):
+            print(f"{last_changed}  {key}  {title}")
+    else:
+        parser.print_help()
+
+    tracker.close()
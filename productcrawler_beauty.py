@@ -1,30 +1,62 @@
-import re
 import time
 import json
-import pandas as pd
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, ElementNotInteractableException
-from webdriver_manager.chrome import ChromeDriverManager
-
-def setup_driver(headless=True):
-    """Chrome 웹드라이버 설정"""
+
+from lazyimport import lazy_module, lazy_import
+from driverfactory import (
+    BACKEND_ASYNC, BACKEND_SELENIUM, BACKENDS, DEFAULT_ASYNC_CONTEXTS, create_driver, release_driver,
+    add_driver_arguments, configure_from_args
+)
+
+# pandas / bs4 / selenium은 첫 사용 시점에 로드 (CLI 기동 시간 단축)
+pd = lazy_module("pandas")
+asyncio = lazy_module("asyncio")
+asyncbrowser = lazy_module("asyncbrowser")
+BeautifulSoup = lazy_import("bs4", "BeautifulSoup")
+By = lazy_import("selenium.webdriver.common.by", "By")
+Options = lazy_import("selenium.webdriver.chrome.options", "Options")
+WebDriverWait = lazy_import("selenium.webdriver.support.ui", "WebDriverWait")
+EC = lazy_module("selenium.webdriver.support.expected_conditions")
+selenium_exceptions = lazy_module("selenium.common.exceptions")
+# 스키마/자원 감시/페이지 분류/재시도 모듈도 해당 기능을 쓸 때 로드
+load_schema = lazy_import("schemaextractor", "load_schema")
+product_key = lazy_import("reviewdedup", "product_key")
+DriverGovernor = lazy_import("drivergovernor", "DriverGovernor")
+reap_orphans = lazy_import("drivergovernor", "reap_orphans")
+store_of = lazy_import("pageguard", "store_of")
+pageguard = lazy_module("pageguard")
+retrypolicy = lazy_module("retrypolicy")
+
+# 이 모듈의 기본 카테고리 (필드/선택자는 category_schemas/beauty.json)
+DEFAULT_CATEGORY = 'beauty'
+
+def resolve_schema(schema=None):
+    """카테고리 이름 또는 CategorySchema를 컴파일된 스키마로 (기본값: 뷰티)"""
+    if schema is None or isinstance(schema, str):
+        return load_schema(schema or DEFAULT_CATEGORY)
+    return schema
+
+def setup_driver(headless=True, lightweight=False, affinity=None):
+    """
+    Chrome 웹드라이버 설정 (driverfactory 백엔드: 로컬 Chrome 또는 원격 세션 풀)
+
+    lightweight=True이면 이미지 로딩을 끄고 DOMContentLoaded 시점에 get()이 반환되도록
+    (page_load_strategy='eager') 설정한다. 가격 갱신처럼 일부 텍스트만 필요한 경우에 사용.
+    affinity(스토어 키 등)를 주면 원격 풀에서 같은 키로 쓰던 세션을 우선 배정받는다.
+    """
     options = Options()
     if headless:
         options.add_argument("--headless")
+    if lightweight:
+        options.page_load_strategy = 'eager'
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     options.add_argument("window-size=1920x1080")
     options.add_argument("disable-gpu")
     options.add_argument("--disable-extensions")
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    driver = create_driver(options, affinity=affinity)
     driver.implicitly_wait(3)
     return driver
 
@@ -35,7 +67,7 @@ def safe_find_element(driver, by, selector, wait_time=5):
             EC.presence_of_element_located((by, selector))
         )
         return element
-    except (TimeoutException, NoSuchElementException):
+    except (selenium_exceptions.TimeoutException, selenium_exceptions.NoSuchElementException):
         return None
 
 def safe_find_elements(driver, by, selector, wait_time=5):
@@ -45,7 +77,7 @@ def safe_find_elements(driver, by, selector, wait_time=5):
             EC.presence_of_all_elements_located((by, selector))
         )
         return elements
-    except (TimeoutException, NoSuchElementException):
+    except (selenium_exceptions.TimeoutException, selenium_exceptions.NoSuchElementException):
         return []
 
 def safe_click(driver, element, retry=3, scroll_first=True):
@@ -61,7 +93,7 @@ def safe_click(driver, element, retry=3, scroll_first=True):
             element.click()
             time.sleep(1)
             return True
-        except (ElementNotInteractableException, TimeoutException) as e:
+        except (selenium_exceptions.ElementNotInteractableException, selenium_exceptions.TimeoutException) as e:
             print(f"클릭 시도 {attempt+1}/{retry} 실패: {e}")
             time.sleep(1)
             
@@ -79,310 +111,64 @@ def safe_click(driver, element, retry=3, scroll_first=True):
     
     return False
 
-def extract_text(element):
-    """요소에서 텍스트 추출 (None 처리)"""
-    return element.text.strip() if element else ""
+def page_usable(page_guard, product_url, html_source, task):
+    """페이지 분류 결과 수집을 계속할 수 있으면 True (품절 상품도 상세/가격은 수집)"""
+    if page_guard is None:
+        return True
+    page_class = page_guard.check(product_url, html_source, task=task, tolerate=(pageguard.PAGE_SOLD_OUT,))
+    return page_class in (pageguard.PAGE_NORMAL, pageguard.PAGE_SOLD_OUT)
 
-def extract_product_basic_info(soup):
-    """상품 기본 정보 추출"""
-    basic_info = {}
-    
-    # 상품명 추출
-    title_tag = soup.find('h3', {'class': '_22kNQuEXmb'})
-    basic_info['product_title'] = extract_text(title_tag)
-    
-    # 상품 번호, 상태, 브랜드 등 추출
-    try:
-        table = soup.find('table', {'class': '_1_UiXWHt__'})
-        if table:
-            rows = table.find_all('tr')
-            for row in rows:
-                headers = row.find_all('th')
-                data_cells = row.find_all('td')
-                
-                for i, header in enumerate(headers):
-                    if i < len(data_cells):
-                        header_text = header.text.strip()
-                        value_text = data_cells[i].text.strip()
-                        
-                        if header_text == "상품번호":
-                            basic_info['product_id'] = value_text
-                        elif header_text == "상품상태":
-                            basic_info['product_status'] = value_text
-                        elif header_text == "제조사":
-                            basic_info['manufacturer'] = value_text
-                        elif header_text == "브랜드":
-                            basic_info['brand'] = value_text
-                        elif header_text == "원산지":
-                            basic_info['origin'] = value_text
-    except Exception as e:
-        print(f"기본 정보 추출 중 오류: {e}")
-    
-    return basic_info
+def extract_product_data(soup, product_url, schema):
+    """
+    상품 페이지 soup에서 스키마 필드 추출 (Selenium/비동기 백엔드 공용)
 
-def extract_product_specs(soup):
-    """상품 상세 스펙 추출 - 뷰티 제품 특화"""
-    specs = {}
-    
-    try:
-        # 상세 스펙이 있는 테이블 (두 번째 테이블)
-        tables = soup.find_all('table', {'class': '_1_UiXWHt__'})
-        if len(tables) >= 2:
-            detail_table = tables[1]
-            rows = detail_table.find_all('tr')
-            
-            for row in rows:
-                headers = row.find_all('th')
-                data_cells = row.find_all('td')
-                
-                for i, header in enumerate(headers):
-                    if i < len(data_cells):
-                        header_text = header.text.strip()
-                        value_text = data_cells[i].text.strip()
-                        
-                        # 주요 스펙 정보 추출 - 뷰티 제품 특화 필드
-                        specs[header_text] = value_text
-    except Exception as e:
-        print(f"상세 스펙 추출 중 오류: {e}")
-    
-    # 뷰티 제품 특화 필드 확인
-    beauty_fields = [
-        "사용부위", "피부타입", "종류", "자외선차단지수", 
-        "주요제품특징", "효능", "용량", "성분"
-    ]
-    
-    # 누락된 필드에 빈 값 추가
-    for field in beauty_fields:
-        if field not in specs:
-            specs[field] = ""
-    
-    return specs
+    상품번호 표가 없는 페이지도 관련 상품의 source_product_id가 비지 않도록 URL의 상품번호로 보충한다.
+    """
+    product_data = {
+        'url': product_url,
+        'crawled_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'category': schema.category,
+    }
+    # 스키마의 모든 필드 (기본 정보, 스펙, 가격, 배송, 태그, 선호도, 이미지, 프로모션, 관련 상품 등)
+    url_product_id = product_key(product_url)
+    product_data.update(schema.extract(soup, context={'product_id': url_product_id}))
+    if not product_data.get('product_id'):
+        product_data['product_id'] = url_product_id
+    return product_data
 
-def extract_price_info(soup):
-    """가격 정보 추출"""
-    price_info = {}
-    
-    try:
-        # 판매가 추출
-        price_elem = soup.find('span', {'class': '_1LY7DqCnwR'})
-        if price_elem:
-            price_text = price_elem.text.strip()
-            # 숫자만 추출
-            price = re.sub(r'[^\d]', '', price_text)
-            price_info['price'] = price
-        
-        # 할인 정보 추출
-        discount_elem = soup.find('span', {'class': 'discount'})
-        if discount_elem:
-            discount_text = discount_elem.text.strip()
-            price_info['discount'] = discount_text
-    except Exception as e:
-        print(f"가격 정보 추출 중 오류: {e}")
-    
-    return price_info
-
-def extract_shipping_info(soup):
-    """배송 정보 추출"""
-    shipping_info = {}
-    
-    try:
-        # 배송 정보 테이블 (페이지 하단 부분)
-        trade_terms_table = soup.find('div', {'class': 'trade_terms_info'})
-        if trade_terms_table:
-            table = trade_terms_table.find('table')
-            if table:
-                rows = table.find_all('tr')
-                
-                for row in rows:
-                    header = row.find('th')
-                    data_cell = row.find('td')
-                    
-                    if header and data_cell:
-                        header_text = header.text.strip()
-                        value_text = data_cell.text.strip()
-                        
-                        if "배송방법" in header_text:
-                            shipping_info['shipping_method'] = value_text
-                        elif "주문 이후 예상되는 배송기간" in header_text:
-                            shipping_info['shipping_period'] = value_text
-                        elif "소비자가 부담하는 반품비용" in header_text:
-                            shipping_info['return_cost'] = value_text
-    except Exception as e:
-        print(f"배송 정보 추출 중 오류: {e}")
-    
-    return shipping_info
-
-def extract_product_tags(soup):
-    """관련 태그 추출"""
-    tags = []
-    
-    try:
-        tag_links = soup.find_all('a', {'class': '_3SMi-TrYq2'})
-        for tag_link in tag_links:
-            tag_text = tag_link.text.strip()
-            if tag_text.startswith('#'):
-                tags.append(tag_text)
-    except Exception as e:
-        print(f"태그 정보 추출 중 오류: {e}")
-    
-    return tags
-
-def extract_preference_analysis(soup):
-    """구매 선호도 분석 추출 - 뷰티 제품 특화"""
-    preference = {}
-    
-    try:
-        # 구매 선호도 영역
-        preference_div = soup.find('div', {'class': 'bd_3GILa'})
-        if preference_div:
-            # 피부 타입별 선호도
-            items = preference_div.find_all('li', {'class': 'bd_WRUDg'})
-            for item in items:
-                try:
-                    type_elem = item.find('div', {'class': 'bd_3Kurp'})
-                    score_elem = item.find('div', {'class': 'bd_LIZeW'})
-                    
-                    if type_elem and score_elem:
-                        skin_type = type_elem.text.strip()
-                        # 높이 값에서 퍼센트 추출
-                        style = score_elem.get('style', '')
-                        percent_match = re.search(r'height:\s*([0-9.]+)%', style)
-                        if percent_match:
-                            score = percent_match.group(1)
-                            preference[skin_type] = score
-                except Exception as item_e:
-                    print(f"선호도 항목 추출 중 오류: {item_e}")
-    except Exception as e:
-        print(f"구매 선호도 추출 중 오류: {e}")
-    
-    return preference
-
-def extract_product_images(soup):
-    """상품 이미지 URL 추출"""
-    images = []
-    
-    try:
-        # 상품 썸네일 이미지
-        thumb_img = soup.find('img', {'class': '_25CKxIKjAk'})
-        if thumb_img and 'src' in thumb_img.attrs:
-            images.append(thumb_img['src'])
-        
-        # 상세 설명 이미지
-        detail_imgs = soup.find_all('img', {'class': 'se-image-resource'})
-        for img in detail_imgs:
-            if 'src' in img.attrs:
-                images.append(img['src'])
-    except Exception as e:
-        print(f"이미지 URL 추출 중 오류: {e}")
-    
-    return images
-
-def extract_promotion_info(soup):
-    """프로모션 정보 추출"""
-    promotion = {}
-    
-    try:
-        # 쿠폰 정보
-        coupon_div = soup.find('div', {'class': '_3l8UUYnfmI'})
-        if coupon_div:
-            # 쿠폰 타이틀
-            title_elem = coupon_div.find('div', {'class': '_6m0rQkziLj'})
-            if title_elem:
-                promotion['coupon_title'] = title_elem.text.strip()
-            
-            # 할인 금액
-            discount_elem = coupon_div.find('span', {'class': '_2SuxywSpjf'})
-            if discount_elem:
-                promotion['discount_amount'] = discount_elem.text.strip()
-            
-            # 최소 주문 금액
-            min_order_elem = coupon_div.find('div', {'class': '_2DIMjdlZpO'})
-            if min_order_elem:
-                promotion['min_order_amount'] = min_order_elem.text.strip()
-    except Exception as e:
-        print(f"프로모션 정보 추출 중 오류: {e}")
-    
-    return promotion
+def merge_expanded(product_data, expanded):
+    """펼치기 버튼을 누른 뒤 다시 추출한 필드를 product_data에 합침 (dict 필드는 키 단위로 갱신)"""
+    for name, value in expanded.items():
+        if isinstance(product_data.get(name), dict) and isinstance(value, dict):
+            product_data[name].update(value)
+        else:
+            product_data[name] = value
 
-def extract_related_products(soup):
-    """관련 상품 정보 추출"""
-    related_products = []
-    
-    try:
-        product_items = soup.find_all('li', {'class': '_1rY1-Sog8x'})
-        for item in product_items:
-            product = {}
-            
-            # 상품명
-            title_elem = item.find('p', {'class': '_33pMQzgHDp'})
-            if title_elem:
-                product['title'] = title_elem.text.strip()
-            
-            # 가격
-            price_elem = item.find('span', {'class': '_3A6Qt4xeM6'})
-            if price_elem:
-                product['price'] = price_elem.text.strip()
-            
-            # 판매자
-            seller_elem = item.find('p', {'class': '_3XPfyP0knm'})
-            if seller_elem:
-                product['seller'] = seller_elem.text.strip()
-            
-            # 이미지 URL
-            img_elem = item.find('img', {'class': '_25CKxIKjAk'})
-            if img_elem and 'src' in img_elem.attrs:
-                product['image_url'] = img_elem['src']
-            
-            # 원본 상품 정보 추가
-            product['source_product_id'] = ""  # 후에 채워질 필드
-            
-            if product:
-                related_products.append(product)
-    except Exception as e:
-        print(f"관련 상품 정보 추출 중 오류: {e}")
-    
-    return related_products
+def crawl_product_detail(product_url, output_csv=None, headless=True, page_guard=None, raise_errors=False,
+                         schema=None, profiler=None):
+    """
+    상품 상세 페이지 크롤링 (카테고리 스키마로 추출, 기본값: 뷰티)
 
-def extract_beauty_specific_info(soup):
-    """뷰티 제품 특화 정보 추출"""
-    beauty_info = {}
-    
-    try:
-        # 화장품 성분 정보 (성분 목록)
-        ingredient_section = soup.find(string=lambda text: text and '화장품법에 따라 기재' in text)
-        if ingredient_section:
-            parent = ingredient_section.parent
-            if parent:
-                ingredients_text = parent.text.strip()
-                beauty_info['ingredients'] = ingredients_text
-        
-        # 기능성 화장품 정보
-        functional_section = soup.find(string=lambda text: text and '기능성 화장품' in text)
-        if functional_section:
-            parent = functional_section.parent
-            if parent:
-                functional_text = parent.text.strip()
-                beauty_info['functional_info'] = functional_text
-                
-        # 사용 시 주의사항
-        caution_section = soup.find(string=lambda text: text and '사용할 때의 주의사항' in text)
-        if caution_section:
-            parent = caution_section.parent
-            if parent:
-                caution_text = parent.text.strip()
-                beauty_info['caution'] = caution_text
-    except Exception as e:
-        print(f"뷰티 특화 정보 추출 중 오류: {e}")
-    
-    return beauty_info
+    schema(카테고리 이름 또는 CategorySchema)의 필드를 문서 한 번 순회로 추출하고,
+    스키마에 expand가 있으면 펼치기 버튼을 누른 뒤 해당 필드만 다시 추출해 합친다.
 
-def crawl_product_detail(product_url, output_csv=None, headless=True):
-    """상품 상세 페이지 크롤링 - 뷰티 제품 특화"""
+    page_guard(PageGuard)가 있으면 스토어 요청이 중단된 상태이거나 차단/캡차/없는 상품
+    페이지일 때 추출을 건너뛰고 {}를 반환한다 (URL은 격리 저장소에 기록됨).
+    raise_errors=True이면 {}를 반환하는 대신 예외를 올린다 (RetryPolicy가 분류해 재시도).
+    차단 페이지는 BlockedPageError, 상품명/가격을 찾지 못하면 ParseMissError.
+    profiler(CrawlProfiler)가 있으면 상품 하나를 세션으로 프로파일링한다.
+    """
     if product_url.startswith('/'):
         product_url = 'https://brand.naver.com' + product_url
+    if page_guard is not None and not page_guard.allow(product_url, task='products'):
+        if raise_errors:
+            raise retrypolicy.BlockedPageError(f"스토어 요청 중단 중: {product_url}")
+        return {}
+    schema = resolve_schema(schema)
     
-    driver = setup_driver(headless=headless)
+    driver = setup_driver(headless=headless, affinity=store_of(product_url))
     product_data = {}
+    profile_session = profiler.start('products', product_url) if profiler is not None else None
     
     try:
         # 상품 페이지 로드
@@ -392,74 +178,31 @@ def crawl_product_detail(product_url, output_csv=None, headless=True):
         
         # 페이지 소스 가져오기
         html_source = driver.page_source
+        if not page_usable(page_guard, product_url, html_source, 'products'):
+            if raise_errors:
+                raise retrypolicy.BlockedPageError(f"차단/없는 상품 페이지: {product_url}")
+            return product_data
         soup = BeautifulSoup(html_source, 'html.parser')
         
         # 필요한 정보 추출
-        product_data['url'] = product_url
-        product_data['crawled_at'] = time.strftime("%Y-%m-%d %H:%M:%S")
-        product_data['category'] = 'beauty'  # 뷰티 카테고리 명시
-        
-        # 상품 기본 정보
-        basic_info = extract_product_basic_info(soup)
-        product_data.update(basic_info)
-        
-        # 상품 상세 스펙 (뷰티 제품 특화)
-        specs = extract_product_specs(soup)
-        product_data['specifications'] = specs
-        
-        # 가격 정보
-        price_info = extract_price_info(soup)
-        product_data.update(price_info)
+        product_data = extract_product_data(soup, product_url, schema)
         
-        # 배송 정보
-        shipping_info = extract_shipping_info(soup)
-        product_data['shipping_info'] = shipping_info
-        
-        # 관련 태그
-        tags = extract_product_tags(soup)
-        product_data['tags'] = tags
-        
-        # 구매 선호도 분석 (피부 타입별)
-        preference = extract_preference_analysis(soup)
-        product_data['preference_analysis'] = preference
-        
-        # 이미지 URL
-        images = extract_product_images(soup)
-        product_data['image_urls'] = images
-        
-        # 프로모션 정보
-        promotion = extract_promotion_info(soup)
-        product_data['promotion'] = promotion
-        
-        # 관련 상품 정보
-        related_products = extract_related_products(soup)
-        # 원본 상품 ID 추가
-        for product in related_products:
-            product['source_product_id'] = product_data.get('product_id', '')
-        
-        product_data['related_products'] = related_products
-        
-        # 뷰티 제품 특화 정보
-        beauty_info = extract_beauty_specific_info(soup)
-        product_data['beauty_info'] = beauty_info
-        
-        # 상세 정보 펼치기 버튼 클릭 시도
-        try:
-            more_button = safe_find_element(driver, By.CSS_SELECTOR, '._1gG8JHE9Zc')
-            if more_button and more_button.is_displayed():
-                safe_click(driver, more_button)
-                time.sleep(2)
-                
-                # 펼쳐진 정보 추가 크롤링
-                html_source = driver.page_source
-                soup = BeautifulSoup(html_source, 'html.parser')
-                
-                # 추가 뷰티 정보 크롤링
-                additional_beauty_info = extract_beauty_specific_info(soup)
-                product_data['beauty_info'].update(additional_beauty_info)
-        except Exception as e:
-            print(f"[WARN] 상세 정보 펼치기 버튼 클릭 중 오류: {e}")
+        # 상세 정보 펼치기 버튼 클릭 후 펼쳐진 필드만 다시 추출
+        if schema.expand:
+            try:
+                more_button = safe_find_element(driver, By.CSS_SELECTOR, schema.expand['selector'])
+                if more_button and more_button.is_displayed():
+                    safe_click(driver, more_button)
+                    time.sleep(2)
+                    
+                    soup = BeautifulSoup(driver.page_source, 'html.parser')
+                    merge_expanded(product_data, schema.extract(soup, only=schema.expand['fields'], context=product_data))
+            except Exception as e:
+                print(f"[WARN] 상세 정보 펼치기 버튼 클릭 중 오류: {e}")
         
+        if raise_errors and not (product_data.get('product_title') or product_data.get('price')):
+            raise retrypolicy.ParseMissError(f"상품명/가격을 찾지 못했습니다: {product_url}")
+
         # 결과 출력
         print(f"[INFO] 상품 '{product_data.get('product_title', '알 수 없음')}' 정보 수집 완료")
         
@@ -497,27 +240,80 @@ def crawl_product_detail(product_url, output_csv=None, headless=True):
         return product_data
         
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"[ERROR] 상품 정보 크롤링 중 오류 발생: {e}")
         return {}
     
     finally:
-        driver.quit()
+        release_driver(driver)
+        if profile_session is not None:
+            profiler.stop(profile_session)
+
+def crawl_multiple_products(product_urls, output_prefix="product_detail", headless=True,
+                            change_tracker=None, changed_only=False, page_guard=None, retry_policy=None,
+                            schema=None, profiler=None, product_graph=None, backend=BACKEND_SELENIUM,
+                            contexts=DEFAULT_ASYNC_CONTEXTS):
+    """
+    여러 상품 페이지 크롤링 (단일 CSV 파일로 저장)
 
-def crawl_multiple_products(product_urls, output_prefix="product_detail", headless=True):
-    """여러 상품 페이지 크롤링 - 뷰티 제품 특화 (단일 CSV 파일로 저장)"""
+    schema(카테고리 이름 또는 CategorySchema)는 한 번만 컴파일해 모든 상품에 재사용한다.
+
+    change_tracker(ProductChangeTracker)가 주어지면 가격/프로모션 이력을 기록하고,
+    changed_only=True일 때는 이전 실행 대비 내용이 바뀐 상품만 저장한다.
+    page_guard(PageGuard)는 상품마다 crawl_product_detail에 전달된다.
+    retry_policy(RetryPolicy)가 있으면 실패한 상품을 오류 분류별로 재시도하고, 끝내 실패한
+    상품은 dead letter로 기록한다.
+    profiler(CrawlProfiler)는 상품마다 crawl_product_detail에 전달된다.
+    product_graph(ProductGraph)가 주어지면 관련 상품 간선을 중복 없이 그래프에 저장한다.
+    backend='async'이면 asyncbrowser가 한 이벤트 루프에서 컨텍스트 contexts개로 상품을 동시에
+    수집한 뒤(profiler는 쓰지 않음) 그래프/이력/저장은 아래의 같은 순서로 처리한다.
+    """
     all_products = []
     all_related_products = []
+    unchanged_count = 0
+    
+    prefetched = None
+    if backend == BACKEND_ASYNC:
+        if profiler is not None:
+            print("[WARN] 비동기 백엔드에서는 상품 세션이 동시에 열리므로 프로파일링을 건너뜁니다.")
+        prefetched = asyncio.run(asyncbrowser.crawl_products_async(
+            product_urls, headless=headless, page_guard=page_guard, retry_policy=retry_policy, schema=schema,
+            contexts=contexts
+        ))
     
     for idx, url in enumerate(product_urls):
         print(f"\n[{idx+1}/{len(product_urls)}] 상품 정보 수집 중: {url}")
         try:
             # 상품 정보 크롤링 (CSV 저장 비활성화)
-            product_data = crawl_product_detail(
-                product_url=url,
-                output_csv=False,  # 개별 CSV 저장 안 함
-                headless=headless
-            )
+            if prefetched is not None:
+                product_data = prefetched[idx]
+            elif retry_policy is not None:
+                product_data = retry_policy.run(
+                    'products', url, crawl_product_detail,
+                    product_url=url, output_csv=False, headless=headless,
+                    page_guard=page_guard, raise_errors=True, schema=schema, profiler=profiler
+                ) or {}
+            else:
+                product_data = crawl_product_detail(
+                    product_url=url,
+                    output_csv=False,  # 개별 CSV 저장 안 함
+                    headless=headless,
+                    page_guard=page_guard,
+                    schema=schema,
+                    profiler=profiler
+                )
             
+            if product_data and product_graph is not None:
+                product_graph.add_product(product_data)
+
+            if product_data and change_tracker is not None:
+                changed = change_tracker.observe(product_data)
+                if changed_only and not changed:
+                    print(f"[INFO] 변경 없음, 저장 생략: {url}")
+                    unchanged_count += 1
+                    product_data = {}
+
             if product_data:
                 # 상품 데이터 추가
                 all_products.append(product_data)
@@ -526,12 +322,16 @@ def crawl_multiple_products(product_urls, output_prefix="product_detail", headle
                 if "related_products" in product_data and product_data["related_products"]:
                     all_related_products.extend(product_data["related_products"])
             
-            # 서버 부하를 줄이기 위해 대기
-            time.sleep(2)
+            # 서버 부하를 줄이기 위해 대기 (비동기 백엔드는 컨텍스트 슬롯마다 대기함)
+            if prefetched is None:
+                time.sleep(2)
             
         except Exception as e:
             print(f"[ERROR] URL 처리 중 오류 발생: {url} - {str(e)}")
     
+    if unchanged_count:
+        print(f"[INFO] 변경되지 않은 상품 {unchanged_count}개는 저장하지 않았습니다.")
+
     # 처리된 상품이 없으면 빈 리스트 반환
     if not all_products:
         print("[WARN] 수집된 상품 정보가 없습니다.")
@@ -559,10 +359,13 @@ def crawl_multiple_products(product_urls, output_prefix="product_detail", headle
     
     # 관련 상품 정보를 하나의 CSV 파일로 저장
     if all_related_products:
+        # 같은 상품에서 같은 관련 상품이 여러 번 노출된 경우는 한 번만 저장
         related_df = pd.DataFrame(all_related_products)
+        dedup_columns = ['source_product_id', 'url'] if {'source_product_id', 'url'} <= set(related_df.columns) else None
+        related_df = related_df.drop_duplicates(subset=dedup_columns)
         related_csv = f"{output_prefix}_related_products.csv"
         related_df.to_csv(related_csv, index=False, encoding='utf-8-sig')
-        print(f"[INFO] 관련 상품 정보 CSV 저장 완료: {related_csv} (총 {len(all_related_products)}개 관련 상품)")
+        print(f"[INFO] 관련 상품 정보 CSV 저장 완료: {related_csv} (총 {len(related_df)}개 관련 상품)")
     
     # 전체 결과를 하나의 JSON으로 저장
     with open(f"{output_prefix}_all.json", 'w', encoding='utf-8') as f:
@@ -572,23 +375,218 @@ def crawl_multiple_products(product_urls, output_prefix="product_detail", headle
     return all_products
 
 
+# 선택한 요소의 outerHTML만 브라우저에서 꺼내는 스크립트 (전체 page_source 직렬화/파싱 생략)
+PRICE_ONLY_SCRIPT = """
+return arguments[0].map(function (selector) {
+    var el = document.querySelector(selector);
+    return el ? el.outerHTML : '';
+}).join('');
+"""
+
+def crawl_price_snapshot(driver, product_url, wait_time=5, page_guard=None, schema=None):
+    """
+    이미 열린 드라이버로 상품 가격/프로모션만 수집
+
+    가격 요소가 나타날 때까지만 기다린 뒤(고정 3초 대기 없음) 스키마 price_fields의
+    요소 HTML만 가져와 해당 필드만 추출한다. 가격 요소가 없을 때만
+    전체 페이지를 page_guard로 분류해 차단/캡차/없는 상품이면 None을 반환한다.
+
+    Returns:
+        dict: url, product_id, crawled_at, price, discount, promotion (차단된 페이지면 None)
+    """
+    if product_url.startswith('/'):
+        product_url = 'https://brand.naver.com' + product_url
+    schema = resolve_schema(schema)
+    price_selectors = schema.selectors(schema.price_fields)
+
+    driver.get(product_url)
+    try:
+        WebDriverWait(driver, wait_time).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, price_selectors[0]))
+        )
+    except selenium_exceptions.TimeoutException:
+        print(f"[WARN] 가격 요소를 찾지 못했습니다: {product_url}")
+        if not page_usable(page_guard, product_url, driver.page_source, 'prices'):
+            return None
+
+    fragment = driver.execute_script(PRICE_ONLY_SCRIPT, price_selectors) or ""
+    return extract_price_data(fragment, product_url, schema)
+
+def extract_price_data(fragment, product_url, schema):
+    """가격 요소 HTML 조각에서 price_fields만 추출 (Selenium/비동기 백엔드 공용)"""
+    price_data = {
+        'url': product_url,
+        'product_id': product_key(product_url),
+        'crawled_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    price_data.update(schema.extract(BeautifulSoup(fragment, 'html.parser'), only=schema.price_fields))
+    return price_data
+
+def _crawl_price_chunk(product_urls, headless=True, wait_time=5, governor=None, page_guard=None, schema=None):
+    """
+    워커 하나가 드라이버 하나를 재사용하며 URL 묶음을 처리
+
+    governor가 있으면 상품 사이마다 브라우저 자원을 확인해 임계값을 넘으면 재시작한다.
+    """
+    def new_driver():
+        driver = setup_driver(headless=headless, lightweight=True)
+        # 가격 요소 탐색은 명시적 대기로 처리하므로 암묵적 대기는 끔
+        driver.implicitly_wait(0)
+        return driver
+
+    governor = governor or DriverGovernor("price")
+    driver = None
+    results = []
+    try:
+        driver = governor.attach(new_driver())
+        for url in product_urls:
+            if page_guard is not None and not page_guard.allow(url, task='prices'):
+                continue
+            try:
+                price_data = crawl_price_snapshot(driver, url, wait_time=wait_time, page_guard=page_guard,
+                                                  schema=schema)
+                if price_data:
+                    results.append(price_data)
+            except Exception as e:
+                print(f"[ERROR] 가격 수집 중 오류 발생: {url} - {str(e)}")
+            if governor.should_recycle():
+                driver = governor.recycle(driver, new_driver)
+    finally:
+        governor.quit(driver)
+    return results
+
+def crawl_price_only(product_urls, output_csv=None, headless=True, workers=4, change_tracker=None, wait_time=5,
+                     max_rss_mb=1536, page_guard=None, schema=None, backend=BACKEND_SELENIUM,
+                     contexts=DEFAULT_ASYNC_CONTEXTS):
+    """
+    가격/프로모션만 빠르게 갱신하는 가격 모니터링 모드
+
+    crawl_product_detail과 달리 상품마다 브라우저를 새로 띄우지 않고, 워커별 드라이버
+    하나를 재사용하며(이미지 로딩 끔, eager 로드) 가격 요소만 가져온다.
+    change_tracker가 있으면 가격/프로모션 변경 이력을 기록한다.
+
+    Args:
+        product_urls (list): 상품 URL 목록
+        output_csv (str, optional): 결과 CSV 파일명
+        headless (bool): 헤드리스 모드 여부
+        workers (int): 동시에 띄울 브라우저 수
+        change_tracker (ProductChangeTracker, optional): 가격 이력 저장소
+        wait_time (int): 가격 요소 최대 대기 시간 (초)
+        max_rss_mb (float): 워커 브라우저 재시작 메모리 기준 (MB)
+        page_guard (PageGuard, optional): 차단/캡차 감지 + 스토어별 서킷 브레이커 (워커 간 공유)
+        schema (str or CategorySchema, optional): price_fields를 가져올 카테고리 스키마 (기본값: 뷰티)
+        backend (str): 'selenium'(워커별 드라이버) 또는 'async'(브라우저 workers개에 컨텍스트 contexts개)
+        contexts (int): 비동기 백엔드의 동시 컨텍스트 수
+
+    Returns:
+        list: 상품별 가격 정보 딕셔너리 목록
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not product_urls:
+        # 빈 목록이면 워커 브라우저를 띄우지 않음
+        print("[INFO] 가격을 수집할 상품 URL이 없습니다.")
+        return []
+
+    start_time = time.time()
+    schema = resolve_schema(schema)
+    workers = max(1, min(workers, len(product_urls)))
+    if backend == BACKEND_ASYNC:
+        price_rows = asyncio.run(asyncbrowser.crawl_prices_async(
+            product_urls, headless=headless, wait_time=wait_time, page_guard=page_guard, schema=schema,
+            browsers=workers, contexts=contexts
+        ))
+    else:
+        chunks = [product_urls[i::workers] for i in range(workers)]
+        governors = [DriverGovernor(f"price-{i + 1}", max_rss_mb=max_rss_mb) for i in range(workers)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunk_results = list(executor.map(
+                lambda chunk, governor: _crawl_price_chunk(chunk, headless=headless, wait_time=wait_time,
+                                                           governor=governor, page_guard=page_guard, schema=schema),
+                chunks, governors
+            ))
+        price_rows = [row for rows in chunk_results for row in rows]
+        for governor in governors:
+            governor.report()
+
+    # SQLite 연결은 스레드 간 공유하지 않도록 이력 기록은 메인 스레드에서 처리
+    changed_count = 0
+    if change_tracker is not None:
+        for row in price_rows:
+            if change_tracker.observe_price(row):
+                changed_count += 1
+
+    elapsed = time.time() - start_time
+    rate = len(price_rows) / elapsed * 3600 if elapsed > 0 else 0
+    print(f"[INFO] 가격 갱신 완료: {len(price_rows)}/{len(product_urls)}개 상품, 소요 시간 {elapsed:.2f}초 (시간당 약 {rate:.0f}개)")
+    if change_tracker is not None:
+        print(f"[INFO] 가격/프로모션 변경 상품: {changed_count}개")
+
+    if output_csv and price_rows:
+        flat_rows = []
+        for row in price_rows:
+            flat_data = {}
+            for key, value in row.items():
+                if isinstance(value, dict):
+                    for sub_key, sub_value in value.items():
+                        flat_data[f"{key}_{sub_key}"] = sub_value
+                else:
+                    flat_data[key] = value
+            flat_rows.append(flat_data)
+        pd.DataFrame(flat_rows).to_csv(output_csv, index=False, encoding='utf-8-sig')
+        print(f"[INFO] 가격 정보 CSV 저장 완료: {output_csv}")
+
+    return price_rows
+
+
 if __name__ == "__main__":
     import argparse
+    from productchanges import ProductChangeTracker
+    from pageguard import PageGuard, QuarantineStore
+    from crawlprofiler import CrawlProfiler, PROFILE_MODES
     
-    parser = argparse.ArgumentParser(description='네이버 스마트스토어 뷰티 제품 상세 정보 크롤러')
+    parser = argparse.ArgumentParser(description='네이버 스마트스토어 상품 상세 정보 크롤러 (카테고리 스키마 기반, 기본값: 뷰티)')
     parser.add_argument('--url', type=str, help='크롤링할 상품 URL')
     parser.add_argument('--urls_file', type=str, help='크롤링할 상품 URL 목록 파일 (.txt 또는 .csv)')
     parser.add_argument('--output', type=str, default='beauty_product_detail.csv', help='결과를 저장할 CSV 파일명')
     parser.add_argument('--no-headless', action='store_true', help='헤드리스 모드 비활성화 (브라우저 표시)')
+    parser.add_argument('--changes-db', type=str, default=None, help='상품 변경/가격 이력 DB (예: product_changes.db)')
+    parser.add_argument('--changed-only', action='store_true', help='이전 실행 대비 변경된 상품만 저장 (--changes-db 필요)')
+    parser.add_argument('--price-only', action='store_true', help='가격/프로모션만 빠르게 갱신 (가격 모니터링 모드)')
+    parser.add_argument('--workers', type=int, default=4, help='가격 갱신 모드의 동시 브라우저 수 (기본값: 4)')
+    parser.add_argument('--quarantine-db', type=str, default='quarantine.db', help='차단된 URL 격리 DB (기본값: quarantine.db)')
+    parser.add_argument('--category', type=str, default=DEFAULT_CATEGORY,
+                        help='추출에 쓸 카테고리 스키마 (category_schemas/<카테고리>.json, 기본값: beauty)')
+    parser.add_argument('--profile-dir', type=str, default=None, help='프로파일링 결과 디렉터리 (지정 시 느린 상품의 스택/메모리 프로파일 저장)')
+    parser.add_argument('--profile-mode', choices=PROFILE_MODES, default='sample', help='프로파일링 방식 (기본값: sample)')
+    parser.add_argument('--profile-keep', type=int, default=5, help='보관할 느린/메모리 많이 쓴 상품 수 (기본값: 5)')
+    parser.add_argument('--backend', choices=BACKENDS, default=BACKEND_SELENIUM,
+                        help='브라우저 백엔드 (async: Playwright 컨텍스트 풀, 기본값: selenium)')
+    parser.add_argument('--contexts', type=int, default=DEFAULT_ASYNC_CONTEXTS,
+                        help=f'비동기 백엔드의 동시 컨텍스트 수 (기본값: {DEFAULT_ASYNC_CONTEXTS})')
+    add_driver_arguments(parser)
     
     args = parser.parse_args()
     
+    # 이전 실행에서 남은 chromedriver/Chrome 정리
+    reap_orphans()
+    driver_backend = configure_from_args(args)
+    page_guard = PageGuard(quarantine=QuarantineStore(args.quarantine_db))
+    schema = load_schema(args.category)
+    if schema is None:
+        parser.error(f"{args.category} 스키마를 찾을 수 없습니다 (category_schemas/{args.category}.json)")
+    profiler = CrawlProfiler(args.profile_dir, keep=args.profile_keep, mode=args.profile_mode) if args.profile_dir else None
+    
     # URL이 직접 제공된 경우
     if args.url:
         crawl_product_detail(
             product_url=args.url,
             output_csv=args.output,
-            headless=(not args.no_headless)
+            headless=(not args.no_headless),
+            page_guard=page_guard,
+            schema=schema,
+            profiler=profiler
         )
     
     # URL 목록 파일이 제공된 경우
@@ -611,12 +609,38 @@ if __name__ == "__main__":
         else:
             print(f"[INFO] 총 {len(product_urls)}개의 URL을 크롤링합니다.")
             output_prefix = args.output.replace(".csv", "")
-            crawl_multiple_products(
-                product_urls=product_urls,
-                output_prefix=output_prefix,
-                headless=(not args.no_headless)
-            )
+            change_tracker = ProductChangeTracker(args.changes_db) if args.changes_db else None
+            if args.price_only:
+                crawl_price_only(
+                    product_urls=product_urls,
+                    output_csv=f"{output_prefix}_prices.csv",
+                    headless=(not args.no_headless),
+                    workers=args.workers,
+                    change_tracker=change_tracker,
+                    page_guard=page_guard,
+                    schema=schema,
+                    backend=args.backend,
+                    contexts=args.contexts
+                )
+            else:
+                crawl_multiple_products(
+                    product_urls=product_urls,
+                    output_prefix=output_prefix,
+                    headless=(not args.no_headless),
+                    change_tracker=change_tracker,
+                    changed_only=args.changed_only and change_tracker is not None,
+                    page_guard=page_guard,
+                    schema=schema,
+                    profiler=profiler,
+                    backend=args.backend,
+                    contexts=args.contexts
+                )
     
     else:
         print("[ERROR] --url 또는 --urls_file 인자가 필요합니다.")
-        parser.print_help()
\ No newline at end of file
+        parser.print_help()
+
+    driver_backend.report()
+    page_guard.report()
+    if profiler is not None:
+        profiler.report()
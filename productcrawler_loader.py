@@ -1,7 +1,29 @@
+import functools
 import importlib
 import os
 import re
 
+from schemaextractor import available_schemas, load_schema
+
+# 모듈 없이 스키마 파일만 있는 카테고리는 이 모듈의 크롤러 함수(드라이버/재시도/저장 흐름)를 공유
+SCHEMA_ENGINE_MODULE = 'productcrawler_beauty'
+
+
+class SchemaCrawler:
+    """
+    카테고리 스키마를 공용 크롤러 함수에 묶은 크롤러 (크롤러 모듈과 같은 방식으로 사용)
+
+    스키마는 load_schema가 카테고리별로 한 번만 컴파일하고, 모든 카테고리가 같은
+    추출 엔진(schemaextractor)과 크롤러 함수를 공유한다.
+    """
+
+    def __init__(self, schema, engine_module):
+        self.category = schema.category
+        self.schema = schema
+        for func_name in ('crawl_product_detail', 'crawl_multiple_products', 'crawl_price_only'):
+            if hasattr(engine_module, func_name):
+                setattr(self, func_name, functools.partial(getattr(engine_module, func_name), schema=schema))
+
 def get_available_crawlers():
     """
     폴더 내 사용 가능한 모든 productcrawler 모듈을 찾아 반환
@@ -26,20 +48,44 @@ def get_available_crawlers():
             })
             print(f"[DEBUG] 크롤러 발견: {module_name}, 카테고리: {category}")
     
+    # 크롤러 모듈이 없는 카테고리 스키마 (category_schemas/*.json)
+    module_categories = {crawler['category'] for crawler in crawlers}
+    for category in available_schemas():
+        if category not in module_categories:
+            crawlers.append({
+                'module': SCHEMA_ENGINE_MODULE,
+                'category': category,
+                'schema': load_schema(category).path
+            })
+            print(f"[DEBUG] 카테고리 스키마 발견: {category}")
+    
     return crawlers
 
 def load_crawler(category):
     """
     지정된 카테고리의 크롤러 모듈을 동적으로 로드
     
+    productcrawler_<카테고리> 모듈이 없으면 category_schemas/<카테고리>.json 스키마를
+    공용 크롤러 함수에 묶은 SchemaCrawler를 반환한다.
+    
     Args:
         category (str): 크롤러 카테고리 이름 (예: beauty, fashion)
     
     Returns:
-        module: 로드된 크롤러 모듈
+        module or SchemaCrawler: 로드된 크롤러
     """
     module_name = f"productcrawler_{category}"
     
+    if not os.path.exists(f"{module_name}.py"):
+        schema = load_schema(category)
+        if schema is not None:
+            print(f"[DEBUG] 카테고리 스키마 사용: {schema.path}")
+            try:
+                return SchemaCrawler(schema, importlib.import_module(SCHEMA_ENGINE_MODULE))
+            except ImportError as e:
+                print(f"[ERROR] {SCHEMA_ENGINE_MODULE} 모듈을 찾을 수 없습니다: {e}")
+                return None
+    
     try:
         print(f"[DEBUG] 모듈 로드 시도: {module_name}")
         # 동적으로 모듈 임포트
@@ -81,6 +127,16 @@ def get_crawler_functions(module):
                 print(f"[ERROR] 모듈에 필요한 함수 {func_name}이(가) 없습니다.")
                 return None
         
+        # 선택 함수 (없으면 해당 모드만 사용할 수 없음)
+        optional_functions = [
+            'crawl_price_only'
+        ]
+        
+        for func_name in optional_functions:
+            if hasattr(module, func_name):
+                print(f"[DEBUG] 선택 함수 발견: {func_name}")
+                functions[func_name] = getattr(module, func_name)
+        
         return functions
     except Exception as e:
         print(f"[ERROR] 크롤러 함수 추출 중 오류: {e}")
@@ -0,0 +1,295 @@
+"""
+관련 상품 그래프 (중복 없는 상품 간 간선 + 인접 색인) 및 너비 우선 상품 탐색
+
+상세 크롤링에서 나오는 관련 상품(related_products)은 지금까지 상품마다
+_related_products.csv에 그대로 쌓여 같은 간선이 계속 중복됐다. ProductGraph는
+(출발 상품번호, 관련 상품번호) 간선을 한 번만 저장하고(관측 횟수/최초·마지막 관측 시각 갱신),
+출발 상품별 인접 목록(기본 키)과 역방향 색인(edges_by_target)으로 바로 조회한다.
+
+discover()는 시드 상품에서 관련 상품 간선을 따라 너비 우선으로 탐색 경계를 넓힌다.
+refresh_days 안에 크롤링한 상품은 페이지를 열지 않고 저장된 인접 목록을 재사용하고,
+상세 페이지 크롤링은 budget개까지만 한다. 그래프에 처음 등장한 상품이 새로 발견된
+상품이며, 카테고리 목록 페이지 전체를 다시 넘기는 것보다 훨씬 적은 요청으로 찾는다.
+
+    python productgraph.py stats
+    python productgraph.py neighbors 8045986719
+    python productgraph.py discover --urls seeds.txt --depth 2 --budget 50 --output discovered_urls.csv
+"""
+import csv
+import sqlite3
+import time
+from collections import deque
+from urllib.parse import urljoin
+
+from reviewdedup import product_key
+
+
+def product_id_of(url):
+    """URL의 상품번호 (/products/123 형식이 아니면 None)"""
+    key = product_key(url) if url else None
+    return key if key and key.isdigit() else None
+
+
+class ProductGraph:
+    """관련 상품 간선 저장소"""
+
+    def __init__(self, db_path="product_graph.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS products (
+                product_id TEXT PRIMARY KEY,
+                url TEXT,
+                title TEXT,
+                seller TEXT,
+                first_seen TEXT NOT NULL,
+                last_crawled TEXT
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS edges (
+                source_id TEXT NOT NULL,
+                target_id TEXT NOT NULL,
+                seen_count INTEGER NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                PRIMARY KEY (source_id, target_id)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS edges_by_target ON edges (target_id, source_id);
+        """)
+        self.conn.commit()
+
+    def known(self, product_ids):
+        """이미 그래프에 있는 상품번호 집합"""
+        known = set()
+        ids = list(product_ids)
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            known.update(row[0] for row in self.conn.execute(
+                f"SELECT product_id FROM products WHERE product_id IN ({placeholders})", chunk
+            ))
+        return known
+
+    def add_product(self, product_data, crawled_at=None):
+        """
+        크롤링한 상품과 관련 상품 간선 저장
+
+        관련 상품은 상대 URL을 상품 URL 기준으로 절대화하고 상품번호로 중복을 제거한다.
+
+        Args:
+            product_data (dict): crawl_product_detail 결과 (url, product_id, related_products)
+            crawled_at (str, optional): 크롤링 시각 (기본값: 현재)
+
+        Returns:
+            dict: 그래프에 처음 등장한 관련 상품 {상품번호: URL}
+        """
+        crawled_at = crawled_at or product_data.get('crawled_at') or time.strftime("%Y-%m-%d %H:%M:%S")
+        source_url = product_data.get('url', '')
+        # discover가 URL의 상품번호로 큐/신선도/이웃을 조회하므로 노드도 URL 기준으로 키를 잡는다
+        # (상세 표의 상품번호는 URL과 다를 수 있어 URL에 번호가 없을 때만 사용)
+        source_id = product_id_of(source_url) or product_data.get('product_id')
+        if not source_id:
+            return {}
+
+        targets = {}
+        for item in product_data.get('related_products') or []:
+            url = urljoin(source_url, item['url']) if item.get('url') else None
+            target_id = product_id_of(url)
+            if target_id and target_id != source_id and target_id not in targets:
+                targets[target_id] = (url, item.get('title'), item.get('seller'))
+
+        new_products = {pid: targets[pid][0] for pid in set(targets) - self.known(targets)}
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO products (product_id, url, title, seller, first_seen, last_crawled)
+                   VALUES (?, ?, ?, NULL, ?, ?)
+                   ON CONFLICT(product_id) DO UPDATE SET
+                       url = excluded.url, title = COALESCE(excluded.title, title), last_crawled = excluded.last_crawled""",
+                (source_id, source_url, product_data.get('product_title') or None, crawled_at, crawled_at)
+            )
+            self.conn.executemany(
+                """INSERT INTO products (product_id, url, title, seller, first_seen, last_crawled)
+                   VALUES (?, ?, ?, ?, ?, NULL)
+                   ON CONFLICT(product_id) DO UPDATE SET
+                       title = COALESCE(title, excluded.title), seller = COALESCE(seller, excluded.seller)""",
+                ((pid, url, title or None, seller or None, crawled_at) for pid, (url, title, seller) in targets.items())
+            )
+            self.conn.executemany(
+                """INSERT INTO edges (source_id, target_id, seen_count, first_seen, last_seen) VALUES (?, ?, 1, ?, ?)
+                   ON CONFLICT(source_id, target_id) DO UPDATE SET
+                       seen_count = seen_count + 1, last_seen = excluded.last_seen""",
+                ((source_id, pid, crawled_at, crawled_at) for pid in targets)
+            )
+        return new_products
+
+    def neighbors(self, product_id):
+        """관련 상품 [(상품번호, URL), ...] (자주 관측된 순)"""
+        return self.conn.execute(
+            """SELECT e.target_id, p.url FROM edges e JOIN products p ON p.product_id = e.target_id
+               WHERE e.source_id = ? ORDER BY e.seen_count DESC, e.target_id""", (product_id,)
+        ).fetchall()
+
+    def referrers(self, product_id):
+        """이 상품을 관련 상품으로 노출하는 상품 [(상품번호, URL), ...]"""
+        return self.conn.execute(
+            """SELECT e.source_id, p.url FROM edges e JOIN products p ON p.product_id = e.source_id
+               WHERE e.target_id = ? ORDER BY e.seen_count DESC, e.source_id""", (product_id,)
+        ).fetchall()
+
+    def is_fresh(self, product_id, max_age_days):
+        """max_age_days 안에 크롤링해 인접 목록을 재사용할 수 있으면 True"""
+        row = self.conn.execute("SELECT last_crawled FROM products WHERE product_id = ?", (product_id,)).fetchone()
+        if not row or not row[0]:
+            return False
+        crawled = time.mktime(time.strptime(row[0], "%Y-%m-%d %H:%M:%S"))
+        return time.time() - crawled <= max_age_days * 86400
+
+    def stats(self):
+        """(상품 수, 크롤링한 상품 수, 간선 수)"""
+        products, crawled = self.conn.execute(
+            "SELECT COUNT(*), COUNT(last_crawled) FROM products"
+        ).fetchone()
+        edges = self.conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+        return products, crawled, edges
+
+    def close(self):
+        self.conn.close()
+
+
+def discover(graph, seed_urls, crawl_product_detail, max_depth=2, budget=50, refresh_days=7,
+             retry_policy=None, page_guard=None, change_tracker=None, headless=True):
+    """
+    시드 상품에서 관련 상품 간선을 따라 너비 우선 탐색
+
+    Args:
+        graph (ProductGraph): 간선 저장소 (새로 크롤링한 상품의 간선이 추가됨)
+        seed_urls (list): 시작 상품 URL
+        crawl_product_detail (callable): 상세 크롤링 함수 (카테고리 크롤러)
+        max_depth (int): 시드에서 이 거리까지의 상품만 크롤링/확장 (더 먼 상품은 발견만)
+        budget (int): 상세 페이지 크롤링 최대 횟수
+        refresh_days (float): 이 기간 안에 크롤링한 상품은 저장된 인접 목록 재사용
+        retry_policy (RetryPolicy, optional): 오류 분류별 재시도
+        page_guard (PageGuard, optional): 차단 감지 + 서킷 브레이커
+        change_tracker (ProductChangeTracker, optional): 크롤링한 상품의 가격 이력 기록
+
+    Returns:
+        dict: discovered(새로 발견한 상품 {상품번호: (URL, 거리)}), crawled, reused, skipped(예산 초과로 못 연 상품 수)
+    """
+    queue = deque()
+    seen = set()
+    for url in seed_urls:
+        product_id = product_id_of(url)
+        if product_id and product_id not in seen:
+            seen.add(product_id)
+            queue.append((product_id, url, 0))
+
+    discovered = {}
+    crawled = reused = skipped = 0
+    while queue:
+        product_id, url, depth = queue.popleft()
+        if graph.is_fresh(product_id, refresh_days):
+            reused += 1
+        elif crawled >= budget:
+            skipped += 1
+            continue
+        else:
+            crawled += 1
+            print(f"\n[{crawled}/{budget}] 거리 {depth} 상품 크롤링: {url}")
+            kwargs = dict(product_url=url, output_csv=False, headless=headless, page_guard=page_guard)
+            if retry_policy is not None:
+                product_data = retry_policy.run('products', url, crawl_product_detail, raise_errors=True, **kwargs)
+            else:
+                product_data = crawl_product_detail(**kwargs)
+            if not product_data:
+                continue
+            if change_tracker is not None:
+                change_tracker.observe(product_data)
+            for new_id, new_url in graph.add_product(product_data).items():
+                discovered[new_id] = (new_url, depth + 1)
+            print(f"[INFO] 관련 상품 {len(graph.neighbors(product_id))}개, 누적 새 상품 {len(discovered)}개")
+
+        if depth >= max_depth:
+            continue
+        for target_id, target_url in graph.neighbors(product_id):
+            if target_id not in seen:
+                seen.add(target_id)
+                queue.append((target_id, target_url, depth + 1))
+
+    return {'discovered': discovered, 'crawled': crawled, 'reused': reused, 'skipped': skipped}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='관련 상품 그래프 조회 및 너비 우선 상품 탐색')
+    parser.add_argument('--db', type=str, default='product_graph.db', help='상품 그래프 DB (기본값: product_graph.db)')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('stats', help='상품/간선 수')
+    neighbors_parser = subparsers.add_parser('neighbors', help='상품의 관련 상품과 역방향 간선')
+    neighbors_parser.add_argument('product_id', help='상품번호')
+    discover_parser = subparsers.add_parser('discover', help='시드 상품에서 관련 상품을 따라 새 상품 탐색')
+    discover_parser.add_argument('--urls', type=str, nargs='+', required=True, help='시드 상품 URL 목록 파일 (.txt 또는 .csv)')
+    discover_parser.add_argument('--depth', type=int, default=2, help='시드에서 크롤링할 최대 거리 (기본값: 2)')
+    discover_parser.add_argument('--budget', type=int, default=50, help='상세 페이지 크롤링 최대 횟수 (기본값: 50)')
+    discover_parser.add_argument('--refresh-days', type=float, default=7, help='이 기간 안에 크롤링한 상품은 저장된 간선 재사용 (기본값: 7일)')
+    discover_parser.add_argument('--category', type=str, default='beauty', help='상품 크롤러 카테고리 (기본값: beauty)')
+    discover_parser.add_argument('--output', type=str, default='discovered_urls.csv', help='새로 발견한 상품 URL CSV (기본값: discovered_urls.csv)')
+
+    args = parser.parse_args()
+    graph = ProductGraph(args.db)
+
+    if args.command == 'stats':
+        products, crawled, edges = graph.stats()
+        print(f"상품 {products}개 (크롤링 {crawled}개), 간선 {edges}개")
+    elif args.command == 'neighbors':
+        print(f"[관련 상품] {args.product_id} →")
+        for target_id, url in graph.neighbors(args.product_id):
+            print(f"  {target_id}\t{url}")
+        print(f"[역방향] → {args.product_id}")
+        for source_id, url in graph.referrers(args.product_id):
+            print(f"  {source_id}\t{url}")
+    elif args.command == 'discover':
+        from recrawlscheduler import load_urls
+        from productchanges import ProductChangeTracker
+        from drivergovernor import reap_orphans
+        from pageguard import PageGuard, QuarantineStore
+        from retrypolicy import RetryPolicy, DeadLetterLog
+        from productcrawler_loader import load_crawler, get_crawler_functions
+
+        crawler_functions = get_crawler_functions(load_crawler(args.category))
+        if not crawler_functions:
+            parser.error(f"{args.category} 크롤러를 로드할 수 없습니다.")
+        seed_urls = [url for path in args.urls for url in load_urls(path)]
+
+        reap_orphans()
+        page_guard = PageGuard(quarantine=QuarantineStore("quarantine.db"))
+        retry_policy = RetryPolicy(DeadLetterLog("dead_letter.jsonl"), quarantine=page_guard.quarantine)
+        change_tracker = ProductChangeTracker("product_changes.db")
+        start_time = time.time()
+        try:
+            result = discover(graph, seed_urls, crawler_functions['crawl_product_detail'], max_depth=args.depth,
+                              budget=args.budget, refresh_days=args.refresh_days, retry_policy=retry_policy,
+                              page_guard=page_guard, change_tracker=change_tracker)
+        finally:
+            change_tracker.close()
+            page_guard.quarantine.close()
+
+        with open(args.output, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(['URL', 'PRODUCT_ID', 'DEPTH'])
+            for product_id, (url, depth) in sorted(result['discovered'].items(), key=lambda item: item[1][1]):
+                writer.writerow([url, product_id, depth])
+
+        print("\n" + "=" * 50)
+        print(f"- 시드 상품: {len(seed_urls)}개")
+        print(f"- 상세 크롤링: {result['crawled']}개, 저장된 간선 재사용: {result['reused']}개, 예산 초과: {result['skipped']}개")
+        print(f"- 새로 발견한 상품: {len(result['discovered'])}개 → {args.output}")
+        print(f"- 소요 시간: {time.time() - start_time:.2f}초")
+        print("=" * 50)
+        page_guard.report()
+        retry_policy.report()
+    else:
+        parser.print_help()
+
+    graph.close()
@@ -0,0 +1,367 @@
+"""
+변경 가능성 기반 우선순위 재크롤링 스케줄러 (데몬)
+
+전체 카탈로그를 고정 주기로 다시 긁는 대신, 상품별로
+  - 리뷰 속도(review_velocity, 하루 새 리뷰 수)
+  - 가격 변경률(price_change_rate, 하루 가격/프로모션 변경 횟수)
+를 과거 크롤링 결과(review_aggregates.db, product_changes.db)와 매 크롤링 결과로
+학습(지수 이동 평균)하고, "마지막 크롤링 이후 예상되는 변경량"이 큰 작업부터
+주기당 예산만큼만 크롤링한다. 한 번도 크롤링하지 않은 상품이나 max_age_days보다
+오래된 상품은 우선 처리한다. 실패한 작업(dead letter/격리/계속 실패)은 학습값을 건드리지
+않고 실패 횟수만큼 지수적으로 늘어나는 동안 계획에서 빠진다.
+
+    python recrawlscheduler.py --urls product_urls.csv --budget 30 --interval 1800
+    python recrawlscheduler.py --plan --budget 50
+"""
+import csv
+import heapq
+import sqlite3
+import time
+
+from reviewdedup import product_key
+
+TASK_REVIEWS = 'reviews'
+TASK_DETAIL = 'products'
+
+# 새 관측을 이동 평균에 반영하는 비율
+EWMA_ALPHA = 0.3
+
+# 첫 실패 후 다시 시도하기까지 대기 시간 (실패할 때마다 2배, 최대 max_age_days)
+FAILURE_BACKOFF_HOURS = 6
+
+_DAY = 86400.0
+
+# 작업별 (속도, 마지막 크롤링, 크롤링 횟수, 연속 실패 횟수, 마지막 실패 시각) 컬럼
+_TASK_COLUMNS = {
+    TASK_REVIEWS: ('review_velocity', 'last_review_crawl', 'review_crawls', 'review_failures', 'last_review_failure'),
+    TASK_DETAIL: ('price_change_rate', 'last_detail_crawl', 'detail_crawls', 'detail_failures', 'last_detail_failure'),
+}
+
+
+def load_urls(path):
+    """URL 목록 파일 읽기 (.csv는 첫 번째 열, 그 외는 한 줄에 하나)"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        if path.endswith('.csv'):
+            rows = [row[0].strip() for row in csv.reader(f) if row and row[0].strip()]
+            return [url for url in rows if url.startswith('http')]
+        return [line.strip() for line in f if line.strip()]
+
+
+class RecrawlScheduler:
+    """상품별 변경 속도 학습 + 우선순위 큐"""
+
+    def __init__(self, db_path="recrawl_schedule.db", price_weight=5.0, max_age_days=30):
+        """
+        Args:
+            db_path (str): 스케줄 DB
+            price_weight (float): 가격 변경 1회를 새 리뷰 몇 건과 같은 가치로 볼지
+            max_age_days (float): 이 기간보다 오래 크롤링하지 않은 작업은 우선 처리
+        """
+        self.db_path = db_path
+        self.price_weight = price_weight
+        self.max_age_days = max_age_days
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS schedule (
+                url TEXT PRIMARY KEY,
+                product_key TEXT NOT NULL,
+                review_velocity REAL,
+                price_change_rate REAL,
+                last_review_crawl REAL,
+                last_detail_crawl REAL,
+                review_crawls INTEGER NOT NULL DEFAULT 0,
+                detail_crawls INTEGER NOT NULL DEFAULT 0,
+                review_failures INTEGER NOT NULL DEFAULT 0,
+                detail_failures INTEGER NOT NULL DEFAULT 0,
+                last_review_failure REAL,
+                last_detail_failure REAL
+            );
+        """)
+        # 실패 컬럼이 없던 이전 스케줄 DB에 컬럼 추가
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(schedule)")}
+        for column, definition in (('review_failures', 'INTEGER NOT NULL DEFAULT 0'),
+                                   ('detail_failures', 'INTEGER NOT NULL DEFAULT 0'),
+                                   ('last_review_failure', 'REAL'), ('last_detail_failure', 'REAL')):
+            if column not in existing:
+                self.conn.execute(f"ALTER TABLE schedule ADD COLUMN {column} {definition}")
+        self.conn.commit()
+
+    def register(self, urls):
+        """스케줄 대상 URL 등록 (이미 있으면 유지)"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO schedule (url, product_key) VALUES (?, ?)",
+                ((url, product_key(url)) for url in urls)
+            )
+
+    def seed_from_history(self, aggregate_store=None, change_tracker=None, now=None):
+        """
+        과거 크롤링 결과로 아직 학습값이 없는 상품의 초기 속도 추정
+
+        - 리뷰 속도: 최근 3개월 월별 리뷰 수 / 90일 (없으면 전체 기간 평균의 절반)
+        - 가격 변경률: 가격 이력 변경 횟수 / 첫 관측 이후 일수
+        """
+        now = now or time.time()
+        recent_month = time.strftime("%Y%m", time.localtime(now - 90 * _DAY))
+        rows = self.conn.execute(
+            "SELECT url, product_key, review_velocity, price_change_rate FROM schedule"
+        ).fetchall()
+
+        with self.conn:
+            for url, key, velocity, price_rate in rows:
+                if velocity is None and aggregate_store is not None:
+                    summary = aggregate_store.summary(key)
+                    if summary and summary['review_count']:
+                        recent = sum(count for month, count in summary['monthly_counts'].items() if month >= recent_month)
+                        if recent:
+                            velocity = recent / 90.0
+                        else:
+                            span = _span_days(summary['first_review_dt'], summary['last_review_dt'])
+                            velocity = summary['review_count'] / span * 0.5
+                        self.conn.execute("UPDATE schedule SET review_velocity = ? WHERE url = ?", (velocity, url))
+
+                if price_rate is None and change_tracker is not None:
+                    history = change_tracker.price_history(key)
+                    if len(history) > 1:
+                        span = _span_days(history[0]['observed_at'][:10].replace('-', ''),
+                                          time.strftime("%Y%m%d", time.localtime(now)))
+                        price_rate = (len(history) - 1) / span
+                        self.conn.execute("UPDATE schedule SET price_change_rate = ? WHERE url = ?", (price_rate, url))
+
+    def failure_backoff(self, failures):
+        """연속 failures번 실패한 작업을 다시 시도하기까지 대기 시간 (초)"""
+        return min(FAILURE_BACKOFF_HOURS * 3600 * 2 ** (failures - 1), self.max_age_days * _DAY)
+
+    def priority(self, rate, last_crawl, weight, now, failures=0, last_failure=None):
+        """마지막 크롤링 이후 예상 변경량 (처음이거나 너무 오래되면 무한대, 실패 후 대기 중이면 0)"""
+        if failures and last_failure is not None and now - last_failure < self.failure_backoff(failures):
+            return 0.0
+        if last_crawl is None:
+            return float('inf')
+        elapsed_days = (now - last_crawl) / _DAY
+        if elapsed_days >= self.max_age_days:
+            return float('inf')
+        return (rate or 0.0) * elapsed_days * weight
+
+    def plan(self, budget, tasks=(TASK_REVIEWS, TASK_DETAIL), now=None):
+        """
+        이번 주기에 실행할 작업 선택 (우선순위 큐에서 budget개)
+
+        Returns:
+            list: (priority, task, url) 목록 (우선순위 높은 순)
+        """
+        now = now or time.time()
+        queue = []
+        for (url, velocity, price_rate, last_review, last_detail,
+             review_failures, detail_failures, last_review_failure, last_detail_failure) in self.conn.execute(
+            """SELECT url, review_velocity, price_change_rate, last_review_crawl, last_detail_crawl,
+                      review_failures, detail_failures, last_review_failure, last_detail_failure FROM schedule"""
+        ):
+            if TASK_REVIEWS in tasks:
+                score = self.priority(velocity, last_review, 1.0, now, review_failures, last_review_failure)
+                heapq.heappush(queue, (-score, last_review or 0, TASK_REVIEWS, url))
+            if TASK_DETAIL in tasks:
+                score = self.priority(price_rate, last_detail, self.price_weight, now,
+                                      detail_failures, last_detail_failure)
+                heapq.heappush(queue, (-score, last_detail or 0, TASK_DETAIL, url))
+
+        selected = []
+        while queue and len(selected) < budget:
+            neg_score, _, task, url = heapq.heappop(queue)
+            if neg_score == 0:
+                break  # 예상 변경량이 0인 작업은 예산을 쓰지 않음
+            selected.append((-neg_score, task, url))
+        return selected
+
+    def record(self, task, url, changes, now=None):
+        """
+        크롤링 결과 반영 (새 리뷰 수 또는 가격 변경 여부로 속도 갱신)
+
+        Args:
+            task (str): TASK_REVIEWS / TASK_DETAIL
+            url (str): 상품 URL
+            changes (int): 새 리뷰 수 또는 가격/프로모션 변경 여부(0/1)
+        """
+        now = now or time.time()
+        rate_column, last_column, count_column, failure_column, _ = _TASK_COLUMNS[task]
+        rate, last_crawl = self.conn.execute(
+            f"SELECT {rate_column}, {last_column} FROM schedule WHERE url = ?", (url,)
+        ).fetchone()
+
+        if last_crawl is not None:
+            observed = changes / max((now - last_crawl) / _DAY, 1 / 24)
+            rate = observed if rate is None else EWMA_ALPHA * observed + (1 - EWMA_ALPHA) * rate
+
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE schedule SET {rate_column} = ?, {last_column} = ?, {count_column} = {count_column} + 1, "
+                f"{failure_column} = 0 WHERE url = ?",
+                (rate, now, url)
+            )
+
+    def record_failure(self, task, url, now=None):
+        """
+        실패한 크롤링 반영 (학습값/마지막 크롤링 시각은 그대로, 실패 횟수와 시각만 기록)
+
+        실패한 작업은 failure_backoff 동안 계획에서 빠지므로, 계속 실패하는 URL이
+        우선순위 무한대로 매 주기 예산을 차지하지 않는다.
+        """
+        now = now or time.time()
+        _, _, _, failure_column, failed_at_column = _TASK_COLUMNS[task]
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE schedule SET {failure_column} = {failure_column} + 1, {failed_at_column} = ? WHERE url = ?",
+                (now, url)
+            )
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM schedule").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def _span_days(first_dt, last_dt):
+    """YYYYMMDD 두 날짜 사이 일수 (최소 1일)"""
+    try:
+        first = time.mktime(time.strptime(first_dt, "%Y%m%d"))
+        last = time.mktime(time.strptime(last_dt, "%Y%m%d"))
+        return max((last - first) / _DAY, 1.0)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def run_daemon(scheduler, budget, interval, reviews_output, category='beauty', tasks=(TASK_REVIEWS, TASK_DETAIL),
+               once=False, headless=True):
+    """
+    재크롤링 데몬 루프
+
+    주기마다 우선순위 상위 budget개 작업을 실행하고 interval초 쉰다. 리뷰 작업은
+    crawl_reviews(중복 색인/집계/검색 색인 갱신), 상세 작업은 crawl_product_detail
+    (변경 이력 기록)로 처리하고 결과를 스케줄러에 반영한다.
+    """
+    from reviewcrawler import crawl_reviews
+    from reviewdedup import ReviewDedupIndex
+    from reviewaggregates import ReviewAggregateStore
+    from reviewsearch import ReviewSearchIndex
+    from productchanges import ProductChangeTracker
+    from drivergovernor import DriverGovernor, reap_orphans
+    from pageguard import PageGuard, QuarantineStore
+    from retrypolicy import RetryPolicy, DeadLetterLog
+    from productcrawler_loader import load_crawler, get_crawler_functions
+
+    crawler_functions = get_crawler_functions(load_crawler(category))
+    if not crawler_functions:
+        print(f"[ERROR] {category} 크롤러를 로드할 수 없습니다.")
+        return
+    crawl_product_detail = crawler_functions['crawl_product_detail']
+
+    reap_orphans()
+    dedup_index = ReviewDedupIndex("review_fingerprints.db")
+    aggregate_store = ReviewAggregateStore("review_aggregates.db")
+    search_index = ReviewSearchIndex("review_search.db")
+    change_tracker = ProductChangeTracker("product_changes.db")
+    page_guard = PageGuard(quarantine=QuarantineStore("quarantine.db"))
+    retry_policy = RetryPolicy(DeadLetterLog("dead_letter.jsonl"), quarantine=page_guard.quarantine)
+    governor = DriverGovernor("recrawl")
+
+    scheduler.seed_from_history(aggregate_store, change_tracker)
+
+    cycle = 0
+    try:
+        while True:
+            cycle += 1
+            cycle_start = time.time()
+            plan = scheduler.plan(budget, tasks)
+            print(f"\n[INFO] 재크롤링 주기 {cycle}: 작업 {len(plan)}개 (예산 {budget}, 대상 {len(scheduler)}개 상품)")
+
+            held = {task: page_guard.quarantine.held(task) for task in tasks}
+            for idx, (score, task, url) in enumerate(plan, 1):
+                label = "첫 크롤링/오래됨" if score == float('inf') else f"예상 변경 {score:.2f}"
+                print(f"\n[{idx}/{len(plan)}] {task} ({label}): {url}")
+                if url in held[task]:
+                    # 격리 보류 시간 전에는 다시 두드리지 않음 (실패로 기록해 백오프)
+                    print("[INFO] 격리 보류 중인 URL이라 건너뜁니다.")
+                    scheduler.record_failure(task, url)
+                    continue
+                if task == TASK_REVIEWS:
+                    df = retry_policy.run(
+                        task, url, crawl_reviews,
+                        target_url=url, output_csv=reviews_output, return_df=True, append_mode=True,
+                        dedup_index=dedup_index, review_sinks=[aggregate_store, search_index],
+                        governor=governor, page_guard=page_guard, raise_errors=True
+                    )
+                    if df is not None:
+                        scheduler.record(task, url, len(df))
+                    else:
+                        scheduler.record_failure(task, url)
+                else:
+                    product_data = retry_policy.run(
+                        task, url, crawl_product_detail,
+                        product_url=url, output_csv=False, headless=headless,
+                        page_guard=page_guard, raise_errors=True
+                    )
+                    if product_data:
+                        scheduler.record(task, url, int(change_tracker.observe(product_data)))
+                    else:
+                        scheduler.record_failure(task, url)
+
+            elapsed = time.time() - cycle_start
+            print(f"[INFO] 주기 {cycle} 완료 ({elapsed:.1f}초)")
+            page_guard.report()
+            retry_policy.report()
+            if once:
+                break
+            time.sleep(max(0.0, interval - elapsed))
+    except KeyboardInterrupt:
+        print("\n[INFO] 재크롤링 데몬을 종료합니다.")
+    finally:
+        governor.report()
+        for store in (dedup_index, aggregate_store, search_index, change_tracker, page_guard.quarantine):
+            store.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='변경 가능성 기반 우선순위 재크롤링 데몬')
+    parser.add_argument('--urls', type=str, nargs='*', help='스케줄에 추가할 상품 URL 목록 파일 (.txt 또는 .csv)')
+    parser.add_argument('--db', type=str, default='recrawl_schedule.db', help='스케줄 DB (기본값: recrawl_schedule.db)')
+    parser.add_argument('--budget', type=int, default=30, help='주기당 크롤링 작업 수 (기본값: 30)')
+    parser.add_argument('--interval', type=float, default=3600, help='주기 간격 (초, 기본값: 3600)')
+    parser.add_argument('--tasks', type=str, nargs='+', default=[TASK_REVIEWS, TASK_DETAIL],
+                        choices=[TASK_REVIEWS, TASK_DETAIL], help='실행할 작업 종류')
+    parser.add_argument('--category', type=str, default='beauty', help='상품 크롤러 카테고리 (기본값: beauty)')
+    parser.add_argument('--output', type=str, default='recrawl_reviews.csv', help='새 리뷰를 추가할 CSV (기본값: recrawl_reviews.csv)')
+    parser.add_argument('--price-weight', type=float, default=5.0, help='가격 변경 1회의 가중치 (새 리뷰 수 기준, 기본값: 5)')
+    parser.add_argument('--max-age-days', type=float, default=30, help='이 기간 이상 지난 작업은 우선 처리 (기본값: 30일)')
+    parser.add_argument('--once', action='store_true', help='한 주기만 실행하고 종료')
+    parser.add_argument('--plan', action='store_true', help='크롤링 없이 이번 주기 계획만 출력')
+
+    args = parser.parse_args()
+    scheduler = RecrawlScheduler(args.db, price_weight=args.price_weight, max_age_days=args.max_age_days)
+
+    for path in args.urls or []:
+        urls = load_urls(path)
+        scheduler.register(urls)
+        print(f"[INFO] {path}: URL {len(urls)}개 등록")
+
+    if not len(scheduler):
+        print("[ERROR] 스케줄에 등록된 URL이 없습니다. --urls로 URL 목록 파일을 지정하세요.")
+    elif args.plan:
+        from reviewaggregates import ReviewAggregateStore
+        from productchanges import ProductChangeTracker
+
+        aggregate_store = ReviewAggregateStore("review_aggregates.db")
+        change_tracker = ProductChangeTracker("product_changes.db")
+        scheduler.seed_from_history(aggregate_store, change_tracker)
+        aggregate_store.close()
+        change_tracker.close()
+        for score, task, url in scheduler.plan(args.budget, args.tasks):
+            label = "inf" if score == float('inf') else f"{score:.2f}"
+            print(f"{label}\t{task}\t{url}")
+    else:
+        run_daemon(scheduler, args.budget, args.interval, args.output, category=args.category,
+                   tasks=args.tasks, once=args.once)
+
+    scheduler.close()
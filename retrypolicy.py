@@ -0,0 +1,260 @@
+"""
+분류별 재시도 정책 + 실패 항목 기록(dead letter)
+
+지금까지는 상품/리뷰 처리 중 예외가 나면 '[ERROR] URL 처리 중 오류'만 출력하고 넘어가서
+실패한 상품이 결과에서 조용히 사라졌다. RetryPolicy는 예외를 분류(타임아웃, 드라이버 종료,
+파싱 실패, 차단)해 분류별 재시도 횟수/지수 백오프로 다시 시도하고, 끝내 실패한 항목은
+마지막 오류와 함께 dead_letter.jsonl에 남긴다. 다음 실행에서 이 파일의 항목만 골라
+다시 처리할 수 있고, 성공한 항목은 파일에서 지워진다.
+
+    python retrypolicy.py list
+    python retrypolicy.py clear --task reviews
+"""
+import json
+import os
+import random
+import socket
+import time
+
+ERROR_TIMEOUT = 'timeout'
+ERROR_DRIVER_CRASH = 'driver_crash'
+ERROR_PARSE_MISS = 'parse_miss'
+ERROR_BLOCKED = 'blocked'
+ERROR_UNKNOWN = 'unknown'
+
+# 분류별 (최대 재시도 횟수, 첫 대기 시간 초, 최대 대기 시간 초)
+# 차단은 PageGuard가 스토어 요청을 멈추고 격리하므로 바로 다시 시도하지 않는다.
+RETRY_BUDGETS = {
+    ERROR_TIMEOUT: (3, 5, 60),
+    ERROR_DRIVER_CRASH: (2, 10, 60),
+    ERROR_PARSE_MISS: (1, 5, 5),
+    ERROR_BLOCKED: (0, 0, 0),
+    ERROR_UNKNOWN: (1, 5, 30),
+}
+
+# 드라이버/브라우저가 죽었을 때 Selenium/Playwright 오류 메시지에 나오는 문구
+_DRIVER_CRASH_MARKERS = (
+    'chrome not reachable', 'invalid session id', 'session deleted', 'disconnected',
+    'no such window', 'target window already closed', 'tab crashed', 'connection refused',
+    'max retries exceeded', 'target closed', 'has been closed', 'page crashed',
+)
+_DRIVER_CRASH_TYPES = ('InvalidSessionIdException', 'NoSuchWindowException', 'MaxRetryError', 'ProtocolError')
+# Playwright의 TimeoutError는 내장 TimeoutError를 상속하지 않으므로 이름으로 판별
+_TIMEOUT_TYPES = ('TimeoutException', 'ReadTimeoutError', 'ReadTimeout', 'ConnectTimeout', 'TimeoutError')
+_PARSE_MISS_TYPES = ('NoSuchElementException', 'StaleElementReferenceException')
+
+
+class CrawlError(Exception):
+    """크롤러가 분류를 지정해 올리는 오류"""
+    error_class = ERROR_UNKNOWN
+
+
+class ParseMissError(CrawlError):
+    """페이지는 열렸지만 필요한 정보를 찾지 못함"""
+    error_class = ERROR_PARSE_MISS
+
+
+class BlockedPageError(CrawlError):
+    """차단/캡차/없는 상품 페이지"""
+    error_class = ERROR_BLOCKED
+
+
+def classify_error(error):
+    """
+    예외 분류 (selenium을 임포트하지 않고 예외 클래스 이름과 메시지로 판별)
+
+    Returns:
+        str: ERROR_TIMEOUT / ERROR_DRIVER_CRASH / ERROR_PARSE_MISS / ERROR_BLOCKED / ERROR_UNKNOWN
+    """
+    if isinstance(error, CrawlError):
+        return error.error_class
+
+    name = type(error).__name__
+    message = str(error).lower()
+    if isinstance(error, (TimeoutError, socket.timeout)) or name in _TIMEOUT_TYPES or 'timed out' in message:
+        return ERROR_TIMEOUT
+    if (isinstance(error, ConnectionError) or name in _DRIVER_CRASH_TYPES
+            or any(marker in message for marker in _DRIVER_CRASH_MARKERS)):
+        return ERROR_DRIVER_CRASH
+    if isinstance(error, (AttributeError, IndexError, KeyError)) or name in _PARSE_MISS_TYPES:
+        return ERROR_PARSE_MISS
+    return ERROR_UNKNOWN
+
+
+def backoff_delay(error_class, attempt, budgets=RETRY_BUDGETS):
+    """attempt번째 재시도 전 대기 시간 (지수 백오프 + ±20% 지터)"""
+    _, base, cap = budgets.get(error_class, budgets[ERROR_UNKNOWN])
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.8, 1.2)
+
+
+class DeadLetterLog:
+    """재시도를 모두 소진한 항목 기록 (JSON Lines, (task, item)마다 한 줄)"""
+
+    def __init__(self, path="dead_letter.jsonl"):
+        self.path = path
+        self._entries = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[(entry['task'], entry['item'])] = entry
+
+    def add(self, task, item, error_class, error, attempts):
+        """실패 항목 기록 (이미 있으면 마지막 오류와 누적 시도 횟수 갱신)"""
+        previous = self._entries.get((task, item), {})
+        self._entries[(task, item)] = {
+            'task': task,
+            'item': item,
+            'error_class': error_class,
+            'error': str(error)[:500],
+            'attempts': previous.get('attempts', 0) + attempts,
+            'failed_at': time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self._save()
+
+    def resolve(self, task, item):
+        """성공한 항목 제거"""
+        if self._entries.pop((task, item), None) is not None:
+            self._save()
+
+    def items(self, task=None):
+        """실패 항목 목록 (task 지정 시 해당 작업만)"""
+        return [entry['item'] for (entry_task, _), entry in self._entries.items() if task in (None, entry_task)]
+
+    def entries(self):
+        return list(self._entries.values())
+
+    def clear(self, task=None):
+        for key in [key for key in self._entries if task in (None, key[0])]:
+            del self._entries[key]
+        self._save()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _save(self):
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(temp_path, self.path)
+
+
+class RetryPolicy:
+    """분류별 재시도 예산과 지수 백오프로 작업 실행"""
+
+    def __init__(self, dead_letter=None, budgets=None, sleep=time.sleep, quarantine=None):
+        """
+        Args:
+            dead_letter (DeadLetterLog, optional): 재시도 소진 항목 기록
+            quarantine (QuarantineStore, optional): 성공한 항목의 격리를 해제할 격리 저장소
+            budgets (dict, optional): RETRY_BUDGETS 형식의 분류별 예산
+            sleep (callable): 대기 함수
+        """
+        self.dead_letter = dead_letter
+        self.budgets = budgets or RETRY_BUDGETS
+        self.sleep = sleep
+        self.quarantine = quarantine
+        self.failures = {}
+        self.exhausted = 0
+
+    def run(self, task, item, func, *args, **kwargs):
+        """
+        func(*args, **kwargs) 실행, 실패하면 분류별 예산만큼 재시도
+
+        Args:
+            task (str): 작업 종류 ('reviews', 'products' 등)
+            item (str): 처리 대상 (보통 URL)
+
+        Returns:
+            func의 반환값 (재시도를 모두 소진하면 None, 항목은 dead letter로 기록)
+        """
+        attempt = 0
+        while True:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                delay = self._failed(task, item, e, attempt)
+                if delay is None:
+                    return None
+                self.sleep(delay)
+                attempt += 1
+                continue
+
+            self._succeeded(task, item)
+            return result
+
+    async def run_async(self, task, item, func, *args, **kwargs):
+        """run의 코루틴 버전 (await func(*args, **kwargs), 백오프는 asyncio.sleep)"""
+        import asyncio
+
+        attempt = 0
+        while True:
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._failed(task, item, e, attempt)
+                if delay is None:
+                    return None
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            self._succeeded(task, item)
+            return result
+
+    def _succeeded(self, task, item):
+        """성공한 항목을 dead letter와 격리 저장소에서 제거"""
+        if self.dead_letter is not None:
+            self.dead_letter.resolve(task, item)
+        if self.quarantine is not None:
+            self.quarantine.release(item, task)
+
+    def _failed(self, task, item, error, attempt):
+        """실패 기록 후 다음 재시도까지 대기 시간 반환 (예산을 소진했으면 dead letter 기록 후 None)"""
+        error_class = classify_error(error)
+        self.failures[error_class] = self.failures.get(error_class, 0) + 1
+        max_retries = self.budgets.get(error_class, self.budgets[ERROR_UNKNOWN])[0]
+        if attempt >= max_retries:
+            print(f"[ERROR] {task} 처리 실패 ({error_class}, {attempt + 1}회 시도): {item} - {error}")
+            self.exhausted += 1
+            if self.dead_letter is not None:
+                self.dead_letter.add(task, item, error_class, error, attempt + 1)
+            return None
+        delay = backoff_delay(error_class, attempt, self.budgets)
+        print(f"[WARN] {task} {error_class} 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {item} - {error}")
+        return delay
+
+    def report(self):
+        """오류 분류 통계 출력"""
+        if not self.failures:
+            return
+        summary = ", ".join(f"{error_class} {count}" for error_class, count in sorted(self.failures.items()))
+        print(f"[INFO] 오류 분류: {summary} (재시도 소진 {self.exhausted}건)")
+        if self.dead_letter is not None and len(self.dead_letter):
+            print(f"[INFO] 실패 항목 {len(self.dead_letter)}개 기록: {self.dead_letter.path}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='실패 항목(dead letter) 조회/정리')
+    parser.add_argument('--file', type=str, default='dead_letter.jsonl', help='실패 항목 파일 (기본값: dead_letter.jsonl)')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('list', help='실패 항목 목록')
+    clear_parser = subparsers.add_parser('clear', help='실패 항목 삭제')
+    clear_parser.add_argument('--task', type=str, help='삭제할 작업 종류 (기본값: 전체)')
+
+    args = parser.parse_args()
+    log = DeadLetterLog(args.file)
+
+    if args.command == 'list':
+        for entry in log.entries():
+            print(f"{entry['task']}\t{entry['error_class']}\t{entry['attempts']}회\t{entry['failed_at']}\t{entry['item']}\t{entry['error'][:80]}")
+        print(f"\n총 {len(log)}개")
+    elif args.command == 'clear':
+        log.clear(args.task)
+        print(f"[INFO] 남은 실패 항목 {len(log)}개")
+    else:
+        parser.print_help()
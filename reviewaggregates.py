@@ -0,0 +1,256 @@
+"""
+상품별 리뷰 집계 저장소 (증분 갱신)
+
+리뷰 CSV를 매번 다시 읽어 평점 분포/월별 리뷰 수/옵션별 통계를 계산하는 대신,
+crawl_reviews가 새 리뷰를 내보낼 때마다 해당 리뷰만으로 집계를 갱신한다 (O(새 리뷰 수)).
+이미 집계한 리뷰는 RD_FINGERPRINT로 걸러내므로 같은 리뷰를 다시 넘겨도 두 번 세지 않는다.
+
+    python reviewaggregates.py 8045986719
+    python reviewaggregates.py --list
+"""
+import sqlite3
+import time
+
+from lazyimport import lazy_module
+from reviewdedup import FINGERPRINT_COLUMN
+
+pd = lazy_module("pandas")
+
+# 옵션 통계를 낼 컬럼 (option_type → 리뷰 컬럼)
+OPTION_COLUMNS = {
+    'size': 'RD_OPTION_SIZE',
+    'color': 'RD_OPTION_COLOR',
+}
+
+
+class ReviewAggregateStore:
+    """상품별 리뷰 수, 평점 분포, 월별 리뷰 수, 옵션별 통계 저장소"""
+
+    def __init__(self, db_path="review_aggregates.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS product_stats (
+                product_key TEXT PRIMARY KEY,
+                title TEXT,
+                review_count INTEGER NOT NULL DEFAULT 0,
+                rating_count INTEGER NOT NULL DEFAULT 0,
+                rating_sum REAL NOT NULL DEFAULT 0,
+                rating_1 INTEGER NOT NULL DEFAULT 0,
+                rating_2 INTEGER NOT NULL DEFAULT 0,
+                rating_3 INTEGER NOT NULL DEFAULT 0,
+                rating_4 INTEGER NOT NULL DEFAULT 0,
+                rating_5 INTEGER NOT NULL DEFAULT 0,
+                first_review_dt TEXT,
+                last_review_dt TEXT,
+                updated_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS monthly_counts (
+                product_key TEXT NOT NULL,
+                month TEXT NOT NULL,
+                review_count INTEGER NOT NULL,
+                PRIMARY KEY (product_key, month)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS option_counts (
+                product_key TEXT NOT NULL,
+                option_type TEXT NOT NULL,
+                option_value TEXT NOT NULL,
+                review_count INTEGER NOT NULL,
+                rating_count INTEGER NOT NULL,
+                rating_sum REAL NOT NULL,
+                PRIMARY KEY (product_key, option_type, option_value)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS aggregated_reviews (
+                fingerprint TEXT PRIMARY KEY
+            ) WITHOUT ROWID;
+        """)
+        self.conn.commit()
+
+    def _unseen(self, df):
+        """아직 집계하지 않은 리뷰만 남김 (지문 컬럼이 없으면 전체)"""
+        if FINGERPRINT_COLUMN not in df.columns or df.empty:
+            return df
+        df = df[~df[FINGERPRINT_COLUMN].duplicated()]
+        fingerprints = df[FINGERPRINT_COLUMN].tolist()
+        seen = set()
+        for start in range(0, len(fingerprints), 500):
+            chunk = fingerprints[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            seen.update(row[0] for row in self.conn.execute(
+                f"SELECT fingerprint FROM aggregated_reviews WHERE fingerprint IN ({placeholders})", chunk
+            ))
+        return df[~df[FINGERPRINT_COLUMN].isin(seen)]
+
+    def add_reviews(self, df, product_key):
+        """
+        새 리뷰로 집계 갱신
+
+        Args:
+            df (DataFrame): crawl_reviews 결과 (RD_* 컬럼, RD_FINGERPRINT 권장)
+            product_key (str): 상품 키 (reviewdedup.product_key)
+
+        Returns:
+            int: 집계에 반영된 리뷰 수
+        """
+        df = self._unseen(df)
+        if df.empty:
+            return 0
+
+        ratings = pd.to_numeric(df['RD_RATING'].astype(object), errors='coerce')
+        rated = ratings.dropna()
+        histogram = rated.round().clip(1, 5).astype(int).value_counts()
+        write_dts = df['RD_WRITE_DT'].astype(object).fillna('')
+        valid_dts = write_dts[write_dts.str.len() == 8]
+        first_dt = valid_dts.min() if len(valid_dts) else None
+        last_dt = valid_dts.max() if len(valid_dts) else None
+        # 날짜를 읽을 수 있는 리뷰가 없는 배치면 MIN/MAX가 NULL이 되므로 기존 값 유지 (아래 COALESCE)
+        title = str(df['PRODUCT_TITLE'].iloc[0]) if 'PRODUCT_TITLE' in df.columns else None
+
+        with self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO product_stats (product_key) VALUES (?)", (product_key,))
+            self.conn.execute(
+                """UPDATE product_stats SET
+                       title = COALESCE(?, title),
+                       review_count = review_count + ?,
+                       rating_count = rating_count + ?,
+                       rating_sum = rating_sum + ?,
+                       rating_1 = rating_1 + ?, rating_2 = rating_2 + ?, rating_3 = rating_3 + ?,
+                       rating_4 = rating_4 + ?, rating_5 = rating_5 + ?,
+                       first_review_dt = COALESCE(MIN(COALESCE(first_review_dt, ?), ?), first_review_dt),
+                       last_review_dt = COALESCE(MAX(COALESCE(last_review_dt, ?), ?), last_review_dt),
+                       updated_at = ?
+                   WHERE product_key = ?""",
+                (title, len(df), len(rated), float(rated.sum()),
+                 *(int(histogram.get(star, 0)) for star in range(1, 6)),
+                 first_dt, first_dt, last_dt, last_dt,
+                 time.strftime("%Y-%m-%d %H:%M:%S"), product_key)
+            )
+
+            monthly = valid_dts.str[:6].value_counts()
+            self.conn.executemany(
+                """INSERT INTO monthly_counts VALUES (?, ?, ?)
+                   ON CONFLICT (product_key, month) DO UPDATE SET review_count = review_count + excluded.review_count""",
+                ((product_key, month, int(count)) for month, count in monthly.items())
+            )
+
+            for option_type, column in OPTION_COLUMNS.items():
+                options = pd.DataFrame({
+                    'value': df[column].astype(object).fillna(''),
+                    'rating': ratings
+                })
+                options = options[options['value'] != '']
+                if options.empty:
+                    continue
+                grouped = options.groupby('value')['rating'].agg(['size', 'count', 'sum'])
+                self.conn.executemany(
+                    """INSERT INTO option_counts VALUES (?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (product_key, option_type, option_value) DO UPDATE SET
+                           review_count = review_count + excluded.review_count,
+                           rating_count = rating_count + excluded.rating_count,
+                           rating_sum = rating_sum + excluded.rating_sum""",
+                    ((product_key, option_type, value, int(row['size']), int(row['count']), float(row['sum']))
+                     for value, row in grouped.iterrows())
+                )
+
+            if FINGERPRINT_COLUMN in df.columns:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO aggregated_reviews VALUES (?)",
+                    ((fingerprint,) for fingerprint in df[FINGERPRINT_COLUMN])
+                )
+
+        return len(df)
+
+    def summary(self, product_key):
+        """
+        상품 집계 조회
+
+        Returns:
+            dict: review_count, rating_mean, rating_histogram, monthly_counts, options (없으면 None)
+        """
+        row = self.conn.execute(
+            """SELECT title, review_count, rating_count, rating_sum, rating_1, rating_2, rating_3,
+                      rating_4, rating_5, first_review_dt, last_review_dt, updated_at
+               FROM product_stats WHERE product_key = ?""",
+            (product_key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        title, review_count, rating_count, rating_sum = row[:4]
+        options = {}
+        for option_type, value, count, r_count, r_sum in self.conn.execute(
+            """SELECT option_type, option_value, review_count, rating_count, rating_sum
+               FROM option_counts WHERE product_key = ? ORDER BY review_count DESC""",
+            (product_key,)
+        ):
+            options.setdefault(option_type, []).append({
+                'value': value,
+                'review_count': count,
+                'rating_mean': r_sum / r_count if r_count else None
+            })
+
+        return {
+            'product_key': product_key,
+            'title': title,
+            'review_count': review_count,
+            'rating_mean': rating_sum / rating_count if rating_count else None,
+            'rating_histogram': dict(zip(range(1, 6), row[4:9])),
+            'first_review_dt': row[9],
+            'last_review_dt': row[10],
+            'updated_at': row[11],
+            'monthly_counts': dict(self.conn.execute(
+                "SELECT month, review_count FROM monthly_counts WHERE product_key = ? ORDER BY month",
+                (product_key,)
+            ).fetchall()),
+            'options': options
+        }
+
+    def products(self):
+        """집계된 상품 목록 (product_key, title, review_count)"""
+        return self.conn.execute(
+            "SELECT product_key, title, review_count FROM product_stats ORDER BY review_count DESC"
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+def print_summary(summary):
+    """집계 결과 출력"""
+    mean = f"{summary['rating_mean']:.2f}" if summary['rating_mean'] is not None else "-"
+    print(f"- 상품: {summary['title']} ({summary['product_key']})")
+    print(f"- 리뷰 수: {summary['review_count']}건, 평균 별점: {mean}/5.0")
+    print("- 별점 분포: " + ", ".join(f"{star}점 {count}" for star, count in summary['rating_histogram'].items()))
+    print(f"- 리뷰 기간: {summary['first_review_dt'] or '-'} ~ {summary['last_review_dt'] or '-'}")
+    if summary['monthly_counts']:
+        recent = list(summary['monthly_counts'].items())[-6:]
+        print("- 최근 월별 리뷰 수: " + ", ".join(f"{month} {count}" for month, count in recent))
+    for option_type, values in summary['options'].items():
+        top = ", ".join(f"{v['value']} {v['review_count']}" for v in values[:5])
+        print(f"- {option_type} 옵션 상위: {top}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='상품별 리뷰 집계 조회')
+    parser.add_argument('product_key', nargs='?', help='상품 키 (상품번호)')
+    parser.add_argument('--db', type=str, default='review_aggregates.db', help='집계 DB (기본값: review_aggregates.db)')
+    parser.add_argument('--list', action='store_true', help='집계된 상품 목록 출력')
+
+    args = parser.parse_args()
+    store = ReviewAggregateStore(args.db)
+
+    if args.list:
+        for key, title, count in store.products():
+            print(f"{key}\t{count}\t{title}")
+    elif args.product_key:
+        summary = store.summary(args.product_key)
+        if summary is None:
+            print(f"[WARN] {args.product_key} 상품의 집계가 없습니다.")
+        else:
+            print_summary(summary)
+    else:
+        parser.print_help()
+
+    store.close()
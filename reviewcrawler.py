@@ -1,26 +1,66 @@
 import re
 import time
-import requests
-import pandas as pd
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
 import os
+import json
+
+from lazyimport import lazy_module, lazy_import
+from reviewrecord import ReviewBatch
+from reviewnormalize import RAW_REVIEW_COLUMNS, RAW_CATEGORICAL_COLUMNS, normalize_reviews
+from driverfactory import BACKEND_ASYNC, BACKEND_SELENIUM, BACKENDS, create_driver, add_driver_arguments, configure_from_args
+
+# pandas / bs4 / selenium은 첫 사용 시점에 로드 (CLI 기동 시간 단축)
+pd = lazy_module("pandas")
+# 중복 제거/자원 감시/페이지 분류/재시도 모듈은 해당 기능을 쓸 때 로드
+# (except 절에 실제 클래스가 필요하므로 pageguard/retrypolicy는 모듈째 지연 로드)
+ReviewDedupIndex = lazy_import("reviewdedup", "ReviewDedupIndex")
+add_fingerprints = lazy_import("reviewdedup", "add_fingerprints")
+product_key = lazy_import("reviewdedup", "product_key")
+DriverGovernor = lazy_import("drivergovernor", "DriverGovernor")
+reap_orphans = lazy_import("drivergovernor", "reap_orphans")
+store_of = lazy_import("pageguard", "store_of")
+pageguard = lazy_module("pageguard")
+retrypolicy = lazy_module("retrypolicy")
+asyncio = lazy_module("asyncio")
+asyncbrowser = lazy_module("asyncbrowser")
+BeautifulSoup = lazy_import("bs4", "BeautifulSoup")
 
 # Selenium 관련
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-
-# webdriver-manager로 크롬드라이버 버전 자동 관리
-from webdriver_manager.chrome import ChromeDriverManager
-
-def setup_driver():
-    """Chrome 웹드라이버 설정"""
+webdriver = lazy_module("selenium.webdriver")
+By = lazy_import("selenium.webdriver.common.by", "By")
+Options = lazy_import("selenium.webdriver.chrome.options", "Options")
+selenium_exceptions = lazy_module("selenium.common.exceptions")
+WebDriverWait = lazy_import("selenium.webdriver.support.ui", "WebDriverWait")
+EC = lazy_module("selenium.webdriver.support.expected_conditions")
+ActionChains = lazy_import("selenium.webdriver.common.action_chains", "ActionChains")
+
+# 페이지 구간 동시 수집 시 브라우저 하나가 맡을 최소 페이지 수 (이보다 적으면 나누지 않음)
+PARALLEL_MIN_PAGES_PER_WORKER = 20
+
+# "다음" 또는 ">" 텍스트/next 클래스가 있는 다음 페이지 버튼 (페이지네이션 스타일 2)
+NEXT_BUTTON_XPATHS = [
+    "//a[contains(text(), '다음')]",
+    "//a[contains(text(), '>')]",
+    "//button[contains(text(), '다음')]",
+    "//button[contains(text(), '>')]",
+    "//a[contains(@class, 'next')]",
+    "//button[contains(@class, 'next')]"
+]
+
+# 페이지네이션 영역 선택자 (페이지네이션 스타일 3)
+PAGINATION_SELECTORS = [
+    'div._2g7PKvqCKe',
+    'div[class*="pagination"]',
+    'div[class*="paging"]',
+    'div[class*="page_num"]',
+    'ul[class*="pagination"]'
+]
+
+def setup_driver(affinity=None):
+    """
+    Chrome 웹드라이버 설정 (driverfactory 백엔드: 로컬 Chrome 또는 원격 세션 풀)
+
+    affinity(스토어 키 등)를 주면 원격 풀에서 같은 키로 쓰던 세션을 우선 배정받는다.
+    """
     options = webdriver.ChromeOptions()
     # options.add_argument("--headless")  # 헤드리스 모드 활성화
     options.add_argument("window-size=1920x1080")  # 브라우저 크기
@@ -30,8 +70,7 @@ def setup_driver():
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')  # 메모리 관련 오류 방지
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
+    driver = create_driver(options, affinity=affinity)
     driver.implicitly_wait(3)
     return driver
 
@@ -53,7 +92,7 @@ def safe_click(driver, element, retry=3, use_js=False, scroll_first=True):
             
             time.sleep(1)  # 클릭 후 잠시 대기
             return True
-        except (ElementNotInteractableException, TimeoutException) as e:
+        except (selenium_exceptions.ElementNotInteractableException, selenium_exceptions.TimeoutException) as e:
             print(f"클릭 시도 {attempt+1}/{retry} 실패: {e}")
             if attempt == retry - 1:
                 # 마지막 시도에서 JavaScript로 클릭 시도
@@ -69,7 +108,658 @@ def safe_click(driver, element, retry=3, use_js=False, scroll_first=True):
             return False
     return False
 
-def crawl_reviews(target_url, max_pages=None, output_csv=None, return_df=False, append_mode=False):
+def extract_review_raw(r):
+    """
+    리뷰 블록 하나에서 원본 텍스트만 수집 (정규화는 reviewnormalize.normalize_reviews에서 일괄 처리)
+
+    Args:
+        r: 리뷰 블록 BeautifulSoup 요소
+
+    Returns:
+        dict: RAW_* 컬럼 값 딕셔너리 (리뷰 내용과 별점이 모두 없으면 None)
+    """
+    # (a) 리뷰 작성 일자 후보 - 선택자별 첫 요소의 텍스트를 모두 모아 두고
+    #     날짜 형식 판별은 정규화 단계에서 한 번에 처리
+    date_selectors = [
+        'span._2L3vDiadT9',  # 기존 선택자
+        'span[class*="date"]',  # 날짜 관련 클래스
+        'div[class*="date"]',  # 날짜 div
+        'span[class*="time"]',  # 시간 관련 클래스
+        'em[class*="date"]'  # em 태그 내 날짜
+    ]
+    
+    date_candidates = []
+    for selector in date_selectors:
+        date_elements = r.select(selector)
+        if date_elements:
+            date_candidates.append(date_elements[0].get_text().replace('\n', ' ').strip())
+
+    # (b) 평점 - 여러 클래스명 시도
+    rating = ""
+    rating_selectors = [
+        'em._15NU42F3kT',  # 기존 선택자
+        'em[class*="rating"]',  # 평점 관련 클래스
+        'span[class*="rating"]',  # 평점 span
+        'div[class*="star"] em',  # 별점 관련 div 내 em
+        'em[class*="score"]'  # 점수 관련 em
+    ]
+    
+    for selector in rating_selectors:
+        rating_elements = r.select(selector)
+        if rating_elements:
+            rating = rating_elements[0].get_text().strip()
+            if rating:
+                break
+
+    # (c) 상품명(옵션명) 원본 텍스트 및 옵션 정보(사이즈, 컬러 등)
+    option_size = ""
+    option_color = ""
+    options_json = ""
+    item_text = ""
+    option_text = ""
+
+    option_selectors = [
+        'div._2FXNMst_ak',  # 기존 선택자
+        'div[class*="option"]',  # 옵션 관련 div
+        'div[class*="product_info"]',  # 상품 정보 div
+        'dl[class*="option"]',  # 옵션 설명 리스트
+        'p[class*="option"]'  # 옵션 관련 p 태그
+    ]
+    
+    for selector in option_selectors:
+        option_elements = r.select(selector)
+        if option_elements:
+            try:
+                item_div = option_elements[0]
+                item_text = item_div.get_text()
+
+                # 옵션 정보가 담긴 dl 태그 찾기
+                dl_tag = None
+                dl_selectors = ['dl.XbGQRlzveO', 'dl[class*="option"]', 'dl']
+                for dl_selector in dl_selectors:
+                    dl_candidates = item_div.select(dl_selector)
+                    if dl_candidates:
+                        dl_tag = dl_candidates[0]
+                        break
+                
+                # 옵션 정보 상세 파싱 (dl 태그가 있는 경우)
+                if dl_tag:
+                    # 모든 dt, dd 쌍을 찾아서 옵션 정보 추출
+                    dt_tags = dl_tag.find_all('dt')
+                    dd_tags = dl_tag.find_all('dd')
+                    
+                    # 옵션 정보 딕셔너리 생성
+                    options_dict = {}
+                    for i in range(min(len(dt_tags), len(dd_tags))):
+                        option_name = dt_tags[i].get_text().strip().replace(':', '')
+                        option_value = dd_tags[i].get_text().strip()
+                        options_dict[option_name] = option_value
+                        
+                    # 사이즈 정보 찾기 (다양한 표현 방식 고려)
+                    for key in ['사이즈', 'size', 'SIZE', '크기']:
+                        if key in options_dict:
+                            option_size = options_dict[key]
+                            break
+                            
+                    # 컬러 정보 찾기 (다양한 표현 방식 고려)
+                    for key in ['색상', '컬러', 'color', 'COLOR']:
+                        if key in options_dict:
+                            option_color = options_dict[key]
+                            break
+
+                    # 사이즈/컬러 외 옵션 평가(핏, 착용감, 보습력 등)는 정규화 단계에서 구조화
+                    if options_dict:
+                        options_json = json.dumps(options_dict, ensure_ascii=False, sort_keys=True)
+                    
+                    # 상품명에서 제외할 옵션 태그 텍스트 (정규화 단계에서 문자열 그대로 제거)
+                    option_text = dl_tag.get_text()
+                
+                break
+            except (IndexError, AttributeError):
+                continue
+
+    # (d) 리뷰 내용 - 여러 클래스명 시도
+    content = ""
+    content_selectors = [
+        'div._1kMfD5ErZ6 span._2L3vDiadT9',  # 기존 선택자
+        'div[class*="content"]',  # 컨텐츠 관련 div
+        'p[class*="content"]',  # 컨텐츠 관련 p 태그
+        'span[class*="content"]'  # 컨텐츠 관련 span
+    ]
+    
+    for selector in content_selectors:
+        content_elements = r.select(selector)
+        if content_elements:
+            try:
+                content = content_elements[0].get_text()
+                if content.strip():
+                    break
+            except (AttributeError, IndexError):
+                continue
+
+    # (e) 리뷰어 정보 수집 (구매자 정보, 신체 정보 등)
+    reviewer_info = ""
+    reviewer_selectors = [
+        'div._1_XCKE2RrJ',  # 기존 선택자
+        'div[class*="profile"]',  # 프로필 관련 div
+        'span[class*="profile"]',  # 프로필 관련 span
+        'div[class*="user_info"]'  # 사용자 정보 div
+    ]
+    
+    for selector in reviewer_selectors:
+        reviewer_elements = r.select(selector)
+        if reviewer_elements:
+            try:
+                reviewer_info = reviewer_elements[0].get_text().strip()
+                if reviewer_info:
+                    break
+            except (AttributeError, IndexError):
+                continue
+    
+    # (f) 리뷰 이미지 URL 수집
+    review_images = []
+    image_selectors = [
+        'div._2389dRohZq img',  # 기존 선택자
+        'div[class*="img"] img',  # 이미지 관련 div 내 img
+        'a[class*="img"] img',  # 이미지 관련 a 태그 내 img
+        'ul[class*="img"] img'  # 이미지 목록 내 img
+    ]
+    
+    for selector in image_selectors:
+        image_elements = r.select(selector)
+        if image_elements:
+            for img in image_elements:
+                if 'src' in img.attrs:
+                    review_images.append(img['src'])
+            if review_images:
+                break
+    
+    # 수집된 정보가 충분한지 확인 (최소한 리뷰 내용이나 별점은 있어야 함)
+    if not (content.strip() or rating):
+        return None
+
+    return {
+        'RAW_WRITE_DT': "\n".join(date_candidates),
+        'RAW_RATING': rating,
+        'RAW_ITEM_TEXT': item_text,
+        'RAW_OPTION_TEXT': option_text,
+        'RAW_CONTENT': content,
+        'RD_OPTION_SIZE': option_size,
+        'RD_OPTION_COLOR': option_color,
+        'RAW_OPTIONS': options_json,
+        'RD_REVIEWER_INFO': reviewer_info,
+        'RD_REVIEW_IMAGES': "|".join(review_images) if review_images else "",
+    }
+
+def check_review_page(page_guard, target_url, html_source):
+    """페이지 분류 결과 리뷰 수집을 계속할 수 있으면 True (품절 상품도 리뷰는 수집)"""
+    if page_guard is None:
+        return True
+    page_class = page_guard.check(target_url, html_source, task='reviews', tolerate=(pageguard.PAGE_SOLD_OUT,))
+    return page_class in (pageguard.PAGE_NORMAL, pageguard.PAGE_SOLD_OUT)
+
+def read_product_title(soup):
+    """상품 페이지의 상품 제목 (찾지 못하면 'Unknown Product')"""
+    title_tag = soup.find('h3', {'class': '_22kNQuEXmb _copyable'})
+    product_title = title_tag.get_text(strip=True) if title_tag else "Unknown Product"
+    print(f"[INFO] 상품 제목: {product_title}")
+    return product_title
+
+def open_review_page(driver, target_url, page_guard=None):
+    """
+    상품 페이지를 열고 리뷰 탭 → 최신순 정렬까지 클릭
+
+    Args:
+        page_guard (PageGuard, optional): 차단/캡차 감지기 (차단되면 클릭을 시도하지 않음)
+
+    Returns:
+        str: 상품 제목 (리뷰 섹션을 찾을 수 없으면 None)
+
+    Raises:
+        BlockedPageError: page_guard가 차단/캡차/없는 상품 페이지로 분류한 경우
+    """
+    # (1-1) 원하는 상품 페이지 열기
+    driver.get(target_url)
+    time.sleep(3)
+    if not check_review_page(page_guard, target_url, driver.page_source):
+        raise retrypolicy.BlockedPageError(f"차단/없는 상품 페이지: {target_url}")
+
+    # (1-2) 상품 제목 가져오기
+    product_title = read_product_title(BeautifulSoup(driver.page_source, 'html.parser'))
+
+    # (1-3) "리뷰" 탭 버튼 클릭 - 여러 선택자 시도
+    review_tab_selectors = [
+        '#content > div > div.z7cS6-TO7X > div._27jmWaPaKy > ul > li:nth-child(2) > a',
+        '#content > div > div._2-I30XS1lA > div._25tOXGEYJK > ul > li:nth-child(2) > a',
+        'a[href="#REVIEW"]',
+        'a[aria-selected="true"]',
+        'li a:contains("리뷰")'
+    ]
+    
+    review_tab_clicked = False
+    for selector in review_tab_selectors:
+        try:
+            # CSS 선택자 사용
+            if selector.startswith('#') or selector.startswith('a['):
+                review_tab = driver.find_element(By.CSS_SELECTOR, selector)
+                if safe_click(driver, review_tab):
+                    review_tab_clicked = True
+                    print("[INFO] 리뷰 탭 클릭 완료.")
+                    break
+            # XPath로 리뷰 텍스트 포함 요소 찾기
+            elif 'contains' in selector:
+                review_elements = driver.find_elements(By.XPATH, "//a[contains(text(), '리뷰')]")
+                if review_elements:
+                    if safe_click(driver, review_elements[0]):
+                        review_tab_clicked = True
+                        print("[INFO] 리뷰 탭 클릭 완료 (텍스트 검색).")
+                        break
+        except selenium_exceptions.NoSuchElementException:
+            continue
+    
+    if not review_tab_clicked:
+        print("[WARN] 리뷰 탭을 찾을 수 없거나 클릭할 수 없습니다. 이미 리뷰 페이지일 수 있습니다.")
+        # 리뷰 섹션이 이미 표시되어 있는지 확인
+        if "REVIEW" not in driver.page_source and "리뷰" not in driver.page_source:
+            print("[ERROR] 리뷰 섹션을 찾을 수 없습니다.")
+            return None
+    
+    time.sleep(3)
+
+    # (1-4) "최신순" 버튼 클릭 - 여러 선택자 시도
+    latest_selectors = [
+        '#REVIEW > div > div._2LvIMaBiIO > div._2LAwVxx1Sd > div._1txuie7UTH > ul > li:nth-child(2) > a',
+        'a.filter_sort:contains("최신순")',
+        '//a[contains(text(), "최신순")]',
+        'a[aria-selected="false"]'
+    ]
+    
+    latest_clicked = False
+    for selector in latest_selectors:
+        try:
+            if selector.startswith('#'):
+                latest_btn = driver.find_element(By.CSS_SELECTOR, selector)
+                if safe_click(driver, latest_btn, use_js=True):
+                    latest_clicked = True
+                    print("[INFO] 최신순 버튼 클릭 완료.")
+                    break
+            elif selector.startswith('//'):
+                latest_btns = driver.find_elements(By.XPATH, selector)
+                if latest_btns and safe_click(driver, latest_btns[0], use_js=True):
+                    latest_clicked = True
+                    print("[INFO] 최신순 버튼 클릭 완료 (XPath).")
+                    break
+            elif 'contains' in selector:
+                latest_btns = driver.find_elements(By.XPATH, "//a[contains(text(), '최신순')]")
+                if latest_btns and safe_click(driver, latest_btns[0], use_js=True):
+                    latest_clicked = True
+                    print("[INFO] 최신순 버튼 클릭 완료 (텍스트 검색).")
+                    break
+            elif selector.startswith('a[aria'):
+                filter_btns = driver.find_elements(By.CSS_SELECTOR, selector)
+                for btn in filter_btns:
+                    if '최신' in btn.text:
+                        if safe_click(driver, btn, use_js=True):
+                            latest_clicked = True
+                            print("[INFO] 최신순 버튼 클릭 완료 (aria 속성).")
+                            break
+        except selenium_exceptions.NoSuchElementException:
+            continue
+        except Exception as e:
+            print(f"[WARN] 최신순 버튼 클릭 시도 중 오류: {e}")
+    
+    if not latest_clicked:
+        print("[WARN] 최신순 버튼 클릭 실패. 기본 정렬 순서로 진행합니다.")
+        
+    time.sleep(3)
+
+    return product_title
+
+def click_page_number(driver, number):
+    """현재 페이지네이션 블록에서 번호가 number인 버튼 클릭 (없으면 False)"""
+    try:
+        # 해당 숫자를 가진 페이지 버튼 찾기 (XPath 사용)
+        page_elements = driver.find_elements(By.XPATH, f"//a[contains(text(), '{number}')]")
+
+        # 숫자만 있는 버튼 찾기
+        for element in page_elements:
+            if element.text.strip() == str(number):
+                return safe_click(driver, element, use_js=True)
+    except Exception as e:
+        print(f"[WARN] 숫자 페이지네이션 시도 중 오류: {e}")
+    return False
+
+def click_next_block(driver):
+    """'다음' 버튼으로 다음 페이지 번호 블록(10페이지 단위)의 첫 페이지로 이동"""
+    try:
+        for button in driver.find_elements(By.XPATH, "//a[contains(text(), '다음')]"):
+            if button.is_displayed() and button.is_enabled():
+                return safe_click(driver, button, use_js=True)
+    except Exception as e:
+        print(f"[WARN] 다음 블록 이동 시도 중 오류: {e}")
+    return False
+
+def jump_to_page(driver, page_num):
+    """
+    리뷰 1페이지에서 page_num 페이지로 이동
+
+    목표 페이지가 있는 번호 블록까지는 '다음'으로 10페이지씩 건너뛰고, 같은 블록에서는
+    번호를 바로 누른다 (한 페이지씩 넘기는 것보다 클릭 수가 약 1/10).
+    '다음' 버튼이 없으면 한 페이지씩 넘긴다.
+
+    Returns:
+        bool: 이동에 성공했으면 True
+    """
+    current = 1
+    while current < page_num:
+        if (current - 1) // 10 < (page_num - 1) // 10:
+            if click_next_block(driver):
+                current = ((current - 1) // 10 + 1) * 10 + 1
+            elif go_to_next_page(driver, current):
+                current += 1
+            else:
+                return False
+        elif click_page_number(driver, page_num):
+            current = page_num
+        elif go_to_next_page(driver, current):
+            current += 1
+        else:
+            return False
+        time.sleep(1)
+    return True
+
+def go_to_next_page(driver, page_num):
+    """
+    현재 페이지(page_num) 다음 리뷰 페이지로 이동 (여러 페이지네이션 방식 시도)
+
+    Returns:
+        bool: 이동에 성공했으면 True
+    """
+    next_page_found = False
+    
+    # 페이지네이션 스타일 1: 숫자 버튼
+    if not next_page_found:
+        next_page_found = click_page_number(driver, page_num + 1)
+    
+    # 페이지네이션 스타일 2: 다음 페이지 버튼
+    if not next_page_found:
+        try:
+            # "다음" 또는 ">" 텍스트가 있는 버튼 찾기
+            for xpath in NEXT_BUTTON_XPATHS:
+                next_buttons = driver.find_elements(By.XPATH, xpath)
+                if next_buttons:
+                    for btn in next_buttons:
+                        # 버튼이 활성화되어 있고 화면에 표시되는지 확인
+                        if btn.is_displayed() and btn.is_enabled():
+                            if safe_click(driver, btn, use_js=True):
+                                next_page_found = True
+                                break
+                if next_page_found:
+                    break
+        except Exception as e:
+            print(f"[WARN] 다음 페이지 버튼 시도 중 오류: {e}")
+    
+    # 페이지네이션 스타일 3: 전체 페이지네이션 영역에서 다음 페이지 찾기
+    if not next_page_found:
+        try:
+            # 페이지네이션 영역에서 현재 페이지 다음 링크 찾기
+            for selector in PAGINATION_SELECTORS:
+                pagination_elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                if pagination_elements:
+                    # 페이지네이션 영역에서 모든 a 태그 찾기
+                    pagination_area = pagination_elements[0]
+                    page_links = pagination_area.find_elements(By.TAG_NAME, 'a')
+                    
+                    # 현재 페이지 다음 링크 찾기
+                    for i, link in enumerate(page_links):
+                        if link.text.strip() == str(page_num):
+                            # 현재 페이지 다음 링크가 있으면 클릭
+                            if i + 1 < len(page_links):
+                                next_link = page_links[i + 1]
+                                if safe_click(driver, next_link, use_js=True):
+                                    next_page_found = True
+                                    break
+                if next_page_found:
+                    break
+        except Exception as e:
+            print(f"[WARN] 페이지네이션 영역 시도 중 오류: {e}")
+
+    return next_page_found
+
+def read_total_reviews(soup):
+    """리뷰 영역의 총 리뷰 수 ('리뷰 1,234' 형식, 찾지 못하면 None)"""
+    total_reviews_text = soup.select_one('span[class*="review_count"], span[class*="review_total"]')
+    if total_reviews_text:
+        match = re.search(r'\d[\d,]*', total_reviews_text.get_text())
+        if match:
+            return int(match.group().replace(',', ''))
+    return None
+
+def find_review_blocks(soup):
+    """현재 페이지에 표시된 모든 리뷰 블록 찾기 (여러 클래스명 시도)"""
+    review_selectors = [
+        'li.BnwL_cs1av',  # 기존 선택자
+        'li[class*="review_"]',  # 부분 클래스명 매칭
+        'div[class*="review_item"]',  # 리뷰 아이템 클래스
+        'div._1MMhUGHnc_',  # 실제 네이버 쇼핑몰 리뷰 컨테이너
+        '.reviewItems_review_item'  # 새로운 클래스 스타일
+    ]
+
+    for selector in review_selectors:
+        reviews = soup.select(selector)
+        if reviews:
+            print(f"[INFO] 리뷰 {len(reviews)}개를 찾았습니다. (선택자: {selector})")
+            return reviews
+    return []
+
+def collect_review_pages(driver, target_url, product_title, review_batch, first_page=1, last_page=None,
+                         governor=None, page_guard=None, stop_at_total=True):
+    """
+    현재 표시된 리뷰 페이지(first_page)부터 last_page까지 수집해 review_batch에 추가
+
+    Args:
+        first_page (int): driver가 지금 보고 있는 리뷰 페이지 번호
+        last_page (int, optional): 마지막으로 수집할 페이지 (None이면 다음 페이지가 없을 때까지)
+        governor (DriverGovernor, optional): 페이지 사이 RSS/CPU 초과 시 브라우저 재시작
+        stop_at_total (bool): 수집한 리뷰 수가 총 리뷰 수에 도달하면 종료 (구간 수집에서는 끔)
+
+    Returns:
+        WebDriver: 수집을 마친 드라이버 (재시작되었으면 새 드라이버)
+
+    Raises:
+        BlockedPageError: 수집 도중 차단/캡차 페이지가 나온 경우 (일부 페이지가 빠진 결과를
+            성공으로 병합/저장하지 않도록)
+    """
+    page_num = first_page
+    consecutive_empty_pages = 0  # 연속으로 리뷰가 없는 페이지 수
+    max_consecutive_empty = 2    # 최대 허용 연속 빈 페이지 (2페이지 연속으로 리뷰가 없으면 종료)
+
+    # 페이지 HTML 저장하여 중복 검사에 사용
+    previous_page_html = ""
+
+    while True:
+        print(f"[INFO] {page_num} 페이지 수집 중...")
+
+        # 현재 페이지 HTML 파싱
+        html_source = driver.page_source
+
+        # 페이지 중복 검사 (이전 페이지와 현재 페이지가 동일하면 페이지네이션 실패로 간주)
+        if html_source == previous_page_html:
+            print("[INFO] 이전 페이지와 동일한 내용입니다. 더 이상 새로운 페이지가 없는 것으로 판단됩니다.")
+            break
+
+        previous_page_html = html_source
+
+        # 페이지 이동 후 차단/캡차 페이지면 빈 페이지 대기 없이 바로 중단 (URL은 격리됨)
+        if page_num > 1 and not check_review_page(page_guard, target_url, html_source):
+            raise retrypolicy.BlockedPageError(f"{page_num} 페이지에서 차단/캡차 페이지 감지: {target_url}")
+        soup = BeautifulSoup(html_source, 'html.parser')
+        time.sleep(0.5)
+
+        reviews = find_review_blocks(soup)
+        if not reviews:
+            print("[INFO] 이 페이지에서 리뷰를 찾을 수 없습니다.")
+            consecutive_empty_pages += 1
+
+            # 리뷰를 찾을 수 없는 페이지가 연속으로 나오면 종료
+            if consecutive_empty_pages >= max_consecutive_empty:
+                print(f"[INFO] {max_consecutive_empty}페이지 연속으로 리뷰를 찾을 수 없어 크롤링을 종료합니다.")
+                break
+
+            # 그렇지 않으면 다음 페이지 시도
+        else:
+            # 리뷰를 찾았으면 연속 빈 페이지 카운터 초기화
+            consecutive_empty_pages = 0
+
+        # 리뷰마다 원본 텍스트 수집 (날짜/공백/평점/상품명 정규화는 수집 후 일괄 처리)
+        for r in reviews:
+            raw_review = extract_review_raw(r)
+            if raw_review:
+                review_batch.append(PRODUCT_TITLE=product_title, **raw_review)
+
+        # 마지막 페이지(최대 페이지 수 또는 구간 끝)에 도달했는지 확인
+        if last_page and page_num >= last_page:
+            print(f"[INFO] {last_page} 페이지에 도달했습니다. 크롤링을 종료합니다.")
+            break
+
+        # 리뷰 계수기를 통해 종료 여부 확인
+        # 상품 총 리뷰 개수 및 현재까지 수집한 개수 표시
+        total_reviews = read_total_reviews(soup) if stop_at_total else None
+        if total_reviews:
+            current_reviews = len(review_batch)
+            print(f"[INFO] 총 리뷰 {total_reviews}개 중 {current_reviews}개 수집 완료 (진행률: {current_reviews/total_reviews*100:.1f}%)")
+
+            # 모든 리뷰를 수집한 경우 종료
+            if current_reviews >= total_reviews:
+                print("[INFO] 모든 리뷰 수집 완료! 크롤링을 종료합니다.")
+                break
+
+        # 다음 페이지로 이동 (여러 페이지네이션 선택자 시도)
+        next_page_found = go_to_next_page(driver, page_num)
+
+        if not next_page_found:
+            print("[INFO] 더 이상 다음 페이지를 찾을 수 없습니다. 크롤링을 종료합니다.")
+            break
+
+        # 페이지 로딩 기다리기
+        time.sleep(3)
+        page_num += 1
+
+        # 브라우저 메모리/CPU가 임계값을 넘었으면 재시작 후 현재 페이지로 복귀
+        if governor is not None and governor.should_recycle():
+            driver = governor.recycle(driver, lambda: setup_driver(store_of(target_url)))
+            open_review_page(driver, target_url, page_guard)
+            if not jump_to_page(driver, page_num):
+                print(f"[WARN] 재시작 후 {page_num} 페이지로 돌아가지 못했습니다.")
+            previous_page_html = ""
+
+    return driver
+
+def plan_page_ranges(html_source, workers, max_pages=None, min_pages_per_worker=PARALLEL_MIN_PAGES_PER_WORKER):
+    """
+    리뷰 1페이지의 총 리뷰 수와 페이지당 리뷰 수로 페이지 구간 나누기
+
+    Returns:
+        list: [(첫 페이지, 마지막 페이지), ...] (마지막 구간의 끝은 max_pages 또는 None = 끝까지),
+              나눌 만큼 페이지가 많지 않으면 None
+    """
+    soup = BeautifulSoup(html_source, 'html.parser')
+    total_reviews = read_total_reviews(soup)
+    page_size = len(find_review_blocks(soup))
+    if not total_reviews or not page_size:
+        return None
+    total_pages = -(-total_reviews // page_size)
+    if max_pages:
+        total_pages = min(total_pages, max_pages)
+
+    workers = min(workers, total_pages // min_pages_per_worker)
+    if workers < 2:
+        return None
+    size = -(-total_pages // workers)
+    # 최신순 정렬이라 수집 중 새 리뷰가 달리면 구간 끝 리뷰가 다음 페이지로 밀리므로
+    # 마지막이 아닌 구간은 한 페이지 더 읽음 (겹친 리뷰는 RD_WRITE_DT/RD_CONTENT 중복 제거에서 빠짐)
+    ranges = [(start, min(start + size, total_pages)) for start in range(1, total_pages + 1, size)]
+    # 수집 중 새 리뷰가 달려 페이지가 밀려도 끝까지 가도록 마지막 구간은 열어 둠
+    ranges[-1] = (ranges[-1][0], max_pages)
+    print(f"[INFO] 총 리뷰 {total_reviews}개 ({total_pages}페이지)를 {len(ranges)}개 구간으로 나눠 동시에 수집합니다: {ranges}")
+    return ranges
+
+def collect_page_ranges(driver, target_url, product_title, page_ranges, governor, page_guard=None):
+    """
+    페이지 구간별 동시 수집 후 페이지 순서대로 병합
+
+    첫 구간은 이미 1페이지를 열어 둔 driver가, 나머지 구간은 구간마다 새 브라우저가
+    상품 페이지 → 리뷰 탭 → 최신순 → 시작 페이지로 이동한 뒤 수집한다. 구간 경계에서
+    겹친 리뷰는 이후 RD_WRITE_DT/RD_CONTENT 중복 제거에서 빠진다.
+
+    Returns:
+        tuple: (첫 구간 드라이버, 병합된 ReviewBatch)
+
+    Raises:
+        Exception: 구간 하나라도 실패하면 그 예외 (일부 페이지가 빠진 결과를 저장하지 않도록)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def collect_range(index, first_page, last_page):
+        batch = ReviewBatch(RAW_REVIEW_COLUMNS, RAW_CATEGORICAL_COLUMNS)
+        worker_governor = DriverGovernor(f"리뷰 구간 {index + 1}", max_rss_mb=governor.max_rss_mb,
+                                         max_cpu_percent=governor.max_cpu_percent)
+        worker_driver = None
+        error = None
+        try:
+            worker_driver = worker_governor.attach(setup_driver(store_of(target_url)))
+            if open_review_page(worker_driver, target_url, page_guard) is None:
+                raise retrypolicy.ParseMissError(f"리뷰 섹션을 찾을 수 없습니다: {target_url}")
+            if not jump_to_page(worker_driver, first_page):
+                raise retrypolicy.ParseMissError(f"{first_page} 페이지로 이동하지 못했습니다: {target_url}")
+            worker_driver = collect_review_pages(worker_driver, target_url, product_title, batch, first_page,
+                                                 last_page, worker_governor, page_guard, stop_at_total=False)
+        except Exception as e:
+            error = e
+        finally:
+            worker_governor.quit(worker_driver)
+            worker_governor.report()
+        return batch, error
+
+    first_batch = ReviewBatch(RAW_REVIEW_COLUMNS, RAW_CATEGORICAL_COLUMNS)
+    with ThreadPoolExecutor(max_workers=len(page_ranges) - 1) as executor:
+        futures = [executor.submit(collect_range, index, first_page, last_page)
+                   for index, (first_page, last_page) in enumerate(page_ranges[1:], 1)]
+        first_page, last_page = page_ranges[0]
+        driver = collect_review_pages(driver, target_url, product_title, first_batch, first_page, last_page,
+                                      governor, page_guard, stop_at_total=False)
+        results = [future.result() for future in futures]
+
+    merge_range_batches(first_batch, page_ranges[1:], results)
+    return driver, first_batch
+
+def merge_range_batches(review_batch, page_ranges, results):
+    """
+    구간별 수집 결과를 페이지 순서대로 review_batch에 이어 붙임
+
+    Args:
+        review_batch (ReviewBatch): 첫 구간 배치 (병합 대상)
+        page_ranges (list): 첫 구간을 뺀 나머지 [(첫 페이지, 마지막 페이지), ...]
+        results (list): 구간마다 (ReviewBatch, 예외 또는 None)
+
+    Raises:
+        Exception: 실패한 구간이 있으면 첫 번째 실패 예외 (병합하지 않음)
+    """
+    errors = []
+    for (first_page, last_page), (batch, error) in zip(page_ranges, results):
+        if error is not None:
+            print(f"[ERROR] 리뷰 {first_page}~{last_page or '끝'} 페이지 구간 수집 실패: {error}")
+            errors.append(error)
+        else:
+            print(f"[INFO] {first_page}~{last_page or '끝'} 페이지 구간: 리뷰 {len(batch)}개")
+    if errors:
+        raise errors[0]
+    for batch, _ in results:
+        review_batch.extend(batch)
+
+def crawl_reviews(target_url, max_pages=None, output_csv=None, return_df=False, append_mode=False,
+                  dedup_index=None, review_sinks=None, governor=None, page_guard=None, raise_errors=False,
+                  profiler=None, page_workers=1, backend=BACKEND_SELENIUM, async_session=None):
     """
     스마트스토어 상품의 리뷰 데이터 수집
     
@@ -79,9 +769,23 @@ def crawl_reviews(target_url, max_pages=None, output_csv=None, return_df=False,
         output_csv (str, optional): 결과를 저장할 CSV 파일명
         return_df (bool, optional): 데이터프레임을 반환할지 여부
         append_mode (bool, optional): 기존 CSV 파일에 결과를 추가할지 여부
+        dedup_index (ReviewDedupIndex, optional): 실행 간 중복 제거 색인 (이미 내보낸 리뷰 제외)
+        review_sinks (list, optional): 새 리뷰를 전달받을 저장소 목록
+            (add_reviews(df, product_key) 메서드를 가진 객체, 예: ReviewAggregateStore)
+        governor (DriverGovernor, optional): 브라우저 자원 감시기 (페이지 사이 RSS/CPU 초과 시 재시작)
+        page_guard (PageGuard, optional): 차단/캡차 감지 + 스토어별 서킷 브레이커 (차단 시 URL 격리)
+        raise_errors (bool, optional): 차단/리뷰 섹션 없음/페이지 구간 실패를 빈 결과 대신 예외로 올림 (RetryPolicy용)
+        profiler (CrawlProfiler, optional): 상품 단위 프로파일러 (느린/메모리 많이 쓴 상품만 보관)
+        page_workers (int, optional): 리뷰 페이지 구간을 나눠 동시에 수집할 브라우저 수
+            (브라우저당 PARALLEL_MIN_PAGES_PER_WORKER 페이지 이상일 때만 나눔, 기본값: 1)
+        backend (str, optional): 'selenium'(기본값) 또는 'async' (asyncbrowser: 구간마다 브라우저
+            컨텍스트 하나를 같은 이벤트 루프에서 진행, 헤드리스, governor 미사용)
+        async_session (asyncbrowser.BrowserSession, optional): 상품 간에 열어 둔 비동기 브라우저 세션
+            (없으면 상품마다 Playwright/Chromium을 새로 띄움)
         
     Returns:
         DataFrame: return_df가 True일 경우 수집된 리뷰 데이터프레임 반환
+            (차단/구간 실패로 끝까지 수집하지 못했으면 None - 호출자가 처리 완료로 기록하지 않도록)
     """
 
     # URL 도메인 처리 수정
@@ -93,7 +797,10 @@ def crawl_reviews(target_url, max_pages=None, output_csv=None, return_df=False,
         target_url = 'https://smartstore.naver.com' + target_url
     
     # URL이 이미 smartstore.naver.com으로 시작하는지 확인
-    if not (target_url.startswith('https://smartstore.naver.com') or target_url.startswith('http://smartstore.naver.com')):
+    # (네이버가 아닌 절대 URL - 예: mockstorefront.py 로컬 서버 - 은 그대로 사용)
+    is_foreign = (target_url.startswith('https://') or target_url.startswith('http://')) \
+        and 'naver.com' not in target_url.split('/')[2]
+    if not is_foreign and not (target_url.startswith('https://smartstore.naver.com') or target_url.startswith('http://smartstore.naver.com')):
         # 도메인이 없는 경우 추가
         if target_url.startswith('/'):
             target_url = 'https://smartstore.naver.com' + target_url
@@ -102,502 +809,66 @@ def crawl_reviews(target_url, max_pages=None, output_csv=None, return_df=False,
     
     print(f"[INFO] 처리된 URL: {target_url}")
     
-    driver = setup_driver()
+    if page_guard is not None and not page_guard.allow(target_url, task='reviews'):
+        if raise_errors:
+            raise retrypolicy.BlockedPageError(f"스토어 요청 중단 중: {target_url}")
+        return None
+
+    own_governor = governor is None
+    governor = governor or DriverGovernor("review")
+    driver = None
+    # 비동기 백엔드의 구간 작업은 같은 스레드의 이벤트 루프에서 돈다
+    profile_workers = page_workers if backend != BACKEND_ASYNC else 1
+    profile_session = profiler.start('reviews', target_url, workers=profile_workers) if profiler is not None else None
         
     # -----------------------------------------------------------
     # 1. 크롤링에 필요한 사전 작업 (사이트 열기 & 버튼 클릭)
     # -----------------------------------------------------------
     try:
-        # (1-1) 원하는 상품 페이지 열기
-        driver.get(target_url)
-        time.sleep(3)
-
-        # (1-2) 상품 제목 가져오기
-        html_source = driver.page_source
-        soup = BeautifulSoup(html_source, 'html.parser')
-        title_tag = soup.find('h3', {'class': '_22kNQuEXmb _copyable'})
-        if title_tag:
-            product_title = title_tag.get_text(strip=True)
+        if backend == BACKEND_ASYNC:
+            # 1~2. 비동기 백엔드: 상품 페이지 열기부터 페이지 구간 수집까지 한 이벤트 루프에서 진행
+            if async_session is not None:
+                product_title, review_batch = async_session.run(asyncbrowser.collect_reviews_async(
+                    target_url, max_pages=max_pages, page_workers=page_workers, page_guard=page_guard,
+                    pool=async_session.pool
+                ))
+            else:
+                product_title, review_batch = asyncio.run(asyncbrowser.collect_reviews_async(
+                    target_url, max_pages=max_pages, page_workers=page_workers, page_guard=page_guard
+                ))
         else:
-            product_title = "Unknown Product"
-        print(f"[INFO] 상품 제목: {product_title}")
-
-        # (1-3) "리뷰" 탭 버튼 클릭 - 여러 선택자 시도
-        review_tab_selectors = [
-            '#content > div > div.z7cS6-TO7X > div._27jmWaPaKy > ul > li:nth-child(2) > a',
-            '#content > div > div._2-I30XS1lA > div._25tOXGEYJK > ul > li:nth-child(2) > a',
-            'a[href="#REVIEW"]',
-            'a[aria-selected="true"]',
-            'li a:contains("리뷰")'
-        ]
-        
-        review_tab_clicked = False
-        for selector in review_tab_selectors:
-            try:
-                # CSS 선택자 사용
-                if selector.startswith('#') or selector.startswith('a['):
-                    review_tab = driver.find_element(By.CSS_SELECTOR, selector)
-                    if safe_click(driver, review_tab):
-                        review_tab_clicked = True
-                        print("[INFO] 리뷰 탭 클릭 완료.")
-                        break
-                # XPath로 리뷰 텍스트 포함 요소 찾기
-                elif 'contains' in selector:
-                    review_elements = driver.find_elements(By.XPATH, "//a[contains(text(), '리뷰')]")
-                    if review_elements:
-                        if safe_click(driver, review_elements[0]):
-                            review_tab_clicked = True
-                            print("[INFO] 리뷰 탭 클릭 완료 (텍스트 검색).")
-                            break
-            except NoSuchElementException:
-                continue
-        
-        if not review_tab_clicked:
-            print("[WARN] 리뷰 탭을 찾을 수 없거나 클릭할 수 없습니다. 이미 리뷰 페이지일 수 있습니다.")
-            # 리뷰 섹션이 이미 표시되어 있는지 확인
-            if "REVIEW" not in driver.page_source and "리뷰" not in driver.page_source:
-                print("[ERROR] 리뷰 섹션을 찾을 수 없습니다.")
-                return pd.DataFrame() if return_df else None
-        
-        time.sleep(3)
+            driver = governor.attach(setup_driver(store_of(target_url)))
 
-        # (1-4) "최신순" 버튼 클릭 - 여러 선택자 시도
-        latest_selectors = [
-            '#REVIEW > div > div._2LvIMaBiIO > div._2LAwVxx1Sd > div._1txuie7UTH > ul > li:nth-child(2) > a',
-            'a.filter_sort:contains("최신순")',
-            '//a[contains(text(), "최신순")]',
-            'a[aria-selected="false"]'
-        ]
-        
-        latest_clicked = False
-        for selector in latest_selectors:
-            try:
-                if selector.startswith('#'):
-                    latest_btn = driver.find_element(By.CSS_SELECTOR, selector)
-                    if safe_click(driver, latest_btn, use_js=True):
-                        latest_clicked = True
-                        print("[INFO] 최신순 버튼 클릭 완료.")
-                        break
-                elif selector.startswith('//'):
-                    latest_btns = driver.find_elements(By.XPATH, selector)
-                    if latest_btns and safe_click(driver, latest_btns[0], use_js=True):
-                        latest_clicked = True
-                        print("[INFO] 최신순 버튼 클릭 완료 (XPath).")
-                        break
-                elif 'contains' in selector:
-                    latest_btns = driver.find_elements(By.XPATH, "//a[contains(text(), '최신순')]")
-                    if latest_btns and safe_click(driver, latest_btns[0], use_js=True):
-                        latest_clicked = True
-                        print("[INFO] 최신순 버튼 클릭 완료 (텍스트 검색).")
-                        break
-                elif selector.startswith('a[aria'):
-                    filter_btns = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for btn in filter_btns:
-                        if '최신' in btn.text:
-                            if safe_click(driver, btn, use_js=True):
-                                latest_clicked = True
-                                print("[INFO] 최신순 버튼 클릭 완료 (aria 속성).")
-                                break
-            except NoSuchElementException:
-                continue
-            except Exception as e:
-                print(f"[WARN] 최신순 버튼 클릭 시도 중 오류: {e}")
-        
-        if not latest_clicked:
-            print("[WARN] 최신순 버튼 클릭 실패. 기본 정렬 순서로 진행합니다.")
-            
-        time.sleep(3)
-
-        # -----------------------------------------------------------
-        # 2. 리뷰데이터 수집을 위한 리스트 초기화
-        # -----------------------------------------------------------
-        write_dt_lst = []
-        rating_lst = []
-        item_nm_lst = []
-        content_lst = []
-        option_size_lst = []  # 사이즈 정보
-        option_color_lst = []  # 컬러 정보
-        reviewer_info_lst = []  # 리뷰어 정보
-        review_imgs_lst = []  # 리뷰 이미지 URL
+            # (1-1) ~ (1-4) 상품 페이지 열기, 리뷰 탭 & 최신순 클릭
+            product_title = open_review_page(driver, target_url, page_guard)
+        if product_title is None:
+            if raise_errors:
+                raise retrypolicy.ParseMissError(f"리뷰 섹션을 찾을 수 없습니다: {target_url}")
+            return pd.DataFrame() if return_df else None
 
         # -----------------------------------------------------------
-        # 3. 여러 페이지 리뷰를 반복적으로 수집하기
+        # 2. 여러 페이지 리뷰를 반복적으로 수집하기
         # -----------------------------------------------------------
-        page_num = 1
-        consecutive_empty_pages = 0  # 연속으로 리뷰가 없는 페이지 수
-        max_consecutive_empty = 2    # 최대 허용 연속 빈 페이지 (2페이지 연속으로 리뷰가 없으면 종료)
-        
-        # 페이지 HTML 저장하여 중복 검사에 사용
-        previous_page_html = ""
-        
-        while True:
-            print(f"[INFO] {page_num} 페이지 수집 중...")
-
-            # 3-1. 현재 페이지 HTML 파싱
-            html_source = driver.page_source
-            
-            # 페이지 중복 검사 (이전 페이지와 현재 페이지가 동일하면 페이지네이션 실패로 간주)
-            if html_source == previous_page_html:
-                print("[INFO] 이전 페이지와 동일한 내용입니다. 더 이상 새로운 페이지가 없는 것으로 판단됩니다.")
-                break
-            
-            previous_page_html = html_source
-            soup = BeautifulSoup(html_source, 'html.parser')
-            time.sleep(0.5)
-
-            # 3-2. 현재 페이지에 표시된 모든 리뷰 블록 찾기 (여러 클래스명 시도)
-            review_selectors = [
-                'li.BnwL_cs1av',  # 기존 선택자
-                'li[class*="review_"]',  # 부분 클래스명 매칭
-                'div[class*="review_item"]',  # 리뷰 아이템 클래스
-                'div._1MMhUGHnc_',  # 실제 네이버 쇼핑몰 리뷰 컨테이너
-                '.reviewItems_review_item'  # 새로운 클래스 스타일
-            ]
-            
-            reviews = []
-            for selector in review_selectors:
-                reviews = soup.select(selector)
-                if reviews:
-                    print(f"[INFO] 리뷰 {len(reviews)}개를 찾았습니다. (선택자: {selector})")
-                    break
-            
-            if not reviews:
-                print("[INFO] 이 페이지에서 리뷰를 찾을 수 없습니다.")
-                consecutive_empty_pages += 1
-                
-                # 리뷰를 찾을 수 없는 페이지가 연속으로 나오면 종료
-                if consecutive_empty_pages >= max_consecutive_empty:
-                    print(f"[INFO] {max_consecutive_empty}페이지 연속으로 리뷰를 찾을 수 없어 크롤링을 종료합니다.")
-                    break
-                
-                # 그렇지 않으면 다음 페이지 시도
+        if backend != BACKEND_ASYNC:
+            # 리뷰가 아주 많은 상품은 페이지 구간을 나눠 여러 브라우저가 동시에 수집
+            page_ranges = plan_page_ranges(driver.page_source, page_workers, max_pages) if page_workers > 1 else None
+            if page_ranges:
+                driver, review_batch = collect_page_ranges(driver, target_url, product_title, page_ranges,
+                                                           governor, page_guard)
             else:
-                # 리뷰를 찾았으면 연속 빈 페이지 카운터 초기화
-                consecutive_empty_pages = 0
-
-            # 3-3. 리뷰마다 날짜, 평점, 상품명, 리뷰내용을 수집
-            for r in reviews:
-                # (a) 리뷰 작성 일자 - 여러 클래스명 시도
-                write_dt = ""
-                date_selectors = [
-                    'span._2L3vDiadT9',  # 기존 선택자
-                    'span[class*="date"]',  # 날짜 관련 클래스
-                    'div[class*="date"]',  # 날짜 div
-                    'span[class*="time"]',  # 시간 관련 클래스
-                    'em[class*="date"]'  # em 태그 내 날짜
-                ]
-                
-                for selector in date_selectors:
-                    date_elements = r.select(selector)
-                    if date_elements:
-                        try:
-                            date_text = date_elements[0].get_text().strip()
-                            # 여러 날짜 형식 처리
-                            if re.match(r'\d{2}\.\d{2}\.\d{2}', date_text) or re.match(r'\d{2}\.\d{2}\.\d{2}\.', date_text):
-                                # 'yy.mm.dd.' or 'yy.mm.dd' → 'YYYYMMDD'
-                                date_text = date_text.rstrip('.')
-                                write_dt = datetime.strptime(date_text, '%y.%m.%d').strftime('%Y%m%d')
-                                break
-                            elif re.match(r'\d{4}\.\d{2}\.\d{2}', date_text):
-                                # 'YYYY.MM.DD' → 'YYYYMMDD'
-                                write_dt = date_text.replace('.', '')
-                                break
-                            elif re.match(r'\d{4}-\d{2}-\d{2}', date_text):
-                                # 'YYYY-MM-DD' → 'YYYYMMDD'
-                                write_dt = date_text.replace('-', '')
-                                break
-                        except (ValueError, IndexError):
-                            continue
-
-                # (b) 평점 - 여러 클래스명 시도
-                rating = ""
-                rating_selectors = [
-                    'em._15NU42F3kT',  # 기존 선택자
-                    'em[class*="rating"]',  # 평점 관련 클래스
-                    'span[class*="rating"]',  # 평점 span
-                    'div[class*="star"] em',  # 별점 관련 div 내 em
-                    'em[class*="score"]'  # 점수 관련 em
-                ]
-                
-                for selector in rating_selectors:
-                    rating_elements = r.select(selector)
-                    if rating_elements:
-                        rating = rating_elements[0].get_text().strip()
-                        if rating:
-                            break
-
-                # (c) 상품명(옵션명) 및 옵션 정보(사이즈, 컬러 등)
-                option_size = ""
-                option_color = ""
-                item_nm = ""
-
-                option_selectors = [
-                    'div._2FXNMst_ak',  # 기존 선택자
-                    'div[class*="option"]',  # 옵션 관련 div
-                    'div[class*="product_info"]',  # 상품 정보 div
-                    'dl[class*="option"]',  # 옵션 설명 리스트
-                    'p[class*="option"]'  # 옵션 관련 p 태그
-                ]
-                
-                for selector in option_selectors:
-                    option_elements = r.select(selector)
-                    if option_elements:
-                        try:
-                            item_div = option_elements[0]
-                            item_nm_info_raw = item_div.get_text()
-
-                            # 옵션 정보가 담긴 dl 태그 찾기
-                            dl_tag = None
-                            dl_selectors = ['dl.XbGQRlzveO', 'dl[class*="option"]', 'dl']
-                            for dl_selector in dl_selectors:
-                                dl_candidates = item_div.select(dl_selector)
-                                if dl_candidates:
-                                    dl_tag = dl_candidates[0]
-                                    break
-                            
-                            # 옵션 정보 상세 파싱 (dl 태그가 있는 경우)
-                            if dl_tag:
-                                # 모든 dt, dd 쌍을 찾아서 옵션 정보 추출
-                                dt_tags = dl_tag.find_all('dt')
-                                dd_tags = dl_tag.find_all('dd')
-                                
-                                # 옵션 정보 딕셔너리 생성
-                                options_dict = {}
-                                for i in range(min(len(dt_tags), len(dd_tags))):
-                                    option_name = dt_tags[i].get_text().strip().replace(':', '')
-                                    option_value = dd_tags[i].get_text().strip()
-                                    options_dict[option_name] = option_value
-                                    
-                                # 사이즈 정보 찾기 (다양한 표현 방식 고려)
-                                for key in ['사이즈', 'size', 'SIZE', '크기']:
-                                    if key in options_dict:
-                                        option_size = options_dict[key]
-                                        break
-                                        
-                                # 컬러 정보 찾기 (다양한 표현 방식 고려)
-                                for key in ['색상', '컬러', 'color', 'COLOR']:
-                                    if key in options_dict:
-                                        option_color = options_dict[key]
-                                        break
-                                        
-                                item_nm_info_for_del = dl_tag.get_text()
-                            else:
-                                item_nm_info_for_del = ""
-
-                            # 옵션 태그를 제외한 제품 정보 추출
-                            item_nm_info = re.sub(item_nm_info_for_del, '', item_nm_info_raw)
-                            
-                            # "제품 선택:" 텍스트 이후의 내용 추출
-                            str_start_idx = item_nm_info.find('제품 선택: ')
-                            if str_start_idx != -1:
-                                item_nm = item_nm_info[str_start_idx + 6:].strip()
-                            else:
-                                # "제품 선택:" 문구가 없을 경우 다른 방법으로 추출 시도
-                                item_nm = item_nm_info.strip()
-                            
-                            break
-                        except (IndexError, AttributeError):
-                            continue
-
-                # (d) 리뷰 내용 - 여러 클래스명 시도
-                review_content = ""
-                content_selectors = [
-                    'div._1kMfD5ErZ6 span._2L3vDiadT9',  # 기존 선택자
-                    'div[class*="content"]',  # 컨텐츠 관련 div
-                    'p[class*="content"]',  # 컨텐츠 관련 p 태그
-                    'span[class*="content"]'  # 컨텐츠 관련 span
-                ]
-                
-                for selector in content_selectors:
-                    content_elements = r.select(selector)
-                    if content_elements:
-                        try:
-                            content_raw = content_elements[0].get_text()
-                            review_content = re.sub(' +', ' ', re.sub('\n', ' ', content_raw)).strip()
-                            if review_content:
-                                break
-                        except (AttributeError, IndexError):
-                            continue
-
-                # (e) 리뷰어 정보 수집 (구매자 정보, 신체 정보 등)
-                reviewer_info = ""
-                reviewer_selectors = [
-                    'div._1_XCKE2RrJ',  # 기존 선택자
-                    'div[class*="profile"]',  # 프로필 관련 div
-                    'span[class*="profile"]',  # 프로필 관련 span
-                    'div[class*="user_info"]'  # 사용자 정보 div
-                ]
-                
-                for selector in reviewer_selectors:
-                    reviewer_elements = r.select(selector)
-                    if reviewer_elements:
-                        try:
-                            reviewer_info = reviewer_elements[0].get_text().strip()
-                            if reviewer_info:
-                                break
-                        except (AttributeError, IndexError):
-                            continue
-                
-                # (f) 리뷰 이미지 URL 수집
-                review_images = []
-                image_selectors = [
-                    'div._2389dRohZq img',  # 기존 선택자
-                    'div[class*="img"] img',  # 이미지 관련 div 내 img
-                    'a[class*="img"] img',  # 이미지 관련 a 태그 내 img
-                    'ul[class*="img"] img'  # 이미지 목록 내 img
-                ]
-                
-                for selector in image_selectors:
-                    image_elements = r.select(selector)
-                    if image_elements:
-                        for img in image_elements:
-                            if 'src' in img.attrs:
-                                review_images.append(img['src'])
-                        if review_images:
-                            break
-                
-                # 수집된 정보가 충분한지 확인 (최소한 리뷰 내용이나 별점은 있어야 함)
-                if review_content or rating:
-                    # 데이터 리스트에 저장
-                    write_dt_lst.append(write_dt)
-                    rating_lst.append(rating)
-                    item_nm_lst.append(item_nm)
-                    content_lst.append(review_content)
-                    option_size_lst.append(option_size)
-                    option_color_lst.append(option_color)
-                    reviewer_info_lst.append(reviewer_info)
-                    review_imgs_lst.append("|".join(review_images) if review_images else "")
-
-            # 3-4. 최대 페이지 수에 도달했는지 확인
-            if max_pages and page_num >= max_pages:
-                print(f"[INFO] 최대 페이지 수({max_pages})에 도달했습니다. 크롤링을 종료합니다.")
-                break
-
-            # 3-5. 리뷰 계수기를 통해 종료 여부 확인
-            # 상품 총 리뷰 개수 및 현재까지 수집한 개수 표시
-            total_reviews_text = soup.select_one('span[class*="review_count"], span[class*="review_total"]')
-            if total_reviews_text:
-                try:
-                    total_reviews_text = total_reviews_text.get_text().strip()
-                    total_reviews = re.search(r'\d+', total_reviews_text)
-                    if total_reviews:
-                        total_reviews = int(total_reviews.group())
-                        current_reviews = len(write_dt_lst)
-                        print(f"[INFO] 총 리뷰 {total_reviews}개 중 {current_reviews}개 수집 완료 (진행률: {current_reviews/total_reviews*100:.1f}%)")
-                        
-                        # 모든 리뷰를 수집한 경우 종료
-                        if current_reviews >= total_reviews:
-                            print("[INFO] 모든 리뷰 수집 완료! 크롤링을 종료합니다.")
-                            break
-                except Exception as e:
-                    print(f"[WARN] 리뷰 개수 확인 중 오류: {e}")
-
-            # 3-6. 다음 페이지로 이동 (여러 페이지네이션 선택자 시도)
-            next_page_found = False
-            
-            # 페이지네이션 스타일 1: 숫자 버튼
-            if not next_page_found:
-                try:
-                    # 다음 페이지 번호 계산
-                    next_page_number = page_num + 1
-                    
-                    # 해당 숫자를 가진 페이지 버튼 찾기 (XPath 사용)
-                    next_page_xpath = f"//a[contains(text(), '{next_page_number}')]"
-                    next_page_elements = driver.find_elements(By.XPATH, next_page_xpath)
-                    
-                    # 숫자만 있는 버튼 찾기
-                    for element in next_page_elements:
-                        if element.text.strip() == str(next_page_number):
-                            if safe_click(driver, element, use_js=True):
-                                next_page_found = True
-                                break
-                except Exception as e:
-                    print(f"[WARN] 숫자 페이지네이션 시도 중 오류: {e}")
-            
-            # 페이지네이션 스타일 2: 다음 페이지 버튼
-            if not next_page_found:
-                try:
-                    # "다음" 또는 ">" 텍스트가 있는 버튼 찾기
-                    next_button_xpaths = [
-                        "//a[contains(text(), '다음')]",
-                        "//a[contains(text(), '>')]",
-                        "//button[contains(text(), '다음')]",
-                        "//button[contains(text(), '>')]",
-                        "//a[contains(@class, 'next')]",
-                        "//button[contains(@class, 'next')]"
-                    ]
-                    
-                    for xpath in next_button_xpaths:
-                        next_buttons = driver.find_elements(By.XPATH, xpath)
-                        if next_buttons:
-                            for btn in next_buttons:
-                                # 버튼이 활성화되어 있고 화면에 표시되는지 확인
-                                if btn.is_displayed() and btn.is_enabled():
-                                    if safe_click(driver, btn, use_js=True):
-                                        next_page_found = True
-                                        break
-                        if next_page_found:
-                            break
-                except Exception as e:
-                    print(f"[WARN] 다음 페이지 버튼 시도 중 오류: {e}")
-            
-            # 페이지네이션 스타일 3: 전체 페이지네이션 영역에서 다음 페이지 찾기
-            if not next_page_found:
-                try:
-                    # 페이지네이션 영역 선택자들
-                    pagination_selectors = [
-                        'div._2g7PKvqCKe', 
-                        'div[class*="pagination"]',
-                        'div[class*="paging"]',
-                        'div[class*="page_num"]',
-                        'ul[class*="pagination"]'
-                    ]
-                    
-                    for selector in pagination_selectors:
-                        pagination_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                        if pagination_elements:
-                            # 페이지네이션 영역에서 모든 a 태그 찾기
-                            pagination_area = pagination_elements[0]
-                            page_links = pagination_area.find_elements(By.TAG_NAME, 'a')
-                            
-                            # 현재 페이지 다음 링크 찾기
-                            for i, link in enumerate(page_links):
-                                if link.text.strip() == str(page_num):
-                                    # 현재 페이지 다음 링크가 있으면 클릭
-                                    if i + 1 < len(page_links):
-                                        next_link = page_links[i + 1]
-                                        if safe_click(driver, next_link, use_js=True):
-                                            next_page_found = True
-                                            break
-                        if next_page_found:
-                            break
-                except Exception as e:
-                    print(f"[WARN] 페이지네이션 영역 시도 중 오류: {e}")
-            
-            if not next_page_found:
-                print("[INFO] 더 이상 다음 페이지를 찾을 수 없습니다. 크롤링을 종료합니다.")
-                break
-            
-            # 페이지 로딩 기다리기
-            time.sleep(3)
-            page_num += 1
+                # 반복 문자열(상품명, 옵션, 리뷰어 정보 등)은 코드북으로 압축 저장
+                review_batch = ReviewBatch(RAW_REVIEW_COLUMNS, RAW_CATEGORICAL_COLUMNS)
+                driver = collect_review_pages(driver, target_url, product_title, review_batch,
+                                              last_page=max_pages, governor=governor, page_guard=page_guard)
 
         print(f"[{product_title}] 크롤링 완료!")
 
         # -----------------------------------------------------------
-        # 4. 데이터프레임으로 정리 후 CSV 파일로 저장
+        # 3. 데이터프레임으로 정리 후 CSV 파일로 저장
         # -----------------------------------------------------------
-        result_df = pd.DataFrame({
-            'RD_WRITE_DT': write_dt_lst,
-            'RD_RATING': rating_lst,
-            'RD_ITEM_NM': item_nm_lst,
-            'RD_CONTENT': content_lst,
-            'RD_OPTION_SIZE': option_size_lst,
-            'RD_OPTION_COLOR': option_color_lst,
-            'RD_REVIEWER_INFO': reviewer_info_lst,
-            'RD_REVIEW_IMAGES': review_imgs_lst,
-            'PRODUCT_TITLE': [product_title] * len(write_dt_lst)
-        })
+        # 범주형 컬럼은 Categorical로 내보내 문자열 사본을 만들지 않음
+        # 원본 텍스트는 상품 단위로 한 번에 정규화 (pandas 문자열 연산)
+        result_df = normalize_reviews(review_batch.to_dataframe())
 
         # 결과가 없을 경우 빈 데이터프레임 반환
         if len(result_df) == 0:
@@ -609,6 +880,13 @@ def crawl_reviews(target_url, max_pages=None, output_csv=None, return_df=False,
             result_df = result_df.drop_duplicates(subset=['RD_WRITE_DT', 'RD_CONTENT'], keep='first')
             print(f"[INFO] 중복 제거 후 {len(result_df)}개의 리뷰가 남았습니다.")
 
+        # 리뷰 지문 컬럼 추가 및 이전 실행에서 내보낸 리뷰 제외
+        review_key = product_key(target_url)
+        result_df = add_fingerprints(result_df, review_key)
+        if dedup_index is not None:
+            result_df = dedup_index.filter_new(result_df)
+            print(f"[INFO] 전역 중복 색인 확인 후 새 리뷰 {len(result_df)}개")
+
         # CSV 저장 (옵션)
         if output_csv:
             # 추가 모드인 경우 기존 파일이 있는지 확인
@@ -621,22 +899,56 @@ def crawl_reviews(target_url, max_pages=None, output_csv=None, return_df=False,
                 result_df.to_csv(output_csv, index=False, encoding='utf-8-sig')
                 print(f"CSV 저장 완료! {output_csv}에 {len(result_df)}건의 리뷰가 저장되었습니다.")
 
+        if dedup_index is not None:
+            dedup_index.register(result_df, review_key)
+
+        # 집계/색인 등 후속 저장소에 새 리뷰 전달
+        for sink in review_sinks or []:
+            sink.add_reviews(result_df, review_key)
+
         if return_df:
             return result_df
     
+    except retrypolicy.CrawlError as e:
+        # 차단 또는 일부 페이지 구간 실패: 빠진 페이지가 있는 결과는 저장/등록하지 않음
+        if raise_errors:
+            raise
+        print(f"[WARN] 리뷰 수집 실패로 결과를 저장하지 않습니다: {e}")
+        return None
+
     finally:
-        driver.quit()
+        governor.quit(driver)
+        if own_governor:
+            governor.report()
+        if profile_session is not None:
+            profiler.stop(profile_session)
         
     return None
 
 
 if __name__ == "__main__":
     import argparse
+    from reviewaggregates import ReviewAggregateStore, print_summary
+    from reviewsearch import ReviewSearchIndex
+    from pageguard import PageGuard, QuarantineStore
+    from crawlprofiler import CrawlProfiler, PROFILE_MODES
     
     parser = argparse.ArgumentParser(description='네이버 스마트스토어 상품 리뷰 크롤러')
     parser.add_argument('--url', type=str, help='크롤링할 상품 URL')
     parser.add_argument('--pages', type=int, default=None, help='수집할 최대 페이지 수 (기본값: 모든 페이지)')
+    parser.add_argument('--page-workers', type=int, default=1, help='리뷰 페이지 구간을 나눠 동시에 수집할 브라우저 수 (기본값: 1)')
+    parser.add_argument('--backend', choices=BACKENDS, default=BACKEND_SELENIUM,
+                        help='브라우저 백엔드 (async: 페이지 구간마다 Playwright 컨텍스트, 기본값: selenium)')
     parser.add_argument('--output', type=str, default='navershopping_review_data.csv', help='결과를 저장할 CSV 파일명')
+    parser.add_argument('--dedup-db', type=str, default=None, help='실행 간 중복 제거 색인 DB (예: review_fingerprints.db)')
+    parser.add_argument('--aggregates-db', type=str, default='review_aggregates.db', help='상품별 리뷰 집계 DB (기본값: review_aggregates.db)')
+    parser.add_argument('--search-db', type=str, default='review_search.db', help='리뷰 전문 검색 색인 DB (기본값: review_search.db)')
+    parser.add_argument('--quarantine-db', type=str, default='quarantine.db', help='차단된 URL 격리 DB (기본값: quarantine.db)')
+    parser.add_argument('--max-rss-mb', type=float, default=1536, help='브라우저 재시작 메모리 기준 (MB, 기본값: 1536)')
+    parser.add_argument('--max-cpu-percent', type=float, default=None, help='브라우저 재시작 CPU 기준 (%%, 기본값: 사용 안 함)')
+    parser.add_argument('--profile-dir', type=str, default=None, help='프로파일링 결과 디렉터리 (지정 시 스택/메모리 프로파일 저장)')
+    parser.add_argument('--profile-mode', choices=PROFILE_MODES, default='sample', help='프로파일링 방식 (기본값: sample)')
+    add_driver_arguments(parser)
 
     args = parser.parse_args()
     
@@ -657,13 +969,32 @@ if __name__ == "__main__":
     
     start_time = time.time()
     
+    # 이전 실행에서 남은 chromedriver/Chrome 정리
+    reap_orphans()
+    driver_backend = configure_from_args(args)
+    governor = DriverGovernor("review", max_rss_mb=args.max_rss_mb, max_cpu_percent=args.max_cpu_percent)
+    page_guard = PageGuard(quarantine=QuarantineStore(args.quarantine_db))
+    
+    dedup_index = ReviewDedupIndex(args.dedup_db) if args.dedup_db else None
+    aggregate_store = ReviewAggregateStore(args.aggregates_db)
+    search_index = ReviewSearchIndex(args.search_db)
+    profiler = CrawlProfiler(args.profile_dir, keep=1, mode=args.profile_mode) if args.profile_dir else None
+
     # 리뷰 수집 실행
     result_df = crawl_reviews(
         target_url=target_url,
         max_pages=args.pages,
         output_csv=args.output,
-        return_df=True
+        return_df=True,
+        dedup_index=dedup_index,
+        review_sinks=[aggregate_store, search_index],
+        governor=governor,
+        page_guard=page_guard,
+        profiler=profiler,
+        page_workers=args.page_workers,
+        backend=args.backend
     )
+    search_index.close()
     
     # 결과 요약
     elapsed_time = time.time() - start_time
@@ -674,10 +1005,21 @@ if __name__ == "__main__":
     
     if result_df is not None and not result_df.empty:
         print(f"- 수집된 리뷰 수: {len(result_df)}개")
-        print(f"- 평균 별점: {result_df['RD_RATING'].astype(float).mean():.1f}/5.0")
         print(f"- 결과 저장 위치: {args.output}")
     else:
         print("- 수집된 리뷰가 없습니다.")
+
+    # 누적 집계는 저장소에서 바로 조회 (CSV 재계산 없음)
+    summary = aggregate_store.summary(product_key(target_url))
+    if summary:
+        print("\n[누적 집계]")
+        print_summary(summary)
+    aggregate_store.close()
         
     print(f"- 소요 시간: {elapsed_time:.2f}초")
+    governor.report()
+    driver_backend.report()
+    page_guard.report()
+    if profiler is not None:
+        profiler.report()
     print("="*50)
\ No newline at end of file
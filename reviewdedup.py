@@ -0,0 +1,117 @@
+"""
+실행 간 리뷰 중복 제거 색인 (SQLite 지문 저장소)
+
+crawl_reviews의 drop_duplicates는 한 상품 호출 안에서만 중복을 지운다. 같은 상품을
+다시 크롤링하거나 시드가 겹치면 main.py가 공유 CSV에 같은 리뷰를 계속 덧붙이게 되므로,
+리뷰마다 (상품 키, 작성일, 평점, 내용) 지문을 만들어 영구 색인에 기록하고
+이미 내보낸 리뷰는 다시 쓰지 않는다. 지문은 RD_FINGERPRINT 컬럼으로도 저장되어
+후속 작업에서 조인 키로 쓸 수 있다.
+"""
+import hashlib
+import re
+import sqlite3
+import time
+
+FINGERPRINT_COLUMN = 'RD_FINGERPRINT'
+
+_PRODUCT_ID_PATTERN = re.compile(r'/products/(\d+)')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# SQLite 바인딩 변수 제한(기본 999)보다 작게 나눠서 조회
+_QUERY_CHUNK = 500
+
+
+def product_key(url=None, title=None):
+    """
+    리뷰 지문에 쓰는 상품 키
+
+    URL에 상품번호(/products/123)가 있으면 상품번호를, 없으면 도메인을 제외한 URL을,
+    URL이 없는 과거 데이터는 상품명을 사용한다.
+    """
+    if url:
+        match = _PRODUCT_ID_PATTERN.search(url)
+        if match:
+            return match.group(1)
+        return re.sub(r'^https?://[^/]+', '', url.strip()).split('?')[0]
+    return _WHITESPACE_PATTERN.sub(' ', title or '').strip()
+
+
+def review_fingerprint(key, write_dt, rating, content):
+    """
+    리뷰 지문 (blake2b 64비트, 16자리 hex)
+
+    내용은 공백을 정규화한 뒤 해시하므로 줄바꿈/공백 차이는 같은 리뷰로 본다.
+    """
+    content = _WHITESPACE_PATTERN.sub(' ', str(content or '')).strip()
+    payload = '\x1f'.join((str(key or ''), str(write_dt or ''), str(rating or ''), content))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def add_fingerprints(df, key):
+    """리뷰 데이터프레임에 RD_FINGERPRINT 컬럼 추가 (복사본 반환)"""
+    df = df.copy()
+    df[FINGERPRINT_COLUMN] = [
+        review_fingerprint(key, write_dt, rating, content)
+        for write_dt, rating, content in zip(df['RD_WRITE_DT'], df['RD_RATING'], df['RD_CONTENT'])
+    ]
+    return df
+
+
+class ReviewDedupIndex:
+    """리뷰 지문 영구 색인 (모든 리뷰 출력 경로가 공유)"""
+
+    def __init__(self, db_path="review_fingerprints.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS review_fingerprints (
+                fingerprint TEXT PRIMARY KEY,
+                product_key TEXT NOT NULL,
+                first_seen TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM review_fingerprints").fetchone()[0]
+
+    def existing(self, fingerprints):
+        """색인에 이미 있는 지문 집합 반환"""
+        fingerprints = list(fingerprints)
+        found = set()
+        for start in range(0, len(fingerprints), _QUERY_CHUNK):
+            chunk = fingerprints[start:start + _QUERY_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT fingerprint FROM review_fingerprints WHERE fingerprint IN ({placeholders})", chunk
+            )
+            found.update(row[0] for row in rows)
+        return found
+
+    def filter_new(self, df):
+        """
+        이전에 내보낸 리뷰와 배치 내 중복을 제거
+
+        Args:
+            df (DataFrame): RD_FINGERPRINT 컬럼이 있는 리뷰 데이터프레임
+
+        Returns:
+            DataFrame: 처음 보는 리뷰만 남긴 데이터프레임
+        """
+        if df.empty:
+            return df
+        seen = self.existing(set(df[FINGERPRINT_COLUMN]))
+        mask = ~df[FINGERPRINT_COLUMN].isin(seen) & ~df[FINGERPRINT_COLUMN].duplicated()
+        return df[mask]
+
+    def register(self, df, key):
+        """내보낸 리뷰의 지문을 색인에 기록 (CSV 저장 후 호출)"""
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO review_fingerprints VALUES (?, ?, ?)",
+            ((fingerprint, key, now) for fingerprint in df[FINGERPRINT_COLUMN])
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
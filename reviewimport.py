@@ -0,0 +1,171 @@
+"""
+과거 리뷰 CSV 스트리밍 가져오기
+
+old/*.csv 같은 과거 내보내기 파일(RD_* 컬럼, utf-8-sig)을 한꺼번에 pandas로 읽지 않고
+청크 단위로 읽어 정규화 → 전역 중복 색인(ReviewDedupIndex)으로 중복 제거 →
+리뷰 CSV에 추가하고 집계/검색 색인 등 후속 저장소에도 넘긴다. 메모리는 청크 크기만큼만 쓴다.
+
+과거 파일에는 상품 URL이 없으므로 상품 키는 상품명 기준이다. --changes-db를 주면
+상품 변경 이력 DB의 상품명 → 상품번호 매핑을 사용해 새로 크롤링한 리뷰와 같은 키로 맞춘다.
+
+    python reviewimport.py old/*.csv --output navershopping_data_reviews.csv
+"""
+import os
+import re
+import time
+
+from lazyimport import lazy_module
+from reviewrecord import REVIEW_COLUMNS, CATEGORICAL_COLUMNS
+from reviewnormalize import normalize_write_dates, normalize_ratings, normalize_contents
+from reviewprofile import parse_profiles
+from reviewdedup import FINGERPRINT_COLUMN, add_fingerprints, product_key as make_product_key
+
+pd = lazy_module("pandas")
+
+_COMPACT_DATE_PATTERN = re.compile(r'^\d{8}$')
+
+
+def normalize_legacy_reviews(chunk):
+    """
+    과거 CSV 청크(RD_* 문자열 컬럼)를 현재 리뷰 컬럼 형식으로 정규화
+
+    이미 YYYYMMDD인 작성일은 그대로 두고, 'YYYY.MM.DD' 같은 옛 형식만 변환한다.
+    없는 컬럼은 빈 값으로 채우고 리뷰어 정보에서 프로필 컬럼을 다시 뽑는다.
+    크롤러가 내보낸 RD_FINGERPRINT가 있으면 그대로 넘긴다 (빈 값은 fill_fingerprints에서 계산).
+    """
+    fingerprints = chunk[FINGERPRINT_COLUMN].fillna('').str.strip() if FINGERPRINT_COLUMN in chunk.columns else None
+    chunk = chunk.reindex(columns=REVIEW_COLUMNS).fillna('')
+    result = pd.DataFrame(index=chunk.index)
+
+    write_dts = chunk['RD_WRITE_DT'].str.strip()
+    compact = write_dts.str.match(_COMPACT_DATE_PATTERN)
+    result['RD_WRITE_DT'] = write_dts.where(compact, normalize_write_dates(write_dts))
+    result['RD_RATING'] = normalize_ratings(chunk['RD_RATING'])
+    result['RD_ITEM_NM'] = chunk['RD_ITEM_NM'].str.strip()
+    result['RD_CONTENT'] = normalize_contents(chunk['RD_CONTENT'])
+    for column in ('RD_OPTION_SIZE', 'RD_OPTION_COLOR', 'RD_REVIEWER_INFO', 'RD_REVIEW_IMAGES', 'PRODUCT_TITLE'):
+        result[column] = chunk[column].str.strip()
+
+    for column in CATEGORICAL_COLUMNS:
+        result[column] = result[column].astype('category')
+
+    profiles = parse_profiles(result['RD_REVIEWER_INFO'])
+    result = pd.concat([result[REVIEW_COLUMNS], profiles], axis=1)
+    if fingerprints is not None:
+        result[FINGERPRINT_COLUMN] = fingerprints
+    return result
+
+
+def fill_fingerprints(reviews, key):
+    """
+    RD_FINGERPRINT가 비어 있는 리뷰만 지문 계산 (복사본 반환)
+
+    크롤러가 등록한 지문은 상품 URL 기준 키로 만든 것이라 상품명 기준 키로 다시 계산하면
+    달라지므로, 파일에 있는 지문은 그대로 둬야 같은 리뷰가 다시 적재되지 않는다.
+    """
+    fingerprinted = add_fingerprints(reviews, key)
+    if FINGERPRINT_COLUMN in reviews.columns:
+        existing = reviews[FINGERPRINT_COLUMN]
+        fingerprinted[FINGERPRINT_COLUMN] = existing.where(existing != '', fingerprinted[FINGERPRINT_COLUMN])
+    return fingerprinted
+
+
+def import_review_csvs(csv_paths, output_csv, dedup_index, review_sinks=None, title_keys=None,
+                       chunksize=20000):
+    """
+    과거 리뷰 CSV를 청크 단위로 정규화/중복 제거해 리뷰 CSV와 후속 저장소에 적재
+
+    Args:
+        csv_paths (list): 과거 리뷰 CSV 경로 목록
+        output_csv (str): 적재할 리뷰 CSV (있으면 헤더 없이 추가)
+        dedup_index (ReviewDedupIndex): 전역 중복 색인
+        review_sinks (list, optional): add_reviews(df, product_key)를 구현한 후속 저장소
+        title_keys (dict, optional): 상품명 → 상품 키 매핑
+        chunksize (int): 청크 크기 (행)
+
+    Returns:
+        dict: rows(읽은 행), imported(새로 적재한 행), seconds
+    """
+    title_keys = title_keys or {}
+    rows = 0
+    imported = 0
+    start_time = time.time()
+
+    for csv_path in csv_paths:
+        file_rows = 0
+        for chunk in pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str, chunksize=chunksize):
+            rows += len(chunk)
+            file_rows += len(chunk)
+            reviews = normalize_legacy_reviews(chunk)
+
+            keyed = []
+            for title, group in reviews.groupby('PRODUCT_TITLE', sort=False, observed=True):
+                key = title_keys.get(title) or make_product_key(title=title)
+                keyed.append((key, fill_fingerprints(group, key)))
+            if not keyed:
+                continue
+
+            # 중복 확인과 CSV 쓰기는 청크 단위로 한 번에, 색인/후속 저장소는 상품 키 단위로
+            new_reviews = dedup_index.filter_new(pd.concat([group for _, group in keyed]))
+            if new_reviews.empty:
+                continue
+            header = not os.path.exists(output_csv)
+            new_reviews.to_csv(output_csv, mode='a', index=False, header=header, encoding='utf-8-sig')
+
+            for key, group in keyed:
+                group = group.loc[group.index.intersection(new_reviews.index)]
+                if group.empty:
+                    continue
+                dedup_index.register(group, key)
+                for sink in review_sinks or []:
+                    sink.add_reviews(group, key)
+            imported += len(new_reviews)
+
+            elapsed = time.time() - start_time
+            print(f"  {csv_path}: {file_rows}행 처리, 누적 적재 {imported}건 ({rows / max(elapsed, 1e-9):,.0f}행/초)")
+
+    return {'rows': rows, 'imported': imported, 'seconds': time.time() - start_time}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from reviewdedup import ReviewDedupIndex
+    from reviewaggregates import ReviewAggregateStore
+    from reviewsearch import ReviewSearchIndex
+    from productchanges import ProductChangeTracker
+
+    parser = argparse.ArgumentParser(description='과거 리뷰 CSV 가져오기 (청크 스트리밍, 중복 제거)')
+    parser.add_argument('csv', nargs='+', help='과거 리뷰 CSV 파일 (RD_* 컬럼)')
+    parser.add_argument('--output', type=str, default='navershopping_data_reviews.csv',
+                        help='적재할 리뷰 CSV (기본값: navershopping_data_reviews.csv)')
+    parser.add_argument('--chunksize', type=int, default=20000, help='청크 크기 (기본값: 20000행)')
+    parser.add_argument('--dedup-db', type=str, default='review_fingerprints.db', help='리뷰 지문 색인 DB')
+    parser.add_argument('--aggregates-db', type=str, default='review_aggregates.db', help='리뷰 집계 DB')
+    parser.add_argument('--search-db', type=str, default='review_search.db', help='리뷰 검색 색인 DB')
+    parser.add_argument('--changes-db', type=str, help='상품명 → 상품번호 매핑에 쓸 상품 변경 이력 DB')
+
+    args = parser.parse_args()
+
+    title_keys = {}
+    if args.changes_db:
+        tracker = ProductChangeTracker(args.changes_db)
+        title_keys = tracker.title_keys()
+        tracker.close()
+        print(f"[INFO] 상품명 → 상품번호 매핑 {len(title_keys)}개 사용")
+
+    dedup_index = ReviewDedupIndex(args.dedup_db)
+    sinks = [ReviewAggregateStore(args.aggregates_db), ReviewSearchIndex(args.search_db)]
+
+    try:
+        stats = import_review_csvs(args.csv, args.output, dedup_index, review_sinks=sinks,
+                                   title_keys=title_keys, chunksize=args.chunksize)
+    finally:
+        dedup_index.close()
+        for sink in sinks:
+            sink.close()
+
+    rate = stats['rows'] / max(stats['seconds'], 1e-9)
+    print(f"\n가져오기 완료: {stats['rows']}행 읽음, 새 리뷰 {stats['imported']}건 적재 "
+          f"({stats['seconds']:.2f}초, {rate:,.0f}행/초)")
+    print(f"- 리뷰 CSV: {args.output}")
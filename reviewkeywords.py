@@ -0,0 +1,288 @@
+"""
+상품별 리뷰 키워드(TF-IDF) 추출 - 프로세스 풀 배치 처리 + 리뷰 집합 지문 캐시
+
+리뷰 CSV(RD_* 컬럼)를 청크 단위로 두 번 읽는다.
+  1) 상품별 리뷰 지문(RD_FINGERPRINT)만 모아 리뷰 집합 지문을 계산하고 캐시와 비교
+  2) 리뷰 집합이 바뀐 상품의 RD_CONTENT만 batch_size 묶음으로 프로세스 풀에 보내 토큰화/집계
+상품별 단어 빈도(tf)와 문서(리뷰) 빈도(df)는 SQLite 캐시에 저장되므로, 다시 실행하면
+리뷰가 그대로인 상품은 토큰화를 건너뛰고 캐시된 빈도로 TF-IDF만 다시 계산한다.
+
+토크나이저는 'bigram'(단어별 글자 2-gram, 기본값), 'word'(공백 단위 단어) 또는
+'모듈:함수' 형식으로 지정한다 (함수는 텍스트를 받아 토큰 리스트를 반환해야 함).
+
+    python reviewkeywords.py navershopping_data_reviews.csv --top 30 --workers 8
+    python reviewkeywords.py old/*.csv --tokenizer mytokenizer:tokenize
+"""
+import hashlib
+import importlib
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from lazyimport import lazy_module
+from reviewdedup import FINGERPRINT_COLUMN, add_fingerprints, product_key as make_product_key
+from reviewsearch import to_bigrams
+
+pd = lazy_module("pandas")
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+# 한 번에 풀에 올려 두는 최대 배치 수 (메모리 상한)
+_MAX_PENDING = 32
+
+
+def bigram_tokenizer(text):
+    """단어별 글자 2-gram 토큰 (1글자 단어 제외)"""
+    return [token for token in to_bigrams(text).split() if len(token) > 1]
+
+
+def word_tokenizer(text):
+    """공백/구두점 기준 단어 토큰 (1글자 단어 제외)"""
+    return [word for word in _WORD_PATTERN.findall(str(text or '').lower()) if len(word) > 1]
+
+
+TOKENIZERS = {
+    'bigram': bigram_tokenizer,
+    'word': word_tokenizer,
+}
+
+
+def resolve_tokenizer(spec):
+    """'bigram' / 'word' / '모듈:함수' → 토크나이저 함수"""
+    if spec in TOKENIZERS:
+        return TOKENIZERS[spec]
+    module_name, _, func_name = spec.partition(':')
+    if not func_name:
+        raise ValueError(f"알 수 없는 토크나이저: {spec} ('bigram', 'word' 또는 '모듈:함수')")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def count_terms(batch):
+    """
+    리뷰 묶음 토큰화 (프로세스 풀 작업 단위)
+
+    Args:
+        batch (tuple): (상품 키, 리뷰 내용 리스트, 토크나이저 지정 문자열)
+
+    Returns:
+        tuple: (상품 키, 단어 빈도 Counter, 문서 빈도 Counter)
+    """
+    key, contents, tokenizer_spec = batch
+    tokenize = resolve_tokenizer(tokenizer_spec)
+    term_counts = Counter()
+    doc_counts = Counter()
+    for content in contents:
+        tokens = tokenize(content)
+        term_counts.update(tokens)
+        doc_counts.update(set(tokens))
+    return key, term_counts, doc_counts
+
+
+def review_set_fingerprint(fingerprints, tokenizer_spec):
+    """리뷰 지문 집합 + 토크나이저 → 리뷰 집합 지문 (순서 무관)"""
+    digest = hashlib.blake2b(tokenizer_spec.encode('utf-8'), digest_size=16)
+    for fingerprint in sorted(set(fingerprints)):
+        digest.update(fingerprint.encode('ascii'))
+    return digest.hexdigest()
+
+
+def iter_review_chunks(csv_paths, chunksize=20000):
+    """
+    리뷰 CSV 청크 순회 - (상품 키, 상품명, 청크) 단위로 반환
+
+    상품 키는 PRODUCT_TITLE 기준이며, RD_FINGERPRINT가 없으면 계산해서 붙인다.
+    """
+    for csv_path in csv_paths:
+        for chunk in pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str, chunksize=chunksize):
+            chunk = chunk.fillna('')
+            for title, group in chunk.groupby('PRODUCT_TITLE', sort=False):
+                key = make_product_key(title=title)
+                if FINGERPRINT_COLUMN not in group.columns:
+                    group = add_fingerprints(group, key)
+                yield key, title, group
+
+
+class KeywordCache:
+    """상품별 단어/문서 빈도 캐시 (리뷰 집합 지문이 같으면 재사용)"""
+
+    def __init__(self, db_path="review_keywords.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS product_sets (
+                product_key TEXT PRIMARY KEY,
+                title TEXT,
+                set_fingerprint TEXT NOT NULL,
+                review_count INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS product_terms (
+                product_key TEXT NOT NULL,
+                term TEXT NOT NULL,
+                tf INTEGER NOT NULL,
+                df INTEGER NOT NULL,
+                PRIMARY KEY (product_key, term)
+            ) WITHOUT ROWID;
+        """)
+        self.conn.commit()
+
+    def set_fingerprint(self, key):
+        row = self.conn.execute(
+            "SELECT set_fingerprint FROM product_sets WHERE product_key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def store(self, key, title, set_fingerprint, review_count, term_counts, doc_counts, min_count=1):
+        """상품 빈도 교체 저장 (tf가 min_count 미만인 단어는 버림)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM product_terms WHERE product_key = ?", (key,))
+            self.conn.executemany(
+                "INSERT INTO product_terms VALUES (?, ?, ?, ?)",
+                ((key, term, count, doc_counts[term])
+                 for term, count in term_counts.items() if count >= min_count)
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO product_sets VALUES (?, ?, ?, ?, ?)",
+                (key, title, set_fingerprint, review_count, time.strftime("%Y-%m-%d %H:%M:%S"))
+            )
+
+    def keyword_table(self, keys, top=20):
+        """
+        상품별 TF-IDF 상위 키워드
+
+        idf는 캐시된 전체 상품의 리뷰를 문서로 보고 계산한다 (log((1 + N) / (1 + df)) + 1).
+
+        Returns:
+            DataFrame: product_key, title, rank, term, tf, df, tfidf
+        """
+        review_total = self.conn.execute("SELECT COALESCE(SUM(review_count), 0) FROM product_sets").fetchone()[0]
+        doc_freq = dict(self.conn.execute("SELECT term, SUM(df) FROM product_terms GROUP BY term"))
+        titles = dict(self.conn.execute("SELECT product_key, title FROM product_sets"))
+
+        rows = []
+        for key in keys:
+            terms = self.conn.execute(
+                "SELECT term, tf, df FROM product_terms WHERE product_key = ?", (key,)
+            ).fetchall()
+            total = sum(tf for _, tf, _ in terms) or 1
+            scored = sorted(
+                ((tf / total * (math.log((1 + review_total) / (1 + doc_freq[term])) + 1), term, tf, df)
+                 for term, tf, df in terms),
+                reverse=True
+            )[:top]
+            for rank, (score, term, tf, df) in enumerate(scored, 1):
+                rows.append((key, titles.get(key), rank, term, tf, df, round(score, 6)))
+        return pd.DataFrame(rows, columns=['product_key', 'title', 'rank', 'term', 'tf', 'df', 'tfidf'])
+
+    def close(self):
+        self.conn.close()
+
+
+def extract_keywords(csv_paths, cache, tokenizer='bigram', workers=None, batch_size=2000,
+                     chunksize=20000, min_count=2):
+    """
+    리뷰 CSV에서 상품별 단어/문서 빈도를 갱신 (리뷰 집합이 바뀐 상품만 토큰화)
+
+    Args:
+        csv_paths (list): 리뷰 CSV 경로 목록
+        cache (KeywordCache): 빈도 캐시
+        tokenizer (str): 'bigram', 'word' 또는 '모듈:함수'
+        workers (int, optional): 프로세스 수 (기본값: CPU 수)
+        batch_size (int): 프로세스 풀 작업 하나에 넣는 리뷰 수
+        chunksize (int): CSV 청크 크기
+        min_count (int): 캐시에 남길 최소 단어 빈도
+
+    Returns:
+        dict: products(전체 상품 키 목록), updated, skipped, reviews
+    """
+    resolve_tokenizer(tokenizer)  # 잘못된 지정은 풀을 띄우기 전에 실패
+
+    # 1단계: 상품별 리뷰 지문 수집 → 캐시와 다른 상품만 골라냄
+    fingerprints = {}
+    titles = {}
+    for key, title, group in iter_review_chunks(csv_paths, chunksize):
+        fingerprints.setdefault(key, set()).update(group[FINGERPRINT_COLUMN])
+        titles.setdefault(key, title)
+
+    set_fingerprints = {key: review_set_fingerprint(fps, tokenizer) for key, fps in fingerprints.items()}
+    stale = {key for key, fp in set_fingerprints.items() if cache.set_fingerprint(key) != fp}
+    print(f"[INFO] 상품 {len(fingerprints)}개 중 {len(stale)}개 갱신 필요 (나머지는 캐시 사용)")
+
+    # 2단계: 바뀐 상품의 리뷰만 묶음으로 나눠 프로세스 풀에서 토큰화
+    term_counts = {key: Counter() for key in stale}
+    doc_counts = {key: Counter() for key in stale}
+    seen = {key: set() for key in stale}
+    reviews = 0
+
+    def merge(future):
+        key, terms, docs = future.result()
+        term_counts[key].update(terms)
+        doc_counts[key].update(docs)
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            pending = []
+            buffers = {key: [] for key in stale}
+            for key, _, group in iter_review_chunks(csv_paths, chunksize):
+                if key not in stale:
+                    continue
+                for fingerprint, content in zip(group[FINGERPRINT_COLUMN], group['RD_CONTENT']):
+                    if fingerprint in seen[key]:
+                        continue
+                    seen[key].add(fingerprint)
+                    buffers[key].append(content)
+                    reviews += 1
+                    if len(buffers[key]) >= batch_size:
+                        pending.append(executor.submit(count_terms, (key, buffers[key], tokenizer)))
+                        buffers[key] = []
+                        if len(pending) >= _MAX_PENDING:
+                            merge(pending.pop(0))
+            for key, contents in buffers.items():
+                if contents:
+                    pending.append(executor.submit(count_terms, (key, contents, tokenizer)))
+            for future in pending:
+                merge(future)
+
+    for key in stale:
+        cache.store(key, titles[key], set_fingerprints[key], len(seen[key]),
+                    term_counts[key], doc_counts[key], min_count)
+
+    return {
+        'products': list(fingerprints),
+        'updated': len(stale),
+        'skipped': len(fingerprints) - len(stale),
+        'reviews': reviews
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='상품별 리뷰 키워드(TF-IDF) 추출')
+    parser.add_argument('csv', nargs='+', help='리뷰 CSV 파일 (RD_* 컬럼)')
+    parser.add_argument('--output', type=str, default='review_keywords.csv', help='키워드 CSV (기본값: review_keywords.csv)')
+    parser.add_argument('--db', type=str, default='review_keywords.db', help='빈도 캐시 DB (기본값: review_keywords.db)')
+    parser.add_argument('--tokenizer', type=str, default='bigram', help="토크나이저: bigram, word 또는 '모듈:함수' (기본값: bigram)")
+    parser.add_argument('--top', type=int, default=20, help='상품별 상위 키워드 수 (기본값: 20)')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--batch-size', type=int, default=2000, help='작업당 리뷰 수 (기본값: 2000)')
+    parser.add_argument('--min-count', type=int, default=2, help='캐시에 남길 최소 단어 빈도 (기본값: 2)')
+
+    args = parser.parse_args()
+    keyword_cache = KeywordCache(args.db)
+
+    start_time = time.time()
+    stats = extract_keywords(args.csv, keyword_cache, tokenizer=args.tokenizer, workers=args.workers,
+                             batch_size=args.batch_size, min_count=args.min_count)
+    elapsed = time.time() - start_time
+
+    table = keyword_cache.keyword_table(stats['products'], top=args.top)
+    table.to_csv(args.output, index=False, encoding='utf-8-sig')
+    keyword_cache.close()
+
+    print(f"[INFO] 토큰화 {stats['reviews']}건, 갱신 {stats['updated']}개 / 캐시 사용 {stats['skipped']}개 상품 ({elapsed:.2f}초)")
+    print(f"[INFO] 키워드 {len(table)}행 저장: {args.output}")
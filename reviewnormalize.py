@@ -0,0 +1,139 @@
+"""
+리뷰 원본 텍스트 일괄 정규화
+
+crawl_reviews는 페이지를 돌며 리뷰 블록의 원본 텍스트(RAW_* 컬럼)만 모으고,
+날짜 형식 판별/공백 정리/평점 추출/상품명(옵션 태그 제외) 정리는 상품 단위로
+모은 뒤 여기서 pandas 문자열 연산으로 한 번에 처리한다.
+
+- 범주형(Categorical) 컬럼은 고유 값(categories)에만 연산한 뒤 코드로 펼친다.
+- 상품명에서 옵션 태그 텍스트를 뺄 때는 정규식이 아닌 문자열 그대로 제거하므로
+  괄호나 + 같은 특수문자가 들어 있어도 안전하다.
+- 리뷰어 정보와 옵션 평가는 reviewprofile로 타입이 있는 컬럼(키, 피부타입, 핏 등)까지 뽑는다.
+"""
+from lazyimport import lazy_module
+from reviewrecord import REVIEW_COLUMNS, CATEGORICAL_COLUMNS
+from reviewprofile import PROFILE_COLUMNS, parse_profiles
+
+pd = lazy_module("pandas")
+
+# 수집 단계 컬럼 (extract_review_raw 결과 + PRODUCT_TITLE)
+RAW_REVIEW_COLUMNS = [
+    'RAW_WRITE_DT', 'RAW_RATING', 'RAW_ITEM_TEXT', 'RAW_OPTION_TEXT', 'RAW_CONTENT',
+    'RD_OPTION_SIZE', 'RD_OPTION_COLOR', 'RAW_OPTIONS', 'RD_REVIEWER_INFO', 'RD_REVIEW_IMAGES', 'PRODUCT_TITLE'
+]
+
+RAW_CATEGORICAL_COLUMNS = (
+    'RAW_WRITE_DT', 'RAW_RATING', 'RAW_ITEM_TEXT', 'RAW_OPTION_TEXT',
+    'RD_OPTION_SIZE', 'RD_OPTION_COLOR', 'RAW_OPTIONS', 'RD_REVIEWER_INFO', 'PRODUCT_TITLE'
+)
+
+# 날짜 후보 텍스트(줄 단위) 중 줄 맨 앞이 날짜인 첫 번째 값
+#   YYYY.MM.DD / YYYY-MM-DD / yy.mm.dd(.)
+DATE_PATTERN = (
+    r'(?m)^\s*(?:(?P<y4>\d{4})[.\-](?P<m4>\d{2})[.\-](?P<d4>\d{2})'
+    r'|(?P<y2>\d{2})\.(?P<m2>\d{2})\.(?P<d2>\d{2}))'
+)
+
+RATING_PATTERN = r'(\d+(?:\.\d+)?)'
+
+# 상품명 앞에 붙는 안내 문구
+ITEM_NAME_PREFIX = '제품 선택: '
+
+
+def _on_categories(series, func):
+    """
+    범주형 컬럼이면 고유 값에만 func를 적용한 뒤 코드로 펼치고, 아니면 그대로 적용
+
+    Returns:
+        Series: func 적용 결과 (object/str)
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = pd.Series(series.cat.categories, dtype=object)
+        mapped = func(categories).to_numpy()
+        return pd.Series(mapped[series.cat.codes.to_numpy()], index=series.index)
+    return func(series.astype(object))
+
+
+def normalize_write_dates(values):
+    """날짜 후보 텍스트 → YYYYMMDD (형식이 맞지 않거나 유효하지 않은 날짜는 빈 문자열)"""
+    parts = values.fillna('').str.extract(DATE_PATTERN)
+
+    # 두 자리 연도는 strptime('%y')와 같은 규칙 (00-68 → 2000년대, 69-99 → 1900년대)
+    short_year = parts['y2'].astype(float)
+    century = short_year.where(short_year.isna(), (short_year < 69).map({True: '20', False: '19'}))
+    year = parts['y4'].fillna(century + parts['y2'])
+    month = parts['m4'].fillna(parts['m2'])
+    day = parts['d4'].fillna(parts['d2'])
+
+    dates = year + month + day
+    valid = pd.to_datetime(dates, format='%Y%m%d', errors='coerce').notna()
+    return dates.where(valid, '').fillna('')
+
+
+def normalize_ratings(values):
+    """평점 텍스트에서 숫자 추출 (숫자가 없으면 원본 텍스트를 공백만 정리해 유지)"""
+    stripped = values.fillna('').str.strip()
+    return stripped.str.extract(RATING_PATTERN)[0].fillna(stripped)
+
+
+def normalize_contents(values):
+    """줄바꿈 → 공백, 연속 공백 축약, 앞뒤 공백 제거"""
+    return (
+        values.fillna('')
+        .str.replace('\n', ' ', regex=False)
+        .str.replace(' +', ' ', regex=True)
+        .str.strip()
+    )
+
+
+def normalize_item_names(item_texts, option_texts):
+    """
+    옵션 태그 텍스트를 뺀 상품명 추출
+
+    옵션 텍스트는 리뷰마다 다른 값이라 행 단위로 str.replace(정규식 아님)하고,
+    '제품 선택: ' 이후 부분 추출은 벡터 연산으로 처리한다.
+    """
+    removed = pd.Series([
+        item.replace(option, '') if option else item
+        for item, option in zip(item_texts.astype(object).fillna(''), option_texts.astype(object).fillna(''))
+    ], index=item_texts.index, dtype=object)
+
+    after_prefix = removed.str.split(ITEM_NAME_PREFIX, n=1).str[1]
+    return after_prefix.fillna(removed).str.strip()
+
+
+def normalize_reviews(raw_df, categorical=True):
+    """
+    수집 단계 리뷰(RAW_* 컬럼)를 최종 리뷰 컬럼(RD_*)으로 정규화
+
+    Args:
+        raw_df (DataFrame): RAW_REVIEW_COLUMNS 컬럼을 가진 데이터프레임
+        categorical (bool): 반복 값이 많은 컬럼을 Categorical로 유지할지 여부
+
+    Returns:
+        DataFrame: REVIEW_COLUMNS + PROFILE_COLUMNS 순서의 정규화된 리뷰 데이터프레임
+    """
+    result = pd.DataFrame(index=raw_df.index)
+    result['RD_WRITE_DT'] = _on_categories(raw_df['RAW_WRITE_DT'], normalize_write_dates)
+    result['RD_RATING'] = _on_categories(raw_df['RAW_RATING'], normalize_ratings)
+    result['RD_ITEM_NM'] = normalize_item_names(raw_df['RAW_ITEM_TEXT'], raw_df['RAW_OPTION_TEXT'])
+    result['RD_CONTENT'] = normalize_contents(raw_df['RAW_CONTENT'].astype(object))
+    result['RD_OPTION_SIZE'] = raw_df['RD_OPTION_SIZE']
+    result['RD_OPTION_COLOR'] = raw_df['RD_OPTION_COLOR']
+    result['RD_REVIEWER_INFO'] = raw_df['RD_REVIEWER_INFO']
+    result['RD_REVIEW_IMAGES'] = raw_df['RD_REVIEW_IMAGES']
+    result['PRODUCT_TITLE'] = raw_df['PRODUCT_TITLE']
+
+    if categorical:
+        for column in CATEGORICAL_COLUMNS:
+            if not isinstance(result[column].dtype, pd.CategoricalDtype):
+                result[column] = result[column].astype('category')
+
+    profiles = parse_profiles(raw_df['RD_REVIEWER_INFO'], raw_df.get('RAW_OPTIONS'))
+    if not categorical:
+        profiles = profiles.astype({
+            column: object for column in PROFILE_COLUMNS
+            if isinstance(profiles[column].dtype, pd.CategoricalDtype)
+        })
+    result = pd.concat([result[REVIEW_COLUMNS], profiles], axis=1)
+    return result[REVIEW_COLUMNS + PROFILE_COLUMNS]
@@ -0,0 +1,142 @@
+"""
+리뷰어 정보/옵션 평가 구조화 파서 (표 기반)
+
+RD_REVIEWER_INFO는 '키 160cm · 몸무게 50kg · 평소사이즈 55'나 '피부타입 건성 · 피부톤 봄웜톤'
+같은 자유 텍스트이고, 리뷰의 옵션 평가(dl의 dt/dd 쌍)는 사이즈/컬러 외에는 버려졌다.
+후속 분석에서 행마다 정규식으로 다시 파싱하지 않도록, 크롤링 단계에서 아래 표에 정의된
+필드를 타입이 있는 컬럼(정수는 nullable Int, 문자열은 Categorical)으로 뽑아 낸다.
+
+- 필드 정규식은 모듈 로드 시 한 번만 컴파일하고, 고유 값(categories)에만 적용한다.
+- 필드 추가는 REVIEWER_FIELDS / OPTION_FIELDS 표에 한 줄 추가하면 된다.
+"""
+import json
+import re
+
+from lazyimport import lazy_module
+
+pd = lazy_module("pandas")
+
+# 리뷰어 정보 필드: (컬럼, 라벨 정규식, 타입)
+#   타입 'int'  → 값에서 숫자만 추출해 nullable 정수
+#   타입 'category' → 값 문자열 그대로 범주형
+REVIEWER_FIELDS = [
+    ('RD_HEIGHT_CM', r'키', 'int'),
+    ('RD_WEIGHT_KG', r'몸무게', 'int'),
+    ('RD_USUAL_SIZE', r'평소\s*사이즈', 'category'),
+    ('RD_FOOT_SIZE_MM', r'발\s*사이즈', 'int'),
+    ('RD_SKIN_TYPE', r'피부\s*타입', 'category'),
+    ('RD_SKIN_TONE', r'피부\s*톤', 'category'),
+    ('RD_SKIN_CONCERN', r'피부\s*고민', 'category'),
+]
+
+# 옵션 평가 필드: (컬럼, dt 라벨 후보) - 사이즈/컬러는 RD_OPTION_SIZE/RD_OPTION_COLOR로 이미 저장
+OPTION_FIELDS = [
+    ('RD_FIT', ('핏',)),
+    ('RD_COMFORT', ('착용감',)),
+    ('RD_THICKNESS', ('두께감', '두께')),
+    ('RD_MOISTURE', ('보습력', '보습감')),
+    ('RD_IRRITATION', ('자극도', '자극')),
+    ('RD_SPREADABILITY', ('발림성',)),
+    ('RD_SCENT', ('향',)),
+]
+
+# RD_OPTION_SIZE / RD_OPTION_COLOR로 이미 저장되는 옵션 라벨
+BASE_OPTION_LABELS = ('사이즈', 'size', 'SIZE', '크기', '색상', '컬러', 'color', 'COLOR')
+
+EXTRA_OPTIONS_COLUMN = 'RD_OPTIONS_EXTRA'
+
+PROFILE_COLUMNS = (
+    [column for column, _, _ in REVIEWER_FIELDS]
+    + [column for column, _ in OPTION_FIELDS]
+    + [EXTRA_OPTIONS_COLUMN]
+)
+
+# 값은 구분자(· | , 줄바꿈)나 다음 라벨 직전에서 끝난다 (구분자 없이 붙어 있는 텍스트 대응)
+_ALL_LABELS = '|'.join(label for _, label, _ in REVIEWER_FIELDS)
+_VALUE_END = rf'(?=\s*(?:[·|,\n/]|$|{_ALL_LABELS}))'
+
+_COMPILED_REVIEWER_FIELDS = [
+    (column, re.compile(rf'(?:{label})\s*:?\s*(?P<value>.+?){_VALUE_END}'), kind)
+    for column, label, kind in REVIEWER_FIELDS
+]
+
+_OPTION_LABEL_TO_COLUMN = {
+    label: column for column, labels in OPTION_FIELDS for label in labels
+}
+
+
+def _unique_values(series):
+    """(고유 값 Series, 각 행의 고유 값 인덱스) 반환 - 범주형이면 categories 그대로 사용"""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object).fillna('').astype('category')
+    return pd.Series(series.cat.categories, dtype=object), series.cat.codes.to_numpy()
+
+
+def parse_reviewer_info(values):
+    """
+    리뷰어 정보 텍스트 → 필드별 타입 컬럼
+
+    Args:
+        values (Series): RD_REVIEWER_INFO
+
+    Returns:
+        DataFrame: REVIEWER_FIELDS 컬럼 (int → Int16, category → Categorical)
+    """
+    uniques, codes = _unique_values(values)
+    result = pd.DataFrame(index=values.index)
+    for column, pattern, kind in _COMPILED_REVIEWER_FIELDS:
+        extracted = uniques.str.extract(pattern)['value'].str.strip()
+        if kind == 'int':
+            numbers = pd.to_numeric(extracted.str.extract(r'(\d+)')[0], errors='coerce').astype('Int16')
+            result[column] = pd.array(numbers.to_numpy()[codes], dtype='Int16')
+        else:
+            result[column] = pd.Categorical(extracted.fillna('').to_numpy()[codes])
+    return result
+
+
+def parse_options(values):
+    """
+    옵션 평가 JSON(RAW_OPTIONS) → 필드별 범주형 컬럼 + 나머지 옵션 JSON
+
+    Args:
+        values (Series): dt 라벨 → dd 값 딕셔너리를 JSON으로 직렬화한 문자열
+
+    Returns:
+        DataFrame: OPTION_FIELDS 컬럼 + RD_OPTIONS_EXTRA
+    """
+    uniques, codes = _unique_values(values)
+    table = {column: [] for column, _ in OPTION_FIELDS}
+    extras = []
+    for raw in uniques:
+        options = json.loads(raw) if raw else {}
+        row = {}
+        extra = {}
+        for label, value in options.items():
+            column = _OPTION_LABEL_TO_COLUMN.get(label)
+            if column:
+                row.setdefault(column, value)
+            elif label not in BASE_OPTION_LABELS:
+                extra[label] = value
+        for column in table:
+            table[column].append(row.get(column, ''))
+        extras.append(json.dumps(extra, ensure_ascii=False, sort_keys=True) if extra else '')
+
+    result = pd.DataFrame(index=values.index)
+    for column, column_values in table.items():
+        result[column] = pd.Categorical(pd.Series(column_values, dtype=object).to_numpy()[codes])
+    result[EXTRA_OPTIONS_COLUMN] = pd.Categorical(pd.Series(extras, dtype=object).to_numpy()[codes])
+    return result
+
+
+def parse_profiles(reviewer_info, options=None):
+    """
+    리뷰어 정보 + 옵션 평가를 PROFILE_COLUMNS 데이터프레임으로 변환
+
+    Args:
+        reviewer_info (Series): RD_REVIEWER_INFO
+        options (Series, optional): RAW_OPTIONS (없으면 옵션 컬럼은 빈 값)
+    """
+    if options is None:
+        options = pd.Series([''] * len(reviewer_info), index=reviewer_info.index, dtype=object)
+    parsed = pd.concat([parse_reviewer_info(reviewer_info), parse_options(options)], axis=1)
+    return parsed[PROFILE_COLUMNS]
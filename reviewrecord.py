@@ -0,0 +1,140 @@
+"""
+리뷰 레코드의 압축 표현 (ReviewBatch)
+
+crawl_reviews는 리뷰마다 PRODUCT_TITLE, 옵션(사이즈/컬러), 상품명, 리뷰어 정보 같은
+반복 문자열을 별도의 str 객체로 들고 있다가 DataFrame으로 한 번 더 복사한다.
+ReviewBatch는 반복이 많은 컬럼을 코드북(문자열 → 정수 코드) + array('I') 코드 배열로
+저장하고, 내보낼 때 pandas Categorical로 변환해 문자열 사본을 만들지 않는다.
+"""
+import sys
+from array import array
+
+from lazyimport import lazy_module
+
+pd = lazy_module("pandas")
+np = lazy_module("numpy")
+
+# crawl_reviews 출력 컬럼 순서
+REVIEW_COLUMNS = [
+    'RD_WRITE_DT', 'RD_RATING', 'RD_ITEM_NM', 'RD_CONTENT', 'RD_OPTION_SIZE',
+    'RD_OPTION_COLOR', 'RD_REVIEWER_INFO', 'RD_REVIEW_IMAGES', 'PRODUCT_TITLE'
+]
+
+# 값의 종류가 적고 반복이 많은 컬럼 → 코드북 + 코드 배열로 저장 (Categorical로 내보냄)
+CATEGORICAL_COLUMNS = (
+    'RD_WRITE_DT', 'RD_RATING', 'RD_ITEM_NM', 'RD_OPTION_SIZE',
+    'RD_OPTION_COLOR', 'RD_REVIEWER_INFO', 'PRODUCT_TITLE'
+)
+
+
+class ReviewBatch:
+    """
+    컬럼 단위 리뷰 배치
+
+    - 범주형 컬럼: 인턴된 문자열 코드북 + array('I') 코드 배열
+    - 자유 텍스트 컬럼(RD_CONTENT, RD_REVIEW_IMAGES): 문자열 리스트
+    """
+
+    __slots__ = ('columns', '_codes', '_categories', '_lookup', '_text')
+
+    def __init__(self, columns=None, categorical_columns=CATEGORICAL_COLUMNS):
+        self.columns = list(columns or REVIEW_COLUMNS)
+        self._codes = {}
+        self._categories = {}
+        self._lookup = {}
+        self._text = {}
+        for column in self.columns:
+            if column in categorical_columns:
+                self._codes[column] = array('I')
+                self._categories[column] = []
+                self._lookup[column] = {}
+            else:
+                self._text[column] = []
+
+    def __len__(self):
+        first = self.columns[0]
+        store = self._codes.get(first)
+        return len(store) if store is not None else len(self._text[first])
+
+    def _encode(self, column, value):
+        """문자열을 코드로 변환 (처음 보는 값은 인턴 후 코드북에 추가)"""
+        lookup = self._lookup[column]
+        code = lookup.get(value)
+        if code is None:
+            code = len(self._categories[column])
+            value = sys.intern(value)
+            lookup[value] = code
+            self._categories[column].append(value)
+        return code
+
+    def append(self, **values):
+        """
+        리뷰 한 건 추가 (컬럼명=값, 누락된 컬럼은 빈 문자열)
+
+        Example:
+            batch.append(RD_WRITE_DT='20250407', RD_RATING='5', RD_CONTENT='좋아요', ...)
+        """
+        for column in self.columns:
+            value = values.get(column) or ""
+            codes = self._codes.get(column)
+            if codes is not None:
+                codes.append(self._encode(column, value))
+            else:
+                self._text[column].append(value)
+
+    def extend(self, other):
+        """
+        다른 배치의 리뷰를 순서대로 이어 붙임 (같은 컬럼 구성)
+
+        범주형 컬럼은 상대 코드북을 이 배치의 코드로 한 번만 변환해 코드 배열을 옮긴다.
+        """
+        for column in self.columns:
+            codes = self._codes.get(column)
+            if codes is None:
+                self._text[column].extend(other._text[column])
+                continue
+            mapping = [self._encode(column, value) for value in other._categories[column]]
+            codes.extend(array('I', (mapping[code] for code in other._codes[column])))
+
+    def column(self, name):
+        """컬럼 값을 문자열 리스트로 반환"""
+        codes = self._codes.get(name)
+        if codes is None:
+            return list(self._text[name])
+        categories = self._categories[name]
+        return [categories[code] for code in codes]
+
+    def row(self, index):
+        """index번째 리뷰를 dict로 반환"""
+        row = {}
+        for column in self.columns:
+            codes = self._codes.get(column)
+            if codes is not None:
+                row[column] = self._categories[column][codes[index]]
+            else:
+                row[column] = self._text[column][index]
+        return row
+
+    def to_dataframe(self, categorical=True):
+        """
+        DataFrame으로 변환
+
+        Args:
+            categorical (bool): True면 범주형 컬럼을 pandas Categorical로 내보냄
+                (코드 배열을 그대로 사용하므로 문자열 사본을 만들지 않음)
+
+        Returns:
+            DataFrame: REVIEW_COLUMNS 순서의 리뷰 데이터프레임
+        """
+        data = {}
+        for column in self.columns:
+            codes = self._codes.get(column)
+            if codes is None:
+                data[column] = self._text[column]
+            elif categorical:
+                data[column] = pd.Categorical.from_codes(
+                    np.frombuffer(codes, dtype=np.uint32), categories=self._categories[column]
+                )
+            else:
+                data[column] = self.column(column)
+        return pd.DataFrame(data, columns=self.columns)
@@ -0,0 +1,214 @@
+"""
+리뷰 전문 검색 색인 (SQLite FTS5 + 한글 2-gram)
+
+수백 MB 리뷰 CSV를 grep하는 대신, 수집된 리뷰를 SQLite FTS5 색인에 넣어 두고
+성분/불만 키워드를 상품·기간 조건과 함께 밀리초 단위로 검색한다.
+
+한국어는 띄어쓰기 단위 토큰으로는 '건성피부에'에서 '건성'을 찾을 수 없으므로,
+단어마다 글자 2-gram으로 쪼갠 문자열을 색인한다 ('건성피부' → '건성 성피 피부').
+검색어도 같은 방식으로 쪼개 구(phrase) 검색하므로 단어 내부 부분 문자열이 일치한다.
+2-gram이 없는 1글자 검색어('향')는 원문 LIKE 검색으로 대신한다.
+crawl_reviews의 review_sinks로 넘기면 새 리뷰가 들어올 때마다 증분 색인된다.
+
+    python reviewsearch.py "수분 크림" --product 8045986719 --since 20250101
+    python reviewsearch.py --index navershopping_data_reviews.csv
+"""
+import re
+import sqlite3
+import time
+
+from reviewdedup import FINGERPRINT_COLUMN, add_fingerprints, product_key as make_product_key
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def to_bigrams(text):
+    """
+    텍스트를 단어별 글자 2-gram 토큰 문자열로 변환 (1글자 단어는 그대로)
+
+    Example:
+        to_bigrams('건성피부 OK') → '건성 성피 피부 ok'
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall(str(text or '').lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return ' '.join(tokens)
+
+
+def build_match_query(query):
+    """검색어 → FTS5 MATCH 식 (2글자 이상 단어마다 2-gram 구 검색, 단어끼리는 AND)"""
+    phrases = []
+    for word in _WORD_PATTERN.findall(query.lower()):
+        if len(word) > 1:
+            phrases.append('"' + to_bigrams(word) + '"')
+    return ' AND '.join(phrases)
+
+
+def single_char_terms(query):
+    """
+    2-gram 색인으로 찾을 수 없는 1글자 검색어 목록
+
+    색인에는 '향이', '무향'처럼 다른 글자와 묶인 2-gram만 남으므로 1글자 단어는 원문 LIKE로 찾는다.
+    """
+    return list(dict.fromkeys(word for word in _WORD_PATTERN.findall(query.lower()) if len(word) == 1))
+
+
+class ReviewSearchIndex:
+    """리뷰 전문 검색 색인"""
+
+    def __init__(self, db_path="review_search.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS reviews (
+                id INTEGER PRIMARY KEY,
+                fingerprint TEXT NOT NULL UNIQUE,
+                product_key TEXT NOT NULL,
+                product_title TEXT,
+                write_dt TEXT,
+                rating TEXT,
+                content TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_reviews_product_dt ON reviews (product_key, write_dt);
+            CREATE INDEX IF NOT EXISTS idx_reviews_dt ON reviews (write_dt);
+            CREATE VIRTUAL TABLE IF NOT EXISTS review_fts USING fts5(grams, content='', tokenize='unicode61');
+        """)
+        self.conn.commit()
+
+    def add_reviews(self, df, product_key):
+        """
+        리뷰 증분 색인 (이미 색인된 지문은 건너뜀)
+
+        Returns:
+            int: 새로 색인된 리뷰 수
+        """
+        if df.empty:
+            return 0
+        if FINGERPRINT_COLUMN not in df.columns:
+            df = add_fingerprints(df, product_key)
+
+        added = 0
+        with self.conn:
+            for fingerprint, title, write_dt, rating, content in zip(
+                df[FINGERPRINT_COLUMN], df['PRODUCT_TITLE'], df['RD_WRITE_DT'], df['RD_RATING'], df['RD_CONTENT']
+            ):
+                cursor = self.conn.execute(
+                    "INSERT OR IGNORE INTO reviews (fingerprint, product_key, product_title, write_dt, rating, content) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (fingerprint, product_key, str(title), str(write_dt), str(rating), str(content))
+                )
+                if cursor.rowcount:
+                    self.conn.execute(
+                        "INSERT INTO review_fts (rowid, grams) VALUES (?, ?)",
+                        (cursor.lastrowid, to_bigrams(content))
+                    )
+                    added += 1
+        return added
+
+    def search(self, query, product=None, since=None, until=None, limit=50):
+        """
+        리뷰 검색
+
+        Args:
+            query (str): 검색어 (공백으로 구분된 단어는 모두 포함해야 일치)
+            product (str, optional): 상품 키
+            since (str, optional): 작성일 하한 (YYYYMMDD)
+            until (str, optional): 작성일 상한 (YYYYMMDD)
+            limit (int): 최대 결과 수
+
+        Returns:
+            list: product_key, product_title, write_dt, rating, content 딕셔너리 목록 (최신순)
+        """
+        match = build_match_query(query)
+        chars = single_char_terms(query)
+        if not match and not chars:
+            return []
+
+        conditions = []
+        params = []
+        if match:
+            conditions.append("r.id IN (SELECT rowid FROM review_fts WHERE review_fts MATCH ?)")
+            params.append(match)
+        for char in chars:
+            conditions.append("r.content LIKE ? ESCAPE '\\'")
+            params.append('%' + re.sub(r'([%_\\])', r'\\\1', char) + '%')
+        if product:
+            conditions.append("r.product_key = ?")
+            params.append(product)
+        if since:
+            conditions.append("r.write_dt >= ?")
+            params.append(since)
+        if until:
+            conditions.append("r.write_dt <= ?")
+            params.append(until)
+        params.append(limit)
+
+        rows = self.conn.execute(
+            f"""SELECT r.product_key, r.product_title, r.write_dt, r.rating, r.content
+                FROM reviews r WHERE {' AND '.join(conditions)}
+                ORDER BY r.write_dt DESC LIMIT ?""",
+            params
+        )
+        columns = ('product_key', 'product_title', 'write_dt', 'rating', 'content')
+        return [dict(zip(columns, row)) for row in rows]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def index_csv(index, csv_path, chunksize=20000):
+    """
+    기존 리뷰 CSV를 색인에 적재 (상품 키는 PRODUCT_TITLE 기준)
+
+    Returns:
+        int: 새로 색인된 리뷰 수
+    """
+    import pandas as pd
+
+    added = 0
+    for chunk in pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str, chunksize=chunksize):
+        chunk = chunk.fillna('')
+        for title, group in chunk.groupby('PRODUCT_TITLE', sort=False):
+            added += index.add_reviews(group, make_product_key(title=title))
+    return added
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='리뷰 전문 검색')
+    parser.add_argument('query', nargs='?', help='검색어')
+    parser.add_argument('--db', type=str, default='review_search.db', help='검색 색인 DB (기본값: review_search.db)')
+    parser.add_argument('--product', type=str, help='상품 키 (상품번호)')
+    parser.add_argument('--since', type=str, help='작성일 하한 (YYYYMMDD)')
+    parser.add_argument('--until', type=str, help='작성일 상한 (YYYYMMDD)')
+    parser.add_argument('--limit', type=int, default=20, help='최대 결과 수 (기본값: 20)')
+    parser.add_argument('--index', type=str, nargs='*', help='색인에 적재할 리뷰 CSV 파일')
+
+    args = parser.parse_args()
+    search_index = ReviewSearchIndex(args.db)
+
+    if args.index:
+        for csv_path in args.index:
+            start_time = time.time()
+            count = index_csv(search_index, csv_path)
+            print(f"[INFO] {csv_path}: {count}건 색인 ({time.time() - start_time:.2f}초)")
+
+    if args.query:
+        start_time = time.time()
+        results = search_index.search(args.query, product=args.product, since=args.since,
+                                      until=args.until, limit=args.limit)
+        elapsed_ms = (time.time() - start_time) * 1000
+        for row in results:
+            print(f"{row['write_dt']}  {row['rating']}점  [{row['product_title']}]  {row['content'][:100]}")
+        print(f"\n총 {len(results)}건 (색인 {len(search_index)}건 중, {elapsed_ms:.1f}ms)")
+    elif not args.index:
+        parser.print_help()
+
+    search_index.close()
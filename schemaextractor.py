@@ -0,0 +1,411 @@
+"""
+선언형 카테고리 스키마 + 단일 패스 추출 엔진
+
+카테고리를 추가하려면 productcrawler_beauty.py를 복사해 beauty_fields, 특화 정보 함수,
+클래스 이름을 고쳐야 했고, 복사본마다 extract_* 함수들이 페이지를 각자 다시 훑었다.
+이제 카테고리는 category_schemas/<카테고리>.json 한 파일(필드, 선택자, 텍스트 앵커,
+타입 변환)이고, CategorySchema가 스키마를 한 번 컴파일해 문서 트리를 한 번만 순회하며
+모든 필드의 후보 요소를 모은 뒤 값을 만든다. 컴파일된 스키마는 load_schema가
+카테고리별로 캐시하므로 여러 카테고리를 돌려도 스키마마다 한 번만 컴파일된다.
+
+필드 정의 (fields 목록의 각 항목):
+  - name: 결과 키
+  - selector: 'tag', '.class', 'tag.class1.class2' (문서 전체 또는 상위 object 안에서 찾음)
+  - anchor: 이 문구가 들어 있는 첫 텍스트 노드의 부모 요소 (selector 대신 사용)
+  - type: text(기본) / digits / int / float / table / map / object / constant
+  - attr: 텍스트 대신 읽을 속성 (예: src, style)
+  - pattern: 정규식. 그룹이 있으면 첫 그룹을 값으로, 없으면 일치하는 값만 남김
+  - many: true면 일치하는 모든 요소의 값 목록, 아니면 index번째(기본 0) 요소
+  - default: 요소가 없을 때 값 (없으면 키를 만들지 않음)
+  - sources: 여러 leaf 필드 정의의 값을 이어 붙인 목록 (예: 썸네일 + 상세 이미지)
+  - table: th/td 쌍을 dict로. keys(헤더 → 결과 키, match: exact/contains), defaults(빈 값으로 채울 키)
+  - map: items 요소마다 key/value leaf 정의로 dict 구성
+  - object: fields 하위 필드를 selector 요소 안에서 추출 (selector가 없으면 문서 전체, many면 목록)
+  - copy: {하위 키: 최상위 결과 키} 추출이 끝난 뒤 최상위 값 복사 (object 목록용)
+  - flatten: true면 table/object 결과를 최상위 결과에 합침
+
+스키마 최상위 키: category, fields, expand({selector, fields}: 클릭 후 다시 추출할 필드),
+price_fields(가격 갱신 모드에서 가져올 필드)
+
+    python schemaextractor.py list
+    python schemaextractor.py extract beauty saved_page.html
+"""
+import json
+import os
+import re
+
+from lazyimport import lazy_import
+
+BeautifulSoup = lazy_import("bs4", "BeautifulSoup")
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'category_schemas')
+
+LEAF_TYPES = ('text', 'digits', 'int', 'float')
+FIELD_TYPES = LEAF_TYPES + ('table', 'map', 'object', 'constant')
+
+_compiled_schemas = {}
+
+
+class SchemaError(ValueError):
+    """스키마 정의 오류"""
+
+
+class Selector:
+    """'tag.class1.class2' 형식 선택자 (태그 이름과 클래스 포함 여부만 비교)"""
+
+    def __init__(self, selector):
+        parts = selector.strip().split('.')
+        if not selector.strip() or ' ' in selector.strip() or any(not part for part in parts[1:]):
+            raise SchemaError(f"지원하지 않는 선택자: {selector!r} ('tag', '.class', 'tag.class'만 지원)")
+        self.text = selector.strip()
+        self.tag = parts[0] or None
+        self.classes = tuple(parts[1:])
+
+    def matches(self, node):
+        if self.tag is not None and node.name != self.tag:
+            return False
+        if self.classes:
+            node_classes = node.get('class') or ()
+            return all(cls in node_classes for cls in self.classes)
+        return True
+
+    def find_all(self, root):
+        """root 하위에서 일치하는 요소 목록 (문서 순서)"""
+        return [node for node in root.descendants if node.name is not None and self.matches(node)]
+
+    def find(self, root):
+        for node in root.descendants:
+            if node.name is not None and self.matches(node):
+                return node
+        return None
+
+
+class Field:
+    """컴파일된 필드 정의"""
+
+    def __init__(self, spec, top_level):
+        if top_level and 'name' not in spec:
+            raise SchemaError(f"필드 이름(name)이 없습니다: {spec}")
+        self.name = spec.get('name')
+        self.type = spec.get('type', 'text')
+        if self.type not in FIELD_TYPES:
+            raise SchemaError(f"{self.name}: 알 수 없는 타입 {self.type!r}")
+        self.selector = Selector(spec['selector']) if spec.get('selector') else None
+        self.anchor = spec.get('anchor')
+        self.attr = spec.get('attr')
+        self.pattern = re.compile(spec['pattern']) if spec.get('pattern') else None
+        self.many = bool(spec.get('many'))
+        self.index = int(spec.get('index', 0))
+        self.has_default = 'default' in spec
+        self.default = spec.get('default')
+        self.value = spec.get('value')
+        self.flatten = bool(spec.get('flatten'))
+        self.copy = spec.get('copy', {})
+        self.keys = spec.get('keys')
+        self.match = spec.get('match', 'exact')
+        self.defaults = spec.get('defaults', [])
+        self.items = Selector(spec['items']) if spec.get('items') else None
+        self.key = Field(spec['key'], False) if spec.get('key') else None
+        self.item_value = Field(spec['value'], False) if isinstance(spec.get('value'), dict) else None
+        self.fields = [Field(sub, False) for sub in spec.get('fields', [])]
+        self.sources = [Field(sub, False) for sub in spec.get('sources', [])]
+
+        if self.type == 'map' and not (self.items and self.key and self.item_value):
+            raise SchemaError(f"{self.name}: map 타입에는 items, key, value가 필요합니다.")
+        if top_level and self.type not in ('constant', 'object') and not self.sources \
+                and self.selector is None and self.anchor is None:
+            raise SchemaError(f"{self.name}: selector 또는 anchor가 필요합니다.")
+
+    def probes(self):
+        """문서 순회에서 후보 요소를 모아야 하는 필드 목록"""
+        if self.sources:
+            return [probe for source in self.sources for probe in source.probes()]
+        if self.type == 'constant':
+            return []
+        if self.selector is None and self.anchor is None:
+            return [probe for field in self.fields for probe in field.probes()]
+        return [self]
+
+    def wanted(self):
+        """후보 요소를 몇 개까지 모으면 되는지 (None이면 전부)"""
+        return None if self.many else self.index + 1
+
+    def candidates(self, container, found):
+        """
+        후보 요소 목록 (문서 순서)
+
+        container가 없으면 문서 순회 결과(found)를, 있으면 container 하위를 찾는다.
+        """
+        if container is None:
+            return found.get(id(self), [])
+        if self.anchor is not None:
+            return [node for node in container.descendants if node.name is None and self.anchor in node]
+        if self.many or self.index:
+            return self.selector.find_all(container)
+        node = self.selector.find(container)
+        return [node] if node is not None else []
+
+    # ---- 값 만들기 ----
+
+    def _leaf_value(self, node):
+        if self.attr and not node.has_attr(self.attr):
+            return None
+        raw = node[self.attr] if self.attr else node.get_text()
+        if isinstance(raw, list):
+            raw = ' '.join(raw)
+        raw = raw.strip()
+        if self.pattern is not None:
+            match = self.pattern.search(raw)
+            if not match:
+                return None
+            raw = match.group(1) if self.pattern.groups else raw
+        if self.type == 'digits':
+            return re.sub(r'[^\d]', '', raw)
+        if self.type in ('int', 'float'):
+            digits = re.sub(r'[^\d.]' if self.type == 'float' else r'[^\d]', '', raw)
+            if not digits:
+                return None
+            return float(digits) if self.type == 'float' else int(digits)
+        return raw
+
+    def _table_value(self, node):
+        table = node if node.name == 'table' else node.find('table')
+        result = {}
+        if table is not None:
+            for row in table.find_all('tr'):
+                for header, cell in zip(row.find_all('th'), row.find_all('td')):
+                    header_text = header.text.strip()
+                    value_text = cell.text.strip()
+                    if self.keys is None:
+                        result[header_text] = value_text
+                        continue
+                    for label, key in self.keys.items():
+                        if header_text == label or (self.match == 'contains' and label in header_text):
+                            result[key] = value_text
+                            break
+        for key in self.defaults:
+            result.setdefault(key, "")
+        return result
+
+    def _map_value(self, node):
+        result = {}
+        for item in self.items.find_all(node):
+            key_node = self.key.selector.find(item) if self.key.selector else item
+            value_node = self.item_value.selector.find(item) if self.item_value.selector else item
+            if key_node is None or value_node is None:
+                continue
+            value = self.item_value._leaf_value(value_node)
+            if value is not None:
+                result[self.key._leaf_value(key_node)] = value
+        return result
+
+    def _object_value(self, container, found):
+        result = {}
+        for field in self.fields:
+            field.fill(result, container, found)
+        return result
+
+    def _empty_value(self):
+        """컨테이너가 없을 때의 빈 값 (table은 defaults를 채움)"""
+        if self.type == 'table':
+            return {key: "" for key in self.defaults}
+        return {}
+
+    def build(self, node, found):
+        """요소 하나에서 값 만들기"""
+        if self.anchor is not None:
+            node = node.parent
+            if node is None:
+                return None
+        if self.type == 'table':
+            return self._table_value(node)
+        if self.type == 'map':
+            return self._map_value(node)
+        if self.type == 'object':
+            return self._object_value(node, found)
+        return self._leaf_value(node)
+
+    def fill(self, result, container, found):
+        """값을 만들어 result에 기록 (요소가 없고 default도 없으면 키를 만들지 않음)"""
+        if self.type == 'constant':
+            result[self.name] = self.value
+            return
+        if self.sources:
+            values = []
+            for source in self.sources:
+                nodes = source.candidates(container, found)
+                for node in nodes if source.many else nodes[source.index:source.index + 1]:
+                    value = source._leaf_value(node)
+                    if value is not None:
+                        values.append(value)
+            result[self.name] = values
+            return
+
+        if self.selector is None and self.anchor is None:
+            value = self._object_value(container, found)
+        else:
+            nodes = self.candidates(container, found)
+            if self.many:
+                values = [self.build(node, found) for node in nodes]
+                value = values if self.type == 'object' else [item for item in values if item not in (None, '')]
+            elif len(nodes) > self.index:
+                value = self.build(nodes[self.index], found)
+                if value is None:
+                    if not self.has_default:
+                        return
+                    value = self.default
+            elif self.type in ('table', 'map', 'object'):
+                value = self._empty_value()
+            elif self.has_default:
+                value = self.default
+            else:
+                return
+
+        if self.flatten and isinstance(value, dict):
+            result.update(value)
+        else:
+            result[self.name] = value
+
+
+class CategorySchema:
+    """컴파일된 카테고리 스키마"""
+
+    def __init__(self, spec, path=None):
+        self.path = path
+        self.category = spec.get('category') or (os.path.splitext(os.path.basename(path))[0] if path else None)
+        if not self.category:
+            raise SchemaError("스키마에 category가 없습니다.")
+        self.fields = [Field(field_spec, True) for field_spec in spec.get('fields', [])]
+        self.expand = spec.get('expand')
+        self.price_fields = spec.get('price_fields', [])
+        self._by_name = {field.name: field for field in self.fields}
+        for name in self.price_fields + (self.expand or {}).get('fields', []):
+            if name not in self._by_name:
+                raise SchemaError(f"{self.category}: 정의되지 않은 필드 {name!r}")
+
+    def _scan(self, root, probes):
+        """
+        문서 트리를 한 번 순회하며 필드별 후보 요소 수집
+
+        Returns:
+            dict: id(필드) → 후보 요소 목록 (문서 순서)
+        """
+        by_tag = {}
+        anchors = []
+        for probe in probes:
+            if probe.anchor is not None:
+                anchors.append(probe)
+            else:
+                by_tag.setdefault(probe.selector.tag, []).append(probe)
+        any_tag = by_tag.pop(None, [])
+        found = {id(probe): [] for probe in probes}
+        remaining = {id(probe): probe.wanted() for probe in probes}
+
+        def collect(probe, node):
+            key = id(probe)
+            found[key].append(node)
+            if remaining[key] is not None:
+                remaining[key] -= 1
+
+        for node in root.descendants:
+            if node.name is None:
+                for probe in anchors:
+                    if remaining[id(probe)] != 0 and probe.anchor in node:
+                        collect(probe, node)
+                continue
+            for probe in by_tag.get(node.name, ()):
+                if remaining[id(probe)] != 0 and probe.selector.matches(node):
+                    collect(probe, node)
+            for probe in any_tag:
+                if remaining[id(probe)] != 0 and probe.selector.matches(node):
+                    collect(probe, node)
+        return found
+
+    def extract(self, soup, only=None, context=None):
+        """
+        스키마의 필드를 한 번의 문서 순회로 추출
+
+        Args:
+            soup: BeautifulSoup 객체 또는 HTML 문자열
+            only (list, optional): 이 필드만 추출
+            context (dict, optional): copy에서 참조할 추가 값
+
+        Returns:
+            dict: 필드 이름 → 값
+        """
+        if isinstance(soup, str):
+            soup = BeautifulSoup(soup, 'html.parser')
+        fields = self.fields if only is None else [self._by_name[name] for name in only]
+        found = self._scan(soup, [probe for field in fields for probe in field.probes()])
+
+        result = {}
+        for field in fields:
+            try:
+                field.fill(result, None, found)
+            except Exception as e:
+                print(f"[WARN] {self.category} 스키마 필드 '{field.name}' 추출 중 오류: {e}")
+
+        values = dict(context or {}, **result)
+        for field in fields:
+            if field.copy and isinstance(result.get(field.name), list):
+                for item in result[field.name]:
+                    for sub_key, source_key in field.copy.items():
+                        item[sub_key] = values.get(source_key, '')
+        return result
+
+    def selectors(self, names):
+        """필드들의 CSS 선택자 목록 (가격 갱신 모드에서 필요한 요소만 꺼낼 때 사용)"""
+        return [probe.selector.text for name in names for probe in self._by_name[name].probes()
+                if probe.selector is not None]
+
+
+def available_schemas(schema_dir=SCHEMA_DIR):
+    """스키마 파일이 있는 카테고리 목록"""
+    if not os.path.isdir(schema_dir):
+        return []
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(schema_dir) if name.endswith('.json'))
+
+
+def load_schema(category, schema_dir=SCHEMA_DIR):
+    """
+    카테고리 스키마 로드 (카테고리별로 한 번만 컴파일해 캐시)
+
+    Returns:
+        CategorySchema: 스키마 파일이 없으면 None
+    """
+    path = os.path.join(schema_dir, f"{category}.json")
+    if path in _compiled_schemas:
+        return _compiled_schemas[path]
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        schema = CategorySchema(json.load(f), path=path)
+    _compiled_schemas[path] = schema
+    return schema
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='카테고리 스키마 확인/추출 테스트')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('list', help='사용 가능한 카테고리 스키마 목록')
+    extract_parser = subparsers.add_parser('extract', help='저장된 HTML 파일에서 스키마로 추출')
+    extract_parser.add_argument('category', help='카테고리 이름')
+    extract_parser.add_argument('html', help='상품 페이지 HTML 파일')
+
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for category in available_schemas():
+            schema = load_schema(category)
+            print(f"{category}\t필드 {len(schema.fields)}개\t{schema.path}")
+    elif args.command == 'extract':
+        schema = load_schema(args.category)
+        if schema is None:
+            print(f"[ERROR] {args.category} 스키마를 찾을 수 없습니다.")
+        else:
+            with open(args.html, 'r', encoding='utf-8') as f:
+                print(json.dumps(schema.extract(f.read()), ensure_ascii=False, indent=4))
+    else:
+        parser.print_help()
@@ -1,19 +1,115 @@
 import time
 import csv
+import re
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
+from lazyimport import lazy_module, lazy_import
+from driverfactory import create_driver, release_driver
+
+# bs4 / selenium은 첫 사용 시점에 로드 (CLI 기동 시간 단축)
+BeautifulSoup = lazy_import("bs4", "BeautifulSoup")
+webdriver = lazy_module("selenium.webdriver")
+By = lazy_import("selenium.webdriver.common.by", "By")
+# 목록 스냅샷/가격 파싱/상품 키 모듈도 첫 사용 시점에 로드
+ListingDiff = lazy_import("listingsnapshot", "ListingDiff")
+parse_price = lazy_import("productchanges", "parse_price")
+product_key = lazy_import("reviewdedup", "product_key")
+store_of = lazy_import("pageguard", "store_of")
+
+_PRICE_PATTERN = re.compile(r'([\d,]+)\s*원')
+# 판매가가 아닌 금액 (배송비/쿠폰/할인/적립 금액) - 금액 앞뒤 문맥으로 판별 ('할인가'는 판매가)
+_NON_PRICE_BEFORE = re.compile(r'(?:배송비|배송|쿠폰|할인(?!가)|적립|포인트)\D{0,6}$')
+_NON_PRICE_AFTER = re.compile(r'^\s*(?:할인(?!가)|적립)')
+# 가격 요소 클래스 중 판매가가 아닌 것
+_NON_PRICE_CLASSES = ('deliver', 'shipping', 'coupon', 'benefit', 'point')
+_REVIEW_COUNT_PATTERN = re.compile(r'리뷰\s*(?:수)?\s*([\d,]+)')
+_RATING_PATTERN = re.compile(r'(?:별점|평점)\s*(\d(?:\.\d+)?)')
+
+CARD_COLUMNS = ["URL", "PRODUCT_ID", "TITLE", "PRICE", "REVIEW_COUNT", "RATING"]
+
+
+def _sale_prices(text):
+    """텍스트의 'N원' 금액 중 배송비/쿠폰/할인/적립 금액을 뺀 값 목록"""
+    prices = []
+    for match in _PRICE_PATTERN.finditer(text):
+        if _NON_PRICE_BEFORE.search(text[:match.start()]) or _NON_PRICE_AFTER.match(text[match.end():]):
+            continue
+        price = parse_price(match.group(1))
+        if price:
+            prices.append(price)
+    return prices
+
+
+def card_price(container):
+    """
+    카드의 판매가 (정가/할인가가 함께 있으면 낮은 값)
+
+    클래스에 'price'가 들어간 가격 요소를 먼저 보고, 없으면 카드 전체 텍스트에서 배송비/쿠폰/할인
+    금액을 뺀 금액을 쓴다. 후보가 셋 이상(정가/할인가로 설명되지 않음)이면 판매가를 특정할 수
+    없으므로 None (ListingSnapshotStore.unchanged가 변경 여부 미상으로 보고 상세 수집함).
+    """
+    elements = [element for element in container.find_all(class_=re.compile('price', re.I))
+                if not any(word in ' '.join(element.get('class', [])).lower() for word in _NON_PRICE_CLASSES)]
+    prices = set()
+    for element in elements:
+        prices.update(_sale_prices(element.get_text(' ', strip=True)))
+    if not prices:
+        prices = set(_sale_prices(container.get_text(' ', strip=True)))
+    if not prices or len(prices) > 2:
+        return None
+    return min(prices)
+
+
+def extract_card(card, href):
+    """
+    목록 카드(상품 링크 요소)에서 상품명/가격/리뷰 수/평점 추출
+
+    카드 마크업은 자주 바뀌므로 클래스 대신 카드(li) 전체 텍스트에서 '12,000원',
+    '리뷰 1,234', '별점 4.8' 같은 표기를 찾는다. 가격은 card_price 참고.
+    찾지 못한 값은 None.
+    """
+    container = card.find_parent('li') or card
+    text = container.get_text(' ', strip=True)
+
+    review_match = _REVIEW_COUNT_PATTERN.search(text)
+    rating_match = _RATING_PATTERN.search(text)
+    image = container.find('img', alt=True)
+    title = (image['alt'] if image else '') or card.get_text(' ', strip=True)
+
+    return {
+        'url': href,
+        'product_id': product_key(href),
+        'title': title.strip(),
+        'price': card_price(container),
+        'review_count': parse_price(review_match.group(1)) if review_match else None,
+        'rating': float(rating_match.group(1)) if rating_match else None,
+    }
+
+
+def scrape_multiple_pages(page_url: str, max_page: int, output_csv: str, snapshot_store=None,
+                          stop_after_matching: int = 2):
+    """
+    카테고리 목록 페이지를 넘기며 상품 URL 수집
+
+    snapshot_store(ListingSnapshotStore)를 주면 페이지별 상품 순서를 이전 스냅샷과 비교해
+    연속 stop_after_matching 페이지가 같으면 페이지 넘김을 멈추고 나머지는 이전 스냅샷으로
+    채운다. 새로 생긴/사라진 상품은 <output_csv>_delta.csv에 기록한다.
+
+    카드의 가격/리뷰 수/평점도 함께 읽어 output_csv의 CARD_COLUMNS로 저장한다
+    (이전 스냅샷에서 채운 상품은 URL/상품번호만 있음).
+
+    Returns:
+        dict: urls(수집한 상품 URL 목록), cards(상품번호 → 카드 dict),
+              added/removed(상품번호 → URL, 스냅샷 미사용 시 빈 dict)
+    """
+    listing_diff = ListingDiff(snapshot_store, page_url, stop_after_matching) if snapshot_store is not None else None
 
-def scrape_multiple_pages(page_url: str, max_page: int, output_csv: str):
-    service = Service(ChromeDriverManager().install())
     options = webdriver.ChromeOptions()
     # options.add_argument("--headless")  # 필요시 헤드리스 모드
-    driver = webdriver.Chrome(service=service, options=options)
+    driver = create_driver(options, affinity=store_of(page_url))
 
-    all_urls = set()
+    all_urls = []  # 목록 순서 유지
+    seen_urls = set()
+    all_cards = {}
 
     try:
         driver.get(page_url)
@@ -40,16 +136,29 @@ def scrape_multiple_pages(page_url: str, max_page: int, output_csv: str):
                     print(f"선택자 '{selector}'로 {len(cards)}개 카드 발견")
                     break
             
+            page_urls = []
+            page_cards = []
             for card in cards:
                 href = card.get('href')
                 if href:
                     # 상대 URL인 경우 절대 URL로 변환
                     if href.startswith('/'):
                         href = 'https://brand.naver.com' + href
-                    all_urls.add(href)
+                    page_urls.append(href)
+                    page_cards.append(extract_card(card, href))
+            for href, card_data in zip(page_urls, page_cards):
+                if href not in seen_urls:
+                    seen_urls.add(href)
+                    all_urls.append(href)
+                    all_cards.setdefault(card_data['product_id'], card_data)
 
             print(f"[페이지 {page}] 상품 {len(cards)}개 수집 (누적 {len(all_urls)}개)")
 
+            # ---- (B) 이전 스냅샷과 연속으로 같은 페이지가 충분하면 조기 종료 ----
+            if listing_diff is not None and listing_diff.add_page(page, page_urls, page_cards):
+                print(f"[INFO] {listing_diff.matching_run}페이지 연속 이전 목록과 같아 페이지 넘김을 멈춥니다.")
+                break
+
             if page == max_page:
                 break  # 원하는 페이지 수만큼 돌았다면 종료
 
@@ -118,22 +227,58 @@ def scrape_multiple_pages(page_url: str, max_page: int, output_csv: str):
             time.sleep(3)  # 다음 페이지 로딩 대기
 
     finally:
-        driver.quit()
+        release_driver(driver)
+
+    result = {'urls': all_urls, 'cards': all_cards, 'added': {}, 'removed': {}}
+    if listing_diff is not None and listing_diff.pages:
+        result = listing_diff.finish()
+        all_urls = result['urls']
+        print(f"[INFO] 목록 {result['pages_read']}페이지 읽음, 이전 스냅샷 {result['pages_reused']}페이지 재사용 "
+              f"(신규 {len(result['added'])}개, 삭제 {len(result['removed'])}개)")
+        delta_csv = output_csv.replace(".csv", "_delta.csv")
+        with open(delta_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["CHANGE", "PRODUCT_ID", "URL"])
+            for change, products in (('added', result['added']), ('removed', result['removed'])):
+                for product_id, url in products.items():
+                    writer.writerow([change, product_id, url])
 
     # --- 수집된 URL CSV 저장 ---
     with open(output_csv, 'w', newline='', encoding='utf-8') as f:
         writer = csv.writer(f)
-        writer.writerow(["URL"])
+        writer.writerow(CARD_COLUMNS)
         for url in all_urls:
-            writer.writerow([url])
+            card_data = result['cards'].get(product_key(url), {})
+            writer.writerow([url, product_key(url)] + [
+                '' if card_data.get(field) is None else card_data[field]
+                for field in ('title', 'price', 'review_count', 'rating')
+            ])
 
     print(f"\n총 {len(all_urls)}개의 상품 URL을 수집했고, {output_csv}에 저장했습니다.")
+    return result
 
 
 if __name__ == "__main__":
-    start_url = "https://brand.naver.com/lucky567/category/50000803"  # 예시 URL
+    import argparse
+
+    from listingsnapshot import ListingSnapshotStore
+
+    parser = argparse.ArgumentParser(description='카테고리 목록 상품 URL 수집')
+    parser.add_argument('--url', type=str, default="https://brand.naver.com/lucky567/category/50000803",
+                        help='카테고리 시드 URL (정렬 조건 포함)')
+    parser.add_argument('--max-page', type=int, default=3, help='최대 페이지 수 (기본값: 3)')
+    parser.add_argument('--output', type=str, default="product_urls_pagination.csv", help='결과 CSV')
+    parser.add_argument('--snapshot-db', type=str, help='목록 스냅샷 DB (지정 시 이전 목록과 비교해 조기 종료)')
+    parser.add_argument('--stop-after', type=int, default=2, help='이전 스냅샷과 연속으로 같은 페이지 수 (기본값: 2)')
+
+    args = parser.parse_args()
+    snapshot_store = ListingSnapshotStore(args.snapshot_db) if args.snapshot_db else None
     scrape_multiple_pages(
-        page_url=start_url,
-        max_page=3,
-        output_csv="product_urls_pagination.csv"
-    )
\ No newline at end of file
+        page_url=args.url,
+        max_page=args.max_page,
+        output_csv=args.output,
+        snapshot_store=snapshot_store,
+        stop_after_matching=args.stop_after
+    )
+    if snapshot_store is not None:
+        snapshot_store.close()